@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Cluster compression: per-cluster concept coverage vs. batched TF-IDF summaries.
+
+Builds synthetic clusters whose memories mix topic words with text drawn
+from a Zipf-distributed vocabulary, plus capitalized words, acronyms,
+numbers, paths, URLs and repeated statements, then times
+``SemanticCompressionEngine.process`` over all of them with each summarizer:
+
+- ``concepts``: per cluster, the key-concept pattern scans and substring
+  checks of every sentence against the key concepts to pick the sentences
+  that cover new concepts
+- ``tfidf``: one sentence split, one word scan and one TF-IDF sentence matrix
+  for all clusters, sentences scored by similarity to their cluster's
+  centroid and weighted by each memory's embedding similarity to the
+  cluster centroid
+
+Embeddings are float32 ``array('f')`` buffers, as SQLite-vec streams them to
+consolidation runs. Each summarizer's best of ``--repeat`` runs is reported.
+
+Two cases run: many small clusters, and a few large clusters (500 memories
+each by default, as in monthly runs). Besides clusters compressed per second
+it reports how comparable the output is: the share of clusters with the same
+key concepts, the mean summary length and the share of summary sentences
+that mention a key concept.
+
+Usage:
+    python scripts/benchmarks/benchmark_compression.py
+    python scripts/benchmarks/benchmark_compression.py --clusters 2000 --memories-per-cluster 12
+    python scripts/benchmarks/benchmark_compression.py --large-clusters 4 --large-cluster-size 2000
+    python scripts/benchmarks/benchmark_compression.py --json results.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import time
+from array import array
+from dataclasses import replace
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from mcp_memory_service.consolidation.base import ConsolidationConfig, MemoryCluster  # noqa: E402
+from mcp_memory_service.consolidation.compression import SemanticCompressionEngine  # noqa: E402
+from mcp_memory_service.models.memory import Memory  # noqa: E402
+
+_SPECIALS = [
+    "HTTP", "SQLite", "ConsolidationConfig", "v2.3", "42", "3.14", "/src/app/main.py",
+    "https://example.com/docs", "`make test`", '"quoted words"', "PostgreSQL", "API",
+]
+_SENTENCE_ENDS = [". ", "! ", "? ", ".\n"]
+
+
+def _vocabulary(rng: np.random.Generator, size: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Random lowercase words, shortest first, and Zipf frequencies for them."""
+    letters = np.array(list("abcdefghijklmnopqrstuvwxyz"))
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choice(letters, int(rng.integers(2, 11)))))
+    frequencies = 1.0 / np.arange(1, size + 1) ** 1.1
+    return np.array(sorted(words, key=len), dtype=object), frequencies / frequencies.sum()
+
+
+def _sentence(rng: np.random.Generator, words: np.ndarray, frequencies: np.ndarray, topic: List[str]) -> str:
+    count = int(rng.integers(6, 20))
+    sentence = list(rng.choice(words, count, p=frequencies))
+    for _ in range(int(rng.integers(1, 4))):
+        sentence.insert(int(rng.integers(0, count)), topic[int(rng.integers(0, len(topic)))])
+    if rng.uniform() < 0.3:
+        sentence.insert(int(rng.integers(0, count)), _SPECIALS[int(rng.integers(0, len(_SPECIALS)))])
+    if rng.uniform() < 0.2:
+        position = int(rng.integers(0, count))
+        sentence[position] = sentence[position].capitalize()
+    return " ".join(sentence).capitalize()
+
+
+def build_clusters(
+    count: int, per_cluster: int, dim: int, seed: int, vocabulary_size: int = 20000
+) -> Tuple[List[MemoryCluster], List[Memory]]:
+    """Clusters of memories about one topic each, with embeddings around the cluster centroid."""
+    rng = np.random.default_rng(seed)
+    words, frequencies = _vocabulary(rng, vocabulary_size)
+    clusters, memories = [], []
+    for c in range(count):
+        topic = [str(word) for word in rng.choice(words[200:5000], 6)]
+        centroid = rng.normal(size=dim)
+        statement = _sentence(rng, words, frequencies, topic)
+        hashes = []
+        for m in range(per_cluster):
+            sentences = [statement] if rng.uniform() < 0.3 else []
+            sentences += [_sentence(rng, words, frequencies, topic) for _ in range(int(rng.integers(2, 7)))]
+            ends = rng.choice(_SENTENCE_ENDS, len(sentences), p=[0.85, 0.05, 0.05, 0.05])
+            memory = Memory(
+                content="".join(s + end for s, end in zip(sentences, ends)).strip(),
+                content_hash=f"bench{c:05d}-{m:04d}",
+                embedding=array("f", (centroid + rng.normal(scale=0.5, size=dim)).astype(np.float32).tobytes()),
+                created_at=time.time() - float(rng.uniform(0, 90)) * 86400,
+            )
+            memories.append(memory)
+            hashes.append(memory.content_hash)
+        clusters.append(MemoryCluster(
+            cluster_id=f"cluster-{c}",
+            memory_hashes=hashes,
+            centroid_embedding=centroid.astype(np.float32).tolist(),
+            coherence_score=0.8,
+            created_at=datetime.now(),
+            theme_keywords=topic[:3],
+        ))
+    return clusters, memories
+
+
+async def _timed(summarizer: str, clusters, memories, args: argparse.Namespace) -> Tuple[Dict[str, Any], list]:
+    config = replace(
+        ConsolidationConfig(), compression_summarizer=summarizer, max_summary_length=args.max_summary_length
+    )
+    engine = SemanticCompressionEngine(config)
+    wall = float("inf")
+    for _ in range(args.repeat):
+        started = time.perf_counter()
+        results = await engine.process(clusters, memories)
+        wall = min(wall, time.perf_counter() - started)
+    return {
+        "clusters": len(results),
+        "wall_s": round(wall, 3),
+        "clusters_per_s": round(len(results) / wall) if wall > 0 else None,
+        "mean_summary_chars": round(float(np.mean([len(r.compressed_memory.content) for r in results])), 1),
+        "concept_sentence_share": round(_concept_sentence_share(results), 3),
+    }, results
+
+
+def _concept_sentence_share(results) -> float:
+    """Share of summary sentences (after the overview) that mention one of the key concepts."""
+    hits = total = 0
+    for result in results:
+        concepts = [c.lower() for c in result.key_concepts]
+        for sentence in result.compressed_memory.content.split(". ")[1:]:
+            if sentence.startswith("Key concepts"):
+                continue
+            total += 1
+            hits += any(c in sentence.lower() for c in concepts)
+    return hits / total if total else 0.0
+
+
+async def _compare(count: int, per_cluster: int, args: argparse.Namespace) -> Dict[str, Any]:
+    clusters, memories = build_clusters(count, per_cluster, args.dim, args.seed)
+    concepts, concept_results = await _timed("concepts", clusters, memories, args)
+    tfidf, tfidf_results = await _timed("tfidf", clusters, memories, args)
+    same = sum(
+        set(a.key_concepts) == set(b.key_concepts) for a, b in zip(concept_results, tfidf_results)
+    )
+    return {
+        "clusters": count,
+        "memories": len(memories),
+        "concepts": concepts,
+        "tfidf": tfidf,
+        "same_key_concepts": round(same / max(len(tfidf_results), 1), 3),
+    }
+
+
+async def run_benchmark(args: argparse.Namespace) -> Dict[str, Any]:
+    return {
+        "small_clusters": await _compare(args.clusters, args.memories_per_cluster, args),
+        "large_clusters": await _compare(args.large_clusters, args.large_cluster_size, args),
+    }
+
+
+def _print_result(result: Dict[str, Any]) -> None:
+    print(f"\n=== compression of {result['clusters']:,} clusters ({result['memories']:,} memories) ===")
+    print(f"  {'summarizer':<10} {'wall s':>8} {'clusters/s':>11} {'mean chars':>11} {'concept sent.':>14}")
+    for mode in ("concepts", "tfidf"):
+        row = result[mode]
+        print(
+            f"  {mode:<10} {row['wall_s']:>8.3f} {row['clusters_per_s'] or 0:>11,} "
+            f"{row['mean_summary_chars']:>11} {row['concept_sentence_share']:>14.1%}"
+        )
+    print(f"  clusters with the same key concepts: {result['same_key_concepts']:.1%}")
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Cluster compression: concept coverage vs. batched TF-IDF")
+    parser.add_argument("--clusters", type=int, default=500)
+    parser.add_argument("--memories-per-cluster", type=int, default=10)
+    parser.add_argument("--large-clusters", type=int, default=4, help="Clusters in the large-cluster case")
+    parser.add_argument("--large-cluster-size", type=int, default=500, help="Memories per large cluster")
+    parser.add_argument("--dim", type=int, default=384, help="Embedding dimension")
+    parser.add_argument("--max-summary-length", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per summarizer; the fastest is reported")
+    parser.add_argument("--json", dest="json_path", help="Write results to this JSON file")
+    return parser.parse_args(argv)
+
+
+async def main(argv=None) -> int:
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+    result = await run_benchmark(args)
+    for case in result.values():
+        _print_result(case)
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(result, indent=2))
+        print(f"\nResults written to {args.json_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+CreativeAssociationEngine: random pair sampling vs. similarity-band candidates.
+
+Builds synthetic memories whose embeddings share a common component plus a
+topic direction (like real sentence embeddings, most pairs are fairly
+similar and only some fall in the 0.3-0.7 "sweet spot"), then runs:
+
+- ``random``: the previous loop, with random pairs from ``_sample_memory_pairs``,
+  a per-pair cosine, and concept extraction for every pair
+- ``band``: ``CreativeAssociationEngine.process``, which samples candidates
+  from the in-band pairs found by blocked matrix products
+
+Both runs get the same ``--max-pairs`` budget. The benchmark reports
+associations found, wall and CPU time, and associations per CPU-second.
+
+Usage:
+    python scripts/benchmarks/benchmark_creative_associations.py
+    python scripts/benchmarks/benchmark_creative_associations.py --memories 20000 --max-pairs 2000
+    python scripts/benchmarks/benchmark_creative_associations.py --json results.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from mcp_memory_service.consolidation.associations import CreativeAssociationEngine  # noqa: E402
+from mcp_memory_service.consolidation.base import ConsolidationConfig  # noqa: E402
+from mcp_memory_service.models.memory import Memory  # noqa: E402
+
+_WORDS = [
+    "Python", "deployment", "database", "migration", "latency", "cache", "Kubernetes",
+    "review", "incident", "schema", "index", "release", "backup", "config", "API",
+]
+
+
+def build_memories(count: int, topics: int, shared: float, dims: int, seed: int) -> List[Memory]:
+    """Memories with embeddings ``w * common + topic + noise``, ``w`` uniform in [0, shared]."""
+    rng = np.random.default_rng(seed)
+    common = rng.normal(size=dims)
+    centers = rng.normal(size=(topics, dims))
+    topic_ids = rng.integers(0, topics, count)
+    weights = rng.uniform(0.0, shared, size=(count, 1))
+    embeddings = weights * common + centers[topic_ids] + rng.normal(scale=0.8, size=(count, dims))
+    base_time = time.time()
+    memories = []
+    for i in range(count):
+        words = rng.choice(_WORDS, 6)
+        memories.append(Memory(
+            content=f"Memory {i}: " + " ".join(words) + ("?" if i % 4 == 0 else "."),
+            content_hash=f"bench{i:07d}",
+            tags=[f"topic{topic_ids[i]}"],
+            embedding=embeddings[i].tolist(),
+            created_at=base_time - float(rng.integers(0, 400)) * 86400,
+        ))
+    return memories
+
+
+async def random_pairs_baseline(engine: CreativeAssociationEngine, memories: List[Memory]) -> int:
+    """The pre-band discovery loop: random pairs, per-pair cosine, uncached concepts."""
+    found = 0
+    for mem1, mem2 in engine._sample_memory_pairs(memories):
+        similarity = await engine._calculate_semantic_similarity(mem1, mem2)
+        if engine.min_similarity <= similarity <= engine.max_similarity:
+            analysis = await engine._analyze_association(mem1, mem2, similarity)
+            if analysis.confidence_score > 0.3:
+                await engine._create_association_memory(analysis)
+                found += 1
+    return found
+
+
+async def _timed(run) -> Dict[str, Any]:
+    wall, cpu = time.perf_counter(), time.process_time()
+    found = await run()
+    wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    return {
+        "associations": found,
+        "wall_s": round(wall, 3),
+        "cpu_s": round(cpu, 3),
+        "associations_per_cpu_s": round(found / cpu, 1) if cpu > 0 else None,
+    }
+
+
+async def run_benchmark(args: argparse.Namespace) -> Dict[str, Any]:
+    memories = build_memories(args.memories, args.topics, args.shared, args.dims, args.seed)
+    engine = CreativeAssociationEngine(ConsolidationConfig(max_pairs_per_run=args.max_pairs))
+
+    async def band():
+        return len(await engine.process(memories))
+
+    return {
+        "memories": args.memories,
+        "max_pairs": args.max_pairs,
+        "random": await _timed(lambda: random_pairs_baseline(engine, memories)),
+        "band": await _timed(band),
+    }
+
+
+def _print_result(result: Dict[str, Any]) -> None:
+    print(f"\n=== {result['memories']:,} memories, {result['max_pairs']:,} pairs per run ===")
+    print(f"  {'mode':<8} {'associations':>13} {'wall s':>9} {'cpu s':>9} {'assoc/cpu-s':>12}")
+    for mode in ("random", "band"):
+        row = result[mode]
+        print(f"  {mode:<8} {row['associations']:>13,} {row['wall_s']:>9.2f} {row['cpu_s']:>9.2f} "
+              f"{row['associations_per_cpu_s'] or 0:>12,.1f}")
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Creative associations: random pairs vs. similarity-band candidates")
+    parser.add_argument("--memories", type=int, default=5000)
+    parser.add_argument("--max-pairs", type=int, default=1000)
+    parser.add_argument("--topics", type=int, default=50)
+    parser.add_argument("--shared", type=float, default=12.0,
+                        help="Maximum weight of the component shared by all embeddings")
+    parser.add_argument("--dims", type=int, default=384)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", dest="json_path", help="Write results to this JSON file")
+    return parser.parse_args(argv)
+
+
+async def main(argv=None) -> int:
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+    result = await run_benchmark(args)
+    _print_result(result)
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(result, indent=2))
+        print(f"\nResults written to {args.json_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+GraphStorage traversal: recursive CTEs vs. the CSR adjacency cache.
+
+Builds a synthetic power-law graph (preferential attachment, so a few hubs
+collect most edges, like real association graphs) in a temporary SQLite
+database with the ``memory_graph`` schema, then times the same queries
+through ``GraphStorage(adjacency_cache=False)`` (recursive CTEs) and
+``GraphStorage(adjacency_cache=True)`` (NumPy BFS over CSR arrays).
+
+Path-enumerating CTEs blow up around hubs, so CTE queries that exceed
+``--cte-timeout`` are interrupted and reported as ``timeout``. Cache timings
+exclude the one-off load, which is reported separately.
+
+Usage:
+    python scripts/benchmarks/benchmark_graph_traversal.py
+    python scripts/benchmarks/benchmark_graph_traversal.py --nodes 50000 --edges-per-node 4 --max-hops 4
+    python scripts/benchmarks/benchmark_graph_traversal.py --json results.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from mcp_memory_service.storage.graph import GraphStorage  # noqa: E402
+
+_SCHEMA = """
+CREATE TABLE memory_graph (
+    source_hash TEXT NOT NULL,
+    target_hash TEXT NOT NULL,
+    similarity REAL NOT NULL,
+    connection_types TEXT NOT NULL,
+    metadata TEXT,
+    created_at REAL NOT NULL,
+    relationship_type TEXT DEFAULT 'related',
+    PRIMARY KEY (source_hash, target_hash)
+)
+"""
+
+
+def build_power_law_graph(db_path: str, nodes: int, edges_per_node: int, seed: int) -> Dict[str, Any]:
+    """
+    Preferential-attachment graph written the way store_association writes it.
+
+    Every new node links to ``edges_per_node`` existing nodes picked in
+    proportion to their degree. 80% of links are symmetric ``related`` edges
+    (stored in both directions), the rest directed ``causes`` edges.
+    """
+    rng = random.Random(seed)
+    endpoints: List[int] = list(range(edges_per_node))  # degree-weighted sampling pool
+    rows = []
+    for node in range(edges_per_node, nodes):
+        targets = set()
+        while len(targets) < edges_per_node:
+            targets.add(rng.choice(endpoints))
+        for target in targets:
+            source_hash, target_hash = f"mem{node:08d}", f"mem{target:08d}"
+            if rng.random() < 0.8:
+                rows.append((source_hash, target_hash, "related"))
+                rows.append((target_hash, source_hash, "related"))
+            else:
+                rows.append((source_hash, target_hash, "causes"))
+            endpoints.extend((node, target))
+
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(_SCHEMA)
+    conn.executemany(
+        "INSERT OR REPLACE INTO memory_graph VALUES (?, ?, 0.5, '[\"semantic\"]', NULL, 0, ?)", rows
+    )
+    conn.execute("CREATE INDEX idx_graph_source ON memory_graph(source_hash)")
+    conn.execute("CREATE INDEX idx_graph_target ON memory_graph(target_hash)")
+    conn.execute("CREATE INDEX idx_graph_relationship ON memory_graph(relationship_type)")
+    conn.commit()
+    degrees = conn.execute("""
+        SELECT source_hash, COUNT(*) AS degree FROM memory_graph
+        GROUP BY source_hash ORDER BY degree DESC
+    """).fetchall()
+    edge_count = conn.execute("SELECT COUNT(*) FROM memory_graph").fetchone()[0]
+    conn.close()
+    return {
+        "nodes": nodes,
+        "edges": edge_count,
+        "hub": degrees[0][0],
+        "hub_degree": degrees[0][1],
+        "median": degrees[len(degrees) // 2][0],
+        "median_degree": degrees[len(degrees) // 2][1],
+        "leaf": degrees[-1][0],
+    }
+
+
+async def _timed(graph: GraphStorage, query: Callable[[], Awaitable[Any]], timeout: Optional[float]) -> Dict[str, Any]:
+    started = time.perf_counter()
+    try:
+        result = await asyncio.wait_for(query(), timeout)
+    except asyncio.TimeoutError:
+        for conn in list(graph._reader_connections):
+            conn.interrupt()  # stop the runaway CTE so the reader thread is freed
+        return {"ms": None, "results": None}
+    return {
+        "ms": round((time.perf_counter() - started) * 1000, 2),
+        "results": len(result) if result is not None else 0,
+    }
+
+
+def _queries(info: Dict[str, Any], max_hops: int) -> Dict[str, Callable[[GraphStorage], Awaitable[Any]]]:
+    queries: Dict[str, Callable[[GraphStorage], Awaitable[Any]]] = {}
+    for hops in range(2, max_hops + 1):
+        for label in ("median", "hub"):
+            queries[f"find_connected {label} {hops}-hop both"] = (
+                lambda g, h=info[label], n=hops: g.find_connected(h, max_hops=n, direction="both")
+            )
+        queries[f"find_connected hub {hops}-hop outgoing"] = (
+            lambda g, n=hops: g.find_connected(info["hub"], max_hops=n, direction="outgoing")
+        )
+    queries["shortest_path leaf→hub"] = lambda g: g.shortest_path(info["leaf"], info["hub"], max_depth=5)
+    queries["common_neighbors hub"] = lambda g: g.common_neighbors(info["hub"])
+    queries["common_neighbors median"] = lambda g: g.common_neighbors(info["median"])
+    queries["transitive_closure causes 3-hop"] = lambda g: g.transitive_closure("causes", max_hops=3)
+    return queries
+
+
+async def run_benchmark(args: argparse.Namespace, db_path: str) -> Dict[str, Any]:
+    started = time.perf_counter()
+    info = build_power_law_graph(db_path, args.nodes, args.edges_per_node, args.seed)
+    info["build_seconds"] = round(time.perf_counter() - started, 2)
+
+    cte = GraphStorage(db_path, adjacency_cache=False)
+    cached = GraphStorage(db_path, adjacency_cache=True)
+    try:
+        started = time.perf_counter()
+        await cached.find_connected(info["leaf"], max_hops=1)  # triggers the lazy load
+        info["cache_load_ms"] = round((time.perf_counter() - started) * 1000, 1)
+
+        rows = []
+        for name, query in _queries(info, args.max_hops).items():
+            before = await _timed(cte, lambda: query(cte), args.cte_timeout)
+            after = await _timed(cached, lambda: query(cached), None)
+            speedup = None
+            if before["ms"] is not None and after["ms"]:
+                speedup = round(before["ms"] / after["ms"], 1)
+            rows.append({"query": name, "cte": before, "cache": after, "speedup": speedup})
+    finally:
+        await cte.close()
+        await cached.close()
+    return {"graph": info, "queries": rows}
+
+
+def _print_result(result: Dict[str, Any], cte_timeout: float) -> None:
+    info = result["graph"]
+    print(f"\n=== power-law graph: {info['nodes']:,} nodes, {info['edges']:,} edge rows ===")
+    print(f"  hub degree {info['hub_degree']}, median degree {info['median_degree']}, "
+          f"built in {info['build_seconds']}s, cache load {info['cache_load_ms']}ms")
+    print(f"\n  {'query':<38} {'CTE ms':>10} {'cache ms':>10} {'results':>16} {'speedup':>8}")
+    for row in result["queries"]:
+        before, after = row["cte"], row["cache"]
+        cte_ms = f"{before['ms']:.1f}" if before["ms"] is not None else f">{cte_timeout:g}s"
+        counts = f"{before['results'] if before['results'] is not None else '-'}/{after['results']}"
+        speedup = f"{row['speedup']}x" if row["speedup"] else "-"
+        print(f"  {row['query']:<38} {cte_ms:>10} {after['ms']:>10.1f} {counts:>16} {speedup:>8}")
+    print("\n  results = CTE rows / cache rows (CTEs may list a node once per distinct path length)")
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="GraphStorage recursive CTEs vs. CSR adjacency cache")
+    parser.add_argument("--nodes", type=int, default=20000)
+    parser.add_argument("--edges-per-node", type=int, default=3)
+    parser.add_argument("--max-hops", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--cte-timeout", type=float, default=30.0,
+                        help="Interrupt CTE queries after this many seconds")
+    parser.add_argument("--json", dest="json_path", help="Write results to this JSON file")
+    return parser.parse_args(argv)
+
+
+async def main(argv=None) -> int:
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        result = await run_benchmark(args, os.path.join(tmpdir, "graph.db"))
+    _print_result(result, args.cte_timeout)
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(result, indent=2))
+        print(f"\nResults written to {args.json_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+End-to-end hybrid sync benchmark against the local Cloudflare emulator.
+
+Unlike benchmark_hybrid_sync.py and tests/performance/test_hybrid_live.py this
+needs no Cloudflare credentials: HybridMemoryStorage talks to an in-process
+CloudflareEmulator (see cloudflare_emulator.py) with configurable latency and
+fault injection, so results are reproducible in CI and on a laptop.
+
+Measured per corpus size:
+- store throughput: hybrid.store() calls per second (local write + enqueue)
+- queue drain: time for the background sync queue to push those stores to Cloudflare
+- initial pull: memories per second pulled from Cloudflare into an empty local DB
+- drift check: wall time and API requests for one drift-detection pass after
+  a small fraction of remote memories changed
+
+Usage:
+    python scripts/benchmarks/benchmark_hybrid_emulator.py
+    python scripts/benchmarks/benchmark_hybrid_emulator.py --sizes 10000 --latency 0.02 --rate-limit-rate 0.01
+    python scripts/benchmarks/benchmark_hybrid_emulator.py --json results.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from cloudflare_emulator import CloudflareEmulator, FaultConfig  # noqa: E402
+from mcp_memory_service.models.memory import Memory  # noqa: E402
+from mcp_memory_service.storage import hybrid as hybrid_module  # noqa: E402
+from mcp_memory_service.storage.hybrid import HybridMemoryStorage  # noqa: E402
+from mcp_memory_service.utils.hashing import generate_content_hash  # noqa: E402
+
+
+def make_memories(count: int, start: int = 0, prefix: str = "benchmark") -> List[Memory]:
+    """Generate distinct memories with increasing created_at timestamps."""
+    memories = []
+    base = 1_700_000_000.0
+    for i in range(start, start + count):
+        content = f"{prefix} memory {i}: notes about component {i % 97} and topic {i % 13}"
+        memories.append(Memory(
+            content=content,
+            content_hash=generate_content_hash(content),
+            tags=[f"topic-{i % 13}", prefix],
+            memory_type="note",
+            created_at=base + i,
+            updated_at=base + i,
+        ))
+    return memories
+
+
+def _cloudflare_config(args: argparse.Namespace) -> Dict[str, Any]:
+    return {
+        'api_token': 'emulator',
+        'account_id': 'emulator-account',
+        'vectorize_index': 'emulator-index',
+        'd1_database_id': 'emulator-d1',
+        'embedding_model': args.embedding_model,
+        'max_retries': 5,
+        'base_delay': 0.05,
+        'requests_per_second': args.rps,
+        'rate_limit_burst': args.burst,
+        'max_concurrency': args.concurrency,
+    }
+
+
+async def _open_hybrid(db_path: str, emulator: CloudflareEmulator, args: argparse.Namespace) -> HybridMemoryStorage:
+    storage = HybridMemoryStorage(
+        sqlite_db_path=db_path,
+        embedding_model=args.local_model,
+        cloudflare_config=_cloudflare_config(args),
+        sync_interval=3600,
+        batch_size=args.batch_size,
+    )
+    emulator.attach(storage.secondary)
+    await storage.initialize()
+    return storage
+
+
+async def run_benchmark(size: int, args: argparse.Namespace) -> Dict[str, Any]:
+    """Run all phases for one corpus size and return the measurements."""
+    # The benchmark drives the initial pull explicitly
+    hybrid_module.HYBRID_SYNC_ON_STARTUP = False
+
+    faults = FaultConfig(
+        latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate, retry_after=0.05, seed=42,
+    )
+    emulator = CloudflareEmulator(dimensions=args.dimensions, faults=faults)
+    result: Dict[str, Any] = {"size": size}
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        # Phase 1+2: store throughput and queue drain
+        writer = await _open_hybrid(os.path.join(tmpdir, "writer.db"), emulator, args)
+        try:
+            store_count = min(size, args.store_count)
+            stored = make_memories(store_count, prefix="stored")
+            emulator.reset_stats()
+            started = time.perf_counter()
+            for memory in stored:
+                await writer.store(memory)
+            store_time = time.perf_counter() - started
+
+            started = time.perf_counter()
+            drain = await writer.wait_for_sync_completion(timeout=args.drain_timeout)
+            drain_time = time.perf_counter() - started
+            result["store"] = {
+                "memories": store_count,
+                "seconds": round(store_time, 3),
+                "memories_per_second": round(store_count / store_time, 1) if store_time else None,
+            }
+            result["queue_drain"] = {
+                "seconds": round(drain_time, 3),
+                "success_count": drain.get("success_count"),
+                "failure_count": drain.get("failure_count"),
+                "api_requests": emulator.stats()["total_requests"],
+            }
+        finally:
+            await writer.close()
+
+        # Seed the rest of the corpus directly in the emulator
+        emulator.seed_memories(make_memories(size - store_count, start=store_count, prefix="seeded"))
+
+        # Phase 3: initial pull into an empty local database
+        reader = await _open_hybrid(os.path.join(tmpdir, "reader.db"), emulator, args)
+        try:
+            emulator.reset_stats()
+            started = time.perf_counter()
+            pull = await reader._sync_memories_from_cloudflare(sync_type="initial", broadcast_sse=False)
+            pull_time = time.perf_counter() - started
+            result["initial_pull"] = {
+                "memories": pull["memories_synced"],
+                "seconds": round(pull_time, 3),
+                "memories_per_second": round(pull["memories_synced"] / pull_time, 1) if pull_time else None,
+                "api_requests": emulator.stats()["total_requests"],
+            }
+
+            # Phase 4: drift check after a small fraction of remote memories changed
+            drift_count = max(1, int(size * args.drift_fraction))
+            emulator.db.execute(
+                "UPDATE memories SET updated_at = updated_at + 3600 WHERE id IN "
+                "(SELECT id FROM memories ORDER BY id LIMIT ?)", (drift_count,)
+            )
+            emulator.db.commit()
+            service = reader.sync_service
+            service.drift_check_enabled = True
+            service.drift_check_interval = service.drift_check_interval or 3600
+            emulator.reset_stats()
+            started = time.perf_counter()
+            drift = await service._detect_and_sync_drift()
+            drift_time = time.perf_counter() - started
+            result["drift_check"] = {
+                "changed": drift_count,
+                "seconds": round(drift_time, 3),
+                "synced": drift.get("synced"),
+                "api_requests": emulator.stats()["total_requests"],
+                "digest_round_trips": service.sync_stats.get("last_digest_round_trips"),
+            }
+        finally:
+            await reader.close()
+
+    result["emulator"] = emulator.stats()
+    return result
+
+
+def _print_result(result: Dict[str, Any]) -> None:
+    print(f"\n=== {result['size']:,} memories ===")
+    store, drain = result["store"], result["queue_drain"]
+    pull, drift = result["initial_pull"], result["drift_check"]
+    print(f"  store:        {store['memories']:>8,} in {store['seconds']:>8.2f}s  ({store['memories_per_second']} /s)")
+    print(f"  queue drain:  {drain['success_count'] or 0:>8,} in {drain['seconds']:>8.2f}s  ({drain['api_requests']} API requests)")
+    print(f"  initial pull: {pull['memories']:>8,} in {pull['seconds']:>8.2f}s  ({pull['memories_per_second']} /s, {pull['api_requests']} API requests)")
+    print(f"  drift check:  {drift['changed']:>8,} changed, {drift['seconds']:.2f}s, "
+          f"{drift['api_requests']} API requests, {drift['digest_round_trips']} digest round trips")
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Hybrid sync benchmark against the local Cloudflare emulator")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--store-count", type=int, default=1000,
+                        help="Memories stored through hybrid.store() per size (rest is seeded remotely)")
+    parser.add_argument("--drift-fraction", type=float, default=0.001)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.0, help="Emulated API latency (seconds)")
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--rps", type=float, default=1000.0, help="Client-side rate limit")
+    parser.add_argument("--burst", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--dimensions", type=int, default=384, help="Emulated Vectorize dimensions")
+    parser.add_argument("--local-model", default="all-MiniLM-L6-v2")
+    parser.add_argument("--embedding-model", default="@cf/sentence-transformers/all-MiniLM-L6-v2",
+                        help="Workers AI model name reported by the emulated backend")
+    parser.add_argument("--drain-timeout", type=int, default=3600)
+    parser.add_argument("--json", dest="json_path", help="Write results to this JSON file")
+    return parser.parse_args(argv)
+
+
+async def main(argv=None) -> int:
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+    results = []
+    for size in args.sizes:
+        result = await run_benchmark(size, args)
+        _print_result(result)
+        results.append(result)
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(results, indent=2))
+        print(f"\nResults written to {args.json_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Search throughput of MilvusMemoryStorage while store_batch() runs concurrently.
+
+Measures retrieve() QPS from N concurrent searchers in two phases:
+- idle: searches only
+- loaded: the same searchers while a writer keeps calling store_batch()
+
+On Milvus Lite every RPC shares one write lock, so the loaded phase shows how
+much searches queue behind inserts. Pointing --uri at a remote Milvus server
+(or Zilliz Cloud) exercises the read client pool instead; compare the two runs
+and vary --read-pool-size to see the effect of concurrent reads.
+
+Usage:
+    python scripts/benchmarks/benchmark_milvus_concurrency.py
+    python scripts/benchmarks/benchmark_milvus_concurrency.py --corpus 5000 --searchers 16
+    python scripts/benchmarks/benchmark_milvus_concurrency.py --uri http://localhost:19530 --read-pool-size 8
+    python scripts/benchmarks/benchmark_milvus_concurrency.py --json results.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from mcp_memory_service.models.memory import Memory  # noqa: E402
+from mcp_memory_service.storage.milvus import MilvusMemoryStorage  # noqa: E402
+from mcp_memory_service.utils.hashing import generate_content_hash  # noqa: E402
+
+QUERIES = [
+    "database connection pooling",
+    "deployment checklist for the api gateway",
+    "meeting notes about the search ranking change",
+    "python asyncio event loop blocking",
+    "vector index rebuild schedule",
+]
+
+
+def make_memories(count: int, start: int = 0, prefix: str = "bench") -> List[Memory]:
+    """Generate distinct memories with a handful of recurring topics."""
+    memories = []
+    for i in range(start, start + count):
+        content = f"{prefix} memory {i}: {QUERIES[i % len(QUERIES)]} (variant {i % 31})"
+        memories.append(Memory(
+            content=content,
+            content_hash=generate_content_hash(content),
+            tags=[f"topic-{i % len(QUERIES)}", prefix],
+            memory_type="note",
+        ))
+    return memories
+
+
+async def _searcher(storage: MilvusMemoryStorage, stop: asyncio.Event, latencies: List[float], seed: int) -> None:
+    i = seed
+    while not stop.is_set():
+        started = time.perf_counter()
+        await storage.retrieve(QUERIES[i % len(QUERIES)], n_results=5)
+        latencies.append(time.perf_counter() - started)
+        i += 1
+
+
+async def _writer(storage: MilvusMemoryStorage, stop: asyncio.Event, batch_size: int, counter: Dict[str, int]) -> None:
+    batch_no = 0
+    while not stop.is_set():
+        batch = make_memories(batch_size, start=batch_no * batch_size, prefix=f"load-{uuid.uuid4().hex[:6]}")
+        await storage.store_batch(batch)
+        counter["stored"] += len(batch)
+        batch_no += 1
+
+
+async def _measure(storage: MilvusMemoryStorage, args: argparse.Namespace, with_writer: bool) -> Dict[str, Any]:
+    stop = asyncio.Event()
+    latencies: List[float] = []
+    counter = {"stored": 0}
+    tasks = [asyncio.create_task(_searcher(storage, stop, latencies, seed)) for seed in range(args.searchers)]
+    if with_writer:
+        tasks.append(asyncio.create_task(_writer(storage, stop, args.batch_size, counter)))
+
+    started = time.perf_counter()
+    await asyncio.sleep(args.duration)
+    stop.set()
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - started
+
+    ordered = sorted(latencies)
+    result: Dict[str, Any] = {
+        "searches": len(latencies),
+        "qps": round(len(latencies) / elapsed, 1) if elapsed else None,
+        "p50_ms": round(statistics.median(ordered) * 1000, 2) if ordered else None,
+        "p95_ms": round(ordered[int(len(ordered) * 0.95) - 1] * 1000, 2) if len(ordered) >= 20 else None,
+    }
+    if with_writer:
+        result["memories_stored"] = counter["stored"]
+        result["stores_per_second"] = round(counter["stored"] / elapsed, 1) if elapsed else None
+    return result
+
+
+async def run_benchmark(args: argparse.Namespace, uri: Optional[str] = None) -> Dict[str, Any]:
+    """Seed a fresh collection, then measure idle and loaded search QPS."""
+    collection = f"bench_concurrency_{uuid.uuid4().hex[:8]}"
+    storage = MilvusMemoryStorage(
+        uri=uri or args.uri,
+        token=args.token,
+        collection_name=collection,
+        read_pool_size=args.read_pool_size,
+    )
+    await storage.initialize()
+    try:
+        for start in range(0, args.corpus, args.batch_size):
+            await storage.store_batch(make_memories(min(args.batch_size, args.corpus - start), start=start))
+
+        return {
+            "uri": storage.uri,
+            "lite": storage._is_lite,
+            "read_pool_size": None if storage._is_lite else storage.read_pool_size,
+            "corpus": args.corpus,
+            "searchers": args.searchers,
+            "idle": await _measure(storage, args, with_writer=False),
+            "loaded": await _measure(storage, args, with_writer=True),
+        }
+    finally:
+        try:
+            if storage.client is not None:
+                storage.client.drop_collection(collection)
+        except Exception:  # noqa: BLE001 — best-effort cleanup
+            pass
+        await storage.close()
+
+
+def _print_result(result: Dict[str, Any]) -> None:
+    mode = "Milvus Lite (single lock)" if result["lite"] else f"remote (read pool {result['read_pool_size']})"
+    print(f"\n=== {mode}: {result['corpus']:,} memories, {result['searchers']} searchers ===")
+    for phase in ("idle", "loaded"):
+        r = result[phase]
+        line = f"  {phase:<7} {r['qps']:>8} searches/s  p50 {r['p50_ms']} ms  p95 {r['p95_ms']} ms"
+        if phase == "loaded":
+            line += f"  ({r['stores_per_second']} stores/s in background)"
+        print(line)
+    idle, loaded = result["idle"]["qps"], result["loaded"]["qps"]
+    if idle and loaded:
+        print(f"  search QPS retained under write load: {loaded / idle:.0%}")
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Milvus search QPS under concurrent store_batch load")
+    parser.add_argument("--uri", help="Milvus URI (default: a temporary Milvus Lite file)")
+    parser.add_argument("--token", default=os.getenv("MCP_MILVUS_TOKEN") or None)
+    parser.add_argument("--read-pool-size", type=int, default=4, help="Read clients for remote URIs")
+    parser.add_argument("--corpus", type=int, default=2000, help="Memories seeded before measuring")
+    parser.add_argument("--searchers", type=int, default=8, help="Concurrent retrieve() loops")
+    parser.add_argument("--batch-size", type=int, default=50, help="Memories per store_batch() call")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per phase")
+    parser.add_argument("--json", dest="json_path", help="Write results to this JSON file")
+    return parser.parse_args(argv)
+
+
+async def main(argv=None) -> int:
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        result = await run_benchmark(args, uri=args.uri or os.path.join(tmpdir, "bench.db"))
+    _print_result(result)
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(result, indent=2))
+        print(f"\nResults written to {args.json_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Milvus store_batch() throughput: per-item preparation vs. the vectorized path.
+
+"before" reproduces the previous store_batch: one get_by_hash() RPC and one
+single-text embedding per memory, then one insert. "after" is the current
+store_batch(): one chunked ``id in [...]`` dedup query, one batched encode and
+size-bounded insert chunks. Both run against a fresh collection with the
+embedding LRU cleared, and report items/second.
+
+Usage:
+    python scripts/benchmarks/benchmark_milvus_store_batch.py
+    python scripts/benchmarks/benchmark_milvus_store_batch.py --sizes 100 1000 5000
+    python scripts/benchmarks/benchmark_milvus_store_batch.py --uri http://localhost:19530 --json results.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from mcp_memory_service.models.memory import Memory  # noqa: E402
+from mcp_memory_service.storage import milvus as milvus_module  # noqa: E402
+from mcp_memory_service.storage.milvus import MilvusMemoryStorage  # noqa: E402
+from mcp_memory_service.utils.hashing import generate_content_hash  # noqa: E402
+
+
+def make_memories(count: int, prefix: str) -> List[Memory]:
+    """Generate distinct memories; ``prefix`` keeps runs from sharing cache entries."""
+    memories = []
+    for i in range(count):
+        content = f"{prefix} imported note {i}: component {i % 97}, topic {i % 13}, detail {i * 7919 % 1009}"
+        memories.append(Memory(
+            content=content,
+            content_hash=generate_content_hash(content),
+            tags=[f"topic-{i % 13}", "import"],
+            memory_type="note",
+        ))
+    return memories
+
+
+async def legacy_store_batch(storage: MilvusMemoryStorage, memories: List[Memory]) -> List[Tuple[bool, str]]:
+    """The pre-vectorization store_batch: per-item dedup RPC and encode."""
+    results: List[Tuple[bool, str]] = []
+    to_insert: List[Dict[str, Any]] = []
+    for memory in memories:
+        if await storage.get_by_hash(memory.content_hash) is not None:
+            results.append((False, "Duplicate content detected (exact match)"))
+            continue
+        to_insert.append(storage._memory_to_entity(memory, storage._generate_embedding(memory.content)))
+        results.append((True, "Memory stored successfully"))
+    if to_insert:
+        await storage._call_client("insert", collection_name=storage.collection_name, data=to_insert)
+    return results
+
+
+async def _timed(storage: MilvusMemoryStorage, memories: List[Memory], legacy: bool) -> Dict[str, Any]:
+    with milvus_module._EMBEDDING_CACHE_LOCK:
+        milvus_module._EMBEDDING_CACHE.clear()
+    started = time.perf_counter()
+    if legacy:
+        results = await legacy_store_batch(storage, memories)
+    else:
+        results = await storage.store_batch(memories)
+    elapsed = time.perf_counter() - started
+    stored = sum(1 for ok, _ in results if ok)
+    return {
+        "stored": stored,
+        "seconds": round(elapsed, 3),
+        "items_per_second": round(len(memories) / elapsed, 1) if elapsed else None,
+    }
+
+
+async def run_benchmark(size: int, uri: str, args: argparse.Namespace) -> Dict[str, Any]:
+    """Measure both paths for one batch size, each on its own collection."""
+    result: Dict[str, Any] = {"size": size}
+    for label, legacy in (("before", True), ("after", False)):
+        collection = f"bench_batch_{label}_{uuid.uuid4().hex[:8]}"
+        storage = MilvusMemoryStorage(uri=uri, token=args.token, collection_name=collection)
+        await storage.initialize()
+        try:
+            result[label] = await _timed(storage, make_memories(size, prefix=collection), legacy)
+        finally:
+            try:
+                if storage.client is not None:
+                    storage.client.drop_collection(collection)
+            except Exception:  # noqa: BLE001 — best-effort cleanup
+                pass
+            await storage.close()
+    before, after = result["before"]["items_per_second"], result["after"]["items_per_second"]
+    result["speedup"] = round(after / before, 2) if before and after else None
+    return result
+
+
+def _print_result(result: Dict[str, Any]) -> None:
+    before, after = result["before"], result["after"]
+    print(f"\n=== store_batch({result['size']:,}) ===")
+    print(f"  before (per-item): {before['items_per_second']:>10} items/s  ({before['seconds']:.2f}s)")
+    print(f"  after (vectorized): {after['items_per_second']:>9} items/s  ({after['seconds']:.2f}s)")
+    print(f"  speedup: {result['speedup']}x")
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Milvus store_batch throughput before/after vectorization")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--uri", help="Milvus URI (default: a temporary Milvus Lite file)")
+    parser.add_argument("--token", default=os.getenv("MCP_MILVUS_TOKEN") or None)
+    parser.add_argument("--json", dest="json_path", help="Write results to this JSON file")
+    return parser.parse_args(argv)
+
+
+async def main(argv=None) -> int:
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+    results = []
+    with tempfile.TemporaryDirectory() as tmpdir:
+        uri = args.uri or os.path.join(tmpdir, "bench.db")
+        for size in args.sizes:
+            result = await run_benchmark(size, uri, args)
+            _print_result(result)
+            results.append(result)
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(results, indent=2))
+        print(f"\nResults written to {args.json_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Relevance scoring: per-memory loop vs. columnar NumPy scoring.
+
+Builds synthetic memories with a spread of ages, tags, memory types, quality
+scores, connection counts and last-access times, then times the relevance
+step of a consolidation run (scoring plus the metadata updates handed to
+``update_memories_batch``):
+
+- ``per-memory``: one ``_score_memory`` call per memory and the previous
+  linear ``next(...)`` lookup of each memory's score, which is quadratic, so
+  it only runs on the first ``--baseline-memories`` memories
+- ``columnar``: ``ExponentialDecayCalculator.process``, which scores all
+  memories over NumPy columns, and a hash-keyed score lookup
+
+Usage:
+    python scripts/benchmarks/benchmark_relevance_scoring.py
+    python scripts/benchmarks/benchmark_relevance_scoring.py --memories 100000
+    python scripts/benchmarks/benchmark_relevance_scoring.py --json results.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from mcp_memory_service.consolidation.base import ConsolidationConfig  # noqa: E402
+from mcp_memory_service.consolidation.decay import ExponentialDecayCalculator  # noqa: E402
+from mcp_memory_service.models.memory import Memory  # noqa: E402
+
+_TAGS = ["critical", "important", "note", "draft", "project", "temporary", "python", "meeting", "idea"]
+# Ontology types, so none is coerced to "observation"; retention periods
+# range from 30 days (error, observation) to 365 (decision)
+_TYPES = [None, "decision", "learning", "pattern", "error", "observation", "reference"]
+
+
+def build_inputs(count: int, seed: int) -> Tuple[List[Memory], Dict[str, int], Dict[str, datetime]]:
+    """Memories plus the connection and access maps a consolidation run passes in."""
+    rng = np.random.default_rng(seed)
+    now = time.time()
+    created = now - rng.uniform(0, 400, count) * 86400
+    memories, connections, access_patterns = [], {}, {}
+    for i in range(count):
+        metadata = {"quality_score": float(rng.uniform())} if rng.uniform() < 0.5 else {}
+        memory = Memory(
+            content=f"Memory {i}",
+            content_hash=f"bench{i:07d}",
+            tags=list(rng.choice(_TAGS, int(rng.integers(0, 4)), replace=False)),
+            memory_type=_TYPES[int(rng.integers(0, len(_TYPES)))],
+            metadata=metadata,
+            created_at=float(created[i]),
+            updated_at=float(created[i] + rng.uniform(0, 5) * 86400),
+        )
+        memories.append(memory)
+        if rng.uniform() < 0.4:
+            connections[memory.content_hash] = int(rng.integers(0, 10))
+        if rng.uniform() < 0.3:
+            access_patterns[memory.content_hash] = datetime.now() - timedelta(days=float(rng.uniform(0, 60)))
+    return memories, connections, access_patterns
+
+
+async def per_memory_baseline(calculator, memories, connections, access_patterns, reference_time) -> int:
+    """One score per call, then a linear scan per memory to find its score."""
+    scores = [
+        calculator._score_memory(memory, reference_time, connections, access_patterns)
+        for memory in memories
+    ]
+    updated = []
+    for memory in memories:
+        score = next((s for s in scores if s.memory_hash == memory.content_hash), None)
+        if score:
+            updated.append(await calculator.update_memory_relevance_metadata(memory, score))
+    return len(updated)
+
+
+async def columnar(calculator, memories, connections, access_patterns, reference_time) -> int:
+    """The consolidator's relevance step: columnar scores and a hash-keyed lookup."""
+    scores = await calculator.process(
+        memories, connections=connections, access_patterns=access_patterns, reference_time=reference_time
+    )
+    scores_by_hash = {score.memory_hash: score for score in scores}
+    calculated_at = datetime.now().isoformat()
+    updated = []
+    for memory in memories:
+        score = scores_by_hash.get(memory.content_hash)
+        if score:
+            updated.append(await calculator.update_memory_relevance_metadata(memory, score, calculated_at))
+    return len(updated)
+
+
+async def _timed(run, memories: List[Memory]) -> Dict[str, Any]:
+    wall = time.perf_counter()
+    scored = await run(memories)
+    wall = time.perf_counter() - wall
+    return {
+        "memories": scored,
+        "wall_s": round(wall, 3),
+        "memories_per_s": round(scored / wall) if wall > 0 else None,
+    }
+
+
+async def run_benchmark(args: argparse.Namespace) -> Dict[str, Any]:
+    memories, connections, access_patterns = build_inputs(args.memories, args.seed)
+    calculator = ExponentialDecayCalculator(ConsolidationConfig())
+    reference_time = datetime.now()
+
+    def mode(fn):
+        return lambda batch: fn(calculator, batch, connections, access_patterns, reference_time)
+
+    return {
+        "memories": args.memories,
+        "per-memory": await _timed(mode(per_memory_baseline), memories[:args.baseline_memories]),
+        "columnar": await _timed(mode(columnar), memories),
+    }
+
+
+def _print_result(result: Dict[str, Any]) -> None:
+    print(f"\n=== relevance step over {result['memories']:,} memories ===")
+    print(f"  {'mode':<11} {'memories':>10} {'wall s':>9} {'memories/s':>12}")
+    for mode in ("per-memory", "columnar"):
+        row = result[mode]
+        print(f"  {mode:<11} {row['memories']:>10,} {row['wall_s']:>9.3f} {row['memories_per_s'] or 0:>12,}")
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Relevance scoring: per-memory loop vs. columnar NumPy scoring")
+    parser.add_argument("--memories", type=int, default=50000)
+    parser.add_argument("--baseline-memories", type=int, default=5000,
+                        help="Memories scored by the quadratic per-memory baseline")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", dest="json_path", help="Write results to this JSON file")
+    return parser.parse_args(argv)
+
+
+async def main(argv=None) -> int:
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+    # Memory construction logs per memory; keep the output to the results
+    logging.getLogger("mcp_memory_service.models.memory").setLevel(logging.ERROR)
+    result = await run_benchmark(args)
+    _print_result(result)
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(result, indent=2))
+        print(f"\nResults written to {args.json_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
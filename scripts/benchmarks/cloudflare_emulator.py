@@ -0,0 +1,407 @@
+#!/usr/bin/env python3
+"""
+Local emulator for the Cloudflare APIs used by CloudflareStorage.
+
+Implements just enough of D1 (``/d1/database/{id}/query``), Vectorize v2
+(``upsert``/``query``/``get_by_ids``/``delete_by_ids``), Workers AI embeddings
+(``/ai/run/{model}``) and R2 objects for CloudflareStorage and hybrid sync to
+run offline. D1 is backed by an in-memory SQLite database, so the real SQL
+issued by the backend is executed (including D1's 100 bound-parameter limit).
+
+Latency, server errors and 429 rate limiting can be injected per service to
+exercise retry, back-off and sync code paths.
+
+In-process usage (no network, e.g. from tests or benchmarks)::
+
+    emulator = CloudflareEmulator(faults=FaultConfig(latency=0.02))
+    storage = CloudflareStorage(api_token="t", account_id="a",
+                                vectorize_index="v", d1_database_id="d")
+    emulator.attach(storage)
+    await storage.initialize()
+
+Standalone server (point MCP at it with CLOUDFLARE_API_BASE_URL)::
+
+    python scripts/benchmarks/cloudflare_emulator.py --port 8787 --latency 0.05
+    export CLOUDFLARE_API_BASE_URL=http://127.0.0.1:8787/client/v4
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+import sqlite3
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+import httpx
+import numpy as np
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, PlainTextResponse, Response
+from starlette.routing import Route
+
+API_PREFIX = "/client/v4/accounts/{account_id}"
+D1_MAX_BOUND_PARAMS = 100
+SERVICES = ("d1", "vectorize", "ai", "r2")
+
+
+@dataclass
+class FaultConfig:
+    """Fault injection settings applied to every emulated request."""
+    latency: float = 0.0            # seconds added to each request
+    jitter: float = 0.0             # extra uniform random latency (seconds)
+    error_rate: float = 0.0         # fraction of requests answered with HTTP 500
+    rate_limit_rate: float = 0.0    # fraction of requests answered with HTTP 429
+    quota: Optional[int] = None     # requests allowed per quota_window before 429s
+    quota_window: float = 1.0       # fixed quota window length (seconds)
+    retry_after: float = 1.0        # Retry-After for randomly injected 429s
+    services: Set[str] = field(default_factory=lambda: set(SERVICES))
+    seed: Optional[int] = None
+
+
+def _json_error(status: int, message: str, code: int = 10000, headers: Optional[Dict[str, str]] = None) -> JSONResponse:
+    return JSONResponse(
+        {"success": False, "errors": [{"code": code, "message": message}], "messages": [], "result": None},
+        status_code=status,
+        headers=headers,
+    )
+
+
+def _ok(result: Any) -> JSONResponse:
+    return JSONResponse({"success": True, "errors": [], "messages": [], "result": result})
+
+
+def _split_statements(sql: str) -> List[str]:
+    """Split a multi-statement D1 query into complete SQLite statements."""
+    statements, buffer = [], ""
+    for line in sql.splitlines(keepends=True):
+        buffer += line
+        if sqlite3.complete_statement(buffer):
+            if buffer.strip().strip(";").strip():
+                statements.append(buffer.strip())
+            buffer = ""
+    if buffer.strip():
+        statements.append(buffer.strip())
+    return statements
+
+
+class CloudflareEmulator:
+    """ASGI app emulating the Cloudflare D1, Vectorize, Workers AI and R2 APIs."""
+
+    def __init__(self, dimensions: int = 768, faults: Optional[FaultConfig] = None):
+        self.dimensions = dimensions
+        self.faults = faults or FaultConfig()
+        self._random = random.Random(self.faults.seed)
+        self.db = sqlite3.connect(":memory:", check_same_thread=False)
+        self.db.row_factory = sqlite3.Row
+        self.vectors: Dict[str, Dict[str, Any]] = {}
+        self.objects: Dict[str, bytes] = {}
+        self.requests: Counter = Counter()
+        self.responses: Counter = Counter()
+        self._window_start = time.monotonic()
+        self._window_used = 0
+
+        self.app = Starlette(routes=[
+            Route(API_PREFIX + "/d1/database/{database_id}/query", self._d1_query, methods=["POST"]),
+            Route(API_PREFIX + "/vectorize/v2/indexes/{index}", self._vectorize_info, methods=["GET"]),
+            Route(API_PREFIX + "/vectorize/v2/indexes/{index}/{operation}", self._vectorize_op, methods=["POST"]),
+            Route(API_PREFIX + "/ai/run/{model:path}", self._ai_run, methods=["POST"]),
+            Route(API_PREFIX + "/r2/buckets/{bucket}/objects", self._r2_list, methods=["GET"]),
+            Route(API_PREFIX + "/r2/buckets/{bucket}/objects/{key:path}", self._r2_object,
+                  methods=["GET", "PUT", "DELETE"]),
+        ])
+
+    # ------------------------------------------------------------------
+    # Wiring helpers
+    # ------------------------------------------------------------------
+
+    def client(self, **kwargs) -> httpx.AsyncClient:
+        """Create an httpx client that routes requests into the emulator in-process."""
+        return httpx.AsyncClient(transport=httpx.ASGITransport(app=self.app), **kwargs)
+
+    def attach(self, storage: Any) -> None:
+        """Route a CloudflareStorage instance's HTTP client through the emulator."""
+        storage.client = self.client(
+            headers={"Authorization": f"Bearer {storage.api_token}", "Content-Type": "application/json"},
+            timeout=httpx.Timeout(30.0),
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """Request counts per service and response counts per status code."""
+        return {
+            "requests": dict(self.requests),
+            "total_requests": sum(self.requests.values()),
+            "responses": {str(k): v for k, v in self.responses.items()},
+        }
+
+    def reset_stats(self) -> None:
+        self.requests.clear()
+        self.responses.clear()
+
+    def embed(self, text: str) -> List[float]:
+        """Deterministic unit-length pseudo-embedding for a text."""
+        seed = int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:8], "little")
+        vector = np.random.default_rng(seed).standard_normal(self.dimensions)
+        return (vector / np.linalg.norm(vector)).astype(np.float32).tolist()
+
+    def seed_memories(self, memories: Iterable[Any]) -> int:
+        """
+        Insert memories directly into the emulated D1/Vectorize state.
+
+        Rows match what CloudflareStorage.store() writes, so large corpora can
+        be prepared without issuing one API call per memory. The D1 schema must
+        already exist (call ``CloudflareStorage.initialize()`` first).
+        """
+        count = 0
+        now = time.time()
+        for memory in memories:
+            tags = [t for t in (memory.tags or []) if t]
+            cursor = self.db.execute(
+                """
+                INSERT OR IGNORE INTO memories (
+                    content_hash, content, memory_type, created_at, created_at_iso,
+                    updated_at, updated_at_iso, metadata_json, vector_id, content_size, r2_key, tags
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    memory.content_hash, memory.content, memory.memory_type,
+                    memory.created_at or now, memory.created_at_iso or "",
+                    memory.updated_at or now, memory.updated_at_iso or "",
+                    json.dumps(memory.metadata) if memory.metadata else None,
+                    memory.content_hash, len(memory.content.encode("utf-8")), None,
+                    ",".join(tags) or None,
+                ),
+            )
+            if not cursor.rowcount:
+                continue
+            memory_id = cursor.lastrowid
+            for tag in tags:
+                self.db.execute("INSERT OR IGNORE INTO tags (name) VALUES (?)", (tag,))
+                self.db.execute(
+                    "INSERT OR IGNORE INTO memory_tags (memory_id, tag_id) SELECT ?, id FROM tags WHERE name = ?",
+                    (memory_id, tag),
+                )
+            self.vectors[memory.content_hash] = {
+                "id": memory.content_hash,
+                "values": self.embed(memory.content),
+                "metadata": {"content_hash": memory.content_hash, "tags": ",".join(tags)},
+            }
+            count += 1
+        self.db.commit()
+        return count
+
+    # ------------------------------------------------------------------
+    # Fault injection
+    # ------------------------------------------------------------------
+
+    async def _admit(self, service: str) -> Optional[Response]:
+        self.requests[service] += 1
+        faults = self.faults
+        if service not in faults.services:
+            return None
+
+        delay = faults.latency + (self._random.uniform(0, faults.jitter) if faults.jitter else 0.0)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        if faults.quota is not None:
+            now = time.monotonic()
+            if now - self._window_start >= faults.quota_window:
+                self._window_start, self._window_used = now, 0
+            if self._window_used >= faults.quota:
+                retry_after = faults.quota_window - (now - self._window_start)
+                return self._record(_json_error(
+                    429, "Rate limited", code=971,
+                    headers={"Retry-After": f"{retry_after:.3f}", "x-ratelimit-remaining": "0"},
+                ))
+            self._window_used += 1
+
+        if faults.rate_limit_rate and self._random.random() < faults.rate_limit_rate:
+            return self._record(_json_error(
+                429, "Rate limited", code=971, headers={"Retry-After": f"{faults.retry_after:.3f}"}
+            ))
+        if faults.error_rate and self._random.random() < faults.error_rate:
+            return self._record(_json_error(500, "Injected internal error"))
+        return None
+
+    def _record(self, response: Response) -> Response:
+        self.responses[response.status_code] += 1
+        return response
+
+    # ------------------------------------------------------------------
+    # D1
+    # ------------------------------------------------------------------
+
+    async def _d1_query(self, request: Request) -> Response:
+        fault = await self._admit("d1")
+        if fault:
+            return fault
+        body = await request.json()
+        sql = body.get("sql", "")
+        params = body.get("params") or []
+        if len(params) > D1_MAX_BOUND_PARAMS:
+            return self._record(_json_error(400, "too many SQL variables", code=7500))
+
+        results = []
+        try:
+            statements = _split_statements(sql) if not params else [sql]
+            for statement in statements:
+                started = time.perf_counter()
+                cursor = self.db.execute(statement, params)
+                rows = [dict(row) for row in cursor.fetchall()]
+                results.append({
+                    "results": rows,
+                    "success": True,
+                    "meta": {
+                        "changes": max(cursor.rowcount, 0),
+                        "last_row_id": cursor.lastrowid or 0,
+                        "rows_read": len(rows),
+                        "duration": (time.perf_counter() - started) * 1000,
+                    },
+                })
+            self.db.commit()
+        except sqlite3.Error as e:
+            self.db.rollback()
+            return self._record(_json_error(400, f"D1_ERROR: {e}", code=7500))
+        return self._record(_ok(results))
+
+    # ------------------------------------------------------------------
+    # Vectorize
+    # ------------------------------------------------------------------
+
+    async def _vectorize_info(self, request: Request) -> Response:
+        fault = await self._admit("vectorize")
+        if fault:
+            return fault
+        return self._record(_ok({
+            "name": request.path_params["index"],
+            "config": {"dimensions": self.dimensions, "metric": "cosine"},
+            "vectorsCount": len(self.vectors),
+        }))
+
+    async def _vectorize_op(self, request: Request) -> Response:
+        fault = await self._admit("vectorize")
+        if fault:
+            return fault
+        operation = request.path_params["operation"]
+
+        if operation in ("upsert", "insert"):
+            count = 0
+            for line in (await request.body()).decode("utf-8").splitlines():
+                if not line.strip():
+                    continue
+                vector = json.loads(line)
+                if operation == "insert" and vector["id"] in self.vectors:
+                    continue
+                self.vectors[vector["id"]] = vector
+                count += 1
+            return self._record(_ok({"mutationId": f"m-{time.time_ns()}", "count": count}))
+
+        body = await request.json()
+        if operation == "delete_by_ids":
+            for vector_id in body.get("ids", []):
+                self.vectors.pop(vector_id, None)
+            return self._record(_ok({"mutationId": f"m-{time.time_ns()}"}))
+
+        if operation == "get_by_ids":
+            return self._record(_ok([self.vectors[v] for v in body.get("ids", []) if v in self.vectors]))
+
+        if operation == "query":
+            return self._record(_ok(self._query_vectors(body)))
+
+        return self._record(_json_error(404, f"Unknown Vectorize operation: {operation}"))
+
+    def _query_vectors(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        if not self.vectors:
+            return {"count": 0, "matches": []}
+        top_k = int(body.get("topK", 5))
+        ids = list(self.vectors)
+        matrix = np.asarray([self.vectors[i]["values"] for i in ids], dtype=np.float32)
+        query = np.asarray(body.get("vector", []), dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1) * (np.linalg.norm(query) or 1.0)
+        scores = (matrix @ query) / np.where(norms == 0, 1.0, norms)
+        order = np.argsort(-scores)[:top_k]
+        matches = []
+        for idx in order:
+            vector = self.vectors[ids[idx]]
+            match = {"id": vector["id"], "score": float(scores[idx])}
+            if body.get("returnMetadata"):
+                match["metadata"] = vector.get("metadata", {})
+            if body.get("returnValues"):
+                match["values"] = vector["values"]
+            matches.append(match)
+        return {"count": len(matches), "matches": matches}
+
+    # ------------------------------------------------------------------
+    # Workers AI
+    # ------------------------------------------------------------------
+
+    async def _ai_run(self, request: Request) -> Response:
+        fault = await self._admit("ai")
+        if fault:
+            return fault
+        body = await request.json()
+        texts = body.get("text") or []
+        if isinstance(texts, str):
+            texts = [texts]
+        data = [self.embed(text) for text in texts]
+        return self._record(_ok({"shape": [len(data), self.dimensions], "data": data}))
+
+    # ------------------------------------------------------------------
+    # R2
+    # ------------------------------------------------------------------
+
+    async def _r2_list(self, request: Request) -> Response:
+        fault = await self._admit("r2")
+        if fault:
+            return fault
+        limit = int(request.query_params.get("max-keys", 1000))
+        return self._record(_ok([{"key": key, "size": len(value)} for key, value in list(self.objects.items())[:limit]]))
+
+    async def _r2_object(self, request: Request) -> Response:
+        fault = await self._admit("r2")
+        if fault:
+            return fault
+        key = request.path_params["key"]
+        if request.method == "PUT":
+            self.objects[key] = await request.body()
+            return self._record(_ok({"key": key}))
+        if request.method == "DELETE":
+            self.objects.pop(key, None)
+            return self._record(_ok({}))
+        if key not in self.objects:
+            return self._record(_json_error(404, "The specified key does not exist.", code=10007))
+        return self._record(PlainTextResponse(self.objects[key].decode("utf-8")))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the local Cloudflare API emulator")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8787)
+    parser.add_argument("--dimensions", type=int, default=768)
+    parser.add_argument("--latency", type=float, default=0.0, help="Added latency per request (seconds)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Random extra latency (seconds)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 500")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Fraction of requests answered with 429")
+    parser.add_argument("--quota", type=int, default=None, help="Requests allowed per quota window")
+    parser.add_argument("--quota-window", type=float, default=1.0)
+    args = parser.parse_args()
+
+    import uvicorn
+
+    emulator = CloudflareEmulator(
+        dimensions=args.dimensions,
+        faults=FaultConfig(
+            latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+            rate_limit_rate=args.rate_limit_rate, quota=args.quota, quota_window=args.quota_window,
+        ),
+    )
+    print(f"Cloudflare emulator: set CLOUDFLARE_API_BASE_URL=http://{args.host}:{args.port}/client/v4")
+    uvicorn.run(emulator.app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -44,7 +44,7 @@ if DB_PATH is None:
     sys.exit(1)
 
 # Version
-VERSION = "1.0.0"
+VERSION = "1.1.0"
 
 
 def check_http_server_running() -> bool:
@@ -285,43 +285,31 @@ async def backfill_associations(
         print("DRY RUN MODE - No changes will be made")
         print("="*80 + "\n")
 
-    # Process in batches
+    # Process in batches; each batch is written in a single transaction
     for i in range(0, len(associations), batch_size):
         batch = associations[i:i + batch_size]
+        pending = []
 
         for assoc in batch:
-            source = assoc['source_hash']
-            target = assoc['target_hash']
-
-            if dry_run:
-                # Check if association already exists
-                existing = await graph_storage.get_association(source, target)
-                if existing:
-                    stats['skipped_duplicate'] += 1
-                else:
-                    stats['inserted'] += 1
+            # Check if association already exists
+            existing = await graph_storage.get_association(assoc['source_hash'], assoc['target_hash'])
+            if existing:
+                stats['skipped_duplicate'] += 1
+            elif dry_run:
+                stats['inserted'] += 1
             else:
-                # Check if already exists
-                existing = await graph_storage.get_association(source, target)
-                if existing:
-                    stats['skipped_duplicate'] += 1
-                    continue
-
-                # Insert association
-                success = await graph_storage.store_association(
-                    source_hash=source,
-                    target_hash=target,
-                    similarity=assoc['similarity'],
-                    connection_types=assoc['connection_types'],
-                    metadata=assoc['metadata'],
-                    created_at=assoc['created_at']
-                )
-
-                if success:
-                    stats['inserted'] += 1
-                else:
-                    stats['failed'] += 1
-                    print(f"❌ Failed to insert: {source[:8]} ↔ {target[:8]}")
+                pending.append(assoc)
+
+        if pending:
+            result = await graph_storage.store_associations_bulk(pending)
+            if result['failed']:
+                stats['failed'] += len(pending)
+                print(f"❌ Failed to insert batch of {len(pending)} associations")
+            else:
+                stats['inserted'] += len(pending) - result['skipped']
+                stats['failed'] += result['skipped']
+                if result['skipped']:
+                    print(f"❌ Skipped {result['skipped']} invalid associations")
 
         # Progress update
         progress = min(i + batch_size, len(associations))
@@ -18,6 +18,11 @@ from pathlib import Path
 from collections import defaultdict
 from datetime import datetime
 
+# Add src to path for the shared near-duplicate index
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from mcp_memory_service.utils.near_duplicates import NearDuplicateIndex  # noqa: E402
+
 def load_config():
     """Load configuration from Claude hooks config file."""
     config_path = Path.home() / '.claude' / 'hooks' / 'config.json'
@@ -128,7 +133,8 @@ def find_duplicates(memories_source, similarity_threshold=0.95):
     print(f"Found {len(all_memories)} total memories")
     
     # Group by content similarity
-    content_groups = defaultdict(list)
+    near_duplicate_index = NearDuplicateIndex(threshold=similarity_threshold)
+    memories_by_hash = {}
     exact_content_groups = defaultdict(list)
     
     for memory in all_memories:
@@ -156,20 +162,16 @@ def find_duplicates(memories_source, similarity_threshold=0.95):
             'content_length': len(content)
         })
         
-        # Similar content match (normalized)
-        similarity_hash = content_similarity_hash(content)
-        content_groups[similarity_hash].append({
-            'hash': content_hash,
-            'content': content,
-            'tags': tags,
-            'created_at': created_at,
-            'metadata': metadata,
-            'content_length': len(content)
-        })
+        # Similar content match (MinHash-LSH over word sets)
+        near_duplicate_index.add(content_hash, content)
+        memories_by_hash.setdefault(content_hash, exact_content_groups[exact_hash][-1])
     
     # Find actual duplicates (groups with > 1 memory)
     exact_duplicates = {k: v for k, v in exact_content_groups.items() if len(v) > 1}
-    similar_duplicates = {k: v for k, v in content_groups.items() if len(v) > 1}
+    similar_duplicates = {
+        content_similarity_hash(memories_by_hash[group[0]]['content']): [memories_by_hash[h] for h in group]
+        for group in near_duplicate_index.groups()
+    }
     
     return {
         'exact': exact_duplicates,
@@ -321,7 +323,7 @@ def main():
     parser.add_argument('--execute', action='store_true',
                         help='Actually delete the duplicates (default is dry run)')
     parser.add_argument('--similarity-threshold', type=float, default=0.95,
-                        help='Similarity threshold for duplicate detection (0.0-1.0)')
+                        help='Word-overlap threshold for similar (near-duplicate) content (0.0-1.0)')
     
     args = parser.parse_args()
     
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Rebuild the Milvus graph degree collection.
+
+MilvusGraphStorage keeps a ``{collection}_degree`` side-collection with one
+row per connected memory. get_memory_connections (used by every consolidation
+forgetting pass) reads candidate hashes from it instead of draining all
+edges. Graphs created before degree tracking have no such collection and
+keep using the slow full-edge drain until this script runs once.
+
+This script:
+1. Scans every edge in ``{collection}_graph``
+2. Drops and recreates ``{collection}_degree``
+3. Inserts one ``(memory_hash, degree)`` row per connected memory
+
+Stop the MCP/HTTP servers first. A running server only starts maintaining
+the degree collection after a restart, so edges it writes during or after
+the rebuild (before the restart) are not counted.
+
+Usage:
+    python scripts/maintenance/rebuild_milvus_degree.py
+    python scripts/maintenance/rebuild_milvus_degree.py --uri http://localhost:19530 --collection mcp_memory
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from mcp_memory_service.storage.milvus_graph import MilvusGraphStorage  # noqa: E402
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+async def rebuild(uri: str, token: str, collection: str, batch_size: int) -> int:
+    graph = MilvusGraphStorage(uri=uri, token=token, collection_name=collection)
+    await graph.initialize()
+    try:
+        return await graph.rebuild_degree_collection(batch_size=batch_size)
+    finally:
+        await graph.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Rebuild the Milvus graph degree collection")
+    parser.add_argument("--uri", default=os.getenv("MCP_MILVUS_URI"),
+                        help="Milvus URI (default: MCP_MILVUS_URI or the configured Milvus Lite file)")
+    parser.add_argument("--token", default=os.getenv("MCP_MILVUS_TOKEN") or None)
+    parser.add_argument("--collection", default=os.getenv("MCP_MILVUS_COLLECTION_NAME", "mcp_memory"),
+                        help="Base collection name (graph lives in <name>_graph)")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Degree rows per insert")
+    args = parser.parse_args()
+
+    uri = args.uri
+    if not uri:
+        from mcp_memory_service.config import BASE_DIR
+        uri = os.path.join(BASE_DIR, "milvus.db")
+
+    logger.info(f"Rebuilding degree collection for '{args.collection}_graph' at {uri}")
+    count = asyncio.run(rebuild(uri, args.token, args.collection, args.batch_size))
+    logger.info(f"✅ Degree collection rebuilt: {count} connected memories")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
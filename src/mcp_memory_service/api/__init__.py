@@ -72,10 +72,10 @@ For More Information:
 
 from .types import (
     CompactMemory, CompactSearchResult, CompactHealthInfo,
-    CompactConsolidationResult, CompactSchedulerStatus
+    CompactConsolidationResult, CompactConsolidationRun, CompactSchedulerStatus
 )
 from .operations import (
-    search, store, health, consolidate, scheduler_status,
+    search, store, health, consolidate, consolidation_runs, scheduler_status,
     delete_by_tag,
     _consolidate_async, _scheduler_status_async
 )
@@ -92,6 +92,7 @@ __all__ = [
 
     # Consolidation operations
     'consolidate',      # Trigger memory consolidation
+    'consolidation_runs',  # List checkpointed consolidation runs
     'scheduler_status', # Get consolidation scheduler status
 
     # Consolidation management (internal use by HTTP server)
@@ -103,6 +104,7 @@ __all__ = [
     'CompactSearchResult',
     'CompactHealthInfo',
     'CompactConsolidationResult',
+    'CompactConsolidationRun',
     'CompactSchedulerStatus',
 ]
 
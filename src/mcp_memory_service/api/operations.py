@@ -36,7 +36,7 @@ import time
 from typing import Optional, Union, List
 from .types import (
     CompactMemory, CompactSearchResult, CompactHealthInfo,
-    CompactConsolidationResult, CompactSchedulerStatus
+    CompactConsolidationResult, CompactConsolidationRun, CompactSchedulerStatus
 )
 from .client import get_storage_async, get_consolidator, get_scheduler
 from .sync_wrapper import sync_wrapper
@@ -270,29 +270,48 @@ async def health() -> CompactHealthInfo:
         )
 
 
-async def _consolidate_async(time_horizon: str) -> CompactConsolidationResult:
+def _require_consolidator():
+    """The global consolidator, or RuntimeError if the HTTP server has none."""
+    consolidator = get_consolidator()
+    if consolidator is None:
+        raise RuntimeError(
+            "Consolidator not available. "
+            "Consolidation requires HTTP server with MCP_CONSOLIDATION_ENABLED=true. "
+            "Start the HTTP server first."
+        )
+    return consolidator
+
+
+async def _consolidate_async(
+    time_horizon: str, run_id: Optional[str] = None, capture_profile: bool = False
+) -> CompactConsolidationResult:
     """
     Internal async implementation of consolidation.
 
     This function contains the core consolidation logic and is used by both
     the sync-wrapped API function and the FastAPI endpoint to avoid duplication.
+    With ``run_id``, that unfinished run is resumed and its own time horizon
+    is used. ``capture_profile`` records cProfile and tracemalloc captures
+    of the run alongside its per-phase profile.
     """
-    # Validate time horizon
+    # Validate time horizon (a resumed run brings its own)
     valid_horizons = ['daily', 'weekly', 'monthly', 'quarterly', 'yearly']
-    if time_horizon not in valid_horizons:
+    if run_id is None and time_horizon not in valid_horizons:
         raise ValueError(
             f"Invalid time_horizon: {time_horizon}. "
             f"Must be one of: {', '.join(valid_horizons)}"
         )
 
     # Get consolidator instance
-    consolidator = get_consolidator()
-    if consolidator is None:
-        raise RuntimeError(
-            "Consolidator not available. "
-            "Consolidation requires HTTP server with MCP_CONSOLIDATION_ENABLED=true. "
-            "Start the HTTP server first."
-        )
+    consolidator = _require_consolidator()
+
+    if run_id is not None:
+        run = await consolidator.get_run(run_id)
+        if run is None:
+            raise ValueError(f"Unknown consolidation run: {run_id}")
+        if not run.resumable:
+            raise ValueError(f"Consolidation run {run_id} already completed")
+        time_horizon = run.time_horizon
 
     try:
         # Record start time
@@ -300,7 +319,9 @@ async def _consolidate_async(time_horizon: str) -> CompactConsolidationResult:
 
         # Run consolidation
         logger.info(f"Running {_sanitize_log_value(time_horizon)} consolidation...")
-        result = await consolidator.consolidate(time_horizon)
+        result = await consolidator.consolidate(
+            time_horizon, run_id=run_id, capture_profile=capture_profile
+        )
 
         # Calculate duration
         duration = time.time() - start_time
@@ -321,7 +342,8 @@ async def _consolidate_async(time_horizon: str) -> CompactConsolidationResult:
             processed=processed,
             compressed=compressed,
             forgotten=forgotten,
-            duration=duration
+            duration=duration,
+            run_id=result.run_id
         )
 
     except Exception as e:
@@ -332,28 +354,35 @@ async def _consolidate_async(time_horizon: str) -> CompactConsolidationResult:
             processed=0,
             compressed=0,
             forgotten=0,
-            duration=0.0
+            duration=0.0,
+            run_id=run_id
         )
 
 
 @sync_wrapper
-async def consolidate(time_horizon: str = "weekly") -> CompactConsolidationResult:
+async def consolidate(time_horizon: str = "weekly", run_id: Optional[str] = None) -> CompactConsolidationResult:
     """
     Trigger memory consolidation for a specific time horizon.
 
     Token efficiency: ~40 tokens (result only)
     vs ~250 tokens for MCP consolidation result (84% reduction)
 
+    Runs are checkpointed after every phase. A run that failed or was
+    interrupted is continued from its last completed phase by the next
+    consolidation of the same horizon, or explicitly via ``run_id``.
+
     Args:
         time_horizon: Time horizon for consolidation
             ('daily' | 'weekly' | 'monthly' | 'quarterly' | 'yearly')
+        run_id: Resume this unfinished run (see consolidation_runs());
+            the run's own time horizon is used
 
     Returns:
         CompactConsolidationResult with operation metrics
 
     Raises:
         RuntimeError: If consolidation fails or consolidator not available
-        ValueError: If time_horizon is invalid
+        ValueError: If time_horizon is invalid, or run_id is unknown or completed
 
     Example:
         >>> from mcp_memory_service.api import consolidate
@@ -372,7 +401,56 @@ async def consolidate(time_horizon: str = "weekly") -> CompactConsolidationResul
         Requires HTTP server with consolidation enabled. If called when
         HTTP server is not running, will raise RuntimeError.
     """
-    return await _consolidate_async(time_horizon)
+    return await _consolidate_async(time_horizon, run_id=run_id)
+
+
+async def _consolidation_runs_async(limit: int = 10) -> List[CompactConsolidationRun]:
+    """
+    Internal async implementation of the consolidation run query.
+
+    Backs the sync-wrapped consolidation_runs(); the FastAPI endpoint
+    returns the full run summaries instead of compact rows.
+    """
+    consolidator = _require_consolidator()
+    compact = []
+    for run in await consolidator.list_runs(limit):
+        phases = list((run.window or {}).get("phases", {}))
+        compact.append(CompactConsolidationRun(
+            run_id=run.run_id,
+            horizon=run.time_horizon,
+            status=run.status,
+            attempts=run.attempts,
+            windows=run.windows_completed,
+            processed=run.totals.get("memories_processed", 0),
+            phase=phases[-1] if phases else None,
+            error=run.error,
+        ))
+    return compact
+
+
+@sync_wrapper
+async def consolidation_runs(limit: int = 10) -> List[CompactConsolidationRun]:
+    """
+    List recent checkpointed consolidation runs, newest first.
+
+    Token efficiency: ~35 tokens per run
+
+    Args:
+        limit: Maximum number of runs to return
+
+    Returns:
+        List of CompactConsolidationRun records
+
+    Raises:
+        RuntimeError: If consolidator not available
+
+    Example:
+        >>> from mcp_memory_service.api import consolidation_runs, consolidate
+        >>> failed = [r for r in consolidation_runs() if r.status == 'failed']
+        >>> if failed:
+        ...     consolidate(run_id=failed[0].run_id)
+    """
+    return await _consolidation_runs_async(limit)
 
 
 async def _scheduler_status_async() -> CompactSchedulerStatus:
@@ -140,6 +140,7 @@ class CompactConsolidationResult(NamedTuple):
         compressed: Number of memories compressed
         forgotten: Number of memories forgotten/archived
         duration: Operation duration in seconds
+        run_id: Checkpointed run the result belongs to (resume it if it failed)
 
     Example:
         >>> result = CompactConsolidationResult(
@@ -159,12 +160,51 @@ class CompactConsolidationResult(NamedTuple):
     compressed: int     # Memories compressed (~5 tokens)
     forgotten: int      # Memories forgotten (~5 tokens)
     duration: float     # Duration in seconds (~5 tokens)
+    run_id: str | None = None  # Run record id (~10 tokens)
 
     def __repr__(self) -> str:
         """Compact string representation for minimal token usage."""
         return f"Consolidation({self.status}, {self.horizon}, {self.processed} processed)"
 
 
+class CompactConsolidationRun(NamedTuple):
+    """
+    Checkpointed consolidation run record with minimal overhead.
+
+    Token Cost: ~35 tokens per run
+
+    Fields:
+        run_id: Run record id (pass to consolidate() to resume)
+        horizon: Time horizon of the run
+        status: 'running' | 'completed' | 'failed'
+        attempts: Number of times the run was started or resumed
+        windows: Memory windows fully consolidated so far
+        processed: Memories processed so far
+        phase: Last phase checkpointed in the window in progress (or None)
+        error: Error of the last failed attempt (or None)
+
+    Example:
+        >>> run = CompactConsolidationRun(
+        ...     run_id='3f2a9c...', horizon='quarterly', status='failed', attempts=1,
+        ...     windows=12, processed=12000, phase='clustering', error='disk I/O error'
+        ... )
+        >>> print(run)
+        ConsolidationRun(3f2a9c..., quarterly, failed, 12 windows)
+    """
+    run_id: str         # Run record id (~10 tokens)
+    horizon: str        # Time horizon (~5 tokens)
+    status: str         # Run status (~3 tokens)
+    attempts: int       # Attempts (~2 tokens)
+    windows: int        # Windows completed (~3 tokens)
+    processed: int      # Memories processed (~3 tokens)
+    phase: str | None   # Last checkpointed phase (~3 tokens)
+    error: str | None   # Last error (~5 tokens)
+
+    def __repr__(self) -> str:
+        """Compact string representation for minimal token usage."""
+        return f"ConsolidationRun({self.run_id}, {self.horizon}, {self.status}, {self.windows} windows)"
+
+
 class CompactSchedulerStatus(NamedTuple):
     """
     Consolidation scheduler status with minimal overhead.
@@ -417,6 +417,13 @@ if STORAGE_BACKEND == 'cloudflare' or STORAGE_BACKEND == 'hybrid':
     CLOUDFLARE_LARGE_CONTENT_THRESHOLD = int(os.getenv('CLOUDFLARE_LARGE_CONTENT_THRESHOLD', '1048576'))  # 1MB
     CLOUDFLARE_MAX_RETRIES = int(os.getenv('CLOUDFLARE_MAX_RETRIES', '3'))
     CLOUDFLARE_BASE_DELAY = float(os.getenv('CLOUDFLARE_BASE_DELAY', '1.0'))
+    # Shared rate limiter / concurrency governor for all Cloudflare API traffic.
+    # The Cloudflare API allows 1200 requests per 5 minutes per user (4 req/s).
+    CLOUDFLARE_RATE_LIMIT_RPS = float(os.getenv('CLOUDFLARE_RATE_LIMIT_RPS', '4.0'))
+    CLOUDFLARE_RATE_LIMIT_BURST = int(os.getenv('CLOUDFLARE_RATE_LIMIT_BURST', '40'))
+    CLOUDFLARE_MAX_CONCURRENCY = int(os.getenv('CLOUDFLARE_MAX_CONCURRENCY', '10'))
+    # Optional API root override (e.g. a local emulator: http://127.0.0.1:8787/client/v4)
+    CLOUDFLARE_API_BASE_URL = os.getenv('CLOUDFLARE_API_BASE_URL')
     
     # Validate required settings
     missing_vars = []
@@ -451,6 +458,10 @@ else:
     CLOUDFLARE_LARGE_CONTENT_THRESHOLD = None
     CLOUDFLARE_MAX_RETRIES = None
     CLOUDFLARE_BASE_DELAY = None
+    CLOUDFLARE_RATE_LIMIT_RPS = None
+    CLOUDFLARE_RATE_LIMIT_BURST = None
+    CLOUDFLARE_MAX_CONCURRENCY = None
+    CLOUDFLARE_API_BASE_URL = None
 
 # Hybrid backend specific configuration
 if STORAGE_BACKEND == 'hybrid':
@@ -476,9 +487,15 @@ if STORAGE_BACKEND == 'hybrid':
     HYBRID_DRIFT_CHECK_INTERVAL = safe_get_int_env('MCP_HYBRID_DRIFT_CHECK_INTERVAL', 3600, min_value=60)  # 1 hour default
     HYBRID_DRIFT_BATCH_SIZE = safe_get_int_env('MCP_HYBRID_DRIFT_BATCH_SIZE', 100, min_value=1)
 
+    # Anti-entropy via hash-range digests: compare bucketed content_hash digests
+    # and descend only into buckets that differ instead of scanning every hash
+    HYBRID_DIGEST_SYNC_ENABLED = safe_get_bool_env('MCP_HYBRID_DIGEST_SYNC_ENABLED', True)
+    HYBRID_DIGEST_LEAF_SIZE = safe_get_int_env('MCP_HYBRID_DIGEST_LEAF_SIZE', 256, min_value=16, max_value=5000)  # Rows per bucket compared directly
+
     # Initial sync behavior tuning (v7.5.4+)
     HYBRID_MAX_EMPTY_BATCHES = safe_get_int_env('MCP_HYBRID_MAX_EMPTY_BATCHES', 20, min_value=1)  # Stop after N batches without new syncs
     HYBRID_MIN_CHECK_COUNT = safe_get_int_env('MCP_HYBRID_MIN_CHECK_COUNT', 1000, min_value=1)  # Minimum memories to check before early stop
+    HYBRID_PULL_REUSE_EMBEDDINGS = safe_get_bool_env('MCP_HYBRID_PULL_REUSE_EMBEDDINGS', True)  # Reuse Vectorize embeddings when models match
 
     # Fallback behavior
     HYBRID_FALLBACK_TO_PRIMARY = safe_get_bool_env('MCP_HYBRID_FALLBACK_TO_PRIMARY', True)
@@ -524,8 +541,11 @@ else:
     HYBRID_SYNC_UPDATES = None
     HYBRID_DRIFT_CHECK_INTERVAL = None
     HYBRID_DRIFT_BATCH_SIZE = None
+    HYBRID_DIGEST_SYNC_ENABLED = None
+    HYBRID_DIGEST_LEAF_SIZE = None
     HYBRID_MAX_EMPTY_BATCHES = None
     HYBRID_MIN_CHECK_COUNT = None
+    HYBRID_PULL_REUSE_EMBEDDINGS = None
     HYBRID_FALLBACK_TO_PRIMARY = None
     HYBRID_WARN_ON_SECONDARY_FAILURE = None
 
@@ -551,6 +571,9 @@ if STORAGE_BACKEND == 'milvus':
     MILVUS_URI = os.getenv('MCP_MILVUS_URI', os.path.join(BASE_DIR, 'milvus.db'))
     MILVUS_TOKEN = os.getenv('MCP_MILVUS_TOKEN') or None
     MILVUS_COLLECTION_NAME = os.getenv('MCP_MILVUS_COLLECTION_NAME', 'mcp_memory')
+    # Number of MilvusClient instances used for concurrent reads against a
+    # remote server. Milvus Lite ignores this and serializes every call.
+    MILVUS_READ_POOL_SIZE = safe_get_int_env('MCP_MILVUS_READ_POOL_SIZE', 4, min_value=1, max_value=64)
 
     # Ensure the parent directory exists for Milvus Lite file URIs.
     if not MILVUS_URI.startswith(('http://', 'https://')):
@@ -566,6 +589,7 @@ else:
     MILVUS_URI = None
     MILVUS_TOKEN = None
     MILVUS_COLLECTION_NAME = None
+    MILVUS_READ_POOL_SIZE = None
 
 # =============================================================================
 # MCP SSE Transport Configuration
@@ -721,11 +745,17 @@ CONSOLIDATION_CONFIG = {
     'clustering_enabled': os.getenv('MCP_CLUSTERING_ENABLED', 'true').lower() == 'true',
     'min_cluster_size': int(os.getenv('MCP_CLUSTERING_MIN_SIZE', '5')),
     'clustering_algorithm': os.getenv('MCP_CLUSTERING_ALGORITHM', 'dbscan'),  # 'dbscan', 'hierarchical', 'simple'
+    'clustering_memory_budget_mb': safe_get_int_env('MCP_CLUSTERING_MEMORY_BUDGET_MB', 256, min_value=16, max_value=65536),
+    'clustering_max_neighbors': safe_get_int_env('MCP_CLUSTERING_MAX_NEIGHBORS', 64, min_value=2, max_value=4096),
+    'cluster_index_enabled': os.getenv('MCP_CLUSTER_INDEX_ENABLED', 'true').lower() == 'true',
+    'cluster_assignment_threshold': float(os.getenv('MCP_CLUSTER_ASSIGN_THRESHOLD', '0.7')),
+    'cluster_drift_threshold': float(os.getenv('MCP_CLUSTER_DRIFT_THRESHOLD', '0.2')),
     
     # Compression settings
     'compression_enabled': os.getenv('MCP_COMPRESSION_ENABLED', 'true').lower() == 'true',
     'max_summary_length': int(os.getenv('MCP_COMPRESSION_MAX_LENGTH', '500')),
     'preserve_originals': os.getenv('MCP_COMPRESSION_PRESERVE_ORIGINALS', 'true').lower() == 'true',
+    'compression_summarizer': os.getenv('MCP_COMPRESSION_SUMMARIZER', 'tfidf'),  # 'tfidf', 'concepts'
     
     # Forgetting settings
     'forgetting_enabled': os.getenv('MCP_FORGETTING_ENABLED', 'true').lower() == 'true',
@@ -735,7 +765,16 @@ CONSOLIDATION_CONFIG = {
 
     # Incremental consolidation settings
     'batch_size': int(os.getenv('MCP_CONSOLIDATION_BATCH_SIZE', '500')),
-    'incremental_mode': os.getenv('MCP_CONSOLIDATION_INCREMENTAL', 'true').lower() == 'true'
+    'incremental_mode': os.getenv('MCP_CONSOLIDATION_INCREMENTAL', 'true').lower() == 'true',
+    'consolidation_chunk_size': safe_get_int_env('MCP_CONSOLIDATION_CHUNK_SIZE', 1000, min_value=50, max_value=100000),
+    # Memories per window in full runs (0 = the whole horizon in one window)
+    'consolidation_window_size': safe_get_int_env('MCP_CONSOLIDATION_WINDOW_SIZE', 0, min_value=0, max_value=1000000),
+
+    # Worker processes for CPU-heavy phases (0 = a thread in the server process)
+    'max_workers': safe_get_int_env('MCP_CONSOLIDATION_MAX_WORKERS', 2, min_value=0, max_value=64),
+
+    # Per-phase performance profiles of recent runs kept for /api/consolidation/profiles
+    'profile_history_size': safe_get_int_env('MCP_CONSOLIDATION_PROFILE_HISTORY', 50, min_value=1, max_value=1000)
 }
 
 # Consolidation scheduling settings (for APScheduler integration)
@@ -1164,6 +1203,20 @@ TYPED_EDGES_ENABLED = os.getenv(
 ).lower() == 'true'
 logger.info(f"Typed edge inference enabled: {TYPED_EDGES_ENABLED}")
 
+# Default node-expansion budget for memory_graph "path" searches. Bounds the
+# worst-case latency of a shortest-path query on large or dense graphs.
+GRAPH_PATH_MAX_EXPANDED_NODES = safe_get_int_env('MCP_GRAPH_PATH_MAX_EXPANDED_NODES', 10000, min_value=1)
+
+# Graph centrality (PageRank + degree) is recomputed into the memory_centrality
+# side table after each consolidation run. Search can blend the resulting
+# importance score into ranking with MCP_GRAPH_IMPORTANCE_WEIGHT (0.0 = off).
+GRAPH_CENTRALITY_ENABLED = safe_get_bool_env('MCP_GRAPH_CENTRALITY_ENABLED', True)
+GRAPH_IMPORTANCE_WEIGHT = float(os.getenv('MCP_GRAPH_IMPORTANCE_WEIGHT', '0.0'))
+if not 0.0 <= GRAPH_IMPORTANCE_WEIGHT <= 1.0:
+    logger.warning(f"Invalid graph importance weight: {GRAPH_IMPORTANCE_WEIGHT}, must be 0.0-1.0. Using default 0.0")
+    GRAPH_IMPORTANCE_WEIGHT = 0.0
+logger.info(f"Graph centrality: enabled={GRAPH_CENTRALITY_ENABLED}, importance weight={GRAPH_IMPORTANCE_WEIGHT}")
+
 # =============================================================================
 # End Graph Database Configuration
 # =============================================================================
@@ -24,6 +24,7 @@ from .base import ConsolidationBase
 from .decay import ExponentialDecayCalculator
 from .associations import CreativeAssociationEngine
 from .clustering import SemanticClusteringEngine
+from .cluster_index import ClusterIndexMaintainer
 from .compression import SemanticCompressionEngine
 from .forgetting import ControlledForgettingEngine
 from .consolidator import DreamInspiredConsolidator
@@ -35,6 +36,7 @@ __all__ = [
     'ExponentialDecayCalculator',
     'CreativeAssociationEngine', 
     'SemanticClusteringEngine',
+    'ClusterIndexMaintainer',
     'SemanticCompressionEngine',
     'ControlledForgettingEngine',
     'DreamInspiredConsolidator',
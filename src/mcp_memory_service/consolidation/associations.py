@@ -16,13 +16,15 @@
 
 import random
 import numpy as np
-from typing import List, Dict, Optional, Tuple, Set
+from typing import List, Dict, Optional, Tuple, Set, Union
 from itertools import combinations
 from datetime import datetime
 from dataclasses import dataclass
 import re
 
 from .base import ConsolidationBase, ConsolidationConfig, MemoryAssociation
+from .executor import SharedMatrix, resolve_matrix
+from .vector_clustering import band_pairs, normalize_rows
 from ..models.memory import Memory
 
 @dataclass
@@ -44,6 +46,11 @@ class CreativeAssociationEngine(ConsolidationBase):
     Similar to how dreams create unexpected associations, this engine randomly
     pairs memories to discover non-obvious connections in the "sweet spot"
     of moderate similarity (0.3-0.7 range).
+    
+    Candidate pairs are drawn at random from the pairs already inside the
+    sweet spot: blocked products of the normalized embedding matrix find them,
+    so no analysis is spent on pairs that would be rejected. Memories without
+    embeddings fall back to random pairs scored by word overlap.
     """
     
     def __init__(self, config: ConsolidationConfig):
@@ -51,6 +58,7 @@ class CreativeAssociationEngine(ConsolidationBase):
         self.min_similarity = config.min_similarity
         self.max_similarity = config.max_similarity
         self.max_pairs_per_run = config.max_pairs_per_run
+        self.memory_budget_mb = getattr(config, 'clustering_memory_budget_mb', 256)
         
         # Compile regex patterns for concept extraction
         self._concept_patterns = {
@@ -71,35 +79,89 @@ class CreativeAssociationEngine(ConsolidationBase):
         # Get existing associations to avoid duplicates
         existing_associations = kwargs.get('existing_associations', set())
         
-        # Sample memory pairs for analysis
-        pairs = self._sample_memory_pairs(memories)
+        # Candidate pairs inside the sweet spot, plus text-scored fallback pairs
+        pairs = await self._band_candidate_pairs(memories, existing_associations)
+        pairs.extend(await self._fallback_pairs(
+            memories, existing_associations, self.max_pairs_per_run - len(pairs)
+        ))
         
+        concept_cache: Dict[str, Set[str]] = {}
         associations = []
-        for mem1, mem2 in pairs:
-            # Skip if association already exists
+        for mem1, mem2, similarity in pairs:
+            analysis = await self._analyze_association(mem1, mem2, similarity, concept_cache)
+            
+            if analysis.confidence_score > 0.3:  # Minimum confidence threshold
+                association = await self._create_association_memory(analysis)
+                associations.append(association)
+        
+        self.logger.info(f"Discovered {len(associations)} creative associations from {len(pairs)} pairs")
+        return associations
+    
+    async def _band_candidate_pairs(
+        self,
+        memories: List[Memory],
+        existing_associations: Set[Tuple[str, str]]
+    ) -> List[Tuple[Memory, Memory, float]]:
+        """Random pairs of embedded memories whose similarity is in the sweet spot."""
+        # A zero vector has no direction; its similarity to anything is 0.0,
+        # below the band, so it never forms a pair
+        embedded = [m for m in memories if m.embedding and any(m.embedding)]
+        if len(embedded) < 2 or self.max_pairs_per_run <= 0:
+            return []
+        
+        # Similarity is reported as (cosine + 1) / 2, so map the band back to cosine.
+        # Oversample so that dropping already-associated pairs still fills the budget.
+        with self._embedding_matrix(embedded) as matrix:
+            rows, cols, cosines = await self._offload(
+                sample_band_pairs,
+                matrix,
+                2 * self.min_similarity - 1,
+                2 * self.max_similarity - 1,
+                self.max_pairs_per_run + min(len(existing_associations), self.max_pairs_per_run),
+                self.memory_budget_mb,
+            )
+        
+        pairs = []
+        for i, j, cosine in zip(rows.tolist(), cols.tolist(), cosines.tolist()):
+            mem1, mem2 = embedded[i], embedded[j]
+            if tuple(sorted([mem1.content_hash, mem2.content_hash])) in existing_associations:
+                continue
+            pairs.append((mem1, mem2, (cosine + 1) / 2))
+            if len(pairs) >= self.max_pairs_per_run:
+                break
+        return pairs
+    
+    async def _fallback_pairs(
+        self,
+        memories: List[Memory],
+        existing_associations: Set[Tuple[str, str]],
+        max_pairs: int
+    ) -> List[Tuple[Memory, Memory, float]]:
+        """Random pairs involving a memory without embedding, scored by text similarity."""
+        if max_pairs <= 0 or all(m.embedding for m in memories):
+            return []
+        
+        pairs = []
+        for mem1, mem2 in self._sample_memory_pairs(memories, max_pairs):
+            if mem1.embedding and mem2.embedding:
+                continue
             pair_key = tuple(sorted([mem1.content_hash, mem2.content_hash]))
             if pair_key in existing_associations:
                 continue
-            
-            # Calculate semantic similarity
             similarity = await self._calculate_semantic_similarity(mem1, mem2)
-            
-            # Check if similarity is in the "sweet spot" for creative connections
             if self.min_similarity <= similarity <= self.max_similarity:
-                analysis = await self._analyze_association(mem1, mem2, similarity)
-                
-                if analysis.confidence_score > 0.3:  # Minimum confidence threshold
-                    association = await self._create_association_memory(analysis)
-                    associations.append(association)
-        
-        self.logger.info(f"Discovered {len(associations)} creative associations from {len(pairs)} pairs")
-        return associations
+                pairs.append((mem1, mem2, similarity))
+        return pairs
     
-    def _sample_memory_pairs(self, memories: List[Memory]) -> List[Tuple[Memory, Memory]]:
+    def _sample_memory_pairs(
+        self, memories: List[Memory], max_pairs: Optional[int] = None
+    ) -> List[Tuple[Memory, Memory]]:
         """Sample random pairs of memories for association discovery."""
         n = len(memories)
         total_possible = n * (n - 1) // 2
-        max_pairs = min(self.max_pairs_per_run, total_possible)
+        if max_pairs is None:
+            max_pairs = self.max_pairs_per_run
+        max_pairs = min(max_pairs, total_possible)
 
         if total_possible <= max_pairs:
             return list(combinations(memories, 2))
@@ -161,9 +223,15 @@ class CreativeAssociationEngine(ConsolidationBase):
         self, 
         mem1: Memory, 
         mem2: Memory, 
-        similarity: float
+        similarity: float,
+        concept_cache: Optional[Dict[str, Set[str]]] = None
     ) -> AssociationAnalysis:
-        """Analyze why two memories might be associated."""
+        """
+        Analyze why two memories might be associated.
+        
+        ``concept_cache`` (content hash -> concepts) is filled as memories are
+        seen, so concepts are extracted once per memory across many pairs.
+        """
         connection_reasons = []
         shared_concepts = []
         tag_overlap = []
@@ -182,8 +250,8 @@ class CreativeAssociationEngine(ConsolidationBase):
             connection_reasons.append("temporal_proximity")
         
         # Extract and compare concepts
-        concepts1 = self._extract_concepts(mem1.content)
-        concepts2 = self._extract_concepts(mem2.content)
+        concepts1 = self._cached_concepts(mem1, concept_cache)
+        concepts2 = self._cached_concepts(mem2, concept_cache)
         shared_concepts = list(concepts1.intersection(concepts2))
         if shared_concepts:
             connection_reasons.append("shared_concepts")
@@ -211,6 +279,15 @@ class CreativeAssociationEngine(ConsolidationBase):
             confidence_score=confidence_score
         )
     
+    def _cached_concepts(self, memory: Memory, concept_cache: Optional[Dict[str, Set[str]]]) -> Set[str]:
+        """Concepts of a memory, extracted at most once per cache."""
+        if concept_cache is None:
+            return self._extract_concepts(memory.content)
+        concepts = concept_cache.get(memory.content_hash)
+        if concepts is None:
+            concepts = concept_cache[memory.content_hash] = self._extract_concepts(memory.content)
+        return concepts
+    
     def _extract_concepts(self, text: str) -> Set[str]:
         """Extract key concepts from text using various patterns."""
         concepts = set()
@@ -363,4 +440,15 @@ class CreativeAssociationEngine(ConsolidationBase):
                 groups[conn_type] = []
             groups[conn_type].append(assoc)
         
-        return groups
\ No newline at end of file
+        return groups
+
+
+def sample_band_pairs(
+    matrix: Union[np.ndarray, SharedMatrix],
+    low: float,
+    high: float,
+    limit: int,
+    memory_budget_mb: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Pairs of embedding rows with cosine in ``[low, high]``; runs in consolidation workers."""
+    return band_pairs(normalize_rows(resolve_matrix(matrix)), low, high, limit, memory_budget_mb)
@@ -15,11 +15,15 @@
 """Base classes and interfaces for memory consolidation components."""
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Dict, Any, Optional, Union
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 import logging
 
+import numpy as np
+
+from .executor import ConsolidationExecutor, SharedMatrix, strip_embeddings
 from ..models.memory import Memory
 
 logger = logging.getLogger(__name__)
@@ -54,12 +58,18 @@ class ConsolidationConfig:
     # Clustering settings
     clustering_enabled: bool = True
     min_cluster_size: int = 5
-    clustering_algorithm: str = 'dbscan'  # 'dbscan', 'hierarchical'
+    clustering_algorithm: str = 'dbscan'  # 'dbscan', 'hierarchical', 'simple'
+    clustering_memory_budget_mb: int = 256  # Working-set budget for the neighbour graph
+    clustering_max_neighbors: int = 64  # Strongest neighbours kept per memory
+    cluster_index_enabled: bool = True  # Keep a persistent centroid index updated incrementally
+    cluster_assignment_threshold: float = 0.7  # Min similarity to join an indexed cluster
+    cluster_drift_threshold: float = 0.2  # Drift that triggers a full re-cluster of the index
     
     # Compression settings
     compression_enabled: bool = True
     max_summary_length: int = 500
     preserve_originals: bool = True
+    compression_summarizer: str = 'tfidf'  # 'tfidf' (batched centroid sentences) or 'concepts' (key-concept coverage)
     
     # Forgetting settings
     forgetting_enabled: bool = True
@@ -70,6 +80,12 @@ class ConsolidationConfig:
     # Incremental consolidation settings
     batch_size: int = 500  # Memories to process per consolidation run
     incremental_mode: bool = True  # Enable oldest-first batch processing
+    consolidation_chunk_size: int = 1000  # Memories per chunk read from storage while streaming
+    consolidation_window_size: int = 0  # Memories per window in full (non-incremental) runs; 0 = whole horizon
+
+    # Execution settings
+    max_workers: int = 0  # Worker processes for CPU-heavy phases (0 = one thread in this process)
+    profile_history_size: int = 50  # Per-phase run profiles kept by the health monitor
 
 @dataclass
 class ConsolidationReport:
@@ -84,6 +100,7 @@ class ConsolidationReport:
     memories_archived: int = 0
     errors: List[str] = field(default_factory=list)
     performance_metrics: Dict[str, Any] = field(default_factory=dict)
+    run_id: Optional[str] = None  # Checkpointed run this report belongs to
 
 @dataclass
 class MemoryAssociation:
@@ -112,12 +129,36 @@ class ConsolidationBase(ABC):
     def __init__(self, config: ConsolidationConfig):
         self.config = config
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        # Set by the consolidator; without one, compute runs inline
+        self.executor: Optional[ConsolidationExecutor] = None
     
     @abstractmethod
     async def process(self, memories: List[Memory], *args, **kwargs) -> Any:
         """Process the given memories and return results."""
         pass
     
+    async def _offload(self, fn: Callable, *args) -> Any:
+        """Run a pure compute function on the executor (inline without one)."""
+        if self.executor is None:
+            return fn(*args)
+        return await self.executor.run(fn, *args)
+    
+    def _portable(self, memories: List[Memory]) -> List[Memory]:
+        """Memories as sent to compute workers: embeddings stay behind when pickled."""
+        if self.executor is None or not self.executor.uses_processes:
+            return memories
+        return strip_embeddings(memories)
+    
+    @contextmanager
+    def _embedding_matrix(self, memories: List[Memory]) -> Iterator[Union[np.ndarray, SharedMatrix]]:
+        """float32 embedding matrix of ``memories``, shared with workers while in use."""
+        embeddings = np.array([m.embedding for m in memories], dtype=np.float32)
+        if self.executor is None:
+            yield embeddings
+            return
+        with self.executor.share(embeddings) as matrix:
+            yield matrix
+    
     def _validate_memories(self, memories: List[Memory]) -> bool:
         """Validate that memories list is valid for processing."""
         if not memories:
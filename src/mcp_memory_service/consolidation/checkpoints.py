@@ -0,0 +1,249 @@
+# Copyright 2024 Heinrich Krupp
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Persistent run records for resumable consolidation.
+
+A consolidation run walks its memories window by window, and each window
+through the relevance, clustering, associations, compression and forgetting
+phases. :class:`ConsolidationRun` records where a run is: the windows already
+finished (as a cursor into the consolidation order), running totals, and a
+checkpoint of the window in progress with the hash of its input set, the
+outputs each completed phase wrote and the state later phases need (relevance
+scores, clusters). After a restart or a failed phase the run continues from
+the last completed phase instead of recomputing everything.
+
+Records live in the storage metadata table (like the hybrid pull checkpoint).
+Backends without one keep records in process memory only, so runs can still
+be resumed after a failed phase but not after a restart.
+"""
+
+import hashlib
+import json
+import logging
+import uuid
+from dataclasses import asdict, dataclass, field, fields
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from .base import MemoryCluster
+from .decay import RelevanceScore
+from ..models.memory import Memory
+
+logger = logging.getLogger(__name__)
+
+RUN_KEY_PREFIX = 'consolidation_run:'
+RUN_INDEX_KEY = 'consolidation_runs'
+MAX_RUN_HISTORY = 20
+
+# Per-window phases in execution order; 'timestamps' marks incremental batches consolidated
+WINDOW_PHASES = ('relevance', 'clustering', 'associations', 'compression', 'forgetting', 'timestamps')
+
+
+def input_set_hash(memories: Iterable[Memory]) -> str:
+    """Order-independent hash of the content hashes in a window."""
+    digest = hashlib.sha256()
+    for content_hash in sorted(memory.content_hash for memory in memories):
+        digest.update(content_hash.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def _json_default(value: Any) -> Any:
+    """Encode the NumPy and datetime values found in phase state."""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dump_relevance_scores(scores: List[RelevanceScore]) -> List[Dict[str, Any]]:
+    """Relevance scores as JSON-ready dicts for a checkpoint."""
+    return [asdict(score) for score in scores]
+
+
+def load_relevance_scores(data: List[Dict[str, Any]]) -> List[RelevanceScore]:
+    """Rebuild relevance scores saved by :func:`dump_relevance_scores`."""
+    return [RelevanceScore(**item) for item in data]
+
+
+def dump_clusters(clusters: List[MemoryCluster]) -> List[Dict[str, Any]]:
+    """Clusters as JSON-ready dicts for a checkpoint."""
+    return [
+        {**asdict(cluster), 'created_at': cluster.created_at.isoformat()}
+        for cluster in clusters
+    ]
+
+
+def load_clusters(data: List[Dict[str, Any]]) -> List[MemoryCluster]:
+    """Rebuild clusters saved by :func:`dump_clusters`."""
+    clusters = []
+    for item in data:
+        item = dict(item)
+        item['created_at'] = datetime.fromisoformat(item['created_at'])
+        clusters.append(MemoryCluster(**item))
+    return clusters
+
+
+@dataclass
+class ConsolidationRun:
+    """Durable state of one consolidation run."""
+    run_id: str
+    time_horizon: str
+    reference_time: float  # Run start (Unix time); horizon cutoffs derive from it on every attempt
+    started_at: str
+    updated_at: str
+    status: str = 'running'  # running | completed | failed
+    finished_at: Optional[str] = None
+    attempts: int = 1
+    error: Optional[str] = None
+    windows_completed: int = 0
+    streamed: bool = False  # Every window finished; only run-level steps remain
+    # Consolidation order key of the last finished window, and the hashes
+    # sharing that key (ties are broken by hash on resume)
+    cursor_key: Optional[float] = None
+    cursor_hashes: List[str] = field(default_factory=list)
+    totals: Dict[str, int] = field(default_factory=dict)
+    # Checkpoint of the window in progress: index, input_hash, phases, state
+    window: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def start(cls, time_horizon: str, reference_time: float) -> 'ConsolidationRun':
+        """Create the record for a new run."""
+        now = datetime.now().isoformat()
+        return cls(
+            run_id=uuid.uuid4().hex,
+            time_horizon=time_horizon,
+            reference_time=reference_time,
+            started_at=now,
+            updated_at=now,
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ConsolidationRun':
+        """Load a record, ignoring keys written by other versions."""
+        known = {f.name for f in fields(cls)}
+        return cls(**{key: value for key, value in data.items() if key in known})
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @property
+    def resumable(self) -> bool:
+        return self.status != 'completed'
+
+    def summary(self) -> Dict[str, Any]:
+        """Record without phase state, for status queries."""
+        data = self.to_dict()
+        window = data.pop('window')
+        data.pop('cursor_hashes')
+        data['current_window'] = None if window is None else {
+            'index': window['index'],
+            'input_hash': window['input_hash'],
+            'phases': window['phases'],
+        }
+        return data
+
+
+class ConsolidationRunStore:
+    """Loads and saves :class:`ConsolidationRun` records for a storage backend."""
+
+    def __init__(self, storage: Any):
+        # Hybrid storage keeps its metadata table in the SQLite primary
+        self._backend = None
+        for candidate in (storage, getattr(storage, 'primary', None)):
+            if candidate is not None and hasattr(type(candidate), 'set_metadata_value'):
+                self._backend = candidate
+                break
+        self._local: Dict[str, str] = {}
+
+    @property
+    def persistent(self) -> bool:
+        """Whether records survive a restart."""
+        return self._backend is not None
+
+    async def _get(self, key: str) -> Optional[str]:
+        if self._backend is not None:
+            try:
+                return await self._backend.get_metadata_value(key)
+            except Exception as e:
+                logger.warning(f"Failed to read consolidation run state: {e}")
+        return self._local.get(key)
+
+    async def _set(self, key: str, value: Optional[str]) -> None:
+        if value is None:
+            self._local.pop(key, None)
+        else:
+            self._local[key] = value
+        if self._backend is not None:
+            try:
+                await self._backend.set_metadata_value(key, value)
+            except Exception as e:
+                logger.warning(f"Failed to save consolidation run state: {e}")
+
+    async def _run_ids(self) -> List[str]:
+        """Known run ids, oldest first."""
+        value = await self._get(RUN_INDEX_KEY)
+        try:
+            return json.loads(value) if value else []
+        except ValueError:
+            logger.warning("Ignoring unreadable consolidation run index")
+            return []
+
+    async def save(self, run: ConsolidationRun) -> None:
+        """Write ``run`` and keep it in the bounded run history."""
+        run.updated_at = datetime.now().isoformat()
+        await self._set(RUN_KEY_PREFIX + run.run_id, json.dumps(run.to_dict(), default=_json_default))
+
+        run_ids = await self._run_ids()
+        if run.run_id in run_ids:
+            return
+        run_ids.append(run.run_id)
+        for expired in run_ids[:-MAX_RUN_HISTORY]:
+            await self._set(RUN_KEY_PREFIX + expired, None)
+        await self._set(RUN_INDEX_KEY, json.dumps(run_ids[-MAX_RUN_HISTORY:]))
+
+    async def load(self, run_id: str) -> Optional[ConsolidationRun]:
+        """The run with ``run_id``, or None if unknown."""
+        value = await self._get(RUN_KEY_PREFIX + run_id)
+        if not value:
+            return None
+        try:
+            return ConsolidationRun.from_dict(json.loads(value))
+        except (ValueError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable consolidation run {run_id}: {e}")
+            return None
+
+    async def list_runs(self, limit: int = MAX_RUN_HISTORY) -> List[ConsolidationRun]:
+        """Recent runs, newest first."""
+        runs = []
+        for run_id in reversed(await self._run_ids()):
+            if len(runs) >= limit:
+                break
+            run = await self.load(run_id)
+            if run is not None:
+                runs.append(run)
+        return runs
+
+    async def latest_unfinished(self, time_horizon: str) -> Optional[ConsolidationRun]:
+        """The newest run for ``time_horizon``, if it did not complete."""
+        for run in await self.list_runs():
+            if run.time_horizon == time_horizon:
+                return run if run.resumable else None
+        return None
@@ -0,0 +1,384 @@
+# Copyright 2024 Heinrich Krupp
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Persistent cluster index, maintained incrementally.
+
+The clustering phase groups each window from scratch, and only cluster
+summaries survive as compressed memories. The cluster index keeps the
+clusters themselves in storage side tables: centroid, member count, radius
+and accumulated centroid shift per cluster, plus the cluster of every
+memory. Each consolidation run (daily included) folds the memories not yet
+indexed into it: one matrix product against the centroids finds each
+memory's nearest cluster, running means move the centroids, and only
+outliers below ``cluster_assignment_threshold`` open new clusters. Upkeep
+therefore scales with the new memories, not with the corpus.
+
+Two drift metrics decide when the whole index is re-clustered instead:
+``outlier_share``, the share of indexed memories that opened clusters since
+the last full re-cluster, and ``centroid_shift``, the member-weighted mean
+cosine distance the centroids moved since then. Either one above
+``cluster_drift_threshold`` triggers a full re-cluster with
+``compute_clusters``, whose noise points are then folded in the same way.
+
+Searches use the index as a coarse filter (``cluster_probe`` in
+``search_memories``).
+"""
+
+import json
+import logging
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+
+from .base import ConsolidationConfig
+from .clustering import compute_clusters
+from .executor import ConsolidationExecutor, SharedMatrix, resolve_matrix
+from .profiling import MeteredStorage, unwrap_storage
+from .vector_clustering import cluster_statistics, leader_clusters, nearest_centroids, normalize_rows
+
+logger = logging.getLogger(__name__)
+
+CLUSTER_INDEX_STATE_KEY = 'cluster_index_state'
+
+
+class IndexArrays(NamedTuple):
+    """Per-cluster arrays of the index, one row per cluster."""
+    centroids: np.ndarray  # float32 (k, d), mean of the member embeddings
+    counts: np.ndarray     # int64, members
+    radii: np.ndarray      # float32, largest cosine distance of a member when it joined
+    shifts: np.ndarray     # float32, cosine distance the centroid moved since the last full re-cluster
+
+    @classmethod
+    def empty(cls, dimension: int) -> 'IndexArrays':
+        return cls(
+            np.zeros((0, dimension), dtype=np.float32), np.zeros(0, dtype=np.int64),
+            np.zeros(0, dtype=np.float32), np.zeros(0, dtype=np.float32),
+        )
+
+
+class IndexUpdate(NamedTuple):
+    """Result of folding memories into the index (or rebuilding it)."""
+    arrays: IndexArrays
+    labels: np.ndarray        # cluster row per input memory
+    similarities: np.ndarray  # cosine similarity of each memory to its centroid
+    changed: np.ndarray       # bool per cluster row: existing rows that moved, and new rows
+    outliers: int             # memories that opened new clusters
+
+
+def fold_into_index(
+    matrix: Union[np.ndarray, SharedMatrix], arrays: IndexArrays, threshold: float
+) -> IndexUpdate:
+    """Assign embedding rows to the index; runs in consolidation workers."""
+    embeddings = resolve_matrix(matrix)
+    return _fold(normalize_rows(embeddings), embeddings, arrays, threshold)
+
+
+def rebuild_index(
+    matrix: Union[np.ndarray, SharedMatrix],
+    algorithm: str,
+    min_cluster_size: int,
+    max_neighbors: int,
+    memory_budget_mb: float,
+    threshold: float,
+) -> IndexUpdate:
+    """Re-cluster every embedding row into a fresh index; runs in consolidation workers."""
+    embeddings = resolve_matrix(matrix)
+    unit = normalize_rows(embeddings)
+    statistics, _ = compute_clusters(embeddings, algorithm, min_cluster_size, max_neighbors, memory_budget_mb)
+
+    labels = np.full(len(embeddings), -1, dtype=np.int64)
+    similarities = np.zeros(len(embeddings), dtype=np.float32)
+    arrays = IndexArrays.empty(embeddings.shape[1])
+    if statistics:
+        radii = []
+        for row, (members, centroid, _) in enumerate(statistics):
+            member_sims = unit[members] @ normalize_rows(centroid[None, :])[0]
+            labels[members] = row
+            similarities[members] = member_sims
+            radii.append(1.0 - float(member_sims.min()))
+        arrays = IndexArrays(
+            np.array([centroid for _, centroid, _ in statistics], dtype=np.float32),
+            np.array([len(members) for members, _, _ in statistics], dtype=np.int64),
+            np.array(radii, dtype=np.float32),
+            np.zeros(len(statistics), dtype=np.float32),
+        )
+
+    # Noise points join their nearest cluster or open their own
+    noise = np.flatnonzero(labels < 0)
+    update = _fold(unit[noise], embeddings[noise], arrays, threshold)
+    labels[noise] = update.labels
+    similarities[noise] = update.similarities
+    return IndexUpdate(
+        update.arrays, labels, similarities,
+        np.ones(len(update.arrays.counts), dtype=bool), update.outliers,
+    )
+
+
+def _fold(unit: np.ndarray, embeddings: np.ndarray, arrays: IndexArrays, threshold: float) -> IndexUpdate:
+    centroids, counts, radii, shifts = (array.copy() for array in arrays)
+    known = len(counts)
+    labels, similarities = nearest_centroids(unit, centroids, threshold)
+    changed = np.zeros(known, dtype=bool)
+
+    # Members move their cluster's centroid as a running mean
+    assigned = np.flatnonzero(labels >= 0)
+    if len(assigned):
+        rows = labels[assigned]
+        added = np.bincount(rows, minlength=known)
+        sums = np.zeros(centroids.shape, dtype=np.float64)
+        np.add.at(sums, rows, embeddings[assigned])
+        changed = added > 0
+        previous = centroids[changed]
+        total = counts[changed] + added[changed]
+        centroids[changed] = (previous * counts[changed, None] + sums[changed]) / total[:, None]
+        counts[changed] = total
+        moved = np.einsum('ij,ij->i', normalize_rows(previous), normalize_rows(centroids[changed]))
+        shifts[changed] += 1.0 - moved
+        np.maximum.at(radii, rows, 1.0 - similarities[assigned])
+
+    # Outliers open new clusters among themselves
+    outliers = np.flatnonzero(labels < 0)
+    opened = cluster_statistics(
+        unit[outliers], embeddings[outliers], leader_clusters(unit[outliers], threshold, 1)
+    ) if len(outliers) else {}
+    new_rows = []
+    for label in sorted(opened):
+        members, centroid, _ = opened[label]
+        rows = outliers[members]
+        member_sims = unit[rows] @ normalize_rows(centroid[None, :])[0]
+        labels[rows] = known + label
+        similarities[rows] = member_sims
+        new_rows.append((centroid, len(rows), 1.0 - float(member_sims.min())))
+    if new_rows:
+        centroids = np.vstack([centroids, np.array([c for c, _, _ in new_rows], dtype=np.float32)])
+        counts = np.concatenate([counts, np.array([n for _, n, _ in new_rows], dtype=np.int64)])
+        radii = np.concatenate([radii, np.array([r for _, _, r in new_rows], dtype=np.float32)])
+        shifts = np.concatenate([shifts, np.zeros(len(new_rows), dtype=np.float32)])
+        changed = np.concatenate([changed, np.ones(len(new_rows), dtype=bool)])
+
+    return IndexUpdate(
+        IndexArrays(centroids.astype(np.float32), counts, radii, shifts),
+        labels, similarities, changed, int(len(outliers)),
+    )
+
+
+def drift_metrics(arrays: IndexArrays, outliers_since_rebuild: int) -> Dict[str, float]:
+    """``outlier_share`` and ``centroid_shift`` of an index (0.0 when empty)."""
+    total = int(arrays.counts.sum())
+    if total == 0:
+        return {'outlier_share': 0.0, 'centroid_shift': 0.0}
+    return {
+        'outlier_share': round(outliers_since_rebuild / total, 4),
+        'centroid_shift': round(float((arrays.shifts * arrays.counts).sum()) / total, 4),
+    }
+
+
+class ClusterIndexMaintainer:
+    """
+    Keeps the persistent cluster index of a storage backend up to date.
+
+    The backend must provide ``get_cluster_index``, ``iter_memory_embeddings``
+    and ``save_cluster_index`` (SQLite-vec, and hybrid through its primary);
+    other backends are skipped. Compute runs on the consolidation executor.
+    """
+
+    def __init__(self, config: ConsolidationConfig):
+        self.config = config
+        self.assignment_threshold = getattr(config, 'cluster_assignment_threshold', 0.7)
+        self.drift_threshold = getattr(config, 'cluster_drift_threshold', 0.2)
+        self.chunk_size = getattr(config, 'consolidation_chunk_size', 1000)
+        self.executor: Optional[ConsolidationExecutor] = None
+        self.logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def backend_for(storage: Any) -> Optional[Any]:
+        """The backend holding the cluster index (hybrid keeps it in its SQLite primary)."""
+        backend = unwrap_storage(storage)
+        for candidate in (backend, getattr(backend, 'primary', None)):
+            if candidate is not None and hasattr(type(candidate), 'save_cluster_index'):
+                # Keep counting round trips of a metered consolidation storage
+                return MeteredStorage(candidate) if backend is not storage else candidate
+        return None
+
+    async def _offload(self, fn: Callable, *args) -> Any:
+        if self.executor is None:
+            return fn(*args)
+        return await self.executor.run(fn, *args)
+
+    @contextmanager
+    def _shared(self, embeddings: np.ndarray) -> Iterator[Union[np.ndarray, SharedMatrix]]:
+        if self.executor is None:
+            yield embeddings
+            return
+        with self.executor.share(embeddings) as matrix:
+            yield matrix
+
+    async def _collect(self, backend: Any, unclustered_only: bool) -> Tuple[List[str], Optional[np.ndarray]]:
+        """Content hashes and embedding matrix of the memories to index."""
+        hashes: List[str] = []
+        vectors: List[np.ndarray] = []
+        async for pairs in backend.iter_memory_embeddings(
+            unclustered_only=unclustered_only, chunk_size=self.chunk_size
+        ):
+            for content_hash, embedding in pairs:
+                hashes.append(content_hash)
+                vectors.append(np.frombuffer(embedding, dtype=np.float32))
+        if not vectors:
+            return hashes, None
+        dimension = len(vectors[-1])
+        keep = [i for i, vector in enumerate(vectors) if len(vector) == dimension]
+        return [hashes[i] for i in keep], np.vstack([vectors[i] for i in keep])
+
+    async def _load_state(self, backend: Any) -> Dict[str, Any]:
+        try:
+            value = await backend.get_metadata_value(CLUSTER_INDEX_STATE_KEY)
+            return json.loads(value) if value else {}
+        except (ValueError, TypeError):
+            self.logger.warning("Ignoring unreadable cluster index state")
+            return {}
+
+    async def maintain(self, storage: Any, force_rebuild: bool = False) -> Dict[str, Any]:
+        """
+        Fold unindexed memories into the index, re-clustering it on drift.
+
+        Args:
+            storage: Storage backend (or hybrid storage) holding the index
+            force_rebuild: Re-cluster every memory regardless of drift
+
+        Returns:
+            Maintenance stats (``mode``, ``indexed``, ``outliers``, ``clusters``,
+            drift metrics, ``seconds``); empty if the backend has no index
+        """
+        backend = self.backend_for(storage)
+        if backend is None:
+            return {}
+
+        started = time.perf_counter()
+        state = await self._load_state(backend)
+        # Drop memberships of deleted memories on every pass, so member counts
+        # and drift follow live memories even when nothing new is folded in
+        pruned = await backend.save_cluster_index([], [])
+        stored = await backend.get_cluster_index()
+        reason = 'forced' if force_rebuild else ('empty' if not stored else None)
+
+        if reason is None:
+            cluster_ids = [cluster['cluster_id'] for cluster in stored]
+            arrays = IndexArrays(
+                np.array([np.frombuffer(c['centroid'], dtype=np.float32) for c in stored], dtype=np.float32),
+                np.array([c['member_count'] for c in stored], dtype=np.int64),
+                np.array([c['radius'] for c in stored], dtype=np.float32),
+                np.array([c['shift'] for c in stored], dtype=np.float32),
+            )
+            hashes, embeddings = await self._collect(backend, unclustered_only=True)
+            update = None
+            if embeddings is not None and embeddings.shape[1] != arrays.centroids.shape[1]:
+                reason = 'dimension'
+            elif embeddings is not None:
+                with self._shared(embeddings) as matrix:
+                    update = await self._offload(fold_into_index, matrix, arrays, self.assignment_threshold)
+                arrays = update.arrays
+            outliers = state.get('outliers_since_rebuild', 0) + (update.outliers if update else 0)
+            drift = drift_metrics(arrays, outliers)
+            if reason is None and max(drift.values()) > self.drift_threshold:
+                reason = 'drift'
+
+            if reason is None:
+                if update is not None:
+                    cluster_ids += [uuid.uuid4().hex for _ in range(len(arrays.counts) - len(cluster_ids))]
+                    pruned += await backend.save_cluster_index(
+                        self._cluster_rows(cluster_ids, arrays, np.flatnonzero(update.changed)),
+                        self._member_rows(hashes, cluster_ids, update),
+                    )
+                    state['outliers_since_rebuild'] = outliers
+                    await backend.set_metadata_value(CLUSTER_INDEX_STATE_KEY, json.dumps(state))
+                return self._stats('incremental', started, len(hashes), update, arrays, drift, pruned)
+
+        # Full re-cluster of every embedded memory
+        self.logger.info(f"Re-clustering the cluster index ({reason})")
+        hashes, embeddings = await self._collect(backend, unclustered_only=False)
+        if embeddings is None:
+            return self._stats('rebuild', started, 0, None, IndexArrays.empty(0), drift_metrics(IndexArrays.empty(0), 0), pruned, reason)
+        with self._shared(embeddings) as matrix:
+            update = await self._offload(
+                rebuild_index, matrix, self.config.clustering_algorithm, self.config.min_cluster_size,
+                getattr(self.config, 'clustering_max_neighbors', 64),
+                getattr(self.config, 'clustering_memory_budget_mb', 256),
+                self.assignment_threshold,
+            )
+        cluster_ids = [uuid.uuid4().hex for _ in range(len(update.arrays.counts))]
+        pruned += await backend.save_cluster_index(
+            self._cluster_rows(cluster_ids, update.arrays, np.arange(len(cluster_ids))),
+            self._member_rows(hashes, cluster_ids, update),
+            rebuild=True,
+        )
+        await backend.set_metadata_value(CLUSTER_INDEX_STATE_KEY, json.dumps({
+            'rebuilt_at': time.time(), 'outliers_since_rebuild': 0,
+        }))
+        return self._stats(
+            'rebuild', started, len(hashes), update, update.arrays, drift_metrics(update.arrays, 0), pruned, reason
+        )
+
+    @staticmethod
+    def _cluster_rows(cluster_ids: List[str], arrays: IndexArrays, rows: np.ndarray) -> List[Dict[str, Any]]:
+        now = time.time()
+        return [
+            {
+                'cluster_id': cluster_ids[row],
+                'centroid': arrays.centroids[row],
+                'member_count': int(arrays.counts[row]),
+                'radius': float(arrays.radii[row]),
+                'shift': float(arrays.shifts[row]),
+                'updated_at': now,
+            }
+            for row in rows.tolist()
+        ]
+
+    @staticmethod
+    def _member_rows(hashes: List[str], cluster_ids: List[str], update: IndexUpdate) -> List[Tuple[str, str, float]]:
+        return [
+            (content_hash, cluster_ids[label], similarity)
+            for content_hash, label, similarity in zip(hashes, update.labels.tolist(), update.similarities.tolist())
+        ]
+
+    def _stats(
+        self,
+        mode: str,
+        started: float,
+        indexed: int,
+        update: Optional[IndexUpdate],
+        arrays: IndexArrays,
+        drift: Dict[str, float],
+        pruned: int,
+        reason: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        stats = {
+            'mode': mode,
+            'indexed': indexed,
+            'outliers': int(update.outliers) if update is not None else 0,
+            'clusters': int(len(arrays.counts)),
+            'pruned': pruned,
+            **drift,
+            'seconds': round(time.perf_counter() - started, 4),
+        }
+        if reason:
+            stats['reason'] = reason
+        self.logger.info(
+            f"Cluster index {mode}: {indexed} memories indexed, {stats['clusters']} clusters, "
+            f"outlier share {drift['outlier_share']}, centroid shift {drift['centroid_shift']}"
+        )
+        return stats
@@ -14,39 +14,66 @@
 
 """Semantic clustering system for memory organization."""
 
+import logging
+import time
 import uuid
 import numpy as np
-from typing import List, Dict
+from typing import Any, List, Dict, Tuple, Union
 from datetime import datetime, timezone
 from collections import Counter
 import re
 
 try:
-    from sklearn.cluster import DBSCAN
     from sklearn.cluster import AgglomerativeClustering
     SKLEARN_AVAILABLE = True
 except ImportError:
     SKLEARN_AVAILABLE = False
 
 from .base import ConsolidationBase, ConsolidationConfig, MemoryCluster
+from .executor import SharedMatrix, resolve_matrix
+from .vector_clustering import (
+    cluster_statistics,
+    density_clusters,
+    leader_clusters,
+    normalize_rows,
+    peak_rss_mb,
+    plan_memory_budget,
+    radius_neighbors,
+    similar_groups,
+)
 from ..models.memory import Memory
 
+logger = logging.getLogger(__name__)
+
+# Member row indices, centroid and coherence of one cluster
+ClusterStatistics = Tuple[np.ndarray, np.ndarray, float]
+
 class SemanticClusteringEngine(ConsolidationBase):
     """
     Creates semantic clusters of related memories for organization and compression.
     
     Uses embedding-based clustering algorithms (DBSCAN, Hierarchical) to group
     semantically similar memories, enabling efficient compression and retrieval.
+
+    The embedding matrix is normalized once per run. DBSCAN runs over a sparse
+    neighbour graph built from blocked matrix multiplies sized by
+    ``clustering_memory_budget_mb``, so it needs neither sklearn nor an n x n
+    distance matrix. Labels and cluster statistics are computed by
+    ``compute_clusters`` on the consolidation executor. Timing and peak RSS of
+    the last run are kept in ``last_run_stats``.
     """
     
     def __init__(self, config: ConsolidationConfig):
         super().__init__(config)
         self.min_cluster_size = config.min_cluster_size
         self.algorithm = config.clustering_algorithm
+        self.memory_budget_mb = getattr(config, 'clustering_memory_budget_mb', 256)
+        self.max_neighbors = getattr(config, 'clustering_max_neighbors', 64)
+        self.last_run_stats: Dict[str, Any] = {}
         
-        if not SKLEARN_AVAILABLE:
-            self.logger.warning("sklearn not available, using simple clustering fallback")
-            self.algorithm = 'simple'
+        if self.algorithm == 'hierarchical' and not SKLEARN_AVAILABLE:
+            self.logger.warning("sklearn not available, using dbscan clustering instead of hierarchical")
+            self.algorithm = 'dbscan'
     
     async def process(self, memories: List[Memory], **kwargs) -> List[MemoryCluster]:
         """Create semantic clusters from memories."""
@@ -60,138 +87,53 @@ class SemanticClusteringEngine(ConsolidationBase):
             self.logger.warning(f"Only {len(memories_with_embeddings)} memories have embeddings, need at least {self.min_cluster_size}")
             return []
         
-        # Extract embeddings matrix
-        embeddings = np.array([m.embedding for m in memories_with_embeddings])
+        started = time.perf_counter()
         
-        # Perform clustering
-        if self.algorithm == 'dbscan':
-            cluster_labels = await self._dbscan_clustering(embeddings)
-        elif self.algorithm == 'hierarchical':
-            cluster_labels = await self._hierarchical_clustering(embeddings)
-        else:
-            cluster_labels = await self._simple_clustering(embeddings)
+        # Cluster in a worker, with the embedding matrix in shared memory
+        with self._embedding_matrix(memories_with_embeddings) as matrix:
+            statistics, self.last_run_stats = await self._offload(
+                compute_clusters, matrix, self.algorithm, self.min_cluster_size,
+                self.max_neighbors, self.memory_budget_mb
+            )
         
         # Create cluster objects
-        clusters = await self._create_clusters(memories_with_embeddings, cluster_labels, embeddings)
+        clusters = await self._create_clusters(memories_with_embeddings, statistics)
         
         # Filter by minimum cluster size
         valid_clusters = [c for c in clusters if len(c.memory_hashes) >= self.min_cluster_size]
         
-        self.logger.info(f"Created {len(valid_clusters)} valid clusters from {len(memories_with_embeddings)} memories")
-        return valid_clusters
-    
-    async def _dbscan_clustering(self, embeddings: np.ndarray) -> np.ndarray:
-        """Perform DBSCAN clustering on embeddings."""
-        if not SKLEARN_AVAILABLE:
-            return await self._simple_clustering(embeddings)
-        
-        # Adaptive epsilon based on data size and dimensionality
-        n_samples, n_features = embeddings.shape
-        eps = 0.5 - (n_samples / 10000) * 0.1  # Decrease eps for larger datasets
-        eps = max(0.2, min(0.7, eps))  # Clamp between 0.2 and 0.7
-        
-        min_samples = max(2, self.min_cluster_size // 2)
-        
-        clustering = DBSCAN(eps=eps, min_samples=min_samples, metric='cosine')
-        labels = clustering.fit_predict(embeddings)
-        
-        self.logger.debug(f"DBSCAN: eps={eps}, min_samples={min_samples}, found {len(set(labels))} clusters")
-        return labels
-    
-    async def _hierarchical_clustering(self, embeddings: np.ndarray) -> np.ndarray:
-        """Perform hierarchical clustering on embeddings."""
-        if not SKLEARN_AVAILABLE:
-            return await self._simple_clustering(embeddings)
-        
-        # Estimate number of clusters (heuristic: sqrt of samples / 2)
-        n_samples = embeddings.shape[0]
-        n_clusters = max(2, min(n_samples // self.min_cluster_size, int(np.sqrt(n_samples) / 2)))
-        
-        clustering = AgglomerativeClustering(
-            n_clusters=n_clusters,
-            metric='cosine',
-            linkage='average'
+        elapsed = time.perf_counter() - started
+        self.last_run_stats.update({
+            'algorithm': self.algorithm,
+            'memories': len(memories_with_embeddings),
+            'clusters': len(valid_clusters),
+            'seconds': round(elapsed, 4),
+            'clusters_per_second': round(len(valid_clusters) / elapsed, 2) if elapsed > 0 else 0.0,
+            'memories_per_second': round(len(memories_with_embeddings) / elapsed, 2) if elapsed > 0 else 0.0,
+            'peak_rss_mb': peak_rss_mb(),
+            'memory_budget_mb': self.memory_budget_mb,
+        })
+        
+        self.logger.info(
+            f"Created {len(valid_clusters)} valid clusters from {len(memories_with_embeddings)} memories "
+            f"in {elapsed:.2f}s ({self.last_run_stats['clusters_per_second']} clusters/s, "
+            f"peak RSS {self.last_run_stats['peak_rss_mb']} MB)"
         )
-        labels = clustering.fit_predict(embeddings)
-        
-        self.logger.debug(f"Hierarchical: n_clusters={n_clusters}, found {len(set(labels))} clusters")
-        return labels
-    
-    async def _simple_clustering(self, embeddings: np.ndarray) -> np.ndarray:
-        """Simple fallback clustering using cosine similarity threshold."""
-        n_samples = embeddings.shape[0]
-        labels = np.full(n_samples, -1)  # Start with all as noise
-        current_cluster = 0
-        
-        similarity_threshold = 0.7  # Threshold for grouping
-        
-        for i in range(n_samples):
-            if labels[i] != -1:  # Already assigned
-                continue
-            
-            # Start new cluster
-            cluster_members = [i]
-            labels[i] = current_cluster
-            
-            # Find similar memories
-            for j in range(i + 1, n_samples):
-                if labels[j] != -1:  # Already assigned
-                    continue
-                
-                # Calculate cosine similarity
-                similarity = np.dot(embeddings[i], embeddings[j]) / (
-                    np.linalg.norm(embeddings[i]) * np.linalg.norm(embeddings[j])
-                )
-                
-                if similarity >= similarity_threshold:
-                    labels[j] = current_cluster
-                    cluster_members.append(j)
-            
-            # Only keep cluster if it meets minimum size
-            if len(cluster_members) >= self.min_cluster_size:
-                current_cluster += 1
-            else:
-                # Mark as noise
-                for member in cluster_members:
-                    labels[member] = -1
-        
-        self.logger.debug(f"Simple clustering: threshold={similarity_threshold}, found {current_cluster} clusters")
-        return labels
+        return valid_clusters
     
     async def _create_clusters(
         self,
         memories: List[Memory],
-        labels: np.ndarray,
-        embeddings: np.ndarray
+        statistics: List[ClusterStatistics]
     ) -> List[MemoryCluster]:
-        """Create MemoryCluster objects from clustering results."""
+        """Create MemoryCluster objects from (members, centroid, coherence) per cluster."""
         clusters = []
-        unique_labels = set(labels)
         
-        for label in unique_labels:
-            if label == -1:  # Skip noise points
+        for cluster_indices, centroid, coherence_score in statistics:
+            if len(cluster_indices) < self.min_cluster_size:
                 continue
             
-            # Get memories in this cluster
-            cluster_indices = np.where(labels == label)[0]
             cluster_memories = [memories[i] for i in cluster_indices]
-            cluster_embeddings = embeddings[cluster_indices]
-            
-            if len(cluster_memories) < self.min_cluster_size:
-                continue
-            
-            # Calculate centroid embedding
-            centroid = np.mean(cluster_embeddings, axis=0)
-            
-            # Calculate coherence score (average cosine similarity to centroid)
-            coherence_scores = []
-            for embedding in cluster_embeddings:
-                similarity = np.dot(embedding, centroid) / (
-                    np.linalg.norm(embedding) * np.linalg.norm(centroid)
-                )
-                coherence_scores.append(similarity)
-            
-            coherence_score = np.mean(coherence_scores)
             
             # Extract theme keywords
             theme_keywords = await self._extract_theme_keywords(cluster_memories)
@@ -299,33 +241,13 @@ class SemanticClusteringEngine(ConsolidationBase):
         if len(clusters) <= 1:
             return clusters
         
-        # Calculate pairwise similarities between cluster centroids
-        centroids = np.array([cluster.centroid_embedding for cluster in clusters])
+        # Pairwise similarities between cluster centroids in one matrix product
+        centroids = np.array([cluster.centroid_embedding for cluster in clusters], dtype=np.float32)
         
-        merged = [False] * len(clusters)
         result_clusters = []
         
-        for i, cluster1 in enumerate(clusters):
-            if merged[i]:
-                continue
-            
-            # Start with current cluster
-            merge_group = [i]
-            merged[i] = True
-            
-            # Find similar clusters to merge
-            for j in range(i + 1, len(clusters)):
-                if merged[j]:
-                    continue
-                
-                # Calculate cosine similarity between centroids
-                similarity = np.dot(centroids[i], centroids[j]) / (
-                    np.linalg.norm(centroids[i]) * np.linalg.norm(centroids[j])
-                )
-                
-                if similarity >= similarity_threshold:
-                    merge_group.append(j)
-                    merged[j] = True
+        for merge_group in similar_groups(centroids, similarity_threshold):
+            i = merge_group[0]
             
             # Create merged cluster
             if len(merge_group) == 1:
@@ -385,4 +307,89 @@ class SemanticClusteringEngine(ConsolidationBase):
                 'merged_from': [cluster.cluster_id for cluster in clusters],
                 'merge_timestamp': datetime.now().isoformat()
             }
-        )
\ No newline at end of file
+        )
+
+
+def compute_clusters(
+    matrix: Union[np.ndarray, SharedMatrix],
+    algorithm: str,
+    min_cluster_size: int,
+    max_neighbors: int,
+    memory_budget_mb: float
+) -> Tuple[List[ClusterStatistics], Dict[str, Any]]:
+    """
+    Cluster the rows of an embedding matrix; runs in consolidation workers.
+
+    Returns:
+        (statistics per cluster in label order, algorithm stats)
+    """
+    embeddings = resolve_matrix(matrix)
+    unit = normalize_rows(embeddings)
+    stats: Dict[str, Any] = {}
+    
+    if algorithm == 'dbscan':
+        labels = _dbscan_labels(unit, min_cluster_size, max_neighbors, memory_budget_mb, stats)
+    elif algorithm == 'hierarchical' and SKLEARN_AVAILABLE:
+        labels = _hierarchical_labels(embeddings, min_cluster_size)
+    else:
+        labels = _simple_labels(unit, min_cluster_size)
+    
+    return list(cluster_statistics(unit, embeddings, np.asarray(labels)).values()), stats
+
+
+def _dbscan_labels(
+    unit: np.ndarray,
+    min_cluster_size: int,
+    max_neighbors: int,
+    memory_budget_mb: float,
+    stats: Dict[str, Any]
+) -> np.ndarray:
+    """DBSCAN labels for normalized embeddings via a sparse neighbour graph."""
+    # Adaptive epsilon based on data size and dimensionality
+    n_samples = unit.shape[0]
+    eps = 0.5 - (n_samples / 10000) * 0.1  # Decrease eps for larger datasets
+    eps = max(0.2, min(0.7, eps))  # Clamp between 0.2 and 0.7
+    
+    min_samples = max(2, min_cluster_size // 2)
+    
+    # Cosine distance <= eps is cosine similarity >= 1 - eps
+    block_rows, max_neighbors = plan_memory_budget(n_samples, max_neighbors, memory_budget_mb)
+    graph = radius_neighbors(unit, 1.0 - eps, max_neighbors, block_rows)
+    labels = density_clusters(graph, min_samples)
+    
+    stats.update({
+        'edges': int(len(graph.sources)),
+        'block_rows': block_rows,
+        'max_neighbors': max_neighbors,
+    })
+    logger.debug(
+        f"DBSCAN: eps={eps}, min_samples={min_samples}, block_rows={block_rows}, "
+        f"edges={len(graph.sources)}, found {len(set(labels.tolist()))} clusters"
+    )
+    return labels
+
+
+def _hierarchical_labels(embeddings: np.ndarray, min_cluster_size: int) -> np.ndarray:
+    """Agglomerative (average linkage, cosine) labels for raw embeddings."""
+    # Estimate number of clusters (heuristic: sqrt of samples / 2)
+    n_samples = embeddings.shape[0]
+    n_clusters = max(2, min(n_samples // min_cluster_size, int(np.sqrt(n_samples) / 2)))
+    
+    clustering = AgglomerativeClustering(
+        n_clusters=n_clusters,
+        metric='cosine',
+        linkage='average'
+    )
+    labels = clustering.fit_predict(embeddings)
+    
+    logger.debug(f"Hierarchical: n_clusters={n_clusters}, found {len(set(labels))} clusters")
+    return labels
+
+
+def _simple_labels(unit: np.ndarray, min_cluster_size: int) -> np.ndarray:
+    """Fallback threshold clustering on normalized embeddings."""
+    similarity_threshold = 0.7  # Threshold for grouping
+    labels = leader_clusters(unit, similarity_threshold, min_cluster_size)
+    
+    logger.debug(f"Simple clustering: threshold={similarity_threshold}, found {labels.max() + 1} clusters")
+    return labels
@@ -15,14 +15,17 @@
 """Semantic compression engine for memory cluster summarization."""
 
 import asyncio
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set, Tuple
 from datetime import datetime, timezone
 from dataclasses import dataclass
 from collections import Counter
 import re
 import hashlib
 
+import numpy as np
+
 from .base import ConsolidationBase, ConsolidationConfig, MemoryCluster
+from .vector_summaries import centroid_scores, centroid_similarity, select_sentences, sentence_matrix
 from ..models.memory import Memory
 
 @dataclass
@@ -42,12 +45,24 @@ class SemanticCompressionEngine(ConsolidationBase):
     
     This creates higher-level abstractions while preserving key information,
     using statistical methods and concept extraction to summarize clusters.
+
+    Summary sentences are chosen by the ``compression_summarizer`` setting:
+    ``tfidf`` (default) scores the sentences of all clusters in a batch at
+    once by similarity to their cluster's TF-IDF centroid (see
+    :mod:`.vector_summaries`), weighted by each memory's embedding
+    similarity to the cluster centroid; ``concepts`` takes, cluster by
+    cluster, the sentences that cover the most key concepts not yet covered.
     """
     
     def __init__(self, config: ConsolidationConfig):
         super().__init__(config)
         self.max_summary_length = config.max_summary_length
         self.preserve_originals = config.preserve_originals
+        self.summarizer = getattr(config, 'compression_summarizer', 'tfidf')
+        
+        if self.summarizer not in ('concepts', 'tfidf'):
+            self.logger.warning(f"Unknown compression summarizer '{self.summarizer}', using tfidf")
+            self.summarizer = 'tfidf'
         
         # Word importance patterns
         self._important_patterns = {
@@ -60,6 +75,9 @@ class SemanticCompressionEngine(ConsolidationBase):
             'code_blocks': re.compile(r'```[\s\S]*?```|`[^`]+`')
         }
     
+    # Important patterns whose matches are not single words
+    _TEXT_PATTERNS = ('urls', 'file_paths', 'quoted_text', 'code_blocks')
+    
     async def process(self, clusters: List[MemoryCluster], memories: List[Memory], **kwargs) -> List[CompressionResult]:
         """Compress memory clusters into condensed representations (parallel)."""
         if not clusters:
@@ -68,17 +86,27 @@ class SemanticCompressionEngine(ConsolidationBase):
         # Create memory hash lookup
         memory_lookup = {m.content_hash: m for m in memories}
 
-        # Build tasks for clusters that have matching memories
-        tasks = []
+        # Pair clusters with their matching memories
+        pairs = []
         for cluster in clusters:
             cluster_memories = [
                 memory_lookup[h] for h in cluster.memory_hashes if h in memory_lookup
             ]
             if cluster_memories:
-                tasks.append(self._compress_cluster(cluster, cluster_memories))
+                pairs.append((cluster, cluster_memories))
 
-        # Run all cluster compressions concurrently
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Embeddings stay in this process, so weigh memories by centroid similarity here
+        priors = self._memory_priors(pairs) if self.summarizer == 'tfidf' else [None] * len(pairs)
+        work = [
+            (cluster, self._portable(cluster_memories), prior)
+            for (cluster, cluster_memories), prior in zip(pairs, priors)
+        ]
+
+        # Summarize on the executor's workers, or concurrently on this loop
+        if self.executor is None:
+            results = await self._compress_all(work)
+        else:
+            results = await self.executor.map_batches(compress_clusters, work, self.config)
 
         compression_results = []
         for r in results:
@@ -90,6 +118,64 @@ class SemanticCompressionEngine(ConsolidationBase):
         self.logger.info(f"Compressed {len(compression_results)} clusters")
         return compression_results
     
+    def _memory_priors(self, pairs: List[Tuple[MemoryCluster, List[Memory]]]) -> List[np.ndarray]:
+        """Embedding similarity of each memory to its cluster centroid, per cluster."""
+        similarity = centroid_similarity(
+            [m.embedding for _, memories in pairs for m in memories],
+            [cluster.centroid_embedding for cluster, _ in pairs],
+            [owner for owner, (_, memories) in enumerate(pairs) for _ in memories],
+        )
+        offsets = np.cumsum([len(memories) for _, memories in pairs])[:-1]
+        return np.split(similarity, offsets) if pairs else []
+    
+    async def _compress_all(self, work: List[Tuple[MemoryCluster, List[Memory], Optional[np.ndarray]]]) -> List[Any]:
+        """Compress (cluster, memories, priors) items; failures are returned, not raised."""
+        if self.summarizer == 'tfidf':
+            return self._compress_batch(work)
+        return await asyncio.gather(
+            *(self._compress_cluster(cluster, memories) for cluster, memories, _ in work),
+            return_exceptions=True
+        )
+    
+    def _compress_batch(self, work: List[Tuple[MemoryCluster, List[Memory], Optional[np.ndarray]]]) -> List[Any]:
+        """Summarize all clusters of ``work`` over one TF-IDF sentence matrix."""
+        eligible = [i for i, (_, memories, _) in enumerate(work) if len(memories) >= 2]
+        results: List[Any] = [None] * len(work)
+        if not eligible:
+            return results
+        try:
+            matrix = sentence_matrix([[m.content for m in work[i][1]] for i in eligible])
+            priors = np.concatenate([
+                work[i][2] if work[i][2] is not None else np.ones(len(work[i][1])) for i in eligible
+            ])
+            scores = centroid_scores(matrix, priors)
+            concepts, overviews = [], []
+            for position, i in enumerate(eligible):
+                cluster, memories, _ = work[i]
+                all_text = ' '.join(m.content for m in memories)
+                key_concepts = self._select_key_concepts(
+                    all_text, cluster.theme_keywords, matrix.term_counts[position],
+                    matrix.marked_words[position],
+                )
+                concepts.append(key_concepts)
+                overviews.append(self._summary_overview(memories, key_concepts))
+            sentences = select_sentences(matrix, scores, [self._sentence_budget(o) for o in overviews])
+        except Exception as e:
+            for i in eligible:
+                results[i] = e
+            return results
+
+        for position, i in enumerate(eligible):
+            cluster, memories, _ = work[i]
+            try:
+                summary = self._assemble_summary(overviews[position], sentences[position], concepts[position])
+                results[i] = self._build_result(
+                    cluster, memories, concepts[position], summary, 'semantic_compression_tfidf_v1'
+                )
+            except Exception as e:
+                results[i] = e
+        return results
+    
     async def _compress_cluster(self, cluster: MemoryCluster, memories: List[Memory]) -> Optional[CompressionResult]:
         """Compress a single memory cluster."""
         if len(memories) < 2:
@@ -101,6 +187,17 @@ class SemanticCompressionEngine(ConsolidationBase):
         # Generate thematic summary
         summary = await self._generate_thematic_summary(memories, key_concepts)
         
+        return self._build_result(cluster, memories, key_concepts, summary, 'semantic_compression_v1')
+    
+    def _build_result(
+        self,
+        cluster: MemoryCluster,
+        memories: List[Memory],
+        key_concepts: List[str],
+        summary: str,
+        algorithm: str,
+    ) -> CompressionResult:
+        """Wrap a cluster's summary into the compressed memory and its result."""
         # Calculate temporal information
         temporal_span = self._calculate_temporal_span(memories)
         
@@ -150,7 +247,7 @@ class SemanticCompressionEngine(ConsolidationBase):
             temporal_span=temporal_span,
             source_memory_count=len(memories),
             compression_metadata={
-                'algorithm': 'semantic_compression_v1',
+                'algorithm': algorithm,
                 'original_total_length': original_size,
                 'compressed_length': compressed_size,
                 'concept_count': len(key_concepts),
@@ -161,27 +258,46 @@ class SemanticCompressionEngine(ConsolidationBase):
     async def _extract_key_concepts(self, memories: List[Memory], theme_keywords: List[str]) -> List[str]:
         """Extract key concepts from cluster memories."""
         all_text = ' '.join([m.content for m in memories])
+        word_counts = Counter(re.findall(r'\b[a-zA-Z]{4,}\b', all_text.lower()))
+        return self._select_key_concepts(all_text, theme_keywords, word_counts)
+    
+    def _select_key_concepts(
+        self,
+        all_text: str,
+        theme_keywords: List[str],
+        word_counts: Counter,
+        marked_words: Optional[Set[str]] = None,
+    ) -> List[str]:
+        """
+        Key concepts of a cluster's text, given its counts of words of 4+ letters.
+
+        ``marked_words`` are the text's CamelCase terms, acronyms, numbers and
+        capitalized words when already scanned for (see
+        :func:`.vector_summaries.sentence_matrix`); only the patterns that
+        match across words then run on the text.
+        """
         concepts = set()
         
         # Add theme keywords as primary concepts
         concepts.update(theme_keywords)
         
-        # Extract important patterns
-        for pattern_name, pattern in self._important_patterns.items():
-            matches = pattern.findall(all_text)
-            if pattern_name == 'quoted_text':
-                # For quoted text, add the content inside quotes
-                concepts.update(matches)
-            else:
-                concepts.update(matches)
-        
-        # Extract capitalized terms (potential proper nouns)
-        capitalized = re.findall(r'\b[A-Z][a-z]{2,}\b', all_text)
-        concepts.update(capitalized)
-        
-        # Extract frequent meaningful words
-        words = re.findall(r'\b[a-zA-Z]{4,}\b', all_text.lower())
-        word_counts = Counter(words)
+        if marked_words is None:
+            # Extract important patterns
+            for pattern_name, pattern in self._important_patterns.items():
+                matches = pattern.findall(all_text)
+                if pattern_name == 'quoted_text':
+                    # For quoted text, add the content inside quotes
+                    concepts.update(matches)
+                else:
+                    concepts.update(matches)
+            
+            # Extract capitalized terms (potential proper nouns)
+            capitalized = re.findall(r'\b[A-Z][a-z]{2,}\b', all_text)
+            concepts.update(capitalized)
+        else:
+            concepts.update(marked_words)
+            for pattern_name in self._TEXT_PATTERNS:
+                concepts.update(self._important_patterns[pattern_name].findall(all_text))
         
         # Filter out common words
         stop_words = {
@@ -199,9 +315,9 @@ class SemanticCompressionEngine(ConsolidationBase):
             if word not in stop_words and count >= 2:  # Must appear at least twice
                 concepts.add(word)
         
-        # Case-insensitive deduplication
+        # Case-insensitive deduplication; sorted, so ties rank the same in every run
         concept_dict = {}
-        for concept in concepts:
+        for concept in sorted(concepts):
             lower_key = concept.lower()
             if lower_key not in concept_dict:
                 # Prefer capitalized form (proper nouns)
@@ -256,10 +372,14 @@ class SemanticCompressionEngine(ConsolidationBase):
         # Sort by score and select best sentences
         representative_sentences.sort(key=lambda x: x['score'], reverse=True)
         
-        # Build summary
-        summary_parts = []
-        
-        # Add cluster overview
+        return self._assemble_summary(
+            self._summary_overview(memories, key_concepts),
+            [sent_info['sentence'] for sent_info in representative_sentences],
+            key_concepts,
+        )
+    
+    def _summary_overview(self, memories: List[Memory], key_concepts: List[str]) -> str:
+        """Opening sentence of a cluster summary."""
         memory_count = len(memories)
         time_span = self._calculate_temporal_span(memories)
         concept_str = ', '.join(key_concepts[:5])
@@ -268,15 +388,21 @@ class SemanticCompressionEngine(ConsolidationBase):
         if time_span['span_days'] > 0:
             overview += f" spanning {time_span['span_days']} days"
         overview += "."
-        
-        summary_parts.append(overview)
+        return overview
+    
+    def _sentence_budget(self, overview: str) -> int:
+        """Characters of sentences that :meth:`_assemble_summary` keeps after ``overview``."""
+        return self.max_summary_length - 2 * len(overview) - 100
+    
+    def _assemble_summary(self, overview: str, sentences: List[str], key_concepts: List[str]) -> str:
+        """Join overview, ranked sentences (while they fit) and the key concepts."""
+        summary_parts = [overview]
         
         # Add key insights from representative sentences
         used_length = len(overview)
         remaining_length = self.max_summary_length - used_length - 100  # Reserve space for conclusion
         
-        for sent_info in representative_sentences:
-            sentence = sent_info['sentence']
+        for sentence in sentences:
             if used_length + len(sentence) < remaining_length:
                 summary_parts.append(sentence)
                 used_length += len(sentence)
@@ -488,4 +614,12 @@ class SemanticCompressionEngine(ConsolidationBase):
             'compression_ratio': overall_ratio,
             'estimated_savings_bytes': savings,
             'estimated_savings_percent': (1 - overall_ratio) * 100
-        }
\ No newline at end of file
+        }
+
+
+def compress_clusters(
+    work: List[Tuple[MemoryCluster, List[Memory], Optional[np.ndarray]]],
+    config: ConsolidationConfig
+) -> List[Any]:
+    """Compress (cluster, memories, priors) items; runs in consolidation workers (no event loop)."""
+    return asyncio.run(SemanticCompressionEngine(config)._compress_all(work))
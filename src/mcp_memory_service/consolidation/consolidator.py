@@ -14,7 +14,8 @@
 
 """Main dream-inspired consolidation orchestrator."""
 
-from typing import List, Dict, Any, Optional, Protocol, Tuple
+from contextlib import nullcontext
+from typing import AsyncIterator, Iterable, List, Dict, Any, Optional, Protocol, Tuple
 from datetime import datetime, timedelta, timezone
 import asyncio
 import logging
@@ -24,13 +25,31 @@ from .base import ConsolidationConfig, ConsolidationReport, ConsolidationError
 from .decay import ExponentialDecayCalculator
 from .associations import CreativeAssociationEngine
 from .clustering import SemanticClusteringEngine
+from .cluster_index import ClusterIndexMaintainer
 from .compression import SemanticCompressionEngine
 from .forgetting import ControlledForgettingEngine
 from .health import ConsolidationHealthMonitor
+from .executor import ConsolidationExecutor
+from .profiling import MeteredStorage, PhaseProfiler, capture_artifacts, profile_phase, unwrap_storage
+from .checkpoints import (
+    ConsolidationRun, ConsolidationRunStore, input_set_hash,
+    dump_clusters, load_clusters, dump_relevance_scores, load_relevance_scores,
+)
 from ..models.memory import Memory
+from ..storage.base import MemoryStorage, consolidation_sort_key
 from ..storage.graph import GraphStorage
-from ..config import GRAPH_STORAGE_MODE, CONSOLIDATION_STORE_ASSOCIATIONS, TYPED_EDGES_ENABLED
+from ..config import (
+    GRAPH_STORAGE_MODE, CONSOLIDATION_STORE_ASSOCIATIONS, TYPED_EDGES_ENABLED, GRAPH_CENTRALITY_ENABLED
+)
 from .relationship_inference import RelationshipInferenceEngine
+from .vector_clustering import peak_rss_mb
+
+# Import SSE for real-time progress updates
+try:
+    from ..web.sse import sse_manager, create_consolidation_progress_event
+    SSE_AVAILABLE = True
+except ImportError:
+    SSE_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
@@ -57,7 +76,9 @@ class StorageProtocol(Protocol):
     async def delete_memory(self, content_hash: str) -> bool:
         pass
 
-    async def get_memory_connections(self) -> Dict[str, int]:
+    async def get_memory_connections(
+        self, memory_hashes: Optional[List[str]] = None
+    ) -> Dict[str, int]:
         pass
 
     async def get_access_patterns(self) -> Dict[str, datetime]:
@@ -157,7 +178,8 @@ class DreamInspiredConsolidator:
     }
 
     def __init__(self, storage: StorageProtocol, config: ConsolidationConfig):
-        self.storage = storage
+        # Storage round trips of a run are counted for its performance profile
+        self.storage = MeteredStorage(storage)
         self.config = config
         self.logger = logging.getLogger(__name__)
         self.plugin_registry = None  # Set externally to fire on_consolidate hook
@@ -173,9 +195,28 @@ class DreamInspiredConsolidator:
             typed_edges_enabled=TYPED_EDGES_ENABLED,
         )
 
+        # CPU-heavy phase work runs off the event loop on this executor
+        self.executor = ConsolidationExecutor(getattr(config, "max_workers", 0))
+        for engine in (
+            self.decay_calculator,
+            self.association_engine,
+            self.clustering_engine,
+            self.compression_engine,
+            self.forgetting_engine,
+        ):
+            engine.executor = self.executor
+
+        # Persistent centroid index, updated with new memories after each run
+        self.cluster_index = ClusterIndexMaintainer(config)
+        self.cluster_index.executor = self.executor
+
         # Initialize health monitoring
         self.health_monitor = ConsolidationHealthMonitor(config)
 
+        # Run records with per-phase checkpoints, for resuming interrupted runs
+        self.run_store = ConsolidationRunStore(storage)
+        self._active_runs = set()
+
         # Graph storage initialized lazily in consolidate() to avoid
         # blocking I/O in __init__ (Milvus backend needs async init).
         self.graph_storage = None
@@ -254,17 +295,59 @@ class DreamInspiredConsolidator:
             self.logger.warning(f"Failed to initialize graph storage: {e}")
             self.graph_storage = None
 
-    async def consolidate(self, time_horizon: str, **kwargs) -> ConsolidationReport:
+    async def consolidate(
+        self,
+        time_horizon: str,
+        run_id: Optional[str] = None,
+        resume: bool = True,
+        capture_profile: bool = False,
+        **kwargs
+    ) -> ConsolidationReport:
         """
         Run full consolidation pipeline for given time horizon.
 
+        Every run is persisted as a run record with per-phase checkpoints
+        (see :mod:`.checkpoints`). An unfinished run continues from its last
+        completed phase instead of recomputing and rewriting earlier ones.
+        Each run's per-phase profile (see :mod:`.profiling`) is attached as
+        ``performance_metrics["profile"]`` and kept in the health monitor's
+        profile history.
+
         Args:
             time_horizon: 'daily', 'weekly', 'monthly', 'quarterly', 'yearly'
+            run_id: Resume this unfinished run of ``time_horizon``
+            resume: Continue the latest unfinished run of the horizon if it
+                started within the horizon's period (False starts afresh)
+            capture_profile: Also record cProfile and tracemalloc captures of
+                this run under ``<archive>/profiles``; their paths are listed
+                in the profile's ``artifacts``
             **kwargs: Additional parameters for consolidation
 
         Returns:
             ConsolidationReport with results and performance metrics
         """
+        profile = PhaseProfiler(self.executor)
+        capture = nullcontext([])
+        if capture_profile:
+            started = datetime.now().strftime("%Y%m%d-%H%M%S")
+            capture = capture_artifacts(
+                self.forgetting_engine.archive_path / "profiles" / f"{time_horizon}-{started}"
+            )
+        with profile.activate(), capture as artifacts:
+            report = await self._consolidate(time_horizon, run_id, resume, profile)
+        if artifacts:
+            # Written once the capture ended; the profile dict is shared with its history entry
+            report.performance_metrics["profile"]["artifacts"] = artifacts
+        return report
+
+    async def _consolidate(
+        self,
+        time_horizon: str,
+        run_id: Optional[str],
+        resume: bool,
+        profile: PhaseProfiler,
+    ) -> ConsolidationReport:
+        """Run the pipeline of :meth:`consolidate` under the active ``profile``."""
         start_time = datetime.now()
         report = ConsolidationReport(
             time_horizon=time_horizon,
@@ -272,11 +355,24 @@ class DreamInspiredConsolidator:
             end_time=start_time,  # Will be updated at the end
             memories_processed=0,
         )
+        run = None
 
+        # Concurrent runs share the worker pool; the last one out releases it
+        self.executor.acquire()
         try:
             self.logger.info(
                 f"Starting {time_horizon} consolidation - this may take several minutes depending on memory count..."
             )
+            run = await self._begin_run(time_horizon, run_id, resume)
+            report.run_id = run.run_id
+            for counter, value in run.totals.items():
+                setattr(report, counter, value)
+            report.performance_metrics["run"] = {
+                "run_id": run.run_id, "attempt": run.attempts, "restored_phases": 0,
+            }
+            await self._publish_progress(time_horizon, "run", "started", details={
+                **self.executor.stats(), "run_id": run.run_id, "attempt": run.attempts,
+            })
 
             # Lazy graph storage init (avoids blocking I/O in __init__).
             # Lock prevents double-init when two consolidate() calls race.
@@ -287,22 +383,256 @@ class DreamInspiredConsolidator:
 
             # Use context manager for sync pause/resume
             async with SyncPauseContext(self.storage, self.logger):
-                # 1. Retrieve memories for processing
-                memories = await self._get_memories_for_horizon(time_horizon, **kwargs)
-                report.memories_processed = len(memories)
+                # 1. Stream memories for processing, one window at a time
+                # (daily and incremental runs are a single window). Only
+                # relevance scores, a float per memory, outlive a window.
+                # A resumed run reuses its reference time, so it sees the
+                # same horizon, and streams from after its last finished window.
+                relevance_summary: Dict[str, float] = {}
+                existing_associations = None
+                windows = 0
+                reference_time = datetime.fromtimestamp(run.reference_time, tz=timezone.utc)
+                windows_left = not run.streamed and not (
+                    run.windows_completed and self._single_window(time_horizon)
+                )
+                window_stream = self._iter_memory_windows(
+                    time_horizon, now=reference_time,
+                    start_key=run.cursor_key, skip_hashes=run.cursor_hashes,
+                ) if windows_left else self._no_windows()
+                while True:
+                    with profile_phase("load") as phase:
+                        memories = await anext(window_stream, None)
+                        phase["items_out"] = len(memories or ())
+                    if memories is None:
+                        break
+                    windows += 1
+                    self.logger.info(
+                        f"✓ Found {len(memories)} memories to process (window {run.windows_completed + 1})"
+                    )
+
+                    if existing_associations is None and self.config.associations_enabled and check_horizon_requirements(
+                        time_horizon, "associations", self.ENABLED_PHASES
+                    ):
+                        existing_associations = await self._get_existing_associations()
+
+                    relevance_summary.update(await self._consolidate_window(
+                        memories, time_horizon, report, existing_associations or set(), run
+                    ))
+                run.streamed = True
+                await self.run_store.save(run)
 
-                if not memories:
+                if not report.memories_processed:
                     self.logger.info(
                         f"No memories to process for {time_horizon} consolidation"
                     )
-                    return self._finalize_report(report, [])
+                    await self._finish_run(run, "completed")
+                    await self._publish_progress(time_horizon, "run", "completed", details={"memories_processed": 0})
+                    return self._finalize_report(report, [], profile)
+
+                report.performance_metrics["streaming"] = {
+                    "windows": windows,
+                    "window_size": getattr(self.config, "consolidation_window_size", 0),
+                    "peak_rss_mb": peak_rss_mb(),
+                }
+                report.performance_metrics["executor"] = self.executor.stats()
 
-                self.logger.info(f"✓ Found {len(memories)} memories to process")
+                with profile_phase("graph", len(relevance_summary)):
+                    # 6b. Prune orphaned graph edges (#632)
+                    orphaned = await self._prune_orphaned_graph_edges()
+                    if orphaned > 0:
+                        self.logger.info(f"🧹 Pruned {orphaned} orphaned graph edges")
 
-                # 2. Calculate/update relevance scores
-                self.logger.info(
-                    f"📊 Phase 1/6: Calculating relevance scores for {len(memories)} memories..."
+                    # 6c. Refresh graph centrality used as a search ranking signal
+                    await self._refresh_graph_centrality(relevance_summary)
+
+                # 6d. Fold new memories into the persistent cluster index
+                await self._maintain_cluster_index(report)
+
+                # 7. Update consolidation statistics
+                self._update_consolidation_stats(report)
+
+                # 8. Finalize report
+                report = self._finalize_report(report, [], profile)
+                if self.plugin_registry:
+                    await self.plugin_registry.fire('on_consolidate', {
+                        **report.performance_metrics,
+                        'time_horizon': report.time_horizon,
+                        'memories_processed': report.memories_processed,
+                        'associations_discovered': report.associations_discovered,
+                        'clusters_created': report.clusters_created,
+                    })
+                await self._finish_run(run, "completed")
+                await self._publish_progress(time_horizon, "run", "completed", details={
+                    "memories_processed": report.memories_processed,
+                    "duration_seconds": report.performance_metrics.get("duration_seconds"),
+                })
+                return report
+
+        except ConsolidationError as e:
+            # Re-raise configuration and validation errors
+            self.logger.error(
+                f"Configuration error during {time_horizon} consolidation: {e}"
+            )
+            self.health_monitor.record_error(
+                "consolidator", e, {"time_horizon": time_horizon}
+            )
+            if run is not None:
+                await self._finish_run(run, "failed", str(e))
+            raise
+        except Exception as e:
+            self.logger.error(f"Error during {time_horizon} consolidation: {e}")
+            self.health_monitor.record_error(
+                "consolidator", e, {"time_horizon": time_horizon}
+            )
+            report.errors.append(str(e))
+            if run is not None:
+                await self._finish_run(run, "failed", str(e))
+            await self._publish_progress(time_horizon, "run", "failed")
+            return self._finalize_report(report, [str(e)], profile)
+        finally:
+            self.executor.release()
+            if run is not None:
+                self._active_runs.discard(run.run_id)
+
+    async def _begin_run(
+        self, time_horizon: str, run_id: Optional[str], resume: bool
+    ) -> ConsolidationRun:
+        """Load the run to resume, or record a new one.
+
+        Raises:
+            ConsolidationError: For an unknown horizon, or a ``run_id`` that
+                is unknown, belongs to another horizon, already completed or
+                is in progress in this process.
+        """
+        if time_horizon not in HORIZON_CONFIGS:
+            raise ConsolidationError(f"Unknown time horizon: {time_horizon}")
+
+        run = None
+        if run_id is not None:
+            run = await self.run_store.load(run_id)
+            if run is None:
+                raise ConsolidationError(f"Unknown consolidation run: {run_id}")
+            if run.time_horizon != time_horizon:
+                raise ConsolidationError(
+                    f"Consolidation run {run_id} is a {run.time_horizon} run, not {time_horizon}"
                 )
+            if not run.resumable:
+                raise ConsolidationError(f"Consolidation run {run_id} already completed")
+            if run_id in self._active_runs:
+                raise ConsolidationError(f"Consolidation run {run_id} is already in progress")
+        elif resume:
+            # A run older than its horizon's period is stale; start afresh
+            candidate = await self.run_store.latest_unfinished(time_horizon)
+            period = HORIZON_CONFIGS[time_horizon]["delta"].total_seconds()
+            if (
+                candidate is not None
+                and candidate.run_id not in self._active_runs
+                and time.time() - candidate.reference_time < period
+            ):
+                run = candidate
+
+        if run is None:
+            run = ConsolidationRun.start(time_horizon, time.time())
+        else:
+            run.attempts += 1
+            run.status = "running"
+            run.error = None
+            self.logger.info(
+                f"Resuming {time_horizon} consolidation run {run.run_id} "
+                f"(attempt {run.attempts}, {run.windows_completed} windows done)"
+            )
+        self._active_runs.add(run.run_id)
+        await self.run_store.save(run)
+        return run
+
+    async def _finish_run(self, run: ConsolidationRun, status: str, error: Optional[str] = None) -> None:
+        """Record the outcome of a run; window state is dropped once it completed."""
+        run.status = status
+        run.error = error
+        run.finished_at = datetime.now().isoformat()
+        if status == "completed":
+            run.window = None
+        await self.run_store.save(run)
+
+    @staticmethod
+    async def _no_windows() -> AsyncIterator[List[Memory]]:
+        """Empty window stream for a resumed run whose windows are all done."""
+        return
+        yield
+
+    def _single_window(self, time_horizon: str) -> bool:
+        """Whether runs of this horizon consolidate a single window (see _iter_memory_windows)."""
+        return (
+            time_horizon == "daily"
+            or self.config.incremental_mode
+            or not getattr(self.config, "consolidation_window_size", 0)
+            or not isinstance(unwrap_storage(self.storage), MemoryStorage)
+        )
+
+    async def get_run(self, run_id: str) -> Optional[ConsolidationRun]:
+        """The recorded consolidation run with ``run_id``, if any."""
+        return await self.run_store.load(run_id)
+
+    async def list_runs(self, limit: int = 20) -> List[ConsolidationRun]:
+        """Recently recorded consolidation runs, newest first."""
+        return await self.run_store.list_runs(limit)
+
+    async def _publish_progress(
+        self,
+        time_horizon: str,
+        phase: str,
+        status: str,
+        window: Optional[int] = None,
+        details: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Broadcast a consolidation_progress SSE event (no-op without the web interface)."""
+        if not SSE_AVAILABLE:
+            return
+        try:
+            await sse_manager.broadcast_event(create_consolidation_progress_event(
+                time_horizon, phase, status, window=window, details=details
+            ))
+        except Exception as e:
+            self.logger.debug(f"Failed to broadcast consolidation progress: {e}")
+
+    async def _consolidate_window(
+        self,
+        memories: List[Memory],
+        time_horizon: str,
+        report: ConsolidationReport,
+        existing_associations: set,
+        run: ConsolidationRun,
+    ) -> Dict[str, float]:
+        """Run the per-memory phases over one window of memories.
+
+        Scores relevance, then clusters, discovers associations, compresses
+        and forgets as enabled for the horizon, adding counts to ``report``.
+        Each phase is checkpointed in ``run`` once its outputs are written;
+        phases already checkpointed for this window's input set are restored
+        rather than run again.
+
+        Returns:
+            Relevance scores by content hash, kept for centrality once the
+            window itself has been released.
+        """
+        # Cursor past this window, taken before incremental timestamps move it
+        cursor_key = max(consolidation_sort_key(memory) for memory in memories)
+        cursor_hashes = [m.content_hash for m in memories if consolidation_sort_key(m) == cursor_key]
+
+        checkpoint = self._window_checkpoint(run, memories, report)
+        window = checkpoint["index"]
+        phases, state = checkpoint["phases"], checkpoint["state"]
+
+        # Calculate/update relevance scores
+        if "relevance" in phases:
+            relevance_scores = load_relevance_scores(state["relevance_scores"])
+            await self._restore_phase(time_horizon, "relevance", report, window)
+        else:
+            self.logger.info(
+                f"📊 Phase 1/6: Calculating relevance scores for {len(memories)} memories..."
+            )
+            await self._publish_progress(time_horizon, "relevance", "running", window, {"memories": len(memories)})
+            with profile_phase("relevance", len(memories)) as phase:
                 performance_start = time.time()
                 relevance_scores = await self._update_relevance_scores(
                     memories, time_horizon
@@ -310,71 +640,111 @@ class DreamInspiredConsolidator:
                 self.logger.info(
                     f"✓ Relevance scoring completed in {time.time() - performance_start:.1f}s"
                 )
-
-                # 3. Cluster by semantic similarity (if enabled and appropriate)
-                clusters = []
-                if self.config.clustering_enabled and check_horizon_requirements(
-                    time_horizon, "clustering", self.ENABLED_PHASES
-                ):
-                    self.logger.info(
-                        f"🔗 Phase 2/6: Clustering memories by semantic similarity..."
-                    )
+                state["relevance_scores"] = dump_relevance_scores(relevance_scores)
+                phase["items_out"] = len(relevance_scores)
+                await self._complete_phase(run, report, "relevance", performance_start, {
+                    "scored": len(relevance_scores),
+                })
+
+        # Cluster by semantic similarity (if enabled and appropriate)
+        clusters = []
+        if self.config.clustering_enabled and check_horizon_requirements(
+            time_horizon, "clustering", self.ENABLED_PHASES
+        ):
+            if "clustering" in phases:
+                clusters = load_clusters(state["clusters"])
+                await self._restore_phase(time_horizon, "clustering", report, window)
+            else:
+                self.logger.info(
+                    f"🔗 Phase 2/6: Clustering memories by semantic similarity..."
+                )
+                await self._publish_progress(time_horizon, "clustering", "running", window)
+                with profile_phase("clustering", len(memories)) as phase:
                     performance_start = time.time()
                     clusters = await self.clustering_engine.process(memories)
-                    report.clusters_created = len(clusters)
+                    report.clusters_created += len(clusters)
+                    if self.clustering_engine.last_run_stats:
+                        report.performance_metrics["clustering"] = self._accumulate_clustering_stats(
+                            report.performance_metrics.get("clustering"), self.clustering_engine.last_run_stats
+                        )
                     self.logger.info(
                         f"✓ Clustering completed in {time.time() - performance_start:.1f}s, created {len(clusters)} clusters"
                     )
+                    state["clusters"] = dump_clusters(clusters)
+                    phase["items_out"] = len(clusters)
+                    await self._complete_phase(run, report, "clustering", performance_start, {
+                        "clusters": len(clusters),
+                    })
 
-                # 4. Run creative associations (if enabled and appropriate)
-                associations = []
-                if self.config.associations_enabled and check_horizon_requirements(
-                    time_horizon, "associations", self.ENABLED_PHASES
-                ):
-                    self.logger.info(
-                        f"🧠 Phase 3/6: Discovering creative associations..."
-                    )
+        # Run creative associations (if enabled and appropriate)
+        if self.config.associations_enabled and check_horizon_requirements(
+            time_horizon, "associations", self.ENABLED_PHASES
+        ):
+            if "associations" in phases:
+                await self._restore_phase(time_horizon, "associations", report, window)
+            else:
+                self.logger.info(
+                    f"🧠 Phase 3/6: Discovering creative associations..."
+                )
+                await self._publish_progress(time_horizon, "associations", "running", window)
+                with profile_phase("associations", len(memories)) as phase:
                     performance_start = time.time()
-                    existing_associations = await self._get_existing_associations()
                     associations = await self.association_engine.process(
                         memories, existing_associations=existing_associations
                     )
-                    report.associations_discovered = len(associations)
+                    report.associations_discovered += len(associations)
                     self.logger.info(
                         f"✓ Association discovery completed in {time.time() - performance_start:.1f}s, found {len(associations)} associations"
                     )
 
                     # Store new associations
                     await self._store_associations(associations)
+                    phase["items_out"] = len(associations)
+                    await self._complete_phase(run, report, "associations", performance_start, {
+                        "associations": len(associations),
+                    })
 
-                # 5. Compress clusters (if enabled and clusters exist)
-                compression_results = []
-                if (
-                    self.config.compression_enabled
-                    and clusters
-                    and check_horizon_requirements(
-                        time_horizon, "compression", self.ENABLED_PHASES
-                    )
-                ):
-                    self.logger.info(f"🗜️ Phase 4/6: Compressing memory clusters...")
+        # Compress clusters (if enabled and clusters exist)
+        if (
+            self.config.compression_enabled
+            and clusters
+            and check_horizon_requirements(
+                time_horizon, "compression", self.ENABLED_PHASES
+            )
+        ):
+            if "compression" in phases:
+                await self._restore_phase(time_horizon, "compression", report, window)
+            else:
+                self.logger.info(f"🗜️ Phase 4/6: Compressing memory clusters...")
+                await self._publish_progress(time_horizon, "compression", "running", window)
+                with profile_phase("compression", len(clusters)) as phase:
                     performance_start = time.time()
                     compression_results = await self.compression_engine.process(
                         clusters, memories
                     )
-                    report.memories_compressed = len(compression_results)
+                    report.memories_compressed += len(compression_results)
                     self.logger.info(
                         f"✓ Compression completed in {time.time() - performance_start:.1f}s, compressed {len(compression_results)} clusters"
                     )
 
                     # Store compressed memories and update originals
                     await self._handle_compression_results(compression_results)
+                    phase["items_out"] = len(compression_results)
+                    await self._complete_phase(run, report, "compression", performance_start, {
+                        "compressed": len(compression_results),
+                        "memory_hashes": [r.compressed_memory.content_hash for r in compression_results],
+                    })
 
-                # 6. Controlled forgetting (if enabled and appropriate)
-                forgetting_results = []
-                if self.config.forgetting_enabled and check_horizon_requirements(
-                    time_horizon, "forgetting", self.ENABLED_PHASES
-                ):
-                    self.logger.info(f"🗂️ Phase 5/6: Applying controlled forgetting...")
+        # Controlled forgetting (if enabled and appropriate)
+        if self.config.forgetting_enabled and check_horizon_requirements(
+            time_horizon, "forgetting", self.ENABLED_PHASES
+        ):
+            if "forgetting" in phases:
+                await self._restore_phase(time_horizon, "forgetting", report, window)
+            else:
+                self.logger.info(f"🗂️ Phase 5/6: Applying controlled forgetting...")
+                await self._publish_progress(time_horizon, "forgetting", "running", window)
+                with profile_phase("forgetting", len(memories)) as phase:
                     performance_start = time.time()
                     access_patterns = await self._get_access_patterns()
                     forgetting_results = await self.forgetting_engine.process(
@@ -383,60 +753,129 @@ class DreamInspiredConsolidator:
                         access_patterns=access_patterns,
                         time_horizon=time_horizon,
                     )
-                    report.memories_archived = len(
+                    archived = len(
                         [
                             r
                             for r in forgetting_results
                             if r.action_taken in ["archived", "deleted"]
                         ]
                     )
+                    report.memories_archived += archived
                     self.logger.info(
                         f"✓ Forgetting completed in {time.time() - performance_start:.1f}s, processed {len(forgetting_results)} candidates"
                     )
 
                     # Apply forgetting results to storage
                     await self._apply_forgetting_results(forgetting_results)
-
-                # 6b. Prune orphaned graph edges (#632)
-                orphaned = await self._prune_orphaned_graph_edges()
-                if orphaned > 0:
-                    self.logger.info(f"🧹 Pruned {orphaned} orphaned graph edges")
-
-                # 7. Update consolidation statistics
-                self._update_consolidation_stats(report)
-
-                # 8. Track consolidation timestamp for incremental mode
-                if self.config.incremental_mode:
-                    await self._update_consolidation_timestamps(memories)
-
-                # 9. Finalize report
-                report = self._finalize_report(report, [])
-                if self.plugin_registry:
-                    await self.plugin_registry.fire('on_consolidate', {
-                        **report.performance_metrics,
-                        'time_horizon': report.time_horizon,
-                        'memories_processed': report.memories_processed,
-                        'associations_discovered': report.associations_discovered,
-                        'clusters_created': report.clusters_created,
+                    phase["items_out"] = archived
+                    await self._complete_phase(run, report, "forgetting", performance_start, {
+                        "candidates": len(forgetting_results), "archived": archived,
                     })
-                return report
 
-        except ConsolidationError as e:
-            # Re-raise configuration and validation errors
-            self.logger.error(
-                f"Configuration error during {time_horizon} consolidation: {e}"
-            )
-            self.health_monitor.record_error(
-                "consolidator", e, {"time_horizon": time_horizon}
-            )
-            raise
-        except Exception as e:
-            self.logger.error(f"Error during {time_horizon} consolidation: {e}")
-            self.health_monitor.record_error(
-                "consolidator", e, {"time_horizon": time_horizon}
+        # Track consolidation timestamp for incremental mode
+        if self.config.incremental_mode and "timestamps" not in phases:
+            with profile_phase("timestamps", len(memories)) as phase:
+                performance_start = time.time()
+                await self._update_consolidation_timestamps(memories)
+                phase["items_out"] = len(memories)
+                await self._complete_phase(run, report, "timestamps", performance_start, {
+                    "memories": len(memories),
+                })
+
+        # Window done: advance the cursor and drop its checkpoint
+        report.memories_processed += len(memories)
+        run.windows_completed += 1
+        run.cursor_key, run.cursor_hashes = cursor_key, cursor_hashes
+        run.window = None
+        run.totals = self._run_totals(report)
+        await self.run_store.save(run)
+
+        return {score.memory_hash: score.total_score for score in relevance_scores}
+
+    def _window_checkpoint(
+        self, run: ConsolidationRun, memories: List[Memory], report: ConsolidationReport
+    ) -> Dict[str, Any]:
+        """Checkpoint of the next window, reusing the saved one if its input set is unchanged."""
+        index = run.windows_completed + 1
+        input_hash = input_set_hash(memories)
+        checkpoint = run.window
+        if checkpoint and checkpoint["index"] == index and checkpoint["input_hash"] == input_hash:
+            return checkpoint
+        if checkpoint:
+            # Memories changed since the interruption; drop the partial
+            # window's counts and recompute it from its first phase
+            self.logger.info(
+                f"Window {index} of run {run.run_id} changed since its checkpoint, recomputing it"
             )
-            report.errors.append(str(e))
-            return self._finalize_report(report, [str(e)])
+            for counter, value in checkpoint["totals"].items():
+                setattr(report, counter, value)
+        run.window = {
+            "index": index,
+            "input_hash": input_hash,
+            "totals": self._run_totals(report),
+            "phases": {},
+            "state": {},
+        }
+        return run.window
+
+    async def _complete_phase(
+        self,
+        run: ConsolidationRun,
+        report: ConsolidationReport,
+        phase: str,
+        started: float,
+        outputs: Dict[str, Any],
+    ) -> None:
+        """Checkpoint a phase whose outputs have been written, then report it."""
+        seconds = round(time.time() - started, 3)
+        run.window["phases"][phase] = {"seconds": seconds, "outputs": outputs}
+        run.totals = self._run_totals(report)
+        await self.run_store.save(run)
+        await self._publish_progress(run.time_horizon, phase, "completed", run.window["index"], {
+            "seconds": seconds,
+            **{key: value for key, value in outputs.items() if not isinstance(value, list)},
+        })
+
+    async def _restore_phase(
+        self, time_horizon: str, phase: str, report: ConsolidationReport, window: int
+    ) -> None:
+        """Note a phase skipped because the resumed run already completed it."""
+        self.logger.info(f"↩ Phase {phase} of window {window} restored from checkpoint")
+        report.performance_metrics["run"]["restored_phases"] += 1
+        await self._publish_progress(time_horizon, phase, "restored", window)
+
+    @staticmethod
+    def _accumulate_clustering_stats(
+        total: Optional[Dict[str, Any]], window: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Clustering stats of a run so far, with one more window's stats folded in.
+
+        Memories, clusters and seconds are summed and the rates recomputed
+        from the sums; peak RSS is the maximum. Algorithm-specific stats are
+        the latest window's.
+        """
+        if not total:
+            return {**window, "windows": 1}
+        merged = {**window, "windows": total.get("windows", 1) + 1}
+        for key in ("memories", "clusters", "seconds"):
+            merged[key] = total.get(key, 0) + window.get(key, 0)
+        merged["seconds"] = round(merged["seconds"], 4)
+        merged["peak_rss_mb"] = max(total.get("peak_rss_mb") or 0, window.get("peak_rss_mb") or 0)
+        if merged["seconds"] > 0:
+            merged["clusters_per_second"] = round(merged["clusters"] / merged["seconds"], 2)
+            merged["memories_per_second"] = round(merged["memories"] / merged["seconds"], 2)
+        return merged
+
+    @staticmethod
+    def _run_totals(report: ConsolidationReport) -> Dict[str, int]:
+        """Report counters persisted with the run, so a resumed run reports all its work."""
+        return {
+            "memories_processed": report.memories_processed,
+            "associations_discovered": report.associations_discovered,
+            "clusters_created": report.clusters_created,
+            "memories_compressed": report.memories_compressed,
+            "memories_archived": report.memories_archived,
+        }
 
     async def _get_memories_for_horizon(
         self, time_horizon: str, **kwargs
@@ -446,7 +885,39 @@ class DreamInspiredConsolidator:
         With incremental mode enabled, returns oldest-first batch of memories
         that haven't been recently consolidated.
         """
-        now = datetime.now(timezone.utc)
+        memories: List[Memory] = []
+        async for window in self._iter_memory_windows(time_horizon):
+            memories.extend(window)
+        return memories
+
+    async def _iter_memory_windows(
+        self,
+        time_horizon: str,
+        now: Optional[datetime] = None,
+        start_key: Optional[float] = None,
+        skip_hashes: Iterable[str] = (),
+    ) -> AsyncIterator[List[Memory]]:
+        """Yield the memories for a time horizon in processing windows.
+
+        Daily runs yield the recent memories as one window, and incremental
+        runs the ``batch_size`` least recently consolidated ones. Full runs
+        over longer horizons stream the horizon from storage in chunks of
+        ``consolidation_chunk_size`` memories and yield it as one window, so
+        clusters and associations can span the whole horizon. Setting
+        ``consolidation_window_size`` yields windows of that many memories
+        instead, bounding peak memory by the window size at the cost of
+        clusters and associations spanning windows, which are not found.
+
+        Args:
+            time_horizon: Horizon whose memories to yield
+            now: Reference time for the horizon cutoffs (default: now)
+            start_key: Skip memories ordered before this consolidation order
+                key, for resuming a full run after its last finished window
+            skip_hashes: Memories at ``start_key`` that were already
+                consolidated; the remaining ones are re-chunked so resumed
+                windows match the original ones
+        """
+        now = now or datetime.now(timezone.utc)
 
         # Validate time horizon
         if time_horizon not in HORIZON_CONFIGS:
@@ -462,35 +933,76 @@ class DreamInspiredConsolidator:
             memories = await self.storage.get_memories_by_time_range(
                 start_time, end_time, include_embeddings=True,
             )
-        else:
-            # For longer horizons: incremental oldest-first processing
-            memories = await self.storage.get_all_memories(include_embeddings=True)
-
-            # Filter by relevance to time horizon (quarterly/yearly still focus on old memories)
-            cutoff_days = config.get("cutoff_days")
-            if cutoff_days is not None:
-                cutoff_date = now - timedelta(days=cutoff_days)
-                memories = filter_memories_by_age(memories, cutoff_date)
-
-            # Incremental mode: Sort oldest-first and batch
-            if self.config.incremental_mode:
-                # Sort by last_consolidated_at (oldest first), fallback to created_at
-                def get_consolidation_sort_key(memory: Memory) -> float:
-                    # Check metadata for last consolidation timestamp
-                    if memory.metadata and "last_consolidated_at" in memory.metadata:
-                        return float(memory.metadata["last_consolidated_at"])
-                    # Fall back to created_at (treat never-consolidated as oldest)
-                    return memory.created_at if memory.created_at else 0.0
-
-                memories.sort(key=get_consolidation_sort_key)
-
-                # Limit to batch size
-                batch_size = self.config.batch_size
-                if len(memories) > batch_size:
-                    self.logger.info(
-                        f"Incremental mode: Processing {batch_size} oldest memories (out of {len(memories)} total)"
-                    )
-                    memories = memories[:batch_size]
+            if memories:
+                yield memories
+            return
+
+        # Quarterly/yearly still focus on old memories. Other horizons stop at
+        # the run start, so memories stored by earlier windows (summaries,
+        # associations) are not streamed back into later ones.
+        cutoff_days = config.get("cutoff_days")
+        cutoff_timestamp = (now - timedelta(days=cutoff_days or 0)).timestamp()
+
+        # Duck-typed storages outside the MemoryStorage hierarchy have no
+        # streaming method; load and order their memories in Python
+        if not isinstance(unwrap_storage(self.storage), MemoryStorage):
+            memories = await self._load_memories_for_horizon(cutoff_days)
+            if memories:
+                yield memories
+            return
+
+        chunk_size = getattr(self.config, "consolidation_chunk_size", 1000)
+        if self.config.incremental_mode:
+            # Oldest-first batch, ordered and limited in storage
+            batch_size = self.config.batch_size
+            memories = []
+            async for chunk in self.storage.iter_memories_for_consolidation(
+                cutoff_timestamp=cutoff_timestamp,
+                chunk_size=min(chunk_size, batch_size),
+                limit=batch_size,
+            ):
+                memories.extend(chunk)
+            if len(memories) == batch_size:
+                self.logger.info(
+                    f"Incremental mode: Processing the {batch_size} least recently consolidated memories"
+                )
+            if memories:
+                yield memories
+            return
+
+        window_size = getattr(self.config, "consolidation_window_size", 0)
+        skip = set(skip_hashes)
+        pending: List[Memory] = []
+        async for chunk in self.storage.iter_memories_for_consolidation(
+            cutoff_timestamp=cutoff_timestamp, chunk_size=chunk_size, start_key=start_key,
+        ):
+            pending.extend(memory for memory in chunk if memory.content_hash not in skip)
+            while window_size and len(pending) >= window_size:
+                yield pending[:window_size]
+                pending = pending[window_size:]
+        if pending:
+            yield pending
+
+    async def _load_memories_for_horizon(self, cutoff_days: Optional[int]) -> List[Memory]:
+        """Load, filter and order memories in Python for storages without streaming support."""
+        memories = await self.storage.get_all_memories(include_embeddings=True)
+
+        # Filter by relevance to time horizon (quarterly/yearly still focus on old memories)
+        if cutoff_days is not None:
+            cutoff_date = datetime.now(timezone.utc) - timedelta(days=cutoff_days)
+            memories = filter_memories_by_age(memories, cutoff_date)
+
+        # Incremental mode: Sort oldest-first and batch
+        if self.config.incremental_mode:
+            memories.sort(key=consolidation_sort_key)
+
+            # Limit to batch size
+            batch_size = self.config.batch_size
+            if len(memories) > batch_size:
+                self.logger.info(
+                    f"Incremental mode: Processing {batch_size} oldest memories (out of {len(memories)} total)"
+                )
+                memories = memories[:batch_size]
 
         return memories
 
@@ -499,7 +1011,9 @@ class DreamInspiredConsolidator:
     ) -> List:
         """Calculate and update relevance scores for memories."""
         # Get connection and access data
-        connections = await self._get_memory_connections()
+        connections = await self._get_memory_connections(
+            [memory.content_hash for memory in memories]
+        )
         access_patterns = await self._get_access_patterns()
 
         # Calculate relevance scores
@@ -512,16 +1026,15 @@ class DreamInspiredConsolidator:
 
         # Update memory metadata with relevance scores (v8.47.1 - batch optimization)
         # Collect all memories to update, then use single batch operation for 50-100x speedup
+        scores_by_hash = {score.memory_hash: score for score in relevance_scores}
+        calculated_at = datetime.now().isoformat()
         memories_to_update = []
         for memory in memories:
-            score = next(
-                (s for s in relevance_scores if s.memory_hash == memory.content_hash),
-                None,
-            )
+            score = scores_by_hash.get(memory.content_hash)
             if score:
                 updated_memory = (
                     await self.decay_calculator.update_memory_relevance_metadata(
-                        memory, score
+                        memory, score, calculated_at
                     )
                 )
                 memories_to_update.append(updated_memory)
@@ -532,10 +1045,12 @@ class DreamInspiredConsolidator:
 
         return relevance_scores
 
-    async def _get_memory_connections(self) -> Dict[str, int]:
-        """Get memory connection counts from storage."""
+    async def _get_memory_connections(
+        self, memory_hashes: Optional[List[str]] = None
+    ) -> Dict[str, int]:
+        """Get memory connection counts from storage for the candidate hashes."""
         try:
-            return await self.storage.get_memory_connections()
+            return await self.storage.get_memory_connections(memory_hashes=memory_hashes)
         except AttributeError:
             # Fallback if storage doesn't implement connection tracking
             self.logger.warning("Storage backend doesn't support connection tracking")
@@ -667,9 +1182,10 @@ class DreamInspiredConsolidator:
             )
             return
 
-        stored_count = 0
         failed_count = 0
-        supersede_pairs = []
+        edges = []
+        # Contradiction pairs for batch superseding (#732), applied once stored
+        supersede_candidates = []
 
         # Build hash -> memory lookup map for efficiency
         all_memories = await self.storage.get_all_memories()
@@ -733,40 +1249,45 @@ class DreamInspiredConsolidator:
                     **association.metadata,
                 }
 
-                # Store in graph table with inferred relationship type
-                success = await self.graph_storage.store_association(
-                    source_hash=source_hash,
-                    target_hash=target_hash,
-                    similarity=association.similarity_score,
-                    connection_types=connection_types,
-                    metadata=metadata,
-                    relationship_type=relationship_type,
-                )
-
-                if success:
-                    stored_count += 1
+                edges.append({
+                    "source_hash": source_hash,
+                    "target_hash": target_hash,
+                    "similarity": association.similarity_score,
+                    "connection_types": connection_types,
+                    "metadata": metadata,
+                    "relationship_type": relationship_type,
+                })
 
-                    # Collect contradiction pairs for batch superseding (#732)
-                    if (
-                        relationship_type == "contradicts"
-                        and confidence >= 0.75
-                        and source_memory
-                        and target_memory
-                    ):
-                        source_ts = source_memory.created_at or 0.0
-                        target_ts = target_memory.created_at or 0.0
-                        if source_ts >= target_ts:
-                            supersede_pairs.append((source_memory.content_hash, target_memory.content_hash))
-                        else:
-                            supersede_pairs.append((target_memory.content_hash, source_memory.content_hash))
-                else:
-                    failed_count += 1
+                if (
+                    relationship_type == "contradicts"
+                    and confidence >= 0.75
+                    and source_memory
+                    and target_memory
+                ):
+                    supersede_candidates.append((source_memory, target_memory))
 
             except Exception as e:
                 failed_count += 1
-                self.logger.warning(f"Failed to store association in graph table: {e}")
+                self.logger.warning(f"Failed to prepare association for graph table: {e}")
+
+        # Upsert every edge in a single transaction
+        result = await self.graph_storage.store_associations_bulk(edges)
+        stored_count = len(edges) - result["skipped"]
+        failed_count += result["skipped"]
+        if result["failed"]:
+            failed_count += stored_count
+            stored_count = 0
+            supersede_candidates = []
 
         # Batch-mark superseded memories in a single transaction (#732)
+        supersede_pairs = []
+        for source_memory, target_memory in supersede_candidates:
+            source_ts = source_memory.created_at or 0.0
+            target_ts = target_memory.created_at or 0.0
+            if source_ts >= target_ts:
+                supersede_pairs.append((source_memory.content_hash, target_memory.content_hash))
+            else:
+                supersede_pairs.append((target_memory.content_hash, source_memory.content_hash))
         if supersede_pairs:
             storage = getattr(self.storage, "primary_storage", None) or self.storage
             if hasattr(storage, 'mark_superseded_batch'):
@@ -849,6 +1370,36 @@ class DreamInspiredConsolidator:
             self.logger.warning(f"Failed to prune orphaned graph edges: {e}")
             return 0
 
+    async def _refresh_graph_centrality(self, relevance_scores: Dict[str, float]) -> None:
+        """Recompute PageRank/degree centrality, personalized by relevance scores (by content hash)."""
+        if not GRAPH_CENTRALITY_ENABLED or not hasattr(self.graph_storage, 'refresh_centrality'):
+            return
+        try:
+            performance_start = time.time()
+            result = await self.graph_storage.refresh_centrality(
+                personalization=relevance_scores
+            )
+            if result and not result.get("skipped"):
+                self.logger.info(
+                    f"✓ Graph centrality refreshed in {time.time() - performance_start:.1f}s "
+                    f"({result['nodes']} nodes, {result['updated']} updated)"
+                )
+        except Exception as e:
+            self.logger.warning(f"Failed to refresh graph centrality: {e}")
+
+    async def _maintain_cluster_index(self, report: ConsolidationReport) -> None:
+        """Assign unindexed memories to the cluster index, re-clustering it on drift."""
+        if not self.config.clustering_enabled or not getattr(self.config, "cluster_index_enabled", True):
+            return
+        try:
+            with profile_phase("cluster_index") as phase:
+                result = await self.cluster_index.maintain(self.storage)
+                if result:
+                    report.performance_metrics["cluster_index"] = result
+                    phase["items_in"], phase["items_out"] = result["indexed"], result["clusters"]
+        except Exception as e:
+            self.logger.warning(f"Failed to maintain cluster index: {e}")
+
     async def _update_consolidation_timestamps(self, memories: List[Memory]) -> None:
         """Mark memories with last_consolidated_at timestamp for incremental mode using batch updates."""
         consolidation_time = datetime.now().timestamp()
@@ -918,22 +1469,24 @@ class DreamInspiredConsolidator:
         self.last_consolidation_times[report.time_horizon] = report.start_time
 
     def _finalize_report(
-        self, report: ConsolidationReport, errors: List[str]
+        self, report: ConsolidationReport, errors: List[str], profile: Optional[PhaseProfiler] = None
     ) -> ConsolidationReport:
-        """Finalize the consolidation report."""
+        """Finalize the consolidation report, attaching the run's ``profile``."""
         report.end_time = datetime.now()
         report.errors.extend(errors)
 
         # Add performance metrics
         duration = (report.end_time - report.start_time).total_seconds()
         success = len(errors) == 0
-        report.performance_metrics = {
+        report.performance_metrics.update({
             "duration_seconds": duration,
             "memories_per_second": report.memories_processed / duration
             if duration > 0
             else 0,
             "success": success,
-        }
+        })
+        if profile is not None:
+            report.performance_metrics["profile"] = profile.summary()
 
         # Record performance in health monitor
         self.health_monitor.record_consolidation_performance(
@@ -942,6 +1495,7 @@ class DreamInspiredConsolidator:
             memories_processed=report.memories_processed,
             success=success,
             errors=errors,
+            profile=report.performance_metrics.get("profile"),
         )
 
         # Log summary
@@ -975,6 +1529,10 @@ class DreamInspiredConsolidator:
         """Get recent performance history."""
         return self.health_monitor.performance_history[-limit:]
 
+    def get_profile_history(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Get per-phase profiles of recent runs, newest first."""
+        return self.health_monitor.get_profile_history(limit)
+
     def resolve_health_alert(self, alert_id: str):
         """Resolve a health alert."""
         self.health_monitor.resolve_alert(alert_id)
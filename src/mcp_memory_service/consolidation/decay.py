@@ -12,16 +12,40 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-"""Exponential decay scoring for memory relevance calculation."""
+"""Exponential decay scoring for memory relevance calculation.
 
-import math
-from typing import List, Dict, Any
-from datetime import datetime, timezone
+Scores are computed over columns: one pass over the memories gathers ages,
+last-access times, connection degrees, base importance, retention periods,
+quality and protection flags into arrays, and :func:`relevance_arrays`
+evaluates the whole decay formula on them with NumPy.
+"""
+
+import logging
+from typing import List, Dict, Any, NamedTuple, Optional
+from datetime import datetime, timedelta, timezone
 from dataclasses import dataclass
 
+import numpy as np
+
 from .base import ConsolidationBase, ConsolidationConfig
 from ..models.memory import Memory
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_DAY_US = 86_400_000_000
+
+# Base importance derived from tags when no explicit importance_score is set
+TAG_IMPORTANCE = {
+    'critical': 2.0,
+    'important': 1.5,
+    'reference': 1.3,
+    'urgent': 1.4,
+    'project': 1.2,
+    'personal': 1.1,
+    'temporary': 0.7,
+    'draft': 0.8,
+    'note': 0.9
+}
+
 @dataclass
 class RelevanceScore:
     """Represents a memory's relevance score with breakdown."""
@@ -33,6 +57,16 @@ class RelevanceScore:
     access_boost: float
     metadata: Dict[str, Any]
 
+class DecayColumns(NamedTuple):
+    """Per-memory decay inputs as parallel arrays."""
+    reference_ts: np.ndarray      # max(created_at, updated_at) in seconds, NaN if unknown
+    last_access_ts: np.ndarray    # last access in seconds, NaN if never accessed
+    base_importance: np.ndarray
+    retention_period: np.ndarray
+    connection_count: np.ndarray
+    quality: np.ndarray
+    protected: np.ndarray
+
 class ExponentialDecayCalculator(ConsolidationBase):
     """
     Calculates memory relevance using exponential decay.
@@ -57,12 +91,11 @@ class ExponentialDecayCalculator(ConsolidationBase):
         memory_connections = kwargs.get('connections', {})  # hash -> connection_count mapping
         access_patterns = kwargs.get('access_patterns', {})  # hash -> last_accessed mapping
         
-        scores = []
-        for memory in memories:
-            score = await self._calculate_memory_relevance(
-                memory, reference_time, memory_connections, access_patterns
-            )
-            scores.append(score)
+        columns = self._decay_columns(memories, memory_connections, access_patterns)
+        arrays = await self._offload(
+            relevance_arrays, columns, _reference_us(reference_time), _quality_boost_settings()
+        )
+        scores = self._relevance_scores(memories, columns, arrays)
         
         self.logger.info(f"Calculated relevance scores for {len(scores)} memories")
         return scores
@@ -74,99 +107,120 @@ class ExponentialDecayCalculator(ConsolidationBase):
         connections: Dict[str, int],
         access_patterns: Dict[str, datetime]
     ) -> RelevanceScore:
-        """
-        Calculate memory relevance using exponential decay with quality weighting.
-
-        Factors:
-        - Age of memory
-        - Base importance score (from metadata or tags)
-        - Retention period (varies by memory type)
-        - Connections to other memories
-        - Recent access patterns
-        - Quality score (high quality = slower decay)
-        - Association-based quality boost (v8.47.0+)
-        """
-        # Get memory age in days
-        age_days = self._get_memory_age_days(memory, current_time)
-
-        # Extract base importance score
-        base_importance = self._get_base_importance(memory)
-
-        # Get retention period for memory type
-        memory_type = self._extract_memory_type(memory)
-        retention_period = self.retention_periods.get(memory_type, 30)
-
-        # Calculate exponential decay factor
-        decay_factor = math.exp(-age_days / retention_period)
-
-        # Calculate connection boost
-        connection_count = connections.get(memory.content_hash, 0)
-        connection_boost = 1 + (0.1 * connection_count)  # 10% boost per connection
-
-        # Calculate access boost
-        access_boost = self._calculate_access_boost(memory, access_patterns, current_time)
-
-        # Get initial quality score
-        quality_score = memory.quality_score
-
-        # Association-based quality boost (v8.47.0+)
-        association_boost_applied = False
-        quality_boost_factor = 1.0
-
-        from ..config import (
-            MCP_CONSOLIDATION_QUALITY_BOOST_ENABLED,
-            MCP_CONSOLIDATION_MIN_CONNECTIONS_FOR_BOOST,
-            MCP_CONSOLIDATION_QUALITY_BOOST_FACTOR
-        )
-
-        if MCP_CONSOLIDATION_QUALITY_BOOST_ENABLED:
-            connection_count = connections.get(memory.content_hash, 0)
-
-            # Boost quality if memory has many connections (network effect)
-            if connection_count >= MCP_CONSOLIDATION_MIN_CONNECTIONS_FOR_BOOST:
-                quality_boost_factor = MCP_CONSOLIDATION_QUALITY_BOOST_FACTOR
-                boosted_quality = min(1.0, quality_score * quality_boost_factor)
-
-                if boosted_quality > quality_score:
-                    association_boost_applied = True
-                    self.logger.debug(
-                        f"Association quality boost: {memory.content_hash[:12]} "
-                        f"quality {quality_score:.3f} → {boosted_quality:.3f} "
-                        f"({connection_count} connections)"
-                    )
-                    quality_score = boosted_quality
-
-        # Quality multiplier (higher quality = slower decay)
-        quality_multiplier = 1.0 + (quality_score * 0.5)  # 1.0-1.5x multiplier for quality 0.0-1.0
-
-        # Calculate total relevance score with quality weighting
-        total_score = base_importance * decay_factor * connection_boost * access_boost * quality_multiplier
-
-        # Ensure protected memories maintain minimum relevance
-        if self._is_protected_memory(memory):
-            total_score = max(total_score, 0.5)  # Minimum 50% relevance for protected memories
-
-        return RelevanceScore(
-            memory_hash=memory.content_hash,
-            total_score=total_score,
-            base_importance=base_importance,
-            decay_factor=decay_factor,
-            connection_boost=connection_boost,
-            access_boost=access_boost,
-            metadata={
-                'age_days': age_days,
-                'memory_type': memory_type,
-                'retention_period': retention_period,
-                'connection_count': connection_count,
-                'is_protected': self._is_protected_memory(memory),
-                'quality_score': quality_score,
-                'quality_multiplier': quality_multiplier,
-                'association_boost_applied': association_boost_applied,
-                'quality_boost_factor': quality_boost_factor,
-                'original_quality_score': memory.quality_score
-            }
+        """Calculate the relevance of a single memory (see ``_score_memory``)."""
+        return self._score_memory(memory, current_time, connections, access_patterns)
+    
+    def _score_memory(
+        self,
+        memory: Memory,
+        current_time: datetime,
+        connections: Dict[str, int],
+        access_patterns: Dict[str, datetime]
+    ) -> RelevanceScore:
+        """Score one memory through the same columnar path as :meth:`process`."""
+        columns = self._decay_columns([memory], connections, access_patterns)
+        arrays = relevance_arrays(columns, _reference_us(current_time), _quality_boost_settings())
+        return self._relevance_scores([memory], columns, arrays)[0]
+    
+    def _decay_columns(
+        self,
+        memories: List[Memory],
+        connections: Dict[str, int],
+        access_patterns: Dict[str, datetime]
+    ) -> DecayColumns:
+        """Gather the decay inputs of ``memories`` in a single pass."""
+        nan = float('nan')
+        reference_ts, last_access_ts, base_importance = [], [], []
+        retention_period, connection_count, quality, protected = [], [], [], []
+        
+        for memory in memories:
+            # Content updates renew a memory's age (#606)
+            reference = max(filter(None, (memory.created_at, memory.updated_at)), default=None)
+            if not reference and memory.timestamp:
+                reference = _as_utc(memory.timestamp).timestamp()
+            elif not reference:
+                self.logger.warning(f"Memory {memory.content_hash} has no timestamp")
+            reference_ts.append(reference or nan)
+            
+            last_accessed = access_patterns.get(memory.content_hash)
+            last_access_ts.append(
+                _as_utc(last_accessed).timestamp() if last_accessed else memory.updated_at or nan
+            )
+            
+            base_importance.append(self._get_base_importance(memory))
+            retention_period.append(self.retention_periods.get(self._extract_memory_type(memory), 30))
+            connection_count.append(connections.get(memory.content_hash, 0))
+            quality.append(memory.quality_score)
+            protected.append(self._is_protected_memory(memory))
+        
+        return DecayColumns(
+            np.array(reference_ts, dtype=np.float64),
+            np.array(last_access_ts, dtype=np.float64),
+            np.array(base_importance, dtype=np.float64),
+            np.array(retention_period),
+            np.array(connection_count, dtype=np.int64),
+            np.array(quality, dtype=np.float64),
+            np.array(protected, dtype=bool)
         )
     
+    def _relevance_scores(
+        self,
+        memories: List[Memory],
+        columns: DecayColumns,
+        arrays: Dict[str, np.ndarray]
+    ) -> List[RelevanceScore]:
+        """Wrap the arrays from :func:`relevance_arrays` into per-memory scores."""
+        boosted = arrays['association_boost_applied']
+        if self.logger.isEnabledFor(logging.DEBUG):
+            for i in np.flatnonzero(boosted):
+                self.logger.debug(
+                    f"Association quality boost: {memories[i].content_hash[:12]} "
+                    f"quality {columns.quality[i]:.3f} → {arrays['quality_score'][i]:.3f} "
+                    f"({columns.connection_count[i]} connections)"
+                )
+        
+        return [
+            RelevanceScore(
+                memory_hash=memory.content_hash,
+                total_score=total_score,
+                base_importance=base_importance,
+                decay_factor=decay_factor,
+                connection_boost=connection_boost,
+                access_boost=access_boost,
+                metadata={
+                    'age_days': age_days,
+                    'memory_type': self._extract_memory_type(memory),
+                    'retention_period': retention_period,
+                    'connection_count': connection_count,
+                    'is_protected': is_protected,
+                    'quality_score': quality_score,
+                    'quality_multiplier': quality_multiplier,
+                    'association_boost_applied': boost_applied,
+                    'quality_boost_factor': boost_factor,
+                    'original_quality_score': memory.quality_score
+                }
+            )
+            for (memory, total_score, base_importance, decay_factor, connection_boost,
+                 access_boost, age_days, retention_period, connection_count, is_protected,
+                 quality_score, quality_multiplier, boost_applied, boost_factor)
+            in zip(
+                memories,
+                arrays['total_score'].tolist(),
+                columns.base_importance.tolist(),
+                arrays['decay_factor'].tolist(),
+                arrays['connection_boost'].tolist(),
+                arrays['access_boost'].tolist(),
+                arrays['age_days'].tolist(),
+                columns.retention_period.tolist(),
+                columns.connection_count.tolist(),
+                columns.protected.tolist(),
+                arrays['quality_score'].tolist(),
+                arrays['quality_multiplier'].tolist(),
+                boosted.tolist(),
+                arrays['quality_boost_factor'].tolist()
+            )
+        ]
+    
     def _get_base_importance(self, memory: Memory) -> float:
         """
         Extract base importance score from memory metadata or tags.
@@ -185,63 +239,9 @@ class ExponentialDecayCalculator(ConsolidationBase):
                 self.logger.warning(f"Invalid importance_score in memory {memory.content_hash}")
         
         # Derive importance from tags
-        tag_importance = {
-            'critical': 2.0,
-            'important': 1.5,
-            'reference': 1.3,
-            'urgent': 1.4,
-            'project': 1.2,
-            'personal': 1.1,
-            'temporary': 0.7,
-            'draft': 0.8,
-            'note': 0.9
-        }
-        
-        max_tag_importance = 1.0
-        for tag in memory.tags:
-            tag_score = tag_importance.get(tag.lower(), 1.0)
-            max_tag_importance = max(max_tag_importance, tag_score)
-        
-        return max_tag_importance
-    
-    def _calculate_access_boost(
-        self,
-        memory: Memory,
-        access_patterns: Dict[str, datetime],
-        current_time: datetime
-    ) -> float:
-        """
-        Calculate boost factor based on recent access patterns.
-        
-        Recent access increases relevance:
-        - Accessed within last day: 1.5x boost
-        - Accessed within last week: 1.2x boost  
-        - Accessed within last month: 1.1x boost
-        - No recent access: 1.0x (no boost)
-        """
-        last_accessed = access_patterns.get(memory.content_hash)
-        
-        if not last_accessed:
-            # Check memory's own updated_at timestamp
-            if memory.updated_at:
-                last_accessed = datetime.fromtimestamp(memory.updated_at, tz=timezone.utc)
-            else:
-                return 1.0  # No access data available
-
-        # Normalize both datetimes to UTC timezone-aware
-        current_time = current_time.replace(tzinfo=timezone.utc) if current_time.tzinfo is None else current_time.astimezone(timezone.utc)
-        last_accessed = last_accessed.replace(tzinfo=timezone.utc) if last_accessed.tzinfo is None else last_accessed.astimezone(timezone.utc)
-
-        days_since_access = (current_time - last_accessed).days
-        
-        if days_since_access <= 1:
-            return 1.5  # Accessed within last day
-        elif days_since_access <= 7:
-            return 1.2  # Accessed within last week
-        elif days_since_access <= 30:
-            return 1.1  # Accessed within last month
-        else:
-            return 1.0  # No recent access
+        if not memory.tags:
+            return 1.0
+        return max(1.0, *(TAG_IMPORTANCE.get(tag.lower(), 1.0) for tag in memory.tags))
     
     async def get_low_relevance_memories(
         self,
@@ -262,12 +262,13 @@ class ExponentialDecayCalculator(ConsolidationBase):
     async def update_memory_relevance_metadata(
         self,
         memory: Memory,
-        score: RelevanceScore
+        score: RelevanceScore,
+        calculated_at: Optional[str] = None
     ) -> Memory:
         """Update memory metadata with calculated relevance score."""
         memory.metadata.update({
             'relevance_score': score.total_score,
-            'relevance_calculated_at': datetime.now().isoformat(),
+            'relevance_calculated_at': calculated_at or datetime.now().isoformat(),
             'decay_factor': score.decay_factor,
             'connection_boost': score.connection_boost,
             'access_boost': score.access_boost
@@ -295,4 +296,101 @@ class ExponentialDecayCalculator(ConsolidationBase):
 
         # NOTE: Do NOT call memory.touch() here — relevance scoring is a read path.
         # Advancing updated_at corrupts age calculations and inflates access boosts. (#604)
-        return memory
\ No newline at end of file
+        return memory
+
+
+def _as_utc(moment: datetime) -> datetime:
+    """``moment`` as an aware UTC datetime; naive datetimes are taken as UTC."""
+    return moment.replace(tzinfo=timezone.utc) if moment.tzinfo is None else moment.astimezone(timezone.utc)
+
+
+def _reference_us(reference_time: datetime) -> int:
+    """Microseconds since the epoch of the scoring reference time."""
+    return (_as_utc(reference_time) - _EPOCH) // timedelta(microseconds=1)
+
+
+def _whole_days(reference_us: int, timestamps: np.ndarray) -> np.ndarray:
+    """Whole days from ``timestamps`` (seconds) to the reference, as ``timedelta.days``."""
+    micros = np.round(np.nan_to_num(timestamps) * 1e6).astype(np.int64)
+    return (reference_us - micros) // _DAY_US
+
+
+def _quality_boost_settings() -> Dict[str, Any]:
+    """Association quality boost settings, read when a scoring run starts."""
+    from ..config import (
+        MCP_CONSOLIDATION_QUALITY_BOOST_ENABLED,
+        MCP_CONSOLIDATION_MIN_CONNECTIONS_FOR_BOOST,
+        MCP_CONSOLIDATION_QUALITY_BOOST_FACTOR
+    )
+    return {
+        'enabled': MCP_CONSOLIDATION_QUALITY_BOOST_ENABLED,
+        'min_connections': MCP_CONSOLIDATION_MIN_CONNECTIONS_FOR_BOOST,
+        'factor': MCP_CONSOLIDATION_QUALITY_BOOST_FACTOR
+    }
+
+
+def relevance_arrays(
+    columns: DecayColumns,
+    reference_us: int,
+    quality_boost: Dict[str, Any]
+) -> Dict[str, np.ndarray]:
+    """
+    Evaluate exponential decay with quality weighting over whole columns.
+
+    Factors:
+    - Age of memory
+    - Base importance score (from metadata or tags)
+    - Retention period (varies by memory type)
+    - Connections to other memories (10% boost per connection)
+    - Recent access: 1.5x within a day, 1.2x within a week, 1.1x within a month
+    - Quality score (high quality = slower decay, 1.0-1.5x multiplier)
+    - Association-based quality boost (v8.47.0+)
+
+    Protected memories keep a minimum relevance of 0.5. Runs in consolidation
+    workers; every result is an array aligned with ``columns``.
+    """
+    known = ~np.isnan(columns.reference_ts)
+    age_days = np.where(known, _whole_days(reference_us, columns.reference_ts), 0)
+    decay_factor = np.exp(-age_days / columns.retention_period)
+
+    connection_boost = 1 + 0.1 * columns.connection_count
+
+    accessed = ~np.isnan(columns.last_access_ts)
+    days_since_access = _whole_days(reference_us, columns.last_access_ts)
+    access_boost = np.select(
+        [accessed & (days_since_access <= 1),
+         accessed & (days_since_access <= 7),
+         accessed & (days_since_access <= 30)],
+        [1.5, 1.2, 1.1],
+        default=1.0
+    )
+
+    quality = columns.quality
+    boost_factor = np.ones_like(quality)
+    boosted = np.zeros(len(quality), dtype=bool)
+    if quality_boost['enabled']:
+        # Boost quality if memory has many connections (network effect)
+        eligible = columns.connection_count >= quality_boost['min_connections']
+        boost_factor[eligible] = quality_boost['factor']
+        boosted_quality = np.minimum(1.0, quality * quality_boost['factor'])
+        boosted = eligible & (boosted_quality > quality)
+        quality = np.where(boosted, boosted_quality, quality)
+
+    quality_multiplier = 1.0 + quality * 0.5
+
+    total_score = (
+        columns.base_importance * decay_factor * connection_boost * access_boost * quality_multiplier
+    )
+    total_score = np.where(columns.protected, np.maximum(total_score, 0.5), total_score)
+
+    return {
+        'total_score': total_score,
+        'age_days': age_days,
+        'decay_factor': decay_factor,
+        'connection_boost': connection_boost,
+        'access_boost': access_boost,
+        'quality_score': quality,
+        'quality_multiplier': quality_multiplier,
+        'association_boost_applied': boosted,
+        'quality_boost_factor': boost_factor
+    }
@@ -0,0 +1,216 @@
+# Copyright 2024 Heinrich Krupp
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Off-loop execution of CPU-heavy consolidation work.
+
+The consolidation phases are coroutines, but their compute cores (decay
+scoring, the clustering neighbour graph, association band sampling, cluster
+summarization and near-duplicate detection) never await. Run on the event
+loop they stall every MCP and HTTP request for their whole duration.
+``ConsolidationExecutor`` runs those cores in a process pool of at most
+``max_workers`` processes, so the loop only coordinates storage I/O.
+
+Embedding matrices are copied into shared memory once and workers attach to
+them by name (:class:`SharedMatrix`) instead of receiving a pickled copy per
+task. With ``max_workers=0`` the same functions run on a worker thread, which
+still frees the loop during NumPy work that releases the GIL.
+"""
+
+import asyncio
+import copy
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ..models.memory import Memory
+
+logger = logging.getLogger(__name__)
+
+
+class SharedMatrix(NamedTuple):
+    """Picklable handle to an array placed in shared memory."""
+    name: str
+    shape: Tuple[int, ...]
+    dtype: str
+
+
+# Shared segments attached by this (worker) process. Arrays returned by
+# resolve_matrix() view the segment, so it stays attached until another
+# matrix is requested; consolidation works on one window at a time.
+_ATTACHED: Dict[str, Tuple[shared_memory.SharedMemory, np.ndarray]] = {}
+
+
+def resolve_matrix(matrix: Union[np.ndarray, SharedMatrix]) -> np.ndarray:
+    """The array behind ``matrix``: attached if shared, passed through otherwise."""
+    if not isinstance(matrix, SharedMatrix):
+        return matrix
+    if matrix.name not in _ATTACHED:
+        for name in list(_ATTACHED):
+            segment, _ = _ATTACHED.pop(name)
+            try:
+                segment.close()
+            except BufferError:
+                pass  # A caller still holds a view; the mapping goes with the process
+        segment = shared_memory.SharedMemory(name=matrix.name)
+        array = np.ndarray(matrix.shape, dtype=np.dtype(matrix.dtype), buffer=segment.buf)
+        _ATTACHED[matrix.name] = (segment, array)
+    return _ATTACHED[matrix.name][1]
+
+
+def strip_embeddings(memories: Sequence[Memory]) -> List[Memory]:
+    """Shallow copies of ``memories`` without embeddings, for shipping to workers."""
+    stripped = []
+    for memory in memories:
+        light = copy.copy(memory)
+        light.embedding = None
+        stripped.append(light)
+    return stripped
+
+
+def _measured(fn: Callable, *args) -> Tuple[Any, float]:
+    """Run ``fn(*args)`` in a worker, returning its result and the CPU time it took."""
+    started = time.process_time()
+    result = fn(*args)
+    return result, time.process_time() - started
+
+
+def _worker_context() -> multiprocessing.context.BaseContext:
+    """Start workers from a fork server where available, spawn otherwise.
+
+    The server holds threads (SQLite readers, sync tasks), which makes a plain
+    fork unsafe. The fork server imports the consolidation engines once and
+    every worker is forked from that clean process.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload([__name__])
+        return context
+    return multiprocessing.get_context("spawn")
+
+
+class ConsolidationExecutor:
+    """
+    Runs pure compute functions for consolidation off the event loop.
+
+    The process pool is created on first use and shared by concurrent
+    consolidation runs. Each run holds it between :meth:`acquire` and
+    :meth:`release`; the last run to release it shuts the pool down, so an
+    idle server holds no worker processes and a finishing run never cancels
+    the work of another. If the pool breaks (a worker was killed), the
+    remaining work falls back to a thread.
+    """
+
+    def __init__(self, max_workers: int = 0):
+        self.max_workers = max(0, min(int(max_workers), os.cpu_count() or 1))
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._broken = False
+        self._holders = 0
+        # CPU time spent in worker processes (thread work counts as this process)
+        self.worker_cpu_seconds = 0.0
+
+    @property
+    def uses_processes(self) -> bool:
+        """Whether work crosses a process boundary (memories are pickled, matrices shared)."""
+        return self.max_workers > 0 and not self._broken
+
+    @property
+    def parallelism(self) -> int:
+        """Number of tasks worth splitting batch work into."""
+        return self.max_workers if self.uses_processes else 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Execution mode for performance reports."""
+        return {
+            'mode': 'process' if self.uses_processes else 'thread',
+            'max_workers': self.max_workers,
+        }
+
+    async def run(self, fn: Callable, *args) -> Any:
+        """Run ``fn(*args)`` in a worker process (or thread) and return its result."""
+        if not self.uses_processes:
+            return await asyncio.to_thread(fn, *args)
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=_worker_context())
+        try:
+            # submit() starts the fork server and forks workers on demand, which
+            # blocks until the engines are imported; keep that off the loop too.
+            future = await asyncio.to_thread(self._pool.submit, _measured, fn, *args)
+            result, cpu_seconds = await asyncio.wrap_future(future)
+            self.worker_cpu_seconds += cpu_seconds
+            return result
+        except BrokenProcessPool:
+            logger.warning("Consolidation worker pool broke; continuing on a thread")
+            self._broken = True
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+            return await asyncio.to_thread(fn, *args)
+
+    async def map_batches(self, fn: Callable, items: Sequence, *args) -> List:
+        """
+        Run ``fn(batch, *args)`` over ``items`` split into one batch per worker.
+
+        ``fn`` must return a list per batch; the lists are concatenated in the
+        order of ``items``.
+        """
+        if not items:
+            return []
+        size = -(-len(items) // self.parallelism)
+        batches = [list(items[start:start + size]) for start in range(0, len(items), size)]
+        results = await asyncio.gather(*(self.run(fn, batch, *args) for batch in batches))
+        return [item for batch in results for item in batch]
+
+    @contextmanager
+    def share(self, array: np.ndarray) -> Iterator[Union[np.ndarray, SharedMatrix]]:
+        """
+        Make ``array`` available to workers for the duration of the block.
+
+        Yields a :class:`SharedMatrix` backed by a shared memory segment that
+        is unlinked on exit, or ``array`` itself when no processes are used.
+        """
+        if not self.uses_processes:
+            yield array
+            return
+        segment = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        try:
+            np.ndarray(array.shape, dtype=array.dtype, buffer=segment.buf)[...] = array
+            yield SharedMatrix(segment.name, tuple(array.shape), array.dtype.str)
+        finally:
+            segment.close()
+            segment.unlink()
+
+    def acquire(self) -> None:
+        """Hold the pool for a consolidation run until :meth:`release`."""
+        self._holders += 1
+
+    def release(self) -> None:
+        """End a run's hold on the pool; the last holder shuts it down."""
+        self._holders = max(0, self._holders - 1)
+        if self._holders == 0:
+            self.shutdown()
+
+    def shutdown(self) -> None:
+        """Release worker processes; the next run starts a fresh pool."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+        self._broken = False
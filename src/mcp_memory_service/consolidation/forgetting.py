@@ -16,7 +16,7 @@
 
 import os
 import json
-from typing import List, Dict, Any, Optional
+from typing import Iterable, List, Dict, Any, Optional, Set, Tuple
 from datetime import datetime, timezone
 from dataclasses import dataclass
 from pathlib import Path
@@ -25,6 +25,7 @@ import hashlib
 from .base import ConsolidationBase, ConsolidationConfig
 from .decay import RelevanceScore
 from ..models.memory import Memory
+from ..utils.near_duplicates import NearDuplicateIndex
 
 @dataclass
 class ForgettingCandidate:
@@ -130,6 +131,10 @@ class ControlledForgettingEngine(ConsolidationBase):
 
         candidates = []
         current_time = datetime.now(timezone.utc)
+        # Near-duplicate detection is CPU-bound; only the hashes come back
+        duplicate_hashes = await self._offload(
+            find_duplicate_hashes, [(m.content_hash, m.content) for m in memories]
+        )
 
         for memory in memories:
             # Skip protected memories
@@ -209,7 +214,7 @@ class ControlledForgettingEngine(ConsolidationBase):
                 archive_priority = min(archive_priority, 2)
             
             # Duplicate content check
-            if self._appears_to_be_duplicate(memory, memories):
+            if memory.content_hash in duplicate_hashes:
                 forgetting_reasons.append("potential_duplicate")
                 can_be_deleted = True
                 archive_priority = 1
@@ -268,42 +273,27 @@ class ControlledForgettingEngine(ConsolidationBase):
         
         return False
     
-    def _appears_to_be_duplicate(self, memory: Memory, all_memories: List[Memory]) -> bool:
-        """Check if memory appears to be a duplicate of another memory."""
-        content = memory.content.strip().lower()
-        
-        # Skip very short content for duplicate detection
-        if len(content) < 20:
-            return False
-        
-        for other_memory in all_memories:
-            if other_memory.content_hash == memory.content_hash:
-                continue
-            
-            other_content = other_memory.content.strip().lower()
-            
-            # Exact match
-            if content == other_content:
-                return True
-            
-            # Very similar content (simple check)
-            if len(content) > 50 and len(other_content) > 50:
-                # Check if one is a substring of the other with high overlap
-                if content in other_content or other_content in content:
-                    return True
-                
-                # Check word overlap
-                words1 = set(content.split())
-                words2 = set(other_content.split())
-                
-                if len(words1) > 5 and len(words2) > 5:
-                    overlap = len(words1.intersection(words2))
-                    union = len(words1.union(words2))
-                    
-                    if overlap / union > 0.8:  # 80% word overlap
-                        return True
+    def _build_duplicate_index(self, memories: List[Memory]) -> NearDuplicateIndex:
+        """Index every memory's content once for near-duplicate lookups."""
+        return build_duplicate_index((m.content_hash, m.content) for m in memories)
+    
+    def _appears_to_be_duplicate(
+        self,
+        memory: Memory,
+        all_memories: List[Memory],
+        duplicate_index: Optional[NearDuplicateIndex] = None
+    ) -> bool:
+        """
+        Check if memory appears to be a duplicate of another memory.
         
-        return False
+        Candidates come from a MinHash-LSH index over ``all_memories`` (built
+        here unless ``duplicate_index`` is passed) and are confirmed by exact
+        match, containment or more than 80% word overlap.
+        """
+        # Very short content is skipped for duplicate detection (not indexed)
+        if duplicate_index is None:
+            duplicate_index = self._build_duplicate_index(all_memories)
+        return duplicate_index.has_duplicate(memory.content_hash)
     
     async def _process_forgetting_candidate(self, candidate: ForgettingCandidate) -> ForgettingResult:
         """Process a single forgetting candidate."""
@@ -605,4 +595,18 @@ class ControlledForgettingEngine(ConsolidationBase):
             except Exception as e:
                 self.logger.warning(f"Error reading forgetting log: {e}")
         
-        return stats
\ No newline at end of file
+        return stats
+
+
+def build_duplicate_index(items: Iterable[Tuple[str, str]]) -> NearDuplicateIndex:
+    """Near-duplicate index over (content hash, content) pairs."""
+    index = NearDuplicateIndex(threshold=0.8)  # 80% word overlap
+    for content_hash, content in items:
+        index.add(content_hash, content)
+    return index
+
+
+def find_duplicate_hashes(items: List[Tuple[str, str]]) -> Set[str]:
+    """Hashes with at least one near duplicate among ``items``; runs in consolidation workers."""
+    index = build_duplicate_index(items)
+    return {content_hash for content_hash, _ in items if index.has_duplicate(content_hash)}
@@ -80,6 +80,10 @@ class ConsolidationHealthMonitor:
         # Performance tracking
         self.performance_history: List[Dict[str, Any]] = []
         self.max_history_entries = 1000
+
+        # Per-phase profiles of recent runs (see consolidation.profiling)
+        self.profile_history: List[Dict[str, Any]] = []
+        self.max_profile_entries = getattr(config, 'profile_history_size', 50)
         
         # Component health cache
         self.component_health_cache: Dict[str, Dict[str, Any]] = {}
@@ -350,8 +354,9 @@ class ConsolidationHealthMonitor:
     
     def record_consolidation_performance(self, time_horizon: str, duration: float, 
                                        memories_processed: int, success: bool, 
-                                       errors: List[str] = None):
-        """Record performance metrics from a consolidation run."""
+                                       errors: List[str] = None,
+                                       profile: Optional[Dict[str, Any]] = None):
+        """Record performance metrics (and the per-phase profile) of a consolidation run."""
         entry = {
             'timestamp': datetime.now(),
             'time_horizon': time_horizon,
@@ -367,6 +372,16 @@ class ConsolidationHealthMonitor:
         # Trim history to max size
         if len(self.performance_history) > self.max_history_entries:
             self.performance_history = self.performance_history[-self.max_history_entries:]
+
+        if profile is not None:
+            self.profile_history.append({
+                'timestamp': entry['timestamp'].isoformat(),
+                'time_horizon': time_horizon,
+                'success': success,
+                'profile': profile,
+            })
+            if len(self.profile_history) > self.max_profile_entries:
+                self.profile_history = self.profile_history[-self.max_profile_entries:]
         
         # Update metrics
         self._update_performance_metrics()
@@ -379,6 +394,10 @@ class ConsolidationHealthMonitor:
                 message=f"Consolidation issues detected: {', '.join(errors[:3])}"
             )
     
+    def get_profile_history(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Profiles of the most recent consolidation runs, newest first."""
+        return list(reversed(self.profile_history[-limit:])) if limit > 0 else []
+    
     def record_error(self, component: str, error: Exception, context: Dict[str, Any] = None):
         """Record an error in the consolidation system.""" 
         error_entry = {
@@ -0,0 +1,278 @@
+# Copyright 2024 Heinrich Krupp
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Per-phase performance profiles of consolidation runs.
+
+Every run records a :class:`PhaseProfiler`. Each phase it passes through
+(:func:`profile_phase`) adds its wall time, CPU time (this process plus the
+consolidation workers), growth of the peak RSS, items in and out, and the
+storage round trips and estimated bytes read while it ran. Phases repeated
+per window are summed under one entry.
+
+Storage calls are counted by :class:`MeteredStorage`, the consolidator's
+view of its backend. The active profiler is held in a context variable, so
+concurrent runs keep separate profiles and storage calls made outside a run
+(searches, stores) are not counted.
+
+:func:`capture_artifacts` additionally records a cProfile and a tracemalloc
+snapshot of a single run and writes them to disk.
+"""
+
+import cProfile
+import functools
+import inspect
+import io
+import logging
+import pstats
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from ..models.memory import Memory
+from .vector_clustering import peak_rss_mb
+
+logger = logging.getLogger(__name__)
+
+_ACTIVE_PROFILE: ContextVar[Optional['PhaseProfiler']] = ContextVar('consolidation_profile', default=None)
+
+# cProfile and tracemalloc are process-wide; one capture at a time
+_CAPTURE_LOCK = threading.Lock()
+
+_COUNTERS = ('items_in', 'items_out', 'storage_calls', 'storage_bytes_read')
+
+
+def payload_bytes(value: Any) -> int:
+    """Estimated size of a storage result: text, embeddings (float32) and scalars."""
+    if isinstance(value, Memory):
+        return len(value.content) + 4 * len(value.embedding or ())
+    if isinstance(value, (list, tuple, set)):
+        return sum(payload_bytes(item) for item in value)
+    if isinstance(value, dict):
+        return sum(payload_bytes(key) + payload_bytes(item) for key, item in value.items())
+    if isinstance(value, (str, bytes, bytearray)):
+        return len(value)
+    if isinstance(value, (int, float)):
+        return 8
+    return 0
+
+
+class PhaseProfiler:
+    """Collects the per-phase profile of one consolidation run."""
+
+    def __init__(self, executor: Any = None):
+        self.executor = executor
+        self.phases: Dict[str, Dict[str, Any]] = {}
+        self._current: Optional[Dict[str, int]] = None
+        self._unattributed = {'storage_calls': 0, 'storage_bytes_read': 0}
+        self._started = (time.perf_counter(), self._cpu_seconds())
+
+    def _cpu_seconds(self) -> float:
+        worker_cpu = getattr(self.executor, 'worker_cpu_seconds', 0.0)
+        return time.process_time() + worker_cpu
+
+    @contextmanager
+    def activate(self) -> Iterator['PhaseProfiler']:
+        """Make this the profile of the current context (the run's task)."""
+        token = _ACTIVE_PROFILE.set(self)
+        try:
+            yield self
+        finally:
+            _ACTIVE_PROFILE.reset(token)
+
+    @contextmanager
+    def phase(self, name: str, items_in: int = 0) -> Iterator[Dict[str, int]]:
+        """
+        Measure the block as phase ``name``.
+
+        Yields the phase counters; set ``items_out`` (or adjust ``items_in``)
+        on them before the block ends.
+        """
+        counters = dict.fromkeys(_COUNTERS, 0)
+        counters['items_in'] = items_in
+        outer, self._current = self._current, counters
+        wall, cpu, rss = time.perf_counter(), self._cpu_seconds(), peak_rss_mb()
+        try:
+            yield counters
+        finally:
+            self._current = outer
+            record = self.phases.setdefault(name, {
+                'runs': 0, 'wall_seconds': 0.0, 'cpu_seconds': 0.0, 'peak_rss_delta_mb': 0.0,
+                **dict.fromkeys(_COUNTERS, 0),
+            })
+            record['runs'] += 1
+            record['wall_seconds'] += time.perf_counter() - wall
+            record['cpu_seconds'] += self._cpu_seconds() - cpu
+            if rss is not None:
+                record['peak_rss_delta_mb'] = max(record['peak_rss_delta_mb'], peak_rss_mb() - rss)
+            for counter in _COUNTERS:
+                record[counter] += counters[counter]
+
+    def count_storage(self, result: Any) -> None:
+        """Charge one storage round trip returning ``result`` to the running phase."""
+        counters = self._current if self._current is not None else self._unattributed
+        counters['storage_calls'] += 1
+        counters['storage_bytes_read'] += payload_bytes(result)
+
+    def summary(self) -> Dict[str, Any]:
+        """The profile as reported in ``performance_metrics["profile"]``."""
+        wall, cpu = self._started
+        phases = [
+            {
+                'phase': name,
+                **record,
+                'wall_seconds': round(record['wall_seconds'], 4),
+                'cpu_seconds': round(record['cpu_seconds'], 4),
+                'peak_rss_delta_mb': round(record['peak_rss_delta_mb'], 1),
+            }
+            for name, record in self.phases.items()
+        ]
+        return {
+            'phases': phases,
+            'wall_seconds': round(time.perf_counter() - wall, 4),
+            'cpu_seconds': round(self._cpu_seconds() - cpu, 4),
+            'peak_rss_mb': peak_rss_mb(),
+            'storage_calls': sum(p['storage_calls'] for p in phases) + self._unattributed['storage_calls'],
+            'storage_bytes_read': (
+                sum(p['storage_bytes_read'] for p in phases) + self._unattributed['storage_bytes_read']
+            ),
+        }
+
+
+def profile_phase(name: str, items_in: int = 0):
+    """Measure a phase of the active run's profile (a no-op outside a profiled run)."""
+    profile = _ACTIVE_PROFILE.get()
+    if profile is None:
+        return nullcontext(dict.fromkeys(_COUNTERS, 0))
+    return profile.phase(name, items_in)
+
+
+class MeteredStorage:
+    """
+    A storage backend as seen by the consolidator, counting its round trips.
+
+    Coroutine methods count one round trip per call and async generators one
+    per yielded chunk, charged with the estimated size of what they return to
+    the phase running in the caller's context. Other attributes pass through.
+    Checks on the backend class (``hasattr(type(storage), ...)``,
+    ``isinstance``) must look at :attr:`wrapped`, see :func:`unwrap_storage`.
+    """
+
+    def __init__(self, wrapped: Any):
+        self.wrapped = wrapped
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self.wrapped, name)
+        if inspect.isasyncgenfunction(attribute):
+            return self._metered_stream(attribute)
+        if inspect.iscoroutinefunction(attribute):
+            return self._metered_call(attribute)
+        return attribute
+
+    @staticmethod
+    def _metered_call(method):
+        @functools.wraps(method)
+        async def call(*args, **kwargs):
+            result = await method(*args, **kwargs)
+            profile = _ACTIVE_PROFILE.get()
+            if profile is not None:
+                profile.count_storage(result)
+            return result
+        return call
+
+    @staticmethod
+    def _metered_stream(method):
+        @functools.wraps(method)
+        async def stream(*args, **kwargs):
+            async for chunk in method(*args, **kwargs):
+                profile = _ACTIVE_PROFILE.get()
+                if profile is not None:
+                    profile.count_storage(chunk)
+                yield chunk
+        return stream
+
+
+def unwrap_storage(storage: Any) -> Any:
+    """The backend behind ``storage`` (``storage`` itself unless metered)."""
+    return storage.wrapped if isinstance(storage, MeteredStorage) else storage
+
+
+@contextmanager
+def capture_artifacts(directory: Path) -> Iterator[List[str]]:
+    """
+    Record a cProfile and tracemalloc capture of the block into ``directory``.
+
+    Writes ``consolidation.prof`` (load with :mod:`pstats` or snakeviz),
+    ``cprofile.txt`` (top functions by cumulative time) and
+    ``tracemalloc.txt`` (top allocation sites still held at the end). Yields
+    the list of written paths, filled in when the block exits. cProfile sees
+    the event loop thread only; work on consolidation workers shows up as
+    waits. Only one capture runs at a time; others are skipped.
+    """
+    artifacts: List[str] = []
+    if not _CAPTURE_LOCK.acquire(blocking=False):
+        logger.warning("Another consolidation profile capture is running; skipping this one")
+        yield artifacts
+        return
+
+    profiler = cProfile.Profile()
+    started_tracing = not tracemalloc.is_tracing()
+    try:
+        if started_tracing:
+            tracemalloc.start()
+        try:
+            profiler.enable()
+        except ValueError as e:  # Another profiler (e.g. a debugger) is active
+            logger.warning(f"cProfile capture unavailable: {e}")
+            profiler = None
+        try:
+            yield artifacts
+        finally:
+            if profiler is not None:
+                profiler.disable()
+            snapshot = tracemalloc.take_snapshot()
+            if started_tracing:
+                tracemalloc.stop()
+            try:
+                artifacts.extend(_write_artifacts(directory, profiler, snapshot))
+            except OSError as e:
+                logger.warning(f"Failed to write consolidation profile artifacts: {e}")
+    finally:
+        _CAPTURE_LOCK.release()
+
+
+def _write_artifacts(
+    directory: Path, profiler: Optional[cProfile.Profile], snapshot: tracemalloc.Snapshot
+) -> List[str]:
+    directory.mkdir(parents=True, exist_ok=True)
+    written = []
+    if profiler is not None:
+        stats_path = directory / 'consolidation.prof'
+        profiler.dump_stats(str(stats_path))
+        report = io.StringIO()
+        pstats.Stats(profiler, stream=report).sort_stats('cumulative').print_stats(50)
+        text_path = directory / 'cprofile.txt'
+        text_path.write_text(report.getvalue())
+        written += [str(stats_path), str(text_path)]
+
+    allocations = directory / 'tracemalloc.txt'
+    lines = [f"{stat.size / 1024:.1f} KiB in {stat.count} blocks: {stat.traceback}"
+             for stat in snapshot.statistics('lineno')[:50]]
+    allocations.write_text('\n'.join(lines) + '\n')
+    written.append(str(allocations))
+    return written
@@ -0,0 +1,374 @@
+# Copyright 2024 Heinrich Krupp
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Vectorized building blocks for semantic clustering.
+
+The embedding matrix is L2-normalized once, so cosine similarity becomes a
+plain dot product. The radius-neighbour graph is built from blocked matrix
+multiplies whose size follows a memory budget, and only the strongest
+``max_neighbors`` edges per memory are kept, so memory grows with
+``n * max_neighbors`` instead of ``n²``. Density clustering (DBSCAN semantics:
+core points, density-connected components, border assignment) then runs on
+that sparse graph with NumPy label propagation. ``band_pairs`` samples
+candidate pairs inside a similarity band for association discovery, and
+``nearest_centroids`` assigns rows to the persistent cluster index.
+"""
+
+import sys
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+_FLOAT_BYTES = np.dtype(np.float32).itemsize
+# Bytes per kept edge: int32 source + int32 target + float32 similarity
+_EDGE_BYTES = 12
+
+
+class NeighborGraph(NamedTuple):
+    """Sparse radius-neighbour graph over normalized embeddings."""
+    sources: np.ndarray       # int32, edge source row
+    targets: np.ndarray       # int32, edge target row
+    similarities: np.ndarray  # float32, cosine similarity of the edge
+    counts: np.ndarray        # int64, neighbours within the radius per row (including itself)
+    block_rows: int           # rows per similarity block that was used
+
+
+def normalize_rows(embeddings: np.ndarray) -> np.ndarray:
+    """Return float32 rows scaled to unit length (zero rows stay zero)."""
+    unit = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(unit, axis=1, keepdims=True)
+    return unit / np.where(norms == 0, 1.0, norms)
+
+
+def plan_memory_budget(
+    n_samples: int, max_neighbors: int, memory_budget_mb: float
+) -> Tuple[int, int]:
+    """
+    Split a memory budget between similarity blocks and the kept edges.
+
+    Half of the budget holds the sparse graph; ``max_neighbors`` is lowered
+    if ``n * max_neighbors`` edges would not fit. The rest bounds the
+    (block_rows x n) similarity block and its scratch arrays; the
+    normalized embedding matrix itself is not counted.
+
+    Returns:
+        (block_rows, max_neighbors)
+    """
+    budget = max(memory_budget_mb, 1) * 1024 * 1024
+    max_neighbors = max(1, min(max_neighbors, int(budget / 2 // (_EDGE_BYTES * max(n_samples, 1)))))
+    block_bytes = budget - n_samples * max_neighbors * _EDGE_BYTES
+    # similarity block (float32) + boolean mask + top-k scratch for dense rows
+    per_row = max(n_samples, 1) * (2 * _FLOAT_BYTES + 1 + 8)
+    block_rows = int(max(1, min(n_samples, block_bytes // per_row)))
+    return block_rows, max_neighbors
+
+
+def radius_neighbors(
+    unit: np.ndarray,
+    threshold: float,
+    max_neighbors: int,
+    block_rows: int,
+) -> NeighborGraph:
+    """
+    Edges between rows of ``unit`` with cosine similarity >= ``threshold``.
+
+    Neighbour counts are exact; per row only the ``max_neighbors`` most
+    similar neighbours are kept as edges.
+    """
+    n_samples = unit.shape[0]
+    counts = np.zeros(n_samples, dtype=np.int64)
+    sources: List[np.ndarray] = []
+    targets: List[np.ndarray] = []
+    similarities: List[np.ndarray] = []
+
+    for start in range(0, n_samples, block_rows):
+        stop = min(start + block_rows, n_samples)
+        block = unit[start:stop] @ unit.T
+        within = block >= threshold
+        rows = np.arange(stop - start)
+        within[rows, rows + start] = False  # no self edges, but self always counts
+        neighbor_counts = within.sum(axis=1)
+        counts[start:stop] = neighbor_counts + 1
+
+        # Rows with more neighbours than we keep: top-k by similarity
+        dense = np.flatnonzero(neighbor_counts > max_neighbors)
+        if len(dense):
+            dense_sims = np.where(within[dense], block[dense], -np.inf)
+            top = np.argpartition(dense_sims, -max_neighbors, axis=1)[:, -max_neighbors:]
+            sources.append(np.repeat(dense + start, max_neighbors).astype(np.int32))
+            targets.append(top.ravel().astype(np.int32))
+            similarities.append(np.take_along_axis(dense_sims, top, axis=1).ravel())
+            within[dense] = False
+            del dense_sims, top
+
+        # Remaining rows keep all of their neighbours
+        row_ids, col_ids = np.nonzero(within)
+        sources.append((row_ids + start).astype(np.int32))
+        targets.append(col_ids.astype(np.int32))
+        similarities.append(block[row_ids, col_ids].astype(np.float32))
+        del block, within
+
+    if sources:
+        return NeighborGraph(
+            np.concatenate(sources), np.concatenate(targets), np.concatenate(similarities),
+            counts, block_rows,
+        )
+    empty_ids = np.zeros(0, dtype=np.int32)
+    return NeighborGraph(empty_ids, empty_ids, np.zeros(0, dtype=np.float32), counts, block_rows)
+
+
+def band_pairs(
+    unit: np.ndarray,
+    low: float,
+    high: float,
+    limit: int,
+    memory_budget_mb: float,
+    rng: Optional[np.random.Generator] = None,
+    per_row: int = 8,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Random sample of up to ``limit`` distinct pairs ``i < j`` whose cosine
+    similarity lies in ``[low, high]``.
+
+    A first batch of random pairs is scored with one row-wise dot product to
+    estimate how common in-band pairs are. If they are common, more random
+    batches are drawn until ``limit`` pairs are found. If they are rare, rows
+    are visited in random order in blocks multiplied against the whole
+    matrix, each contributing up to ``per_row`` random in-band partners,
+    until ``limit`` pairs are found. Either way the work is proportional to
+    the pairs requested rather than to ``n²``, and blocks respect the budget.
+
+    Returns:
+        (rows, cols, similarities) with ``rows < cols``
+    """
+    rng = rng or np.random.default_rng()
+    n_samples = unit.shape[0]
+    found: Dict[int, Tuple[int, int, float]] = {}
+
+    def add(rows: np.ndarray, cols: np.ndarray, sims: np.ndarray) -> None:
+        lo, hi = np.minimum(rows, cols), np.maximum(rows, cols)
+        for a, b, sim in zip(lo.tolist(), hi.tolist(), sims.tolist()):
+            found.setdefault(a * n_samples + b, (a, b, sim))
+
+    if n_samples >= 2 and limit > 0:
+        per_row = max(1, min(per_row, n_samples - 1))
+        per_cell = _FLOAT_BYTES + 1 + _FLOAT_BYTES + 8  # block, mask, keys, partners
+        budget_bytes = max(memory_budget_mb, 1) * 1024 * 1024
+        batch = int(max(1024, min(4 * limit, budget_bytes // (2 * unit.shape[1] * _FLOAT_BYTES))))
+        total_pairs = n_samples * (n_samples - 1) // 2
+
+        # Random pairs while in-band pairs are common enough that a random
+        # draw is cheaper than scanning rows (hit rate above per_row / n)
+        draws = hits = 0
+        while len(found) < limit and draws < 4 * total_pairs:
+            rows = rng.integers(0, n_samples, batch)
+            cols = (rows + rng.integers(1, n_samples, batch)) % n_samples
+            sims = np.einsum("ij,ij->i", unit[rows], unit[cols])
+            in_band = (sims >= low) & (sims <= high)
+            add(rows[in_band], cols[in_band], sims[in_band])
+            draws += batch
+            hits += int(in_band.sum())
+            if hits * n_samples < per_row * draws:
+                break
+
+        block_rows = max(1, min(
+            int(budget_bytes // (n_samples * per_cell)), -(-(limit - len(found)) // per_row)
+        ))
+        order = rng.permutation(n_samples) if len(found) < limit else np.zeros(0, dtype=np.int64)
+        for start in range(0, len(order), block_rows):
+            block_ids = order[start:start + block_rows]
+            block = unit[block_ids] @ unit.T
+            in_band = (block >= low) & (block <= high)
+            in_band[np.arange(len(block_ids)), block_ids] = False
+
+            # Up to per_row random in-band partners per row
+            keys = np.where(in_band, rng.random(block.shape, dtype=np.float32), np.inf)
+            partners = np.argpartition(keys, per_row - 1, axis=1)[:, :per_row]
+            valid = np.isfinite(np.take_along_axis(keys, partners, axis=1))
+            local_rows = np.broadcast_to(np.arange(len(block_ids))[:, None], partners.shape)[valid]
+            cols = partners[valid]
+            add(block_ids[local_rows], cols, block[local_rows, cols])
+            del block, in_band, keys
+            if len(found) >= limit:
+                break
+
+    picked = list(found.values())
+    if len(picked) > limit:
+        picked = [picked[k] for k in rng.choice(len(picked), limit, replace=False)]
+    rows, cols, sims = zip(*picked) if picked else ((), (), ())
+    return (
+        np.asarray(rows, dtype=np.int64),
+        np.asarray(cols, dtype=np.int64),
+        np.asarray(sims, dtype=np.float32),
+    )
+
+
+def connected_components(n_nodes: int, sources: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """Component label (smallest member index) per node, by min-label propagation."""
+    labels = np.arange(n_nodes)
+    if len(sources) == 0:
+        return labels
+    while True:
+        edge_min = np.minimum(labels[sources], labels[targets])
+        updated = labels.copy()
+        np.minimum.at(updated, sources, edge_min)
+        np.minimum.at(updated, targets, edge_min)
+        # Pointer jumping: follow labels to their own label until stable
+        while True:
+            jumped = updated[updated]
+            if np.array_equal(jumped, updated):
+                break
+            updated = jumped
+        if np.array_equal(updated, labels):
+            return labels
+        labels = updated
+
+
+def density_clusters(graph: NeighborGraph, min_samples: int) -> np.ndarray:
+    """
+    DBSCAN-style labels over a neighbour graph (-1 = noise).
+
+    Core points have at least ``min_samples`` neighbours (including
+    themselves); clusters are connected components of core points, and each
+    border point joins the cluster of its most similar core neighbour.
+    """
+    n_samples = len(graph.counts)
+    core = graph.counts >= min_samples
+    labels = np.full(n_samples, -1, dtype=np.int64)
+    if not core.any():
+        return labels
+
+    core_edges = core[graph.sources] & core[graph.targets]
+    components = connected_components(
+        n_samples, graph.sources[core_edges], graph.targets[core_edges]
+    )
+    labels[core] = components[core]
+
+    # Border points: most similar core neighbour wins
+    border_edges = ~core[graph.sources] & core[graph.targets]
+    if border_edges.any():
+        sources = graph.sources[border_edges]
+        order = np.lexsort((-graph.similarities[border_edges], sources))
+        sources = sources[order]
+        first = np.ones(len(sources), dtype=bool)
+        first[1:] = sources[1:] != sources[:-1]
+        labels[sources[first]] = labels[graph.targets[border_edges][order][first]]
+
+    # Relabel components to 0..k-1 in order of first appearance
+    assigned = labels >= 0
+    _, first_seen, dense = np.unique(labels[assigned], return_index=True, return_inverse=True)
+    rank = np.argsort(np.argsort(first_seen))
+    labels[assigned] = rank[dense]
+    return labels
+
+
+def leader_clusters(unit: np.ndarray, threshold: float, min_cluster_size: int) -> np.ndarray:
+    """
+    Greedy threshold clustering (-1 = noise).
+
+    Each unassigned row in order starts a cluster and claims the later
+    unassigned rows with similarity >= ``threshold``; clusters smaller than
+    ``min_cluster_size`` are returned to the pool as noise.
+    """
+    n_samples = unit.shape[0]
+    labels = np.full(n_samples, -1, dtype=np.int64)
+    current = 0
+    for i in range(n_samples):
+        if labels[i] != -1:
+            continue
+        candidates = np.flatnonzero(labels[i + 1:] == -1) + i + 1
+        members = candidates[unit[candidates] @ unit[i] >= threshold]
+        if len(members) + 1 >= min_cluster_size:
+            labels[i] = current
+            labels[members] = current
+            current += 1
+    return labels
+
+
+def cluster_statistics(
+    unit: np.ndarray, embeddings: np.ndarray, labels: np.ndarray
+) -> Dict[int, Tuple[np.ndarray, np.ndarray, float]]:
+    """
+    Member indices, centroid and coherence for every cluster label.
+
+    The centroid is the mean of the raw embeddings; coherence is the mean
+    cosine similarity of the members to it.
+    """
+    stats: Dict[int, Tuple[np.ndarray, np.ndarray, float]] = {}
+    assigned = np.flatnonzero(labels >= 0)
+    if len(assigned) == 0:
+        return stats
+    order = assigned[np.argsort(labels[assigned], kind="stable")]
+    sorted_labels = labels[order]
+    boundaries = np.flatnonzero(np.diff(sorted_labels)) + 1
+    for members in np.split(order, boundaries):
+        centroid = embeddings[members].mean(axis=0)
+        norm = np.linalg.norm(centroid)
+        coherence = float(np.mean(unit[members] @ (centroid / norm))) if norm > 0 else 0.0
+        stats[int(labels[members[0]])] = (members, centroid, coherence)
+    return stats
+
+
+def nearest_centroids(
+    unit: np.ndarray, centroids: np.ndarray, threshold: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Nearest centroid per row of ``unit`` from one matrix product.
+
+    Returns:
+        (labels, similarities): centroid row per row of ``unit`` (-1 where
+        the best cosine similarity is below ``threshold``) and that similarity
+    """
+    if len(centroids) == 0 or len(unit) == 0:
+        return np.full(len(unit), -1, dtype=np.int64), np.zeros(len(unit), dtype=np.float32)
+    similarities = unit @ normalize_rows(centroids).T
+    labels = np.argmax(similarities, axis=1)
+    best = similarities[np.arange(len(unit)), labels]
+    return np.where(best >= threshold, labels, -1), best.astype(np.float32)
+
+
+def similar_groups(vectors: np.ndarray, threshold: float) -> List[List[int]]:
+    """
+    Greedy grouping of rows by cosine similarity >= ``threshold``.
+
+    Matches pairwise greedy merging: each ungrouped row in order collects the
+    later ungrouped rows similar to it.
+    """
+    unit = normalize_rows(vectors)
+    similar = (unit @ unit.T) >= threshold
+    grouped = np.zeros(len(unit), dtype=bool)
+    groups: List[List[int]] = []
+    for i in range(len(unit)):
+        if grouped[i]:
+            continue
+        members = np.flatnonzero(similar[i] & ~grouped)
+        members = members[members >= i]
+        grouped[members] = True
+        groups.append([i] + [int(j) for j in members if j != i])
+    return groups
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process in MB (None where unsupported)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS bytes
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
@@ -0,0 +1,327 @@
+# Copyright 2024 Heinrich Krupp
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Vectorized building blocks for extractive cluster summaries.
+
+Every sentence of a batch of clusters becomes a row of one sparse TF-IDF
+matrix, kept as coordinate arrays sorted by sentence, so no sparse matrix
+library is needed. Document frequencies are counted over all sentences of
+the batch. Each cluster's centroid is the sum of its sentence rows, and a
+sentence is scored by its cosine similarity to that centroid. Scores can be
+weighted by how close the sentence's memory is to the cluster centroid in
+embedding space (:func:`centroid_similarity`), which reuses the stored
+embeddings instead of embedding sentences.
+
+The whole batch is split into sentences with one regex pass and scanned
+for words with another, and each distinct word is classified once, so the
+per-cluster pattern scans of the concept-based summarizer are not repeated.
+"""
+
+import re
+from array import array
+from collections import Counter
+from typing import List, NamedTuple, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+# Same sentence boundaries as the concept-based summarizer
+_SENTENCE_BREAK = re.compile(r'[.!?]+\s+')
+# TF-IDF terms (4+ letters), shorter capitalized words and numbers, or a sentence end
+_WORD_OR_END = re.compile(r'\b(?:[a-zA-Z]{4,}|[A-Z][a-zA-Z]{1,2}|\d+(?:\.\d+)?)\b|\0')
+
+
+class SentenceMatrix(NamedTuple):
+    """TF-IDF rows of every sentence in a batch of clusters."""
+    sentences: List[str]     # stripped sentence text, cluster by cluster
+    clusters: np.ndarray     # int64, cluster of each sentence, ascending
+    memories: np.ndarray     # int64, memory of each sentence (batch-wide index)
+    rows: np.ndarray         # int64, sentence of each non-zero, ascending
+    terms: np.ndarray        # int64, term of each non-zero
+    weights: np.ndarray      # float64, L2-normalized TF-IDF weight of each non-zero
+    vocabulary: List[str]    # term text by term id
+    term_counts: List[Counter]  # per cluster, term occurrences in first-seen order
+    marked_words: List[Set[str]]  # per cluster, capitalized words and numbers
+
+
+def sentence_matrix(clusters: Sequence[Sequence[str]]) -> SentenceMatrix:
+    """
+    Split the memory texts of each cluster into sentences and build their TF-IDF rows.
+
+    Terms are the words of 4+ letters, lowercased. ``marked_words`` holds the
+    words that the concept-based summarizer's word patterns find in a
+    cluster's text: CamelCase terms, acronyms, capitalized words of 3+
+    letters and numbers. NUL characters in a memory are read as spaces.
+
+    Args:
+        clusters: Memory contents per cluster; memories are numbered across
+            the whole batch in this order.
+    """
+    n_clusters = len(clusters)
+    memory_cluster = np.repeat(np.arange(n_clusters, dtype=np.int64), [len(contents) for contents in clusters])
+    if not len(memory_cluster):
+        empty = np.zeros(0, dtype=np.int64)
+        return SentenceMatrix(
+            [], empty, empty, empty, empty, np.zeros(0), [],
+            [Counter() for _ in clusters], [set() for _ in clusters],
+        )
+
+    # One split over the batch; memories are joined by NUL, which no break consumes
+    sentences: List[str] = []
+    memory_starts = [0]
+    for piece in _SENTENCE_BREAK.split('\0'.join(
+        content.replace('\0', ' ') for contents in clusters for content in contents
+    )):
+        if '\0' in piece:
+            *ends, piece = piece.split('\0')
+            for end in ends:
+                sentences.append(end.strip())
+                memory_starts.append(len(sentences))
+        sentences.append(piece.strip())
+    sentence_memory = np.repeat(
+        np.arange(len(memory_starts), dtype=np.int64), np.diff(memory_starts + [len(sentences)])
+    )
+    sentence_cluster = memory_cluster[sentence_memory]
+
+    # One scan over the batch; NUL ends each sentence
+    tokens = _WORD_OR_END.findall('\0'.join(sentences) + '\0')
+    words = list(dict.fromkeys(tokens))
+    index = {word: i for i, word in enumerate(words)}
+    ids = np.fromiter(map(index.__getitem__, tokens), dtype=np.int64, count=len(tokens))
+    ends = ids == index['\0']
+    token_sentence = np.cumsum(ends) - ends
+    word_terms, word_marked, vocabulary = _classify_words(words)
+    n_terms = max(len(vocabulary), 1)
+
+    token_terms = word_terms[ids]
+    is_term = token_terms >= 0
+    token_rows, token_terms = token_sentence[is_term], token_terms[is_term]
+
+    # Term frequency per (sentence, term): sorted keys keep rows ascending
+    keys, frequencies = np.unique(token_rows * n_terms + token_terms, return_counts=True)
+    rows, terms = keys // n_terms, keys % n_terms
+
+    # Smoothed inverse document frequency, documents being the batch's sentences
+    document_frequency = np.bincount(terms, minlength=n_terms)
+    idf = np.log((1 + len(sentences)) / (1 + document_frequency)) + 1.0
+    weights = frequencies * idf[terms]
+    norms = np.sqrt(np.bincount(rows, weights * weights, minlength=len(sentences)))
+    weights = weights / norms[rows]
+
+    marked = word_marked[ids]
+    return SentenceMatrix(
+        sentences=sentences,
+        clusters=sentence_cluster,
+        memories=sentence_memory,
+        rows=rows,
+        terms=terms,
+        weights=weights,
+        vocabulary=vocabulary,
+        term_counts=_cluster_term_counts(
+            sentence_cluster[token_rows], token_terms, n_terms, vocabulary, n_clusters
+        ),
+        marked_words=_cluster_words(sentence_cluster[token_sentence[marked]], ids[marked], words, n_clusters),
+    )
+
+
+def _classify_words(words: List[str]) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+    """
+    Term id (-1 if none) and marked flag of each distinct scanned word, and the term texts.
+
+    Words are ASCII letters, numbers or the NUL sentence end. Letter words of
+    4+ letters are terms, lowercased. Marked words are numbers and words
+    starting with a capital, except two-letter ones like "Of" that only the
+    acronym pattern would find, and it needs both letters capitalized.
+    """
+    n_words = len(words)
+    lengths = np.fromiter(map(len, words), dtype=np.int64, count=n_words)
+    letters = np.fromiter(map(str.isalpha, words), dtype=bool, count=n_words)
+    # Code points of each word's first two characters, read from one buffer
+    joined = '\n'.join(words)
+    codes = np.frombuffer(joined.encode('utf-32-le'), dtype=np.uint32)
+    starts = np.concatenate(([0], np.cumsum(lengths + 1)[:-1]))
+    first = codes[starts]
+    second = codes[np.minimum(starts + 1, len(codes) - 1)]
+    capital = (first >= ord('A')) & (first <= ord('Z'))
+    lower_second = (second >= ord('a')) & (second <= ord('z'))
+    marked = (capital & ((lengths >= 3) | ~lower_second)) | (~letters & (first != 0))
+
+    is_term = letters & (lengths >= 4)
+    term_words = np.flatnonzero(is_term)
+    lowered = joined.lower().split('\n')
+    term_texts = [lowered[i] for i in term_words.tolist()]
+    vocabulary = list(dict.fromkeys(term_texts))
+    term_index = {term: i for i, term in enumerate(vocabulary)}
+    word_terms = np.full(n_words, -1, dtype=np.int64)
+    word_terms[term_words] = np.fromiter(map(term_index.__getitem__, term_texts), dtype=np.int64, count=len(term_texts))
+    return word_terms, marked, vocabulary
+
+
+def _cluster_words(token_clusters: np.ndarray, token_words: np.ndarray, words: List[str], n_clusters: int) -> List[Set[str]]:
+    """Distinct words per cluster."""
+    keys = np.unique(token_clusters * len(words) + token_words)
+    owners = keys // len(words)
+    texts = np.asarray(words, dtype=object)[keys % len(words)].tolist()
+    bounds = np.searchsorted(owners, np.arange(n_clusters + 1)).tolist()
+    return [set(texts[start:end]) for start, end in zip(bounds[:-1], bounds[1:])]
+
+
+def _cluster_term_counts(
+    token_clusters: np.ndarray, token_terms: np.ndarray, n_terms: int, words: List[str], n_clusters: int
+) -> List[Counter]:
+    """Term counts per cluster, ordered by first occurrence like a Counter over the text."""
+    keys, first, counts = np.unique(
+        token_clusters * n_terms + token_terms, return_index=True, return_counts=True
+    )
+    # Order by first occurrence, then group by cluster keeping that order
+    order = np.argsort(first, kind='stable')
+    keys, counts = keys[order], counts[order]
+    grouped = np.argsort(keys // n_terms, kind='stable')
+    keys, counts = keys[grouped], counts[grouped].tolist()
+    texts = np.asarray(words, dtype=object)[keys % n_terms].tolist()
+    bounds = np.searchsorted(keys // n_terms, np.arange(n_clusters + 1)).tolist()
+    return [
+        Counter(dict(zip(texts[start:end], counts[start:end])))
+        for start, end in zip(bounds[:-1], bounds[1:])
+    ]
+
+
+def centroid_scores(matrix: SentenceMatrix, memory_weights: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Cosine similarity of each sentence to its cluster's TF-IDF centroid.
+
+    Args:
+        matrix: Sentences of the batch
+        memory_weights: Optional factor per memory (batch-wide index), e.g.
+            from :func:`centroid_similarity`, applied to its sentences
+    """
+    n_sentences = len(matrix.sentences)
+    if not len(matrix.rows):
+        return np.zeros(n_sentences)
+    n_terms = max(len(matrix.vocabulary), 1)
+    owners = matrix.clusters[matrix.rows]
+    # Centroid entries per (cluster, term); ``entry`` maps each non-zero to its entry
+    keys, entry = np.unique(owners * n_terms + matrix.terms, return_inverse=True)
+    centroid = np.bincount(entry, matrix.weights)
+    centroid_norms = np.sqrt(np.bincount(keys // n_terms, centroid * centroid))
+    contributions = matrix.weights * centroid[entry] / np.where(centroid_norms == 0, 1.0, centroid_norms)[owners]
+    scores = np.bincount(matrix.rows, contributions, minlength=n_sentences)
+    if memory_weights is not None:
+        scores = scores * np.asarray(memory_weights, dtype=np.float64)[matrix.memories]
+    return scores
+
+
+def select_sentences(
+    matrix: SentenceMatrix,
+    scores: np.ndarray,
+    budgets: Sequence[int],
+    min_length: int = 20,
+    max_overlap: float = 0.8,
+) -> List[List[str]]:
+    """
+    Per cluster, its best-scoring sentences that fit the cluster's character budget.
+
+    Sentences are taken by descending score until the next one would reach
+    the budget. Sentences of ``min_length`` characters or fewer, with no
+    score, or with a cosine similarity above ``max_overlap`` to a sentence
+    already taken (repeated statements across memories) are skipped. Each
+    taken sentence's similarity to all sentences of its cluster is computed
+    in one pass over the cluster's non-zeros.
+    """
+    n_sentences = len(matrix.sentences)
+    lengths = np.fromiter(map(len, matrix.sentences), dtype=np.int64, count=n_sentences)
+    order = np.lexsort((-scores, matrix.clusters))
+    order = order[((scores > 0) & (lengths > min_length))[order]]
+    starts = np.searchsorted(matrix.clusters[order], np.arange(len(budgets) + 1))
+    # Sentences, and so non-zeros, of a cluster are contiguous
+    first = np.searchsorted(matrix.clusters, np.arange(len(budgets) + 1))
+    bounds = np.searchsorted(matrix.rows, np.arange(n_sentences + 1))
+    dense = np.zeros(max(len(matrix.vocabulary), 1))
+
+    selected: List[List[str]] = []
+    for cluster, budget in enumerate(budgets):
+        taken: List[str] = []
+        used = 0
+        candidates = order[starts[cluster]:starts[cluster + 1]].tolist()
+        offset = first[cluster]
+        entries = slice(bounds[offset], bounds[first[cluster + 1]])
+        blocked = np.zeros(first[cluster + 1] - offset, dtype=bool)
+        for sentence in candidates:
+            if blocked[sentence - offset]:
+                continue
+            text = matrix.sentences[sentence]
+            if used + len(text) >= budget:
+                break
+            taken.append(text)
+            used += len(text)
+            # Dot product of every sentence of the cluster with the one just taken
+            row = slice(bounds[sentence], bounds[sentence + 1])
+            dense[matrix.terms[row]] = matrix.weights[row]
+            overlap = np.bincount(
+                matrix.rows[entries] - offset,
+                matrix.weights[entries] * dense[matrix.terms[entries]],
+                minlength=len(blocked),
+            )
+            dense[matrix.terms[row]] = 0.0
+            blocked |= overlap > max_overlap
+        selected.append(taken)
+    return selected
+
+
+def centroid_similarity(
+    vectors: Sequence[Optional[Sequence[float]]],
+    centroids: Sequence[Optional[Sequence[float]]],
+    owners: Sequence[int],
+) -> np.ndarray:
+    """
+    Cosine similarity of each vector to the centroid it belongs to, clipped to [0, 1].
+
+    Args:
+        vectors: Embedding per memory (None when missing)
+        centroids: Centroid embedding per cluster (None when missing)
+        owners: Index into ``centroids`` for each vector
+
+    Vectors without an embedding or centroid, or whose dimension differs
+    from the centroid's, get 1.0 and so leave sentence scores unchanged.
+    Float32 ``array('f')`` embeddings, as streamed from SQLite-vec, are
+    stacked from their buffers without converting each element.
+    """
+    result = np.ones(len(vectors))
+    dimensions = Counter(len(c) for c in centroids if c)
+    if not dimensions:
+        return result
+    dimension = dimensions.most_common(1)[0][0]
+    valid = [
+        i for i, (vector, owner) in enumerate(zip(vectors, owners))
+        if vector is not None and len(vector) == dimension
+        and centroids[owner] is not None and len(centroids[owner]) == dimension
+    ]
+    if not valid:
+        return result
+    # Each centroid is converted once, not once per member
+    targets = np.asarray([c if c and len(c) == dimension else [0.0] * dimension for c in centroids], dtype=np.float32)
+    target_norms = np.sqrt(np.einsum('ij,ij->i', targets, targets))
+    rows = _stack([vectors[i] for i in valid], dimension)
+    owned = np.asarray(owners)[valid]
+    norms = np.sqrt(np.einsum('ij,ij->i', rows, rows)) * target_norms[owned]
+    similarity = np.einsum('ij,ij->i', rows, targets[owned]) / np.where(norms == 0, 1.0, norms)
+    result[valid] = np.clip(similarity, 0.0, 1.0)
+    return result
+
+
+def _stack(vectors: List[Sequence[float]], dimension: int) -> np.ndarray:
+    """Equal-length vectors as the rows of one float32 matrix."""
+    if all(type(vector) is array and vector.typecode == 'f' for vector in vectors):
+        return np.frombuffer(b''.join(vectors), dtype=np.float32).reshape(len(vectors), dimension)
+    return np.asarray(vectors, dtype=np.float32)
@@ -760,6 +760,9 @@ async def memory_graph(
     hash: Optional[str] = None,
     hash1: Optional[str] = None,
     hash2: Optional[str] = None,
+    hashes: Optional[List[str]] = None,
+    relationship_types: Optional[List[str]] = None,
+    direction: str = "both",
     max_hops: int = 2,
     max_depth: int = 5,
     radius: int = 2,
@@ -774,6 +777,7 @@ USE THIS WHEN:
 
 ACTIONS:
 - connected: Find memories connected to a given memory (BFS traversal up to max_hops)
+- neighbors: Direct neighbors of several memories in one lookup (optional relationship_types, direction)
 - path: Find shortest path between two memories
 - subgraph: Extract subgraph around a memory (nodes + edges for visualization)
 
@@ -781,11 +785,13 @@ REQUIRES: SQLite-vec, Hybrid, or Milvus storage backend. Returns error for Cloud
 
 RETURNS:
 - connected: {success, connected: [{hash, distance}], count}
+- neighbors: {success, neighbors: {hash: [neighbor_hash, ...]}, count}
 - path: {success, path: [hash1, ..., hash2], length}
 - subgraph: {success, nodes: [...], edges: [{source, target, similarity, ...}], node_count, edge_count}
 
 Examples:
 {"action": "connected", "hash": "abc123def456...", "max_hops": 2}
+{"action": "neighbors", "hashes": ["abc123...", "def456..."], "relationship_types": ["causes"], "direction": "incoming"}
 {"action": "path", "hash1": "abc123...", "hash2": "def456..."}
 {"action": "subgraph", "hash": "abc123...", "radius": 3}
     """
@@ -796,6 +802,13 @@ Examples:
             return {"success": False, "error": "hash is required for 'connected' action"}
         return await graph_service.find_connected(hash, max_hops=max_hops)
 
+    elif action == "neighbors":
+        if not hashes:
+            return {"success": False, "error": "hashes is required for 'neighbors' action"}
+        return await graph_service.get_neighbors(
+            hashes, relationship_types=relationship_types, direction=direction
+        )
+
     elif action == "path":
         if not hash1 or not hash2:
             return {"success": False, "error": "hash1 and hash2 are required for 'path' action"}
@@ -809,7 +822,7 @@ Examples:
     else:
         return {
             "success": False,
-            "error": f"Invalid action '{action}'. Must be one of: connected, path, subgraph"
+            "error": f"Invalid action '{action}'. Must be one of: connected, neighbors, path, subgraph"
         }
 
 
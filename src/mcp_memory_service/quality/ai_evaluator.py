@@ -57,7 +57,8 @@ class QualityEvaluator:
                         try:
                             model = get_onnx_ranker_model(
                                 model_name=model_name,
-                                device=self.config.local_device
+                                device=self.config.local_device,
+                                config=self.config
                             )
                             if model:
                                 self._onnx_models[model_name] = model
@@ -81,7 +82,8 @@ class QualityEvaluator:
                 try:
                     self._onnx_ranker = get_onnx_ranker_model(
                         model_name=self.config.local_model,
-                        device=self.config.local_device
+                        device=self.config.local_device,
+                        config=self.config
                     )
                     if self._onnx_ranker:
                         logger.info(f"ONNX ranker model initialized: {self.config.local_model}")
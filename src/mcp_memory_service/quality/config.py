@@ -20,6 +20,12 @@ class QualityConfig:
     local_model: str = 'nvidia-quality-classifier-deberta'
     local_device: str = 'auto'  # auto|cpu|cuda|mps|directml
 
+    # ONNX Runtime session and tokenization settings
+    onnx_intra_op_threads: int = 0  # 0 = ONNX Runtime default (one per physical core)
+    onnx_graph_optimization: str = 'all'  # disabled|basic|extended|all
+    onnx_cpu_mem_arena: bool = True  # Arena allocator; disable to return memory between batches
+    onnx_max_length: int = 512  # Token limit per (query, memory) sequence
+
     # Cloud API settings (optional, user opt-in)
     groq_api_key: Optional[str] = None
     gemini_api_key: Optional[str] = None
@@ -47,6 +53,10 @@ class QualityConfig:
             ai_provider=os.getenv('MCP_QUALITY_AI_PROVIDER', 'local'),
             local_model=os.getenv('MCP_QUALITY_LOCAL_MODEL', 'ms-marco-MiniLM-L-6-v2'),
             local_device=os.getenv('MCP_QUALITY_LOCAL_DEVICE', 'auto'),
+            onnx_intra_op_threads=int(os.getenv('MCP_QUALITY_ONNX_INTRA_OP_THREADS', '0')),
+            onnx_graph_optimization=os.getenv('MCP_QUALITY_ONNX_GRAPH_OPTIMIZATION', 'all').lower(),
+            onnx_cpu_mem_arena=os.getenv('MCP_QUALITY_ONNX_CPU_MEM_ARENA', 'true').lower() == 'true',
+            onnx_max_length=int(os.getenv('MCP_QUALITY_ONNX_MAX_LENGTH', '512')),
             groq_api_key=os.getenv('GROQ_API_KEY'),
             gemini_api_key=os.getenv('GEMINI_API_KEY'),
             openai_compat_base_url=os.getenv('MCP_QUALITY_AI_BASE_URL'),
@@ -68,6 +78,15 @@ class QualityConfig:
         if self.local_device not in ['auto', 'cpu', 'cuda', 'mps', 'directml']:
             raise ValueError(f"Invalid local_device: {self.local_device}")
 
+        if self.onnx_intra_op_threads < 0:
+            raise ValueError(f"onnx_intra_op_threads must be >= 0, got {self.onnx_intra_op_threads}")
+
+        if self.onnx_graph_optimization not in ONNX_GRAPH_OPTIMIZATION_LEVELS:
+            raise ValueError(f"Invalid onnx_graph_optimization: {self.onnx_graph_optimization}")
+
+        if not 16 <= self.onnx_max_length <= 512:
+            raise ValueError(f"onnx_max_length must be between 16 and 512, got {self.onnx_max_length}")
+
         if not 0.0 <= self.boost_weight <= 1.0:
             raise ValueError(f"boost_weight must be between 0.0 and 1.0, got {self.boost_weight}")
 
@@ -139,6 +158,15 @@ class QualityConfig:
         return self.gemini_api_key is not None and self.ai_provider in ['gemini', 'auto']
 
 
+# ONNX Runtime graph optimization levels by config name
+ONNX_GRAPH_OPTIMIZATION_LEVELS = {
+    'disabled': 'ORT_DISABLE_ALL',
+    'basic': 'ORT_ENABLE_BASIC',
+    'extended': 'ORT_ENABLE_EXTENDED',
+    'all': 'ORT_ENABLE_ALL',
+}
+
+
 # Model registry for supported ONNX models
 SUPPORTED_MODELS = {
     'nvidia-quality-classifier-deberta': {
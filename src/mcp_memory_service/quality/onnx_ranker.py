@@ -7,15 +7,17 @@ Exports the model from transformers to ONNX format on first use.
 
 import logging
 import os
-import threading
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import TYPE_CHECKING, List, Optional, Tuple
 import numpy as np
 
 # Setup offline mode before importing transformers
 from ..offline_mode import setup_offline_mode
 setup_offline_mode()
 
+if TYPE_CHECKING:
+    from .config import QualityConfig
+
 logger = logging.getLogger(__name__)
 
 # Try to import ONNX Runtime
@@ -78,11 +80,25 @@ class ONNXRankerModel:
     Supports both classifier (DeBERTa) and cross-encoder (MS-MARCO) types.
 
     On first use, exports the model from transformers to ONNX format.
+
+    Sequences are never padded to a fixed length: batches are sorted by
+    token count and each inference call is padded to its longest member.
     """
 
     ONNX_MODEL_FILE = "model.onnx"
 
-    def __init__(self, model_name: str = "nvidia-quality-classifier-deberta", device: str = "auto", preferred_providers: Optional[list] = None):
+    # Memory text beyond max_length * CHARS_PER_TOKEN characters cannot fit
+    # in the sequence (English averages ~4 characters per token), so it is
+    # cut before tokenizing instead of tokenizing it only to truncate it.
+    CHARS_PER_TOKEN = 8
+
+    def __init__(
+        self,
+        model_name: str = "nvidia-quality-classifier-deberta",
+        device: str = "auto",
+        preferred_providers: Optional[list] = None,
+        config: Optional["QualityConfig"] = None,
+    ):
         """
         Initialize ONNX ranker model.
 
@@ -90,22 +106,25 @@ class ONNXRankerModel:
             model_name: Model to use (default: 'nvidia-quality-classifier-deberta')
             device: Device to use ('auto', 'cpu', 'cuda', 'mps', 'directml')
             preferred_providers: List of ONNX execution providers in order of preference
+            config: Quality config with the ONNX session and token limit settings
+                (default: from environment)
         """
         if not ONNX_AVAILABLE:
             raise ImportError("ONNX Runtime is required but not installed. Install with: pip install onnxruntime")
 
-        # Import config validation here to avoid circular imports
-        from .config import validate_model_selection
+        # Import config here to avoid circular imports
+        from .config import QualityConfig, validate_model_selection
 
         self.model_name = model_name
         self.model_config = validate_model_selection(model_name)
         self.MODEL_PATH = Path.home() / ".cache" / "mcp_memory" / "onnx_models" / model_name
 
         self.device = device
+        self._config = config or QualityConfig.from_env()
+        self.max_length = self._config.onnx_max_length
         self._preferred_providers = preferred_providers or self._detect_providers(device)
         self._model = None
         self._tokenizer = None
-        self._tokenizer_lock = threading.Lock()  # Protects tokenizer state mutations in batch ops
 
         # Check if ONNX model already exists (no transformers needed!)
         onnx_path = self.MODEL_PATH / self.ONNX_MODEL_FILE
@@ -288,6 +307,7 @@ class ONNXRankerModel:
         logger.info(f"Loading ONNX ranker model with providers: {self._preferred_providers}")
         self._model = ort.InferenceSession(
             str(onnx_path),
+            sess_options=self._session_options(),
             providers=self._preferred_providers
         )
 
@@ -297,7 +317,9 @@ class ONNXRankerModel:
             try:
                 from tokenizers import Tokenizer
                 self._tokenizer = Tokenizer.from_file(str(tokenizer_json_path))
-                self._tokenizer.enable_truncation(max_length=512)
+                # Set once: batches are padded per bucket, not by the tokenizer
+                self._tokenizer.enable_truncation(max_length=self.max_length)
+                self._tokenizer.no_padding()
                 self._use_fast_tokenizer = True
                 logger.info("Loaded tokenizer using tokenizers package (no transformers)")
             except ImportError:
@@ -315,6 +337,18 @@ class ONNXRankerModel:
 
         logger.info(f"ONNX ranker model loaded. Active provider: {self._model.get_providers()[0]}")
 
+    def _session_options(self) -> "ort.SessionOptions":
+        """ONNX Runtime session options from the quality config."""
+        from .config import ONNX_GRAPH_OPTIMIZATION_LEVELS
+
+        options = ort.SessionOptions()
+        if self._config.onnx_intra_op_threads > 0:
+            options.intra_op_num_threads = self._config.onnx_intra_op_threads
+        level = ONNX_GRAPH_OPTIMIZATION_LEVELS.get(self._config.onnx_graph_optimization, 'ORT_ENABLE_ALL')
+        options.graph_optimization_level = getattr(ort.GraphOptimizationLevel, level)
+        options.enable_cpu_mem_arena = self._config.onnx_cpu_mem_arena
+        return options
+
     def score_quality(self, query: str, memory_content: str) -> float:
         """
         Score the quality/relevance of a memory.
@@ -332,87 +366,12 @@ class ONNXRankerModel:
         if not memory_content:
             return 0.0
 
-        try:
-            # Prepare input based on model type
-            if self.model_config['type'] == 'classifier':
-                # DeBERTa: Evaluate memory content only (absolute quality)
-                text_input = memory_content
-
-                if self._use_fast_tokenizer:
-                    # Use tokenizers package
-                    encoded = self._tokenizer.encode(text_input)
-                    input_ids = np.array([encoded.ids], dtype=np.int64)
-                    attention_mask = np.array([encoded.attention_mask], dtype=np.int64)
-                else:
-                    # Use transformers AutoTokenizer
-                    inputs = self._tokenizer(text_input, padding=True, truncation=True, max_length=512, return_tensors="np")
-                    input_ids = inputs["input_ids"].astype(np.int64)
-                    attention_mask = inputs["attention_mask"].astype(np.int64)
-
-                ort_inputs = {
-                    "input_ids": input_ids,
-                    "attention_mask": attention_mask
-                }
-
-            elif self.model_config['type'] == 'cross-encoder':
-                # MS-MARCO: Evaluate query-document relevance
-                if not query:
-                    return 0.0
-
-                if self._use_fast_tokenizer:
-                    # Use tokenizers package's ability to encode pairs, which correctly handles special tokens and token type IDs.
-                    self._tokenizer.enable_truncation(max_length=512)
-                    self._tokenizer.enable_padding(length=512)
-                    encoded = self._tokenizer.encode(query, pair=memory_content)
-
-                    input_ids = np.array([encoded.ids], dtype=np.int64)
-                    attention_mask = np.array([encoded.attention_mask], dtype=np.int64)
-                    token_type_ids = np.array([encoded.type_ids], dtype=np.int64)
-                else:
-                    # Use transformers AutoTokenizer
-                    inputs = self._tokenizer(query, memory_content, padding=True, truncation=True, max_length=512, return_tensors="np")
-                    input_ids = inputs["input_ids"].astype(np.int64)
-                    attention_mask = inputs["attention_mask"].astype(np.int64)
-                    token_type_ids = inputs["token_type_ids"].astype(np.int64)
-
-                ort_inputs = {
-                    "input_ids": input_ids,
-                    "attention_mask": attention_mask,
-                    "token_type_ids": token_type_ids
-                }
-
-            else:
-                logger.error(f"Unsupported model type: {self.model_config['type']}")
-                return 0.5
-
-            # Run inference
-            outputs = self._model.run(None, ort_inputs)
-            logits = outputs[0][0]  # Shape: (num_classes,)
-
-            # Convert logits to score based on model type
-            score = 0.5  # Default score if model type is unrecognized
-            if self.model_config['type'] == 'classifier':
-                # DeBERTa: 3-class classification
-                # Apply softmax to get probabilities
-                exp_logits = np.exp(logits - np.max(logits))  # Numerical stability
-                probs = exp_logits / exp_logits.sum()
-
-                # Map to 0-1 scale with proper spacing
-                # NVIDIA DeBERTa label order: 0=High, 1=Medium, 2=Low
-                # So class_values should be [1.0, 0.5, 0.0]
-                class_values = np.array([1.0, 0.5, 0.0])
-                score = float(np.dot(probs, class_values))
-
-            elif self.model_config['type'] == 'cross-encoder':
-                # MS-MARCO: Binary classification with sigmoid.
-                # ORT may return shape (1,), (1, 1), or scalar — flatten to be shape-agnostic
-                # (issue #764: shape (1, 1) previously raised TypeError, swallowed to 0.5 placeholder).
-                logits_arr = np.asarray(logits)
-                logit = float(logits_arr.reshape(-1)[0])
-                score = 1.0 / (1.0 + np.exp(-logit))
-
-            return np.clip(score, 0.0, 1.0)
+        # MS-MARCO: Evaluate query-document relevance
+        if self.model_config['type'] == 'cross-encoder' and not query:
+            return 0.0
 
+        try:
+            return float(self._score_encoded(self._encode([(query, memory_content)]))[0])
         except Exception as e:
             logger.error(f"Error scoring quality with {self.model_name}: {e}")
             return 0.5  # Return neutral score on error
@@ -431,10 +390,12 @@ class ONNXRankerModel:
         """
         Score multiple (query, memory_content) pairs in batched inference calls.
 
-        Processes items in chunks of max_batch_size to cap memory usage.
+        All pairs are tokenized up front and sorted by token count, then run
+        in buckets of up to max_batch_size, each padded only to its own
+        longest sequence. Scores are returned in the order of ``pairs``.
         On GPU with small batches (< MIN_GPU_BATCH_SIZE), dispatches to
         sequential single-item calls which are faster due to lower overhead.
-        Falls back to sequential score_quality() on per-item error.
+        Falls back to sequential score_quality() for a bucket that fails.
 
         Args:
             pairs: List of (query, memory_content) tuples
@@ -456,131 +417,110 @@ class ONNXRankerModel:
             )
             return [self.score_quality(q, c) for q, c in pairs]
 
-        all_scores: List[float] = []
+        try:
+            encoded = self._encode(pairs)
+        except Exception as e:
+            logger.warning(f"Batch tokenization failed ({len(pairs)} items), falling back to sequential: {e}")
+            return [self.score_quality(q, c) for q, c in pairs]
 
-        # Process in chunks
-        for chunk_start in range(0, len(pairs), max_batch_size):
-            chunk = pairs[chunk_start:chunk_start + max_batch_size]
+        # Length buckets: neighbours in token count share an inference call
+        order = np.argsort([len(ids) for ids, _ in encoded], kind="stable")
+        scores = np.empty(len(pairs))
+        for bucket_start in range(0, len(pairs), max_batch_size):
+            bucket = order[bucket_start:bucket_start + max_batch_size]
             try:
-                chunk_scores = self._score_batch_chunk(chunk)
-                all_scores.extend(chunk_scores)
+                scores[bucket] = self._score_encoded([encoded[i] for i in bucket])
             except Exception as e:
                 logger.warning(
-                    f"Batch chunk failed ({len(chunk)} items), falling back to sequential: {e}"
+                    f"Batch chunk failed ({len(bucket)} items), falling back to sequential: {e}"
                 )
-                for query, content in chunk:
-                    all_scores.append(self.score_quality(query, content))
+                scores[bucket] = [self.score_quality(*pairs[i]) for i in bucket]
 
-        return all_scores
+        return scores.tolist()
 
-    def _score_batch_chunk(self, pairs: List[Tuple[str, str]]) -> List[float]:
-        """Score a single chunk of pairs in one ONNX inference call."""
-        if self.model_config['type'] == 'classifier':
-            return self._score_classifier_batch(pairs)
-        elif self.model_config['type'] == 'cross-encoder':
-            return self._score_cross_encoder_batch(pairs)
-        else:
-            raise ValueError(f"Unsupported model type: {self.model_config['type']}")
-
-    def _score_classifier_batch(self, pairs: List[Tuple[str, str]]) -> List[float]:
-        """Batch score for classifier models (DeBERTa). Uses memory_content only."""
-        texts = [content for _, content in pairs]
-        texts = [t if t else " " for t in texts]  # Avoid empty strings
-
-        if self._use_fast_tokenizer:
-            encoded_list = self._tokenizer.encode_batch(texts)
-            max_len = max(len(enc.ids) for enc in encoded_list)
-            batch_size = len(texts)
+    def _clip(self, text: str) -> str:
+        """Cut text that cannot fit in max_length tokens, at a word boundary when possible."""
+        limit = self.max_length * self.CHARS_PER_TOKEN
+        if len(text) <= limit:
+            return text
+        clipped = text[:limit]
+        cut = clipped.rfind(" ")
+        return clipped[:cut] if cut > limit // 2 else clipped
 
-            input_ids = np.zeros((batch_size, max_len), dtype=np.int64)
-            attention_mask = np.zeros((batch_size, max_len), dtype=np.int64)
+    def _encode(self, pairs: List[Tuple[str, str]]) -> List[Tuple[List[int], List[int]]]:
+        """
+        Token ids and token type ids per pair, truncated to max_length and unpadded.
 
-            for i, enc in enumerate(encoded_list):
-                length = len(enc.ids)
-                input_ids[i, :length] = enc.ids
-                attention_mask[i, :length] = enc.attention_mask
-        else:
-            inputs = self._tokenizer(
-                texts, padding=True, truncation=True, max_length=512, return_tensors="np"
-            )
-            input_ids = inputs["input_ids"].astype(np.int64)
-            attention_mask = inputs["attention_mask"].astype(np.int64)
+        Classifiers encode the memory content only; cross-encoders encode
+        the (query, content) pair.
+        """
+        contents = [self._clip(c) if c else " " for _, c in pairs]  # Avoid empty strings
+        cross_encoder = self.model_config['type'] == 'cross-encoder'
+        if cross_encoder:
+            queries = [q if q else " " for q, _ in pairs]
 
-        ort_inputs = {"input_ids": input_ids, "attention_mask": attention_mask}
-        outputs = self._model.run(None, ort_inputs)
-        logits = outputs[0]  # Shape: (batch_size, num_classes)
-
-        # Vectorized softmax + weighted score
-        # DeBERTa: 3-class — [High=1.0, Medium=0.5, Low=0.0]
-        max_logits = np.max(logits, axis=1, keepdims=True)
-        exp_logits = np.exp(logits - max_logits)
-        probs = exp_logits / exp_logits.sum(axis=1, keepdims=True)
-        class_values = np.array([1.0, 0.5, 0.0])
-        scores = probs @ class_values
-        return np.clip(scores, 0.0, 1.0).tolist()
-
-    def _score_cross_encoder_batch(self, pairs: List[Tuple[str, str]]) -> List[float]:
-        """Batch score for cross-encoder models (MS-MARCO). Uses query+content pairs."""
         if self._use_fast_tokenizer:
-            # Lock protects tokenizer state (no_padding/enable_padding) from
-            # concurrent callers (e.g., interleaved single-item score_quality).
-            with self._tokenizer_lock:
-                self._tokenizer.enable_truncation(max_length=512)
-                self._tokenizer.no_padding()
-
-                encoded_list = self._tokenizer.encode_batch(
-                    [(q if q else " ", c if c else " ") for q, c in pairs]
-                )
-
-                # Re-enable padding before releasing lock
-                self._tokenizer.enable_padding(length=512)
-
-            max_len = max(len(enc.ids) for enc in encoded_list)
-            batch_size = len(pairs)
-
-            input_ids = np.zeros((batch_size, max_len), dtype=np.int64)
-            attention_mask = np.zeros((batch_size, max_len), dtype=np.int64)
-            token_type_ids = np.zeros((batch_size, max_len), dtype=np.int64)
+            if cross_encoder:
+                # Pair encoding handles special tokens and token type IDs
+                encoded_list = self._tokenizer.encode_batch(list(zip(queries, contents)))
+            else:
+                encoded_list = self._tokenizer.encode_batch(contents)
+            return [(enc.ids, enc.type_ids) for enc in encoded_list]
+
+        # transformers AutoTokenizer
+        if cross_encoder:
+            inputs = self._tokenizer(queries, contents, truncation=True, max_length=self.max_length)
+            return list(zip(inputs["input_ids"], inputs["token_type_ids"]))
+        inputs = self._tokenizer(contents, truncation=True, max_length=self.max_length)
+        return [(ids, [0] * len(ids)) for ids in inputs["input_ids"]]
+
+    def _score_encoded(self, encoded: List[Tuple[List[int], List[int]]]) -> np.ndarray:
+        """Score encoded sequences in one ONNX inference call, padded to the longest of them."""
+        model_type = self.model_config['type']
+        if model_type not in ('classifier', 'cross-encoder'):
+            raise ValueError(f"Unsupported model type: {model_type}")
+
+        max_len = max(len(ids) for ids, _ in encoded)
+        input_ids = np.zeros((len(encoded), max_len), dtype=np.int64)
+        attention_mask = np.zeros((len(encoded), max_len), dtype=np.int64)
+        token_type_ids = np.zeros((len(encoded), max_len), dtype=np.int64)
+        for i, (ids, type_ids) in enumerate(encoded):
+            length = len(ids)
+            input_ids[i, :length] = ids
+            attention_mask[i, :length] = 1
+            token_type_ids[i, :length] = type_ids
 
-            for i, enc in enumerate(encoded_list):
-                length = len(enc.ids)
-                input_ids[i, :length] = enc.ids
-                attention_mask[i, :length] = enc.attention_mask
-                token_type_ids[i, :length] = enc.type_ids
-        else:
-            queries = [q if q else " " for q, _ in pairs]
-            contents = [c if c else " " for _, c in pairs]
-            inputs = self._tokenizer(
-                queries, contents, padding=True, truncation=True, max_length=512, return_tensors="np"
-            )
-            input_ids = inputs["input_ids"].astype(np.int64)
-            attention_mask = inputs["attention_mask"].astype(np.int64)
-            token_type_ids = inputs["token_type_ids"].astype(np.int64)
-
-        ort_inputs = {
-            "input_ids": input_ids,
-            "attention_mask": attention_mask,
-            "token_type_ids": token_type_ids,
-        }
-        outputs = self._model.run(None, ort_inputs)
-        logits = outputs[0]  # Shape: (batch_size, num_classes) or (batch_size,)
-
-        # Vectorized sigmoid
-        if len(logits.shape) > 1 and logits.shape[1] > 1:
-            raw = logits[:, 0]
+        ort_inputs = {"input_ids": input_ids, "attention_mask": attention_mask}
+        if model_type == 'cross-encoder':
+            ort_inputs["token_type_ids"] = token_type_ids
+        logits = np.asarray(self._model.run(None, ort_inputs)[0])
+
+        if model_type == 'classifier':
+            # Vectorized softmax + weighted score
+            # NVIDIA DeBERTa label order: 0=High, 1=Medium, 2=Low -> [1.0, 0.5, 0.0]
+            max_logits = np.max(logits, axis=1, keepdims=True)
+            exp_logits = np.exp(logits - max_logits)
+            probs = exp_logits / exp_logits.sum(axis=1, keepdims=True)
+            scores = probs @ np.array([1.0, 0.5, 0.0])
         else:
-            raw = logits.flatten()
-        scores = 1.0 / (1.0 + np.exp(-raw))
-        return np.clip(scores, 0.0, 1.0).tolist()
+            # MS-MARCO: vectorized sigmoid of the first logit.
+            # ORT may return shape (batch,), (batch, 1) or a scalar for one item — reshape to be
+            # shape-agnostic (issue #764: shape (1, 1) previously raised TypeError).
+            raw = logits.reshape(len(encoded), -1)[:, 0]
+            scores = 1.0 / (1.0 + np.exp(-raw))
+        return np.clip(scores, 0.0, 1.0)
 
 
-def get_onnx_ranker_model(model_name: str = None, device: str = "auto") -> Optional[ONNXRankerModel]:
+def get_onnx_ranker_model(
+    model_name: str = None, device: str = "auto", config: Optional["QualityConfig"] = None
+) -> Optional[ONNXRankerModel]:
     """
     Get ONNX ranker model if available.
 
     Args:
         model_name: Model to use (default from config if None)
         device: Device to use ('auto', 'cpu', 'cuda', 'mps', 'directml')
+        config: Quality config for session settings (default: from environment)
 
     Returns:
         ONNXRankerModel instance or None if ONNX is not available
@@ -589,10 +529,12 @@ def get_onnx_ranker_model(model_name: str = None, device: str = "auto") -> Optio
         logger.warning("ONNX Runtime not available")
         return None
 
-    # Use config default if not specified
-    if model_name is None:
+    if config is None:
         from .config import QualityConfig
         config = QualityConfig.from_env()
+
+    # Use config default if not specified
+    if model_name is None:
         model_name = config.local_model
 
     # Check if ONNX model exists - if so, we don't need transformers!
@@ -604,7 +546,7 @@ def get_onnx_ranker_model(model_name: str = None, device: str = "auto") -> Optio
         return None
 
     try:
-        return ONNXRankerModel(model_name=model_name, device=device)
+        return ONNXRankerModel(model_name=model_name, device=device, config=config)
     except Exception as e:
         logger.error(f"Failed to create ONNX ranker for {model_name}: {e}")
         return None
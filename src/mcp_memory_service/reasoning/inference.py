@@ -43,6 +43,9 @@ class SemanticReasoner:
         """
         Helper to fetch memories connected via specific relationship type.
 
+        Uses ``graph.neighbors_many`` (one indexed one-hop lookup) when the
+        graph backend has it, otherwise ``find_connected`` with ``max_hops=1``.
+
         Args:
             hash: Source memory hash
             rel_type: Relationship type to filter
@@ -52,6 +55,14 @@ class SemanticReasoner:
             List of connected memory hashes
         """
         try:
+            if hasattr(self.graph, 'neighbors_many'):
+                neighbors = await self.graph.neighbors_many(
+                    [hash],
+                    relationship_types=[rel_type],
+                    direction=direction
+                )
+                return neighbors.get(hash, [])
+
             # Use graph.find_connected with relationship_type filter
             connected = await self.graph.find_connected(
                 memory_hash=hash,
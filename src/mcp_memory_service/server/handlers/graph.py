@@ -17,6 +17,7 @@ Graph traversal handler functions for MCP server.
 
 Provides graph database operations including:
 - find_connected_memories: Multi-hop connection discovery
+- get_neighbors: Batched one-hop neighbors of several memories
 - find_shortest_path: Path finding between memories
 - get_memory_subgraph: Subgraph extraction for visualization
 """
@@ -27,7 +28,7 @@ from typing import List, Optional
 
 from mcp import types
 from ...storage.graph import GraphStorage
-from ...config import SQLITE_VEC_PATH, STORAGE_BACKEND
+from ...config import SQLITE_VEC_PATH, STORAGE_BACKEND, GRAPH_PATH_MAX_EXPANDED_NODES
 
 logger = logging.getLogger(__name__)
 
@@ -75,7 +76,7 @@ async def handle_memory_graph(server, arguments: dict) -> List[types.TextContent
         return [types.TextContent(type="text", text="Error: action parameter is required")]
 
     # Validate action
-    valid_actions = ["connected", "path", "subgraph", "extract_entities", "infer", "suggest"]
+    valid_actions = ["connected", "neighbors", "path", "subgraph", "extract_entities", "infer", "suggest"]
     if action not in valid_actions:
         return [types.TextContent(
             type="text",
@@ -95,6 +96,18 @@ async def handle_memory_graph(server, arguments: dict) -> List[types.TextContent
                 "max_hops": arguments.get("max_hops", 2)
             })
 
+        elif action == "neighbors":
+            # Direct neighbors of several memories in one lookup
+            hashes = arguments.get("hashes")
+            if not hashes:
+                return [types.TextContent(type="text", text="Error: hashes is required for 'neighbors' action")]
+
+            return await handle_get_neighbors(server, {
+                "hashes": hashes,
+                "relationship_types": arguments.get("relationship_types"),
+                "direction": arguments.get("direction") or "both"
+            })
+
         elif action == "path":
             # Find shortest path
             hash1 = arguments.get("hash1")
@@ -105,7 +118,10 @@ async def handle_memory_graph(server, arguments: dict) -> List[types.TextContent
             return await handle_find_shortest_path(server, {
                 "hash1": hash1,
                 "hash2": hash2,
-                "max_depth": arguments.get("max_depth", 5)
+                "max_depth": arguments.get("max_depth", 5),
+                "direction": arguments.get("direction"),
+                "relationship_types": arguments.get("relationship_types"),
+                "max_expanded_nodes": arguments.get("max_expanded_nodes", GRAPH_PATH_MAX_EXPANDED_NODES)
             })
 
         elif action == "subgraph":
@@ -323,6 +339,71 @@ async def handle_find_connected_memories(
         )]
 
 
+async def handle_get_neighbors(
+    server,
+    arguments: dict
+) -> List[types.TextContent]:
+    """
+    Find the direct neighbors of several memories with one storage lookup.
+
+    Args:
+        server: MCP server instance (unused, for handler pattern consistency)
+        arguments: Dict with:
+            - hashes: Content hashes of the memories to look up
+            - relationship_types: Optional list of relationship types to follow
+            - direction: "outgoing", "incoming" or "both" (default: "both")
+
+    Returns:
+        List with single TextContent containing JSON result:
+        {
+            "success": true,
+            "neighbors": {"abc123": ["def456"], "ghi789": []},
+            "count": 1
+        }
+        Or error result if graph unavailable or operation fails.
+    """
+    graph = await get_graph_storage()
+    if graph is None:
+        result = {
+            "success": False,
+            "error": f"Graph operations not available for backend: {STORAGE_BACKEND}",
+            "neighbors": {},
+            "count": 0
+        }
+        return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
+
+    hashes = arguments.get("hashes")
+    if not hashes:
+        result = {
+            "success": False,
+            "error": "Missing required parameter: hashes",
+            "neighbors": {},
+            "count": 0
+        }
+        return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
+
+    try:
+        neighbors = await graph.neighbors_many(
+            hashes,
+            relationship_types=arguments.get("relationship_types"),
+            direction=arguments.get("direction", "both")
+        )
+        count = sum(len(neighbor_hashes) for neighbor_hashes in neighbors.values())
+        result = {"success": True, "neighbors": neighbors, "count": count}
+        logger.info(f"Found {count} neighbors for {len(hashes)} memories")
+        return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
+
+    except Exception as e:
+        logger.error(f"Error finding neighbors: {e}")
+        result = {
+            "success": False,
+            "error": str(e),
+            "neighbors": {},
+            "count": 0
+        }
+        return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
+
+
 async def handle_find_shortest_path(
     server,
     arguments: dict
@@ -330,8 +411,9 @@ async def handle_find_shortest_path(
     """
     Find shortest path between two memories in the association graph.
 
-    Uses breadth-first search to find the shortest sequence of associations
-    connecting two memories. Returns null if no path exists.
+    Uses bidirectional breadth-first search to find the shortest sequence of
+    associations connecting two memories. Returns null if no path exists or
+    the search budget runs out first.
 
     Args:
         server: MCP server instance (unused, for handler pattern consistency)
@@ -339,6 +421,11 @@ async def handle_find_shortest_path(
             - hash1: Starting memory hash
             - hash2: Target memory hash
             - max_depth: Maximum path length (default: 5)
+            - direction: "outgoing", "incoming" or "both" (default: the
+              backend's own - "outgoing" for SQLite, "both" for Milvus)
+            - relationship_types: Optional list of relationship types to follow
+            - max_expanded_nodes: Node expansion budget bounding worst-case
+              latency (default: MCP_GRAPH_PATH_MAX_EXPANDED_NODES)
 
     Returns:
         List with single TextContent containing JSON result:
@@ -383,10 +470,16 @@ async def handle_find_shortest_path(
 
     # Get optional parameters
     max_depth = arguments.get("max_depth", 5)
+    path_options = {
+        "relationship_types": arguments.get("relationship_types"),
+        "max_expanded_nodes": arguments.get("max_expanded_nodes") or GRAPH_PATH_MAX_EXPANDED_NODES,
+    }
+    if arguments.get("direction"):
+        path_options["direction"] = arguments["direction"]
 
     try:
         # Find shortest path
-        path = await graph.shortest_path(hash1, hash2, max_depth=max_depth)
+        path = await graph.shortest_path(hash1, hash2, max_depth=max_depth, **path_options)
 
         # Format results
         if path is not None:
@@ -401,7 +494,7 @@ async def handle_find_shortest_path(
                 "success": True,
                 "path": None,
                 "length": 0,
-                "message": "No path found within depth limit"
+                "message": "No path found within depth limit and search budget"
             }
             logger.info(f"No path found between {hash1} and {hash2}")
 
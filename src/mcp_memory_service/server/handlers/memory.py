@@ -809,7 +809,10 @@ async def handle_cleanup_duplicates(server, arguments: dict) -> List[types.TextC
     try:
         # Initialize storage lazily when needed
         storage = await server._ensure_storage_initialized()
-        count, message = await storage.cleanup_duplicates()
+        count, message = await storage.cleanup_duplicates(
+            near_duplicates=bool(arguments.get("near_duplicates", False)),
+            threshold=float(arguments.get("threshold", 0.8)),
+        )
         return [types.TextContent(type="text", text=message)]
     except Exception as e:
         logger.error(f"Error cleaning up duplicates: {str(e)}\n{traceback.format_exc()}")
@@ -845,6 +848,8 @@ async def handle_memory_search(server, arguments: dict) -> List[types.TextConten
             tags=tags,
             tag_match=arguments.get("tag_match", "any"),
             quality_boost=arguments.get("quality_boost", 0.0),
+            graph_boost=arguments.get("graph_boost", 0.0),
+            cluster_probe=arguments.get("cluster_probe", 0),
             limit=limit,
             include_debug=arguments.get("include_debug", False),
             include_superseded=arguments.get("include_superseded", False)
@@ -1501,6 +1501,19 @@ Examples:
                                     "default": 0,
                                     "description": "Quality weight for reranking (0.0-1.0)"
                                 },
+                                "graph_boost": {
+                                    "type": "number",
+                                    "minimum": 0,
+                                    "maximum": 1,
+                                    "default": 0,
+                                    "description": "Graph importance (PageRank/degree centrality) weight for reranking (0.0-1.0)"
+                                },
+                                "cluster_probe": {
+                                    "type": "integer",
+                                    "minimum": 0,
+                                    "default": 0,
+                                    "description": "Only search the N memory clusters nearest the query, using the cluster index kept by consolidation (0 = search everything)"
+                                },
                                 "limit": {
                                     "type": "integer",
                                     "default": 10,
@@ -1692,7 +1705,20 @@ Examples:
                         description="Find and remove duplicate entries",
                         inputSchema={
                             "type": "object",
-                            "properties": {}
+                            "properties": {
+                                "near_duplicates": {
+                                    "type": "boolean",
+                                    "default": False,
+                                    "description": "Also remove near duplicates (same text up to case and whitespace, containment, or high word overlap), keeping the oldest memory"
+                                },
+                                "threshold": {
+                                    "type": "number",
+                                    "default": 0.8,
+                                    "minimum": 0,
+                                    "maximum": 1,
+                                    "description": "Word-overlap threshold for near duplicates"
+                                }
+                            }
                         },
                         annotations=types.ToolAnnotations(
                             title="Cleanup Duplicates",
@@ -2156,6 +2182,7 @@ Examples:
 
 ACTIONS:
 - connected: Find memories connected via associations (BFS traversal)
+- neighbors: Direct neighbors of several memories in one lookup. Params: hashes (array), relationship_types, direction
 - path: Find shortest path between two memories
 - subgraph: Get graph structure around a memory for visualization
 - infer: Find transitive relationships (A→B→C implies A→C). Params: rel_type (string), max_hops (int, default 2)
@@ -2163,7 +2190,9 @@ ACTIONS:
 
 Examples:
 {"action": "connected", "hash": "abc123", "max_hops": 2}
+{"action": "neighbors", "hashes": ["abc123", "def456"], "relationship_types": ["fixes"], "direction": "incoming"}
 {"action": "path", "hash1": "abc123", "hash2": "def456", "max_depth": 5}
+{"action": "path", "hash1": "abc123", "hash2": "def456", "direction": "both", "max_expanded_nodes": 2000}
 {"action": "subgraph", "hash": "abc123", "radius": 2}
 {"action": "infer", "rel_type": "causes", "max_hops": 2}
 {"action": "suggest", "hash": "abc123"}
@@ -2173,13 +2202,18 @@ Examples:
                             "properties": {
                                 "action": {
                                     "type": "string",
-                                    "enum": ["connected", "path", "subgraph", "infer", "suggest"],
+                                    "enum": ["connected", "neighbors", "path", "subgraph", "infer", "suggest"],
                                     "description": "Graph operation to perform"
                                 },
                                 "hash": {
                                     "type": "string",
                                     "description": "Memory hash (for connected/subgraph)"
                                 },
+                                "hashes": {
+                                    "type": "array",
+                                    "items": {"type": "string"},
+                                    "description": "Memory hashes (for neighbors)"
+                                },
                                 "hash1": {
                                     "type": "string",
                                     "description": "Start memory hash (for path)"
@@ -2198,6 +2232,20 @@ Examples:
                                     "default": 5,
                                     "description": "For 'path': max path length"
                                 },
+                                "direction": {
+                                    "type": "string",
+                                    "enum": ["outgoing", "incoming", "both"],
+                                    "description": "For 'path'/'neighbors': follow edges forward, backward, or ignore direction (path default on SQLite: outgoing; neighbors default: both)"
+                                },
+                                "relationship_types": {
+                                    "type": "array",
+                                    "items": {"type": "string"},
+                                    "description": "For 'path'/'neighbors': only follow these relationship types"
+                                },
+                                "max_expanded_nodes": {
+                                    "type": "integer",
+                                    "description": "For 'path': node expansion budget (default: MCP_GRAPH_PATH_MAX_EXPANDED_NODES, 10000)"
+                                },
                                 "radius": {
                                     "type": "integer",
                                     "default": 2,
@@ -16,13 +16,13 @@
 Graph Service - Shared business logic for knowledge graph operations.
 
 Provides a unified interface for graph traversal operations (find connected,
-shortest path, subgraph extraction) that can be used by both the stdio
-MCP server (server_impl.py) and the streamable-http FastMCP server
+batched neighbor lookup, shortest path, subgraph extraction) that can be used
+by both the stdio MCP server (server_impl.py) and the streamable-http FastMCP server
 (mcp_server.py).
 """
 
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from ..storage.graph import GraphStorage
 
@@ -109,6 +109,56 @@ class GraphService:
                 "count": 0,
             }
 
+    async def get_neighbors(
+        self,
+        content_hashes: List[str],
+        relationship_types: Optional[List[str]] = None,
+        direction: str = "both",
+    ) -> Dict[str, Any]:
+        """
+        Find the direct neighbors of several memories at once.
+
+        Uses a single batched storage lookup instead of one traversal per
+        memory.
+
+        Args:
+            content_hashes: Content hashes of the memories to look up.
+            relationship_types: Optional relationship types to filter by.
+            direction: "outgoing", "incoming" or "both" (default).
+
+        Returns:
+            Dict with success status, neighbors mapping (hash -> list of
+            neighbor hashes), and total neighbor count.
+        """
+        if not self.is_available():
+            return {
+                "success": False,
+                "error": "Graph operations not available for current storage backend",
+                "neighbors": {},
+                "count": 0,
+            }
+
+        try:
+            neighbors = await self._graph.neighbors_many(
+                content_hashes,
+                relationship_types=relationship_types,
+                direction=direction,
+            )
+            count = sum(len(hashes) for hashes in neighbors.values())
+            logger.info(
+                "Found %d neighbors for %d memories", count, len(content_hashes),
+            )
+            return {"success": True, "neighbors": neighbors, "count": count}
+
+        except Exception as e:
+            logger.error("Error finding neighbors: %s", e)
+            return {
+                "success": False,
+                "error": str(e),
+                "neighbors": {},
+                "count": 0,
+            }
+
     async def find_shortest_path(
         self, hash1: str, hash2: str, max_depth: int = 5
     ) -> Dict[str, Any]:
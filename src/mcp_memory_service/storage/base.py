@@ -20,12 +20,20 @@ Licensed under the MIT License. See LICENSE file in the project root for full li
 import asyncio
 import logging
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any, Tuple
+from typing import AsyncIterator, List, Optional, Dict, Any, Tuple
 from datetime import datetime, timezone, timedelta, date
 from ..models.memory import Memory, MemoryQueryResult
 
 logger = logging.getLogger(__name__)
 
+
+def consolidation_sort_key(memory: Memory) -> float:
+    """Consolidation order key: last consolidation time, else creation time (never-consolidated first)."""
+    if memory.metadata and memory.metadata.get("last_consolidated_at") is not None:
+        return float(memory.metadata["last_consolidated_at"])
+    return memory.created_at if memory.created_at else 0.0
+
+
 class MemoryStorage(ABC):
     """Abstract base class for memory storage implementations."""
 
@@ -131,7 +139,8 @@ class MemoryStorage(ABC):
         tags: Optional[List[str]] = None,
         quality_boost: Optional[bool] = None,
         quality_weight: Optional[float] = None,
-        include_superseded: bool = False
+        include_superseded: bool = False,
+        graph_weight: Optional[float] = None
     ) -> List[MemoryQueryResult]:
         """
         Retrieve memories with optional quality-based reranking.
@@ -140,12 +149,17 @@ class MemoryStorage(ABC):
         in the results. It over-fetches candidates (3x) then reranks by a composite score
         combining semantic similarity and quality scores.
 
+        With a non-zero ``graph_weight`` the score is further blended with the
+        memory's precomputed graph importance (see :meth:`get_graph_importance`).
+
         Args:
             query: Search query
             n_results: Number of results to return
             tags: Optional list of tags to filter by (match ANY tag)
             quality_boost: Enable quality reranking (default from config)
             quality_weight: Weight for quality score 0.0-1.0 (default 0.3, meaning 30% quality, 70% semantic)
+            graph_weight: Weight for graph importance 0.0-1.0 (default from
+                MCP_GRAPH_IMPORTANCE_WEIGHT, 0.0 = disabled)
 
         Returns:
             List of MemoryQueryResult, reranked by quality if enabled
@@ -162,19 +176,23 @@ class MemoryStorage(ABC):
                 quality_weight=0.3
             )
         """
-        from ..config import MCP_QUALITY_BOOST_ENABLED, MCP_QUALITY_BOOST_WEIGHT
+        from ..config import MCP_QUALITY_BOOST_ENABLED, MCP_QUALITY_BOOST_WEIGHT, GRAPH_IMPORTANCE_WEIGHT
 
         # Get config defaults if not specified
         if quality_boost is None:
             quality_boost = MCP_QUALITY_BOOST_ENABLED
         if quality_weight is None:
             quality_weight = MCP_QUALITY_BOOST_WEIGHT
+        if graph_weight is None:
+            graph_weight = GRAPH_IMPORTANCE_WEIGHT
 
         # Validate quality_weight
         if not 0.0 <= quality_weight <= 1.0:
             raise ValueError(f"quality_weight must be 0.0-1.0, got {quality_weight}")
+        if not 0.0 <= graph_weight <= 1.0:
+            raise ValueError(f"graph_weight must be 0.0-1.0, got {graph_weight}")
 
-        if not quality_boost:
+        if not quality_boost and not graph_weight:
             # Standard retrieval, no reranking
             return await self.retrieve(query, n_results, tags=tags, include_superseded=include_superseded)
 
@@ -186,6 +204,9 @@ class MemoryStorage(ABC):
         if not candidates:
             return []
 
+        if not quality_boost:
+            return (await self.apply_graph_importance(candidates, graph_weight))[:n_results]
+
         # Step 2: Rerank by composite score
         semantic_weight = 1.0 - quality_weight
 
@@ -210,12 +231,63 @@ class MemoryStorage(ABC):
                 'reranked': True
             })
 
-        # Step 3: Resort by new composite score
-        candidates.sort(key=lambda r: r.relevance_score, reverse=True)
+        # Step 3: Resort by new composite score (blending in graph importance if enabled)
+        if graph_weight:
+            candidates = await self.apply_graph_importance(candidates, graph_weight)
+        else:
+            candidates.sort(key=lambda r: r.relevance_score, reverse=True)
 
         # Step 4: Return top N
         return candidates[:n_results]
 
+    async def get_graph_importance(self, memory_hashes: List[str]) -> Dict[str, float]:
+        """
+        Precomputed graph importance (0.0-1.0) for the given memories.
+
+        Backends with a knowledge graph override this to read the centrality
+        scores refreshed after consolidation. Default: no scores.
+        """
+        return {}
+
+    async def apply_graph_importance(
+        self,
+        results: List[MemoryQueryResult],
+        graph_weight: float
+    ) -> List[MemoryQueryResult]:
+        """
+        Blend graph importance into ``relevance_score`` and resort.
+
+        Costs one :meth:`get_graph_importance` lookup for all results; memories
+        without a score (not in the graph) count as importance 0.0.
+
+        Args:
+            results: Search results to rerank in place
+            graph_weight: Weight for graph importance 0.0-1.0
+
+        Returns:
+            The results, sorted by the blended score
+        """
+        if not results or not graph_weight:
+            return results
+
+        importance = await self.get_graph_importance([r.memory.content_hash for r in results])
+        for result in results:
+            score = result.relevance_score
+            graph_score = importance.get(result.memory.content_hash, 0.0)
+            result.relevance_score = (1.0 - graph_weight) * score + graph_weight * graph_score
+
+            if result.debug_info is None:
+                result.debug_info = {}
+            result.debug_info.update({
+                'pre_graph_score': score,
+                'graph_importance': graph_score,
+                'graph_weight': graph_weight,
+                'reranked': True
+            })
+
+        results.sort(key=lambda r: r.relevance_score, reverse=True)
+        return results
+
     @abstractmethod
     async def search_by_tag(self, tags: List[str], time_start: Optional[float] = None) -> List[Memory]:
         """Search memories by tags with optional time filtering.
@@ -694,8 +766,19 @@ class MemoryStorage(ABC):
             }
 
     @abstractmethod
-    async def cleanup_duplicates(self) -> Tuple[int, str]:
-        """Remove duplicate memories. Returns (count_removed, message)."""
+    async def cleanup_duplicates(
+        self, near_duplicates: bool = False, threshold: float = 0.8
+    ) -> Tuple[int, str]:
+        """
+        Remove duplicate memories. Returns (count_removed, message).
+
+        Args:
+            near_duplicates: Also remove near duplicates (same text up to case
+                and whitespace, containment, or word overlap above
+                ``threshold``), keeping the oldest memory. Backends without
+                near-duplicate detection remove exact duplicates only.
+            threshold: Word-overlap (Jaccard) threshold for near duplicates.
+        """
         pass
     
     @abstractmethod
@@ -902,9 +985,56 @@ class MemoryStorage(ABC):
             A list of Memory objects within the specified time range.
         """
         return []
+
+    async def iter_memories_for_consolidation(
+        self,
+        cutoff_timestamp: Optional[float] = None,
+        chunk_size: int = 1000,
+        limit: Optional[int] = None,
+        start_key: Optional[float] = None,
+    ) -> AsyncIterator[List[Memory]]:
+        """
+        Stream memories with embeddings in consolidation order.
+
+        Memories are yielded in chunks of at most ``chunk_size``, least
+        recently consolidated first: ordered by
+        ``metadata["last_consolidated_at"]``, falling back to ``created_at``
+        for memories that were never consolidated.
+
+        This default loads everything through ``get_all_memories`` and filters
+        in Python. Backends should override it to push the filter and
+        ordering into their query and fetch one chunk at a time, so callers
+        hold at most ``chunk_size`` memories regardless of corpus size.
+
+        Args:
+            cutoff_timestamp: Only memories created before this Unix timestamp.
+            chunk_size: Maximum number of memories per yielded list.
+            limit: Maximum number of memories in total (None for all).
+            start_key: Only memories whose order key is at least this value,
+                for resuming a stream where an earlier one stopped.
+
+        Yields:
+            Non-empty lists of Memory objects.
+        """
+        memories = await self.get_all_memories(include_embeddings=True)
+        if cutoff_timestamp is not None:
+            memories = [m for m in memories if m.created_at and m.created_at < cutoff_timestamp]
+        if start_key is not None:
+            memories = [m for m in memories if consolidation_sort_key(m) >= start_key]
+        memories.sort(key=consolidation_sort_key)
+        if limit is not None:
+            memories = memories[:limit]
+        for start in range(0, len(memories), chunk_size):
+            yield memories[start:start + chunk_size]
     
-    async def get_memory_connections(self) -> Dict[str, int]:
-        """Get memory connection statistics. Override for specific implementations."""
+    async def get_memory_connections(
+        self, memory_hashes: Optional[List[str]] = None
+    ) -> Dict[str, int]:
+        """Get memory connection statistics. Override for specific implementations.
+
+        ``memory_hashes`` lets backends that count per-memory connections
+        restrict the lookup to the given candidates; others may ignore it.
+        """
         return {}
 
     async def get_access_patterns(self) -> Dict[str, datetime]:
@@ -988,6 +1118,59 @@ class MemoryStorage(ABC):
         """
         return {"nodes": [], "edges": []}
 
+    async def get_graph_view(
+        self,
+        node_budget: int = 200,
+        rank_by: str = "degree",
+        min_connections: int = 1
+    ) -> Dict[str, Any]:
+        """
+        Level-of-detail graph for visualization.
+
+        Returns the top ``node_budget`` memories by degree or centrality and
+        the edges between them; the remaining memories are summarized as
+        cluster super-nodes that can be opened with expand_graph_node().
+
+        Args:
+            node_budget: Maximum number of memory nodes to return
+            rank_by: "degree" or "centrality"
+            min_connections: Minimum degree a memory must have to be counted
+
+        Returns:
+            Dictionary with "nodes", "edges", "clusters", "cluster_edges" and "meta":
+            {
+                "nodes": [{"id": "hash123", "type": "observation", "connections": 12, ...}],
+                "edges": [{"source": "hash123", "target": "hash456", ...}],
+                "clusters": [{"id": "cluster:hash123", "type": "cluster", "anchor": "hash123", "size": 40, ...}],
+                "cluster_edges": [{"source": "hash123", "target": "cluster:hash123", "weight": 40, ...}],
+                "meta": {"total_nodes": 5000, "visible_nodes": 200, "hidden_nodes": 4800, ...}
+            }
+        """
+        return {"nodes": [], "edges": [], "clusters": [], "cluster_edges": [], "meta": {}}
+
+    async def expand_graph_node(
+        self,
+        content_hash: str,
+        limit: int = 50,
+        offset: int = 0
+    ) -> Dict[str, Any]:
+        """
+        One page of a memory's neighbors, strongest similarity first.
+
+        Args:
+            content_hash: Memory whose neighbors to return
+            limit: Page size
+            offset: Number of neighbors to skip
+
+        Returns:
+            Dictionary with "node", "nodes", "edges", "total", "offset",
+            "limit" and "has_more"
+        """
+        return {
+            "node": content_hash, "nodes": [], "edges": [],
+            "total": 0, "offset": offset, "limit": limit, "has_more": False
+        }
+
     async def search_memories(
         self,
         query: Optional[str] = None,
@@ -1000,7 +1183,9 @@ class MemoryStorage(ABC):
         quality_boost: float = 0.0,
         limit: int = 10,
         include_debug: bool = False,
-        include_superseded: bool = False
+        include_superseded: bool = False,
+        graph_boost: float = 0.0,
+        cluster_probe: int = 0
     ) -> Dict[str, Any]:
         """
         Unified memory search with flexible modes and filters.
@@ -1019,6 +1204,12 @@ class MemoryStorage(ABC):
             quality_boost: Quality weight for reranking 0.0-1.0 (0.0=pure semantic, 1.0=pure quality)
             limit: Maximum number of results to return (default: 10)
             include_debug: Include debug information in response (default: False)
+            graph_boost: Graph importance weight 0.0-1.0 blended into the score
+                of query results (0.0 = off); reads precomputed centrality only
+            cluster_probe: Coarse filter for semantic queries: only score memories
+                in this many clusters nearest the query, from the cluster index
+                kept by consolidation (0 = off). Ignored, with a warning, in
+                hybrid mode, with quality_boost and by backends without one
 
         Returns:
             Dictionary with:
@@ -1102,6 +1293,26 @@ class MemoryStorage(ABC):
                     "error": f"Invalid quality_boost: {quality_boost}. Must be 0.0-1.0"
                 }
 
+            # Validate graph_boost
+            if not 0.0 <= graph_boost <= 1.0:
+                return {
+                    "memories": [],
+                    "total": 0,
+                    "query": query,
+                    "mode": mode,
+                    "error": f"Invalid graph_boost: {graph_boost}. Must be 0.0-1.0"
+                }
+
+            # Validate cluster_probe
+            if cluster_probe < 0:
+                return {
+                    "memories": [],
+                    "total": 0,
+                    "query": query,
+                    "mode": mode,
+                    "error": f"Invalid cluster_probe: {cluster_probe}. Must be >= 0"
+                }
+
             pre_filter_count = 0
             start_time = None
             end_time = None
@@ -1185,9 +1396,19 @@ class MemoryStorage(ABC):
                 if query:
                     # Determine fetch limit (over-fetch when post-filtering is needed)
                     fetch_limit = limit
-                    if quality_boost > 0 and mode == "hybrid":
+                    if (quality_boost > 0 and mode == "hybrid") or graph_boost > 0 or (cluster_probe > 0 and tags):
                         fetch_limit = limit * 3
 
+                    if cluster_probe > 0 and (
+                        (mode == "hybrid" and hasattr(self, 'retrieve_hybrid'))
+                        or quality_boost > 0
+                        or not hasattr(self, 'retrieve_clustered')
+                    ):
+                        logger.warning(
+                            "cluster_probe is ignored in hybrid mode, with quality_boost and by backends "
+                            "without a cluster index; searching all memories"
+                        )
+
                     # Choose search method based on mode and available features
                     if mode == "hybrid" and hasattr(self, 'retrieve_hybrid'):
                         # Use hybrid search (BM25 + Vector)
@@ -1208,7 +1429,8 @@ class MemoryStorage(ABC):
                                     tags=tags,
                                     quality_boost=True,
                                     quality_weight=quality_boost,
-                                    include_superseded=include_superseded
+                                    include_superseded=include_superseded,
+                                    graph_weight=0.0
                                 )
                             else:
                                 results = await self.retrieve(query, n_results=fetch_limit, tags=tags, include_superseded=include_superseded)
@@ -1220,12 +1442,25 @@ class MemoryStorage(ABC):
                             tags=tags,
                             quality_boost=True,
                             quality_weight=quality_boost,
+                            include_superseded=include_superseded,
+                            graph_weight=0.0
+                        )
+                    elif cluster_probe > 0 and hasattr(self, 'retrieve_clustered'):
+                        # Coarse filter: score only the clusters nearest the query
+                        # (tags are filtered below)
+                        results = await self.retrieve_clustered(
+                            query,
+                            n_results=fetch_limit,
+                            probe=cluster_probe,
                             include_superseded=include_superseded
                         )
                     else:
                         # Standard semantic search
                         results = await self.retrieve(query, n_results=fetch_limit, tags=tags, include_superseded=include_superseded)
 
+                    if graph_boost > 0:
+                        results = await self.apply_graph_importance(results, graph_boost)
+
                     pre_filter_count = len(results)
                 else:
                     # Time-only or tag-only search - try optimized path first (Issue #374)
@@ -1320,6 +1555,8 @@ class MemoryStorage(ABC):
                     },
                     "tag_filter": tags,
                     "quality_boost": quality_boost,
+                    "graph_boost": graph_boost,
+                    "cluster_probe": cluster_probe,
                     "pre_filter_count": pre_filter_count,
                     "post_filter_count": len(memories),
                     "limit": limit
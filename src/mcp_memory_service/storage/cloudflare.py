@@ -27,11 +27,17 @@ from datetime import datetime, timezone, timedelta, date
 import httpx
 
 from .base import MemoryStorage
+from .cloudflare_limiter import CloudflareRateLimiter, parse_retry_after
+from .sync_digest import build_bucket_digest_query, build_bucket_entries_query, rows_to_digests
 from ..models.memory import Memory, MemoryQueryResult
+from .. import config as app_config
 from ..config import CLOUDFLARE_MAX_CONTENT_LENGTH
 
 logger = logging.getLogger(__name__)
 
+# Default Cloudflare API root; overridable for local emulators
+CLOUDFLARE_API_BASE_URL = "https://api.cloudflare.com/client/v4"
+
 
 def _sanitize_log_value(value: object) -> str:
     """Sanitize a user-provided value for safe inclusion in log messages."""
@@ -139,7 +145,11 @@ class CloudflareStorage(MemoryStorage):
                  embedding_model: str = "@cf/baai/bge-base-en-v1.5",
                  large_content_threshold: int = 1024 * 1024,  # 1MB
                  max_retries: int = 3,
-                 base_delay: float = 1.0):
+                 base_delay: float = 1.0,
+                 requests_per_second: Optional[float] = None,
+                 rate_limit_burst: Optional[int] = None,
+                 max_concurrency: Optional[int] = None,
+                 api_base_url: Optional[str] = None):
         """
         Initialize Cloudflare storage backend.
 
@@ -153,6 +163,13 @@ class CloudflareStorage(MemoryStorage):
             large_content_threshold: Size threshold for R2 storage
             max_retries: Maximum retry attempts for API calls
             base_delay: Base delay for exponential backoff
+            requests_per_second: Sustained API request rate shared by all callers
+                (default: CLOUDFLARE_RATE_LIMIT_RPS)
+            rate_limit_burst: Token bucket capacity (default: CLOUDFLARE_RATE_LIMIT_BURST)
+            max_concurrency: Upper bound on in-flight requests (default: CLOUDFLARE_MAX_CONCURRENCY)
+            api_base_url: Cloudflare API root (default: CLOUDFLARE_API_BASE_URL, i.e.
+                https://api.cloudflare.com/client/v4); point it at a local emulator
+                for offline testing and benchmarks
         """
         self.api_token = api_token
         self.account_id = account_id
@@ -165,7 +182,8 @@ class CloudflareStorage(MemoryStorage):
         self.base_delay = base_delay
 
         # API endpoints
-        self.base_url = f"https://api.cloudflare.com/client/v4/accounts/{account_id}"
+        api_root = api_base_url or getattr(app_config, 'CLOUDFLARE_API_BASE_URL', None) or CLOUDFLARE_API_BASE_URL
+        self.base_url = f"{api_root.rstrip('/')}/accounts/{account_id}"
         self.vectorize_url = f"{self.base_url}/vectorize/v2/indexes/{vectorize_index}"
         self.d1_url = f"{self.base_url}/d1/database/{d1_database_id}"
         self.ai_url = f"{self.base_url}/ai/run/{embedding_model}"
@@ -173,6 +191,18 @@ class CloudflareStorage(MemoryStorage):
         if r2_bucket:
             self.r2_url = f"{self.base_url}/r2/buckets/{r2_bucket}/objects"
 
+        # One limiter per instance: foreground queries, background sync, initial
+        # pull and drift detection all draw from the same budget.
+        rps = requests_per_second if requests_per_second is not None else getattr(app_config, 'CLOUDFLARE_RATE_LIMIT_RPS', None)
+        burst = rate_limit_burst if rate_limit_burst is not None else getattr(app_config, 'CLOUDFLARE_RATE_LIMIT_BURST', None)
+        concurrency = max_concurrency if max_concurrency is not None else getattr(app_config, 'CLOUDFLARE_MAX_CONCURRENCY', None)
+        self.rate_limiter = CloudflareRateLimiter(
+            requests_per_second=rps if rps is not None else 4.0,
+            burst=burst if burst is not None else 40,
+            max_concurrency=concurrency if concurrency is not None else 10,
+            default_backoff=base_delay,
+        )
+
         # HTTP client with connection pooling
         self.client = None
         self._initialized = False
@@ -191,24 +221,40 @@ class CloudflareStorage(MemoryStorage):
             self.client = httpx.AsyncClient(
                 headers=headers,
                 timeout=httpx.Timeout(30.0),
-                limits=httpx.Limits(max_connections=10, max_keepalive_connections=5)
+                limits=httpx.Limits(
+                    max_connections=self.rate_limiter.max_concurrency,
+                    max_keepalive_connections=max(1, self.rate_limiter.max_concurrency // 2)
+                )
             )
         return self.client
     
     async def _retry_request(self, method: str, url: str, **kwargs) -> httpx.Response:
-        """Make HTTP request with exponential backoff retry logic."""
+        """
+        Make HTTP request with exponential backoff retry logic.
+
+        Every attempt is admitted by the shared rate limiter, which spaces
+        requests, bounds concurrency and applies server-requested back-off
+        (Retry-After / rate-limit headers) to all callers at once.
+        """
         client = await self._get_client()
-        
+        limiter = self.rate_limiter
+
         for attempt in range(self.max_retries + 1):
             try:
-                response = await client.request(method, url, **kwargs)
-                
-                # Handle rate limiting
+                async with limiter.slot():
+                    response = await client.request(method, url, **kwargs)
+                limiter.observe_headers(getattr(response, "headers", None))
+
+                # Handle rate limiting: the limiter blocks every caller until the
+                # back-off expires, so the next attempt simply re-enters admission.
                 if response.status_code == 429:
+                    headers = getattr(response, "headers", None)
+                    retry_after = parse_retry_after(headers.get("retry-after") if hasattr(headers, "get") else None)
+                    delay = limiter.on_rate_limited(
+                        retry_after if retry_after is not None else self.base_delay * (2 ** attempt)
+                    )
                     if attempt < self.max_retries:
-                        delay = self.base_delay * (2 ** attempt)
                         logger.warning(f"Rate limited, retrying in {delay}s (attempt {attempt + 1}/{self.max_retries + 1})")
-                        await asyncio.sleep(delay)
                         continue
                     else:
                         raise httpx.HTTPError(f"Rate limited after {self.max_retries} retries")
@@ -222,6 +268,7 @@ class CloudflareStorage(MemoryStorage):
                         continue
                 
                 response.raise_for_status()
+                limiter.on_success()
                 return response
                 
             except (httpx.NetworkError, httpx.TimeoutException) as e:
@@ -1097,6 +1144,33 @@ class CloudflareStorage(MemoryStorage):
         )
         return response.json()
 
+    async def get_vectors_by_ids(self, vector_ids: List[str], chunk_size: int = 20) -> Dict[str, List[float]]:
+        """
+        Fetch stored embeddings from Vectorize by vector ID.
+
+        Lets the hybrid initial pull reuse Cloudflare's vectors instead of
+        re-embedding every memory locally when both sides use the same model.
+
+        Args:
+            vector_ids: Vector IDs (content hashes) to fetch
+            chunk_size: IDs per get_by_ids request
+
+        Returns:
+            Mapping of vector ID -> embedding values; missing IDs are omitted
+        """
+        vectors: Dict[str, List[float]] = {}
+        for i in range(0, len(vector_ids), chunk_size):
+            payload = {"ids": vector_ids[i:i + chunk_size]}
+            response = await self._retry_request("POST", f"{self.vectorize_url}/get_by_ids", json=payload)
+            result = response.json()
+            if not result.get("success"):
+                logger.warning(f"Failed to fetch vectors from Vectorize: {result.get('errors')}")
+                continue
+            for vector in result.get("result") or []:
+                if vector.get("id") and vector.get("values"):
+                    vectors[vector["id"]] = vector["values"]
+        return vectors
+
     async def _delete_r2_content(self, r2_key: str) -> None:
         """Delete content from R2."""
         try:
@@ -1276,8 +1350,12 @@ class CloudflareStorage(MemoryStorage):
             logger.error(f"Error deleting before date in Cloudflare: {str(e)}")
             return 0, f"Error: {str(e)}"
 
-    async def cleanup_duplicates(self) -> Tuple[int, str]:
+    async def cleanup_duplicates(
+        self, near_duplicates: bool = False, threshold: float = 0.8
+    ) -> Tuple[int, str]:
         """Remove duplicate memories based on content hash."""
+        if near_duplicates:
+            logger.warning("Near-duplicate cleanup is not supported by Cloudflare; removing exact duplicates only")
         try:
             # Find duplicates in D1
             sql = """
@@ -2069,6 +2147,76 @@ class CloudflareStorage(MemoryStorage):
             logger.error(f"Error getting updated memories: {e}")
             return []
 
+    async def _d1_rows(self, sql: str, params: List[Any]) -> List[Dict[str, Any]]:
+        """Run a D1 query and return its result rows, raising on failure."""
+        payload = {"sql": sql, "params": params}
+        response = await self._retry_request("POST", f"{self.d1_url}/query", json=payload)
+        result = response.json()
+        if not result.get("success"):
+            raise ValueError(f"D1 query failed: {result.get('errors')}")
+        return result.get("result", [{}])[0].get("results") or []
+
+    async def get_hash_bucket_digests(self, prefix_len: int, parents: Optional[List[str]] = None) -> Dict[str, Tuple[int, int, int]]:
+        """
+        Aggregate live D1 memories into content_hash prefix buckets.
+
+        Computed server-side so hybrid anti-entropy sync (see sync_digest.py)
+        transfers one row per bucket instead of one row per memory.
+
+        Args:
+            prefix_len: Bucket prefix length
+            parents: Optional parent prefixes restricting the scan (<= 40 per call)
+
+        Returns:
+            Mapping of bucket prefix -> (count, hash_sum, time_sum)
+        """
+        sql, params = build_bucket_digest_query(prefix_len, parents)
+        rows = await self._d1_rows(sql, params)
+        return rows_to_digests(
+            (row["bucket"], row["n"], row["hash_sum"], row["time_sum"]) for row in rows
+        )
+
+    async def get_hash_bucket_entries(self, prefixes: List[str]) -> Dict[str, Optional[float]]:
+        """
+        Return content_hash -> updated_at for live D1 memories in the given buckets.
+
+        Args:
+            prefixes: Bucket prefixes to expand (<= 40 per call)
+
+        Returns:
+            Mapping of content_hash -> updated_at
+        """
+        if not prefixes:
+            return {}
+        sql, params = build_bucket_entries_query(prefixes)
+        rows = await self._d1_rows(sql, params)
+        return {row["content_hash"]: row.get("updated_at") for row in rows}
+
+    async def get_memories_by_hashes(self, content_hashes: List[str], chunk_size: int = 90) -> List[Memory]:
+        """
+        Load several live memories by content hash with chunked IN queries.
+
+        Args:
+            content_hashes: Hashes to load
+            chunk_size: Hashes per D1 query (D1 binds at most 100 parameters)
+
+        Returns:
+            List of Memory objects found (order not guaranteed)
+        """
+        memories = []
+        for i in range(0, len(content_hashes), chunk_size):
+            chunk = content_hashes[i:i + chunk_size]
+            placeholders = ",".join(["?"] * len(chunk))
+            rows = await self._d1_rows(
+                f"SELECT * FROM memories WHERE deleted_at IS NULL AND content_hash IN ({placeholders})",
+                list(chunk),
+            )
+            for row in rows:
+                memory = await self._load_memory_from_row(row)
+                if memory:
+                    memories.append(memory)
+        return memories
+
     async def get_memories_by_time_range(
         self,
         start_time: float,
@@ -0,0 +1,359 @@
+# Copyright 2024 Heinrich Krupp
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Shared rate limiter and concurrency governor for Cloudflare API traffic.
+
+Every request made by a CloudflareStorage instance (foreground queries, the
+hybrid background sync, initial pull, drift detection, metadata updates) passes
+through one CloudflareRateLimiter, which combines:
+
+- a token bucket sized to the account's API rate limit,
+- an AIMD (additive-increase / multiplicative-decrease) concurrency limit that
+  halves on every 429 and grows back slowly on success,
+- global back-off honouring ``Retry-After`` and rate-limit response headers,
+- priorities: background work leaves a share of tokens and one connection slot
+  free so foreground reads are never starved by sync traffic.
+
+Priority is carried in a context variable so callers do not have to thread it
+through every storage method; tasks inherit the priority of the code that
+spawned them.
+"""
+
+import asyncio
+import contextvars
+import logging
+import re
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from email.utils import parsedate_to_datetime
+from typing import Any, Deque, Dict, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+FOREGROUND = "foreground"
+BACKGROUND = "background"
+
+_request_priority: contextvars.ContextVar = contextvars.ContextVar(
+    "cloudflare_request_priority", default=FOREGROUND
+)
+
+# Cloudflare's structured header: `ratelimit: "default";r=1195;t=239`
+_STRUCTURED_RATELIMIT = re.compile(r"r=(\d+).*?t=(\d+)")
+
+
+def current_priority() -> str:
+    """Priority of Cloudflare requests issued from the current context."""
+    return _request_priority.get()
+
+
+def set_request_priority(priority: str) -> None:
+    """Set the priority for the current task (and tasks it spawns)."""
+    _request_priority.set(priority)
+
+
+@contextmanager
+def background_priority():
+    """Run the enclosed block's Cloudflare requests at background priority."""
+    token = _request_priority.set(BACKGROUND)
+    try:
+        yield
+    finally:
+        _request_priority.reset(token)
+
+
+def parse_retry_after(value: Any) -> Optional[float]:
+    """Parse a Retry-After header (delta seconds or HTTP date) into seconds."""
+    if not isinstance(value, str) or not value.strip():
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+        return max(0.0, retry_at.timestamp() - time.time())
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
+
+
+def parse_rate_limit_headers(headers: Any) -> Optional[Dict[str, float]]:
+    """
+    Extract remaining quota and reset delay from rate-limit response headers.
+
+    Understands Cloudflare's structured ``ratelimit`` header as well as the
+    conventional ``x-ratelimit-remaining`` / ``x-ratelimit-reset`` pair (reset
+    given either as delta seconds or as an epoch timestamp).
+
+    Returns:
+        Dict with ``remaining`` and ``reset`` (seconds), or None if absent
+    """
+    if not isinstance(headers, Mapping) and not hasattr(headers, "get"):
+        return None
+    try:
+        structured = headers.get("ratelimit")
+        if isinstance(structured, str):
+            match = _STRUCTURED_RATELIMIT.search(structured)
+            if match:
+                return {"remaining": float(match.group(1)), "reset": float(match.group(2))}
+
+        remaining = headers.get("x-ratelimit-remaining")
+        reset = headers.get("x-ratelimit-reset")
+        if isinstance(remaining, str) and remaining.strip():
+            reset_seconds = 0.0
+            if isinstance(reset, str) and reset.strip():
+                reset_seconds = float(reset)
+                if reset_seconds > 1e9:  # epoch timestamp
+                    reset_seconds = max(0.0, reset_seconds - time.time())
+            return {"remaining": float(remaining), "reset": reset_seconds}
+    except (TypeError, ValueError):
+        return None
+    return None
+
+
+class CloudflareRateLimiter:
+    """
+    Token bucket plus AIMD concurrency controller shared by all requests of
+    one CloudflareStorage instance.
+
+    Args:
+        requests_per_second: Sustained request rate (token refill rate)
+        burst: Token bucket capacity
+        max_concurrency: Upper bound for concurrent in-flight requests
+        min_concurrency: Lower bound the AIMD controller never goes below
+        background_reserve: Fraction of the bucket background requests leave
+            untouched for foreground traffic
+        default_backoff: Back-off used for a 429 without Retry-After
+    """
+
+    def __init__(self,
+                 requests_per_second: float = 4.0,
+                 burst: int = 40,
+                 max_concurrency: int = 10,
+                 min_concurrency: int = 1,
+                 background_reserve: float = 0.25,
+                 default_backoff: float = 1.0,
+                 clock=time.monotonic):
+        self.requests_per_second = max(0.01, float(requests_per_second))
+        self.burst = max(1, int(burst))
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.min_concurrency = max(1, min(int(min_concurrency), self.max_concurrency))
+        self.background_reserve = max(0.0, min(float(background_reserve), 0.9)) * self.burst
+        self.default_backoff = default_backoff
+        self._clock = clock
+
+        self._tokens = float(self.burst)
+        self._last_refill = clock()
+        self._blocked_until = 0.0
+        self._backoff_epoch = 0
+        self._limit = float(self.max_concurrency)
+        self._in_flight = {FOREGROUND: 0, BACKGROUND: 0}
+        self._waiters: Dict[str, Deque[asyncio.Future]] = {FOREGROUND: deque(), BACKGROUND: deque()}
+
+        self.stats_counters = {
+            "requests": 0,
+            "rate_limited_count": 0,
+            "throttled_seconds": 0.0,
+            "queued_seconds": 0.0,
+            "foreground_requests": 0,
+            "background_requests": 0,
+        }
+
+    # ------------------------------------------------------------------ #
+    # Admission
+    # ------------------------------------------------------------------ #
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._last_refill
+        if elapsed > 0:
+            self._tokens = min(float(self.burst), self._tokens + elapsed * self.requests_per_second)
+            self._last_refill = now
+
+    async def _wait_for_token(self, priority: str) -> None:
+        """
+        Take one token from the bucket, sleeping as long as needed.
+
+        Foreground requests reserve their token immediately (possibly on credit)
+        and sleep once for the computed delay. Background requests only take a
+        token once the bucket holds more than the foreground reserve, re-checking
+        after each sleep, so they yield to any foreground demand.
+        """
+        if priority == FOREGROUND:
+            now = self._clock()
+            self._refill(now)
+            self._tokens -= 1.0
+            delay = max(-self._tokens / self.requests_per_second, self._blocked_until - now, 0.0)
+            while delay > 0:
+                epoch = self._backoff_epoch
+                self.stats_counters["throttled_seconds"] += delay
+                await asyncio.sleep(delay)
+                # Sleep again only if a new 429 extended the back-off meanwhile
+                if self._backoff_epoch == epoch:
+                    break
+                delay = max(self._blocked_until - self._clock(), 0.0)
+            return
+
+        while True:
+            now = self._clock()
+            self._refill(now)
+            deficit = self.background_reserve + 1.0 - self._tokens
+            delay = max(deficit / self.requests_per_second, self._blocked_until - now, 0.0)
+            if delay <= 0:
+                self._tokens -= 1.0
+                return
+            self.stats_counters["throttled_seconds"] += delay
+            await asyncio.sleep(delay)
+
+    def _slot_available(self, priority: str, respect_queue: bool = True) -> bool:
+        limit = int(self._limit)
+        total = self._in_flight[FOREGROUND] + self._in_flight[BACKGROUND]
+        if total >= limit:
+            return False
+        if priority == BACKGROUND:
+            # Foreground waiters go first, and one slot stays free for them
+            if respect_queue and self._waiters[FOREGROUND]:
+                return False
+            return self._in_flight[BACKGROUND] < max(1, limit - 1)
+        return True
+
+    def _wake(self) -> None:
+        for priority in (FOREGROUND, BACKGROUND):
+            waiters = self._waiters[priority]
+            while waiters and self._slot_available(priority, respect_queue=False):
+                future = waiters.popleft()
+                if not future.done():
+                    future.set_result(None)
+                    return
+
+    async def acquire(self, priority: Optional[str] = None) -> str:
+        """Wait for rate and concurrency budget; returns the priority used."""
+        priority = priority or current_priority()
+
+        queued_at = self._clock()
+        while not self._slot_available(priority):
+            future = asyncio.get_running_loop().create_future()
+            self._waiters[priority].append(future)
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future in self._waiters[priority]:
+                    self._waiters[priority].remove(future)
+                self._wake()
+                raise
+        self.stats_counters["queued_seconds"] += max(0.0, self._clock() - queued_at)
+        self._in_flight[priority] += 1
+        # A foreground admission may unblock queued background requests
+        self._wake()
+
+        # Rate budget and back-off are checked while holding the slot, so a
+        # 429 observed while this request queued still delays it.
+        try:
+            await self._wait_for_token(priority)
+        except asyncio.CancelledError:
+            self.release(priority)
+            raise
+
+        self.stats_counters["requests"] += 1
+        self.stats_counters[f"{priority}_requests"] += 1
+        return priority
+
+    def release(self, priority: str) -> None:
+        self._in_flight[priority] = max(0, self._in_flight[priority] - 1)
+        self._wake()
+
+    @asynccontextmanager
+    async def slot(self, priority: Optional[str] = None):
+        """Async context manager holding one admitted request slot."""
+        used = await self.acquire(priority)
+        try:
+            yield used
+        finally:
+            self.release(used)
+
+    # ------------------------------------------------------------------ #
+    # Feedback
+    # ------------------------------------------------------------------ #
+
+    def on_success(self) -> None:
+        """Additive increase: roughly +1 slot per window of successful requests."""
+        if self._limit < self.max_concurrency:
+            self._limit = min(float(self.max_concurrency), self._limit + 1.0 / self._limit)
+            self._wake()
+
+    def on_rate_limited(self, retry_after: Optional[float] = None) -> float:
+        """
+        Multiplicative decrease and global back-off after a 429.
+
+        Returns:
+            Seconds until requests are admitted again
+        """
+        now = self._clock()
+        self.stats_counters["rate_limited_count"] += 1
+        # Requests already in flight when the first 429 arrived will fail too;
+        # decrease once per back-off period rather than once per response.
+        if now >= self._blocked_until:
+            self._limit = max(float(self.min_concurrency), self._limit / 2.0)
+        backoff = retry_after if retry_after is not None else self.default_backoff
+        self._blocked_until = max(self._blocked_until, now + backoff)
+        self._backoff_epoch += 1
+        self._tokens = min(self._tokens, 0.0)
+        self._last_refill = max(self._last_refill, now)
+        logger.warning(
+            f"Cloudflare rate limited: concurrency -> {int(self._limit)}, "
+            f"backing off {backoff:.2f}s"
+        )
+        return backoff
+
+    def observe_headers(self, headers: Any) -> None:
+        """Align the bucket with server-reported quota when headers provide it."""
+        quota = parse_rate_limit_headers(headers)
+        if not quota:
+            return
+        now = self._clock()
+        self._refill(now)
+        self._tokens = min(self._tokens, quota["remaining"])
+        if quota["remaining"] <= 0 and quota["reset"] > 0:
+            self._blocked_until = max(self._blocked_until, now + quota["reset"])
+
+    # ------------------------------------------------------------------ #
+    # Reporting
+    # ------------------------------------------------------------------ #
+
+    @property
+    def concurrency_limit(self) -> int:
+        return int(self._limit)
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot for sync status / health endpoints."""
+        now = self._clock()
+        self._refill(now)
+        return {
+            "concurrency_limit": int(self._limit),
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self._in_flight[FOREGROUND] + self._in_flight[BACKGROUND],
+            "in_flight_background": self._in_flight[BACKGROUND],
+            "waiting_foreground": len(self._waiters[FOREGROUND]),
+            "waiting_background": len(self._waiters[BACKGROUND]),
+            "tokens_available": round(max(self._tokens, 0.0), 2),
+            "requests_per_second": self.requests_per_second,
+            "backoff_remaining_seconds": round(max(0.0, self._blocked_until - now), 3),
+            "requests": self.stats_counters["requests"],
+            "foreground_requests": self.stats_counters["foreground_requests"],
+            "background_requests": self.stats_counters["background_requests"],
+            "rate_limited_count": self.stats_counters["rate_limited_count"],
+            "throttled_seconds": round(self.stats_counters["throttled_seconds"], 3),
+            "queued_seconds": round(self.stats_counters["queued_seconds"], 3),
+        }
@@ -99,7 +99,7 @@ async def create_storage_instance(sqlite_path: str, server_type: str = None) ->
         CLOUDFLARE_LARGE_CONTENT_THRESHOLD, CLOUDFLARE_MAX_RETRIES,
         CLOUDFLARE_BASE_DELAY,
         HYBRID_SYNC_INTERVAL, HYBRID_BATCH_SIZE, HYBRID_SYNC_OWNER,
-        MILVUS_URI, MILVUS_TOKEN, MILVUS_COLLECTION_NAME
+        MILVUS_URI, MILVUS_TOKEN, MILVUS_COLLECTION_NAME, MILVUS_READ_POOL_SIZE
     )
 
     logger.info(f"Creating storage backend instance (sqlite_path: {sqlite_path}, server_type: {server_type})...")
@@ -151,6 +151,7 @@ async def create_storage_instance(sqlite_path: str, server_type: str = None) ->
             token=MILVUS_TOKEN,
             collection_name=MILVUS_COLLECTION_NAME,
             embedding_model=EMBEDDING_MODEL_NAME,
+            read_pool_size=MILVUS_READ_POOL_SIZE,
         )
         logger.info(
             f"Initialized Milvus storage (uri={MILVUS_URI}, collection={MILVUS_COLLECTION_NAME})"
@@ -17,9 +17,11 @@ Graph storage layer for memory associations.
 
 Provides recursive CTE-based graph traversal operations including:
 - Multi-hop connection discovery (find all connected memories)
-- Shortest path finding between memories
+- Batched one-hop neighbor lookups for many memories at once
+- Shortest path finding between memories (bidirectional BFS)
 - Subgraph extraction for visualization
-- Association CRUD operations
+- Precomputed PageRank / degree centrality for search ranking
+- Association CRUD operations, including bulk upserts for consolidation
 
 Uses SQLite recursive CTEs for efficient graph queries with cycle prevention.
 """
@@ -28,7 +30,12 @@ import sqlite3
 import json
 import logging
 import asyncio
-from typing import List, Dict, Any, Tuple, Optional
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Tuple, Optional, Callable, Iterable, Sequence, Set
 from datetime import datetime, timezone
 
 from mcp_memory_service.models.ontology import is_symmetric_relationship, validate_relationship
@@ -62,33 +69,6 @@ WHERE distance > 0  -- Exclude starting node
 ORDER BY distance, hash
 """
 
-_QUERY_TEMPLATE_SHORTEST_PATH = """
-WITH RECURSIVE path_finder(current_hash, path, depth) AS (
-    -- Base case: Start from hash1
-    SELECT ?, ?, 1
-
-    UNION ALL
-
-    -- Recursive case: Expand path
-    SELECT
-        mg.target_hash,
-        pf.path || mg.target_hash || ',',
-        pf.depth + 1
-    FROM path_finder pf
-    JOIN memory_graph mg ON pf.current_hash = mg.source_hash
-    WHERE
-        pf.depth < ?  -- Limit search depth
-        AND instr(pf.path, ',' || mg.target_hash || ',') = 0  -- Prevent cycles (exact match)
-        AND pf.current_hash != ?  -- Stop if target found (handled in outer query)
-        {relationship_filter}
-)
-SELECT path
-FROM path_finder
-WHERE current_hash = ?  -- Found target
-ORDER BY depth
-LIMIT 1  -- Return shortest path only
-"""
-
 _QUERY_TEMPLATE_SUBGRAPH = """
 SELECT
     source_hash,
@@ -99,42 +79,258 @@ SELECT
     relationship_type
 FROM memory_graph
 WHERE source_hash IN ({placeholders})
-  AND target_hash IN ({placeholders})
   {relationship_filter}
 """
 
+# Side table of precomputed centrality scores (see graph_centrality.py),
+# read by search ranking with a primary-key lookup
+_CENTRALITY_SCHEMA = """
+CREATE TABLE IF NOT EXISTS memory_centrality (
+    content_hash TEXT PRIMARY KEY,
+    pagerank REAL NOT NULL,
+    personalized_pagerank REAL NOT NULL,
+    degree INTEGER NOT NULL,
+    importance REAL NOT NULL,
+    personalization REAL,
+    updated_at REAL NOT NULL
+) WITHOUT ROWID
+"""
+
+# memory_graph fingerprint the stored scores were computed from
+_CENTRALITY_STATE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS memory_centrality_state (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    edge_count INTEGER NOT NULL,
+    max_rowid INTEGER,
+    total_similarity REAL NOT NULL,
+    iterations INTEGER NOT NULL,
+    computed_at REAL NOT NULL
+)
+"""
+
+# Score changes below this are not written back on refresh
+_CENTRALITY_EPSILON = 1e-6
+
+# Frontier hashes per neighbor query (stays under SQLite's 999 parameters
+# together with the relationship_type filter)
+_NEIGHBOR_QUERY_CHUNK = 500
+
+# Path direction -> (forward expansion, backward expansion)
+_PATH_EXPANSIONS = {
+    "outgoing": ("outgoing", "incoming"),
+    "incoming": ("incoming", "outgoing"),
+    "both": ("both", "both"),
+}
+
+
+def expand_association_edges(
+    edges: Iterable[Dict[str, Any]]
+) -> Tuple[Dict[Tuple[str, str], Tuple[str, str, float, str, str, float, str]], int]:
+    """
+    Validate association dicts and expand them into stored edge rows.
+
+    Each dict takes the keyword arguments of ``store_association``. Relationship
+    types are validated once per distinct type; symmetric types add the reverse
+    edge. Invalid associations (empty hashes, self-loops, similarity outside
+    0-1, unknown relationship type) are skipped. When several associations map
+    to the same (source, target) row the last one wins, matching sequential
+    ``store_association`` calls.
+
+    Returns:
+        ({(source, target): (source, target, similarity, connection_types_json,
+        metadata_json, created_at, relationship_type)}, skipped count)
+    """
+    symmetric_by_type: Dict[str, Optional[bool]] = {}
+    rows: Dict[Tuple[str, str], Tuple[str, str, float, str, str, float, str]] = {}
+    skipped = 0
+    now = datetime.now(timezone.utc).timestamp()
+
+    for edge in edges:
+        source_hash = edge.get("source_hash")
+        target_hash = edge.get("target_hash")
+        similarity = edge.get("similarity")
+        relationship_type = edge.get("relationship_type") or "related"
+
+        if relationship_type not in symmetric_by_type:
+            symmetric_by_type[relationship_type] = (
+                is_symmetric_relationship(relationship_type)
+                if validate_relationship(relationship_type) else None
+            )
+        symmetric = symmetric_by_type[relationship_type]
+
+        if (
+            not source_hash or not target_hash or source_hash == target_hash
+            or similarity is None or not (0.0 <= similarity <= 1.0)
+            or symmetric is None
+        ):
+            skipped += 1
+            continue
+
+        created_at = edge.get("created_at")
+        connection_types_json = json.dumps(edge.get("connection_types") or [])
+        metadata_json = json.dumps(edge.get("metadata") or {})
+        created_at = now if created_at is None else float(created_at)
+
+        rows[(source_hash, target_hash)] = (
+            source_hash, target_hash, float(similarity), connection_types_json,
+            metadata_json, created_at, relationship_type,
+        )
+        if symmetric:
+            rows[(target_hash, source_hash)] = (
+                target_hash, source_hash, float(similarity), connection_types_json,
+                metadata_json, created_at, relationship_type,
+            )
+
+    invalid_types = [t for t, symmetric in symmetric_by_type.items() if symmetric is None]
+    if invalid_types:
+        logger.error(f"Invalid relationship types in bulk association write: {invalid_types}")
+    return rows, skipped
+
+
+def _bidirectional_shortest_path(
+    source: str,
+    target: str,
+    max_edges: int,
+    expand: Callable[[List[str], str], List[Tuple[str, str]]],
+    forward: str,
+    backward: str,
+    max_expanded_nodes: Optional[int] = None
+) -> Tuple[Optional[List[str]], int, bool]:
+    """
+    Bidirectional breadth-first search between ``source`` and ``target``.
+
+    Each round expands one complete BFS level of whichever side has the
+    smaller frontier. The search stops after the first level that meets the
+    other side; the shortest path through any meeting node of that level is
+    returned.
+
+    Args:
+        source: Start hash
+        target: End hash
+        max_edges: Maximum path length in edges
+        expand: ``expand(hashes, direction)`` returns ``(hash, neighbor)`` pairs
+        forward: Expansion direction from ``source`` ("outgoing", "incoming", "both")
+        backward: Expansion direction from ``target`` (the reverse of ``forward``)
+        max_expanded_nodes: Stop once this many nodes would have been expanded
+
+    Returns:
+        (path or None, nodes expanded, whether the budget stopped the search)
+    """
+    if source == target:
+        return [source], 0, False
+
+    # side 0 grows from source, side 1 from target
+    parents: Tuple[Dict[str, Optional[str]], Dict[str, Optional[str]]] = ({source: None}, {target: None})
+    distances: Tuple[Dict[str, int], Dict[str, int]] = ({source: 0}, {target: 0})
+    frontiers = ([source], [target])
+    directions = (forward, backward)
+    depths = [0, 0]
+    expanded = 0
+
+    while frontiers[0] and frontiers[1] and depths[0] + depths[1] < max_edges:
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        frontier = frontiers[side]
+        if max_expanded_nodes is not None and expanded + len(frontier) > max_expanded_nodes:
+            return None, expanded, True
+        expanded += len(frontier)
+
+        own_parents, own_distances = parents[side], distances[side]
+        other_distances = distances[1 - side]
+        next_frontier: List[str] = []
+        meeting: Optional[str] = None
+        for node, neighbor in expand(frontier, directions[side]):
+            if neighbor in own_parents:
+                continue
+            own_parents[neighbor] = node
+            own_distances[neighbor] = depths[side] + 1
+            next_frontier.append(neighbor)
+            if neighbor in other_distances and (
+                meeting is None or other_distances[neighbor] < other_distances[meeting]
+            ):
+                meeting = neighbor
+
+        depths[side] += 1
+        if meeting is not None:
+            path = [meeting]
+            while parents[0][path[-1]] is not None:
+                path.append(parents[0][path[-1]])
+            path.reverse()
+            while parents[1][path[-1]] is not None:
+                path.append(parents[1][path[-1]])
+            return path, expanded, False
+        frontiers = (next_frontier, frontiers[1]) if side == 0 else (frontiers[0], next_frontier)
+
+    return None, expanded, False
+
 
 class GraphStorage:
     """
-    Graph-based storage for memory associations with recursive CTE queries.
+    Graph-based storage for memory associations with recursive CTE and BFS queries.
 
     Supports bidirectional traversal, multi-hop discovery, and subgraph extraction
     for knowledge graph operations on memory associations.
+
+    All SQL runs off the event loop: reads on a small thread pool where each
+    thread owns a read-only connection, writes on a single writer thread that
+    owns the connection returned by ``_get_connection()``. Recursive CTEs
+    therefore never block the loop serving MCP and HTTP requests, and graph
+    writes are serialized in-process; cross-connection writers (e.g.
+    ``SqliteVecMemoryStorage`` on the same file) are coordinated by SQLite's
+    WAL locking plus ``busy_timeout``.
+
+    With ``adjacency_cache`` enabled, ``find_connected``, ``neighbors_many``,
+    ``shortest_path``, ``transitive_closure`` and ``common_neighbors`` read an
+    in-memory CSR copy of ``memory_graph`` (see ``graph_adjacency.py``)
+    instead of recursive CTEs. The copy is loaded on first use, updated in
+    place by this instance's writes, and reloaded when another connection
+    changes the table.
     """
 
-    def __init__(self, db_path: str):
+    # Per-operation latency samples kept for get_query_stats()
+    _LATENCY_SAMPLES = 512
+
+    def __init__(self, db_path: str, read_pool_size: int = 4, adjacency_cache: Optional[bool] = None):
         """
         Initialize graph storage with SQLite database.
 
         Args:
             db_path: Path to SQLite database file
+            read_pool_size: Number of reader threads/connections (default: 4)
+            adjacency_cache: Traverse an in-memory CSR adjacency instead of
+                recursive CTEs (default: MCP_GRAPH_ADJACENCY_CACHE, false)
         """
         self.db_path = db_path
-        self._connection = None
+        self.read_pool_size = max(1, read_pool_size)
+        if adjacency_cache is None:
+            adjacency_cache = os.getenv('MCP_GRAPH_ADJACENCY_CACHE', 'false').lower() == 'true'
+        self.adjacency_cache_enabled = adjacency_cache
+        self._adjacency = None  # CSRAdjacency, built lazily by a reader thread
+        self._adjacency_lock = threading.Lock()
+        self._connection = None  # Writer connection, owned by the writer thread
         self._lock = asyncio.Lock()  # Instance-level lock for thread safety
+        self._writer: Optional[ThreadPoolExecutor] = None
+        self._readers: Optional[ThreadPoolExecutor] = None
+        self._reader_local = threading.local()
+        self._reader_connections: List[sqlite3.Connection] = []
+        self._reader_connections_lock = threading.Lock()
+        self._latencies: Dict[str, deque] = {}
+        self._query_counts: Dict[str, int] = {}
         logger.info(f"Initialized GraphStorage with database: {db_path}")
 
     async def _get_connection(self) -> sqlite3.Connection:
-        """Get or create database connection with optimizations."""
+        """Get or create the writer connection (created on the writer thread)."""
         if self._connection is None:
-            # Run connection setup in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            self._connection = await loop.run_in_executor(
-                None, self._create_connection
-            )
+            if self._writer is None:
+                self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="graph-writer")
+            loop = asyncio.get_running_loop()
+            connection = await loop.run_in_executor(self._writer, self._create_connection)
+            if self._connection is None:
+                self._connection = connection
+            else:
+                connection.close()
         return self._connection
 
-    def _create_connection(self) -> sqlite3.Connection:
+    def _create_connection(self, read_only: bool = False) -> sqlite3.Connection:
         """Create database connection with performance optimizations."""
         conn = sqlite3.connect(self.db_path, check_same_thread=False)
         conn.row_factory = sqlite3.Row  # Enable column access by name
@@ -144,9 +340,194 @@ class GraphStorage:
         conn.execute("PRAGMA synchronous=NORMAL")
         conn.execute("PRAGMA cache_size=-64000")  # 64MB cache
         conn.execute("PRAGMA temp_store=MEMORY")
+        # Wait for SqliteVecMemoryStorage (or another process) instead of
+        # failing with "database is locked"
+        conn.execute("PRAGMA busy_timeout=15000")
+        if read_only:
+            conn.execute("PRAGMA query_only=ON")
+
+        return conn
 
+    def _reader_connection(self) -> sqlite3.Connection:
+        """Return the calling reader thread's connection, creating it once."""
+        conn = getattr(self._reader_local, "conn", None)
+        if conn is None:
+            conn = self._create_connection(read_only=True)
+            self._reader_local.conn = conn
+            with self._reader_connections_lock:
+                self._reader_connections.append(conn)
         return conn
 
+    def _current_adjacency(self, conn: sqlite3.Connection):
+        """
+        Return the CSR adjacency cache, (re)loading it from ``conn`` if stale.
+
+        Runs on a reader thread. ``PRAGMA data_version`` is checked on every
+        call; only when another connection has committed since this thread's
+        last check is the ``(COUNT(*), MAX(rowid))`` fingerprint of
+        ``memory_graph`` compared with the one the cache reflects.
+
+        Returns:
+            CSRAdjacency, or None when the cache is disabled or NumPy is missing
+        """
+        if not self.adjacency_cache_enabled:
+            return None
+        data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+        adjacency = self._adjacency
+        if adjacency is not None and getattr(self._reader_local, "data_version", None) == data_version:
+            return adjacency
+        try:
+            from .graph_adjacency import CSRAdjacency
+        except ImportError:
+            logger.warning("NumPy not available - disabling graph adjacency cache")
+            self.adjacency_cache_enabled = False
+            return None
+        with self._adjacency_lock:
+            fingerprint = tuple(conn.execute("SELECT COUNT(*), MAX(rowid) FROM memory_graph").fetchone())
+            adjacency = self._adjacency
+            if adjacency is None or adjacency.fingerprint != fingerprint:
+                started = time.perf_counter()
+                adjacency = CSRAdjacency.from_rows(conn.execute(
+                    "SELECT source_hash, target_hash, relationship_type FROM memory_graph"
+                ))
+                adjacency.fingerprint = fingerprint
+                self._adjacency = adjacency
+                self._record_latency("adjacency_load", time.perf_counter() - started)
+                logger.info(
+                    f"Loaded graph adjacency cache: {adjacency.node_count} nodes, {adjacency.edge_count} edges"
+                )
+        self._reader_local.data_version = data_version
+        return adjacency
+
+    def _update_adjacency(
+        self,
+        added: Sequence[Tuple[str, str, str]] = (),
+        removed: Sequence[Tuple[str, str]] = (),
+        rowid: Optional[int] = None
+    ) -> None:
+        """
+        Apply this instance's committed edge writes to the adjacency cache.
+
+        Runs on the writer thread after commit. The fingerprint moves by the
+        edges that were actually new or removed in the cache, so a cache that
+        was reloaded between the commit and this call is not double counted.
+        Deleting the row with the highest rowid lowers MAX(rowid) in the
+        table but not in the fingerprint; that only costs a reload.
+        """
+        if self._adjacency is None:
+            return
+        with self._adjacency_lock:
+            adjacency = self._adjacency
+            delta = 0
+            for source, target, relationship_type in added:
+                delta += adjacency.add_edge(source, target, relationship_type)
+            for source, target in removed:
+                delta -= adjacency.remove_edge(source, target)
+            if adjacency.fingerprint is not None:
+                count, max_rowid = adjacency.fingerprint
+                if rowid is not None:
+                    max_rowid = rowid if max_rowid is None else max(max_rowid, rowid)
+                adjacency.fingerprint = (count + delta, max_rowid)
+
+    def _neighbor_pairs(
+        self,
+        conn: sqlite3.Connection,
+        memory_hashes: List[str],
+        direction: str,
+        relationship_types: Optional[List[str]] = None
+    ) -> List[Tuple[str, str]]:
+        """
+        One-hop neighbors of many memories in a single pass (reader thread).
+
+        Uses the adjacency cache when enabled, otherwise one indexed query per
+        ``_NEIGHBOR_QUERY_CHUNK`` hashes and edge direction. An empty
+        ``relationship_types`` list means all types on both paths.
+
+        Returns:
+            ``(memory_hash, neighbor_hash)`` pairs; a neighbor reachable over
+            several stored edges is listed once per edge
+        """
+        relationship_types = relationship_types or None
+        adjacency = self._current_adjacency(conn)
+        if adjacency is not None:
+            return adjacency.neighbor_pairs(memory_hashes, direction, relationship_types)
+
+        relationship_filter = ""
+        if relationship_types:
+            relationship_filter = f"AND relationship_type IN ({','.join('?' * len(relationship_types))})"
+        columns = []
+        if direction in ("outgoing", "both"):
+            columns.append(("source_hash", "target_hash"))
+        if direction in ("incoming", "both"):
+            columns.append(("target_hash", "source_hash"))
+
+        pairs: List[Tuple[str, str]] = []
+        for start in range(0, len(memory_hashes), _NEIGHBOR_QUERY_CHUNK):
+            chunk = memory_hashes[start:start + _NEIGHBOR_QUERY_CHUNK]
+            for own, other in columns:
+                rows = conn.execute(
+                    f"SELECT {own}, {other} FROM memory_graph "
+                    f"WHERE {own} IN ({','.join('?' * len(chunk))}) {relationship_filter}",
+                    [*chunk, *(relationship_types or [])]
+                ).fetchall()
+                pairs.extend((row[0], row[1]) for row in rows)
+        return pairs
+
+    def _record_latency(self, operation: str, seconds: float) -> None:
+        samples = self._latencies.get(operation)
+        if samples is None:
+            samples = self._latencies[operation] = deque(maxlen=self._LATENCY_SAMPLES)
+        samples.append(seconds)
+        self._query_counts[operation] = self._query_counts.get(operation, 0) + 1
+        if seconds > 1.0:
+            logger.info(f"Slow graph query: {operation} took {seconds * 1000:.0f}ms")
+
+    async def _read(self, operation: str, fn: Callable[[sqlite3.Connection], Any]) -> Any:
+        """Run ``fn(conn)`` on the read pool and record its latency."""
+        if self._readers is None:
+            self._readers = ThreadPoolExecutor(
+                max_workers=self.read_pool_size, thread_name_prefix="graph-reader"
+            )
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        try:
+            return await loop.run_in_executor(
+                self._readers, lambda: fn(self._reader_connection())
+            )
+        finally:
+            self._record_latency(operation, time.perf_counter() - started)
+
+    async def _write(self, operation: str, fn: Callable[[sqlite3.Connection], Any]) -> Any:
+        """Run ``fn(conn)`` on the single writer thread and record its latency."""
+        conn = await self._get_connection()
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        try:
+            async with self._lock:
+                return await loop.run_in_executor(self._writer, fn, conn)
+        finally:
+            self._record_latency(operation, time.perf_counter() - started)
+
+    def get_query_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Per-operation query latency statistics.
+
+        Returns:
+            Dict mapping operation name to count, avg/p50/p95/max latency in ms
+            (percentiles over the most recent samples)
+        """
+        stats = {}
+        for operation, samples in self._latencies.items():
+            ordered = sorted(samples)
+            stats[operation] = {
+                "count": self._query_counts.get(operation, 0),
+                "avg_ms": round(sum(ordered) / len(ordered) * 1000, 3),
+                "p50_ms": round(ordered[len(ordered) // 2] * 1000, 3),
+                "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 3),
+                "max_ms": round(ordered[-1] * 1000, 3),
+            }
+        return stats
+
     async def store_association(
         self,
         source_hash: str,
@@ -198,47 +579,114 @@ class GraphStorage:
             logger.error(f"Invalid relationship type: {relationship_type}")
             return False
 
-        try:
-            conn = await self._get_connection()
-            if created_at is None:
-                created_at = datetime.now(timezone.utc).timestamp()
-            metadata_json = json.dumps(metadata or {})
-            connection_types_json = json.dumps(connection_types)
+        if created_at is None:
+            created_at = datetime.now(timezone.utc).timestamp()
+        metadata_json = json.dumps(metadata or {})
+        connection_types_json = json.dumps(connection_types)
 
+        def _store(conn: sqlite3.Connection) -> None:
             # Store edges based on relationship symmetry
-            async with self._lock:  # Use instance lock for thread safety
-                cursor = conn.cursor()
-                try:
-                    # Always store the forward edge (source → target)
+            cursor = conn.cursor()
+            try:
+                # Always store the forward edge (source → target)
+                cursor.execute("""
+                    INSERT OR REPLACE INTO memory_graph
+                    (source_hash, target_hash, similarity, connection_types, metadata, created_at, relationship_type)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                """, (source_hash, target_hash, similarity, connection_types_json,
+                      metadata_json, created_at, relationship_type))
+                edges = [(source_hash, target_hash, relationship_type)]
+
+                # Only store reverse edge for symmetric relationships
+                if is_symmetric_relationship(relationship_type):
                     cursor.execute("""
                         INSERT OR REPLACE INTO memory_graph
                         (source_hash, target_hash, similarity, connection_types, metadata, created_at, relationship_type)
                         VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """, (source_hash, target_hash, similarity, connection_types_json,
+                    """, (target_hash, source_hash, similarity, connection_types_json,
                           metadata_json, created_at, relationship_type))
+                    edges.append((target_hash, source_hash, relationship_type))
+                    logger.debug(f"Stored bidirectional association: {source_hash} ↔ {target_hash} (type: {relationship_type})")
+                else:
+                    logger.debug(f"Stored directed association: {source_hash} → {target_hash} (type: {relationship_type})")
 
-                    # Only store reverse edge for symmetric relationships
-                    if is_symmetric_relationship(relationship_type):
-                        cursor.execute("""
-                            INSERT OR REPLACE INTO memory_graph
-                            (source_hash, target_hash, similarity, connection_types, metadata, created_at, relationship_type)
-                            VALUES (?, ?, ?, ?, ?, ?, ?)
-                        """, (target_hash, source_hash, similarity, connection_types_json,
-                              metadata_json, created_at, relationship_type))
-                        logger.debug(f"Stored bidirectional association: {source_hash} ↔ {target_hash} (type: {relationship_type})")
-                    else:
-                        logger.debug(f"Stored directed association: {source_hash} → {target_hash} (type: {relationship_type})")
-
-                    conn.commit()
-                finally:
-                    cursor.close()
+                conn.commit()
+                self._update_adjacency(added=edges, rowid=cursor.lastrowid)
+            except sqlite3.Error:
+                conn.rollback()
+                raise
+            finally:
+                cursor.close()
 
+        try:
+            await self._write("store_association", _store)
             return True
 
         except sqlite3.Error as e:
             logger.error(f"Failed to store association: {e}")
             return False
 
+    async def store_associations_bulk(self, edges: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Store many associations in a single transaction.
+
+        Equivalent to calling ``store_association`` for each item, but
+        relationship types are validated once per type and all edge rows
+        (including the reverse rows of symmetric relationships) are upserted
+        with one ``executemany`` and one commit.
+
+        Args:
+            edges: Dicts with the keyword arguments of ``store_association``
+                (source_hash, target_hash, similarity, connection_types and
+                optionally metadata, created_at, relationship_type)
+
+        Returns:
+            Dict with ``inserted`` and ``updated`` edge rows and ``skipped``
+            invalid associations; ``failed`` is the number of rows that could
+            not be written because the transaction was rolled back
+        """
+        rows, skipped = expand_association_edges(edges)
+        result = {"inserted": 0, "updated": 0, "skipped": skipped, "failed": 0}
+        if not rows:
+            return result
+        values = list(rows.values())
+
+        def _store(conn: sqlite3.Connection) -> Tuple[int, int]:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("BEGIN IMMEDIATE")
+                before = cursor.execute("SELECT COUNT(*) FROM memory_graph").fetchone()[0]
+                cursor.executemany("""
+                    INSERT OR REPLACE INTO memory_graph
+                    (source_hash, target_hash, similarity, connection_types, metadata, created_at, relationship_type)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                """, values)
+                after, max_rowid = cursor.execute(
+                    "SELECT COUNT(*), MAX(rowid) FROM memory_graph"
+                ).fetchone()
+                conn.commit()
+                self._update_adjacency(
+                    added=[(row[0], row[1], row[6]) for row in values], rowid=max_rowid
+                )
+                inserted = after - before
+                return inserted, len(values) - inserted
+            except sqlite3.Error:
+                conn.rollback()
+                raise
+            finally:
+                cursor.close()
+
+        try:
+            result["inserted"], result["updated"] = await self._write("store_associations_bulk", _store)
+            logger.debug(
+                f"Bulk stored {len(values)} edge rows "
+                f"({result['inserted']} inserted, {result['updated']} updated, {skipped} skipped)"
+            )
+        except sqlite3.Error as e:
+            logger.error(f"Failed to bulk store associations: {e}")
+            result["failed"] = len(values)
+        return result
+
     async def find_connected(
         self,
         memory_hash: str,
@@ -273,57 +721,108 @@ class GraphStorage:
             logger.error(f"Invalid direction '{direction}', must be 'outgoing', 'incoming', or 'both'")
             return []
 
-        try:
-            conn = await self._get_connection()
-
-            # Recursive CTE query for multi-hop traversal
-            # Base case: Direct neighbors (distance = 1)
-            # Recursive case: Neighbors of neighbors (distance + 1)
-            # Cycle prevention: Wrap hashes with delimiters to avoid substring matches
-
-            # Build WHERE clause for relationship_type filter
-            relationship_filter = ""
-            params = [memory_hash, f',{memory_hash},', max_hops]
-
-            if relationship_type is not None:
-                relationship_filter = "AND mg.relationship_type = ?"
-                params.append(relationship_type)
-
-            # Build join condition and selected hash based on direction
-            if direction == "outgoing":
-                join_condition = "JOIN memory_graph mg ON cm.hash = mg.source_hash"
-                selected_hash = "mg.target_hash"
-            elif direction == "incoming":
-                join_condition = "JOIN memory_graph mg ON cm.hash = mg.target_hash"
-                selected_hash = "mg.source_hash"
-            else:  # both
-                # For direction="both", check BOTH source and target columns
-                # This handles both symmetric (bidirectional edges) and asymmetric (single edge) correctly
-                join_condition = "JOIN memory_graph mg ON (cm.hash = mg.source_hash OR cm.hash = mg.target_hash)"
-                selected_hash = "CASE WHEN cm.hash = mg.source_hash THEN mg.target_hash ELSE mg.source_hash END"
-
-            query = _QUERY_TEMPLATE_FIND_CONNECTED.format(
-                selected_hash=selected_hash,
-                join_condition=join_condition,
-                relationship_filter=relationship_filter
-            )
-
+        # Recursive CTE query for multi-hop traversal
+        # Base case: Direct neighbors (distance = 1)
+        # Recursive case: Neighbors of neighbors (distance + 1)
+        # Cycle prevention: Wrap hashes with delimiters to avoid substring matches
+
+        # Build WHERE clause for relationship_type filter
+        relationship_filter = ""
+        params = [memory_hash, f',{memory_hash},', max_hops]
+
+        if relationship_type is not None:
+            relationship_filter = "AND mg.relationship_type = ?"
+            params.append(relationship_type)
+
+        # Build join condition and selected hash based on direction
+        if direction == "outgoing":
+            join_condition = "JOIN memory_graph mg ON cm.hash = mg.source_hash"
+            selected_hash = "mg.target_hash"
+        elif direction == "incoming":
+            join_condition = "JOIN memory_graph mg ON cm.hash = mg.target_hash"
+            selected_hash = "mg.source_hash"
+        else:  # both
+            # For direction="both", check BOTH source and target columns
+            # This handles both symmetric (bidirectional edges) and asymmetric (single edge) correctly
+            join_condition = "JOIN memory_graph mg ON (cm.hash = mg.source_hash OR cm.hash = mg.target_hash)"
+            selected_hash = "CASE WHEN cm.hash = mg.source_hash THEN mg.target_hash ELSE mg.source_hash END"
+
+        query = _QUERY_TEMPLATE_FIND_CONNECTED.format(
+            selected_hash=selected_hash,
+            join_condition=join_condition,
+            relationship_filter=relationship_filter
+        )
+
+        def _find(conn: sqlite3.Connection) -> List[Tuple[str, int]]:
+            adjacency = self._current_adjacency(conn)
+            if adjacency is not None:
+                relationship_types = None if relationship_type is None else [relationship_type]
+                return adjacency.k_hop(memory_hash, max_hops, relationship_types, direction)
             cursor = conn.cursor()
             try:
                 cursor.execute(query, params)
-                results = cursor.fetchall()
-
-                connected = [(row['hash'], row['distance']) for row in results]
-                logger.debug(f"Found {len(connected)} connected memories within {max_hops} hops")
-
-                return connected
+                return [(row['hash'], row['distance']) for row in cursor.fetchall()]
             finally:
                 cursor.close()
 
+        try:
+            connected = await self._read("find_connected", _find)
+            logger.debug(f"Found {len(connected)} connected memories within {max_hops} hops")
+            return connected
+
         except sqlite3.Error as e:
             logger.error(f"Failed to find connected memories: {e}")
             return []
 
+    async def neighbors_many(
+        self,
+        memory_hashes: List[str],
+        relationship_types: Optional[List[str]] = None,
+        direction: str = "both"
+    ) -> Dict[str, List[str]]:
+        """
+        Direct neighbors of many memories in one round trip.
+
+        Equivalent to calling ``find_connected(h, max_hops=1)`` for every hash,
+        but answered by one indexed query per edge direction (or one adjacency
+        cache lookup) for the whole batch.
+
+        Args:
+            memory_hashes: Memory content hashes to look up
+            relationship_types: Optional list of relationship types to filter by
+            direction: Direction to traverse ("outgoing", "incoming", "both")
+
+        Returns:
+            Dict mapping every requested hash to its sorted neighbor hashes
+            (empty list when it has none)
+
+        Example:
+            {"hash1": ["hash2", "hash3"], "hash4": []}
+        """
+        if direction not in ("outgoing", "incoming", "both"):
+            logger.error(f"Invalid direction '{direction}', must be 'outgoing', 'incoming', or 'both'")
+            return {}
+
+        hashes = list(dict.fromkeys(h for h in memory_hashes if h))
+        if not hashes:
+            return {}
+
+        def _neighbors(conn: sqlite3.Connection) -> Dict[str, List[str]]:
+            grouped: Dict[str, Set[str]] = {h: set() for h in hashes}
+            for memory_hash, neighbor in self._neighbor_pairs(conn, hashes, direction, relationship_types):
+                if neighbor != memory_hash:
+                    grouped[memory_hash].add(neighbor)
+            return {h: sorted(neighbors) for h, neighbors in grouped.items()}
+
+        try:
+            neighbors = await self._read("neighbors_many", _neighbors)
+            logger.debug(f"Fetched neighbors for {len(hashes)} memories")
+            return neighbors
+
+        except sqlite3.Error as e:
+            logger.error(f"Failed to fetch neighbors: {e}")
+            return {}
+
     async def get_relationship_types(self, memory_hash: str) -> Dict[str, int]:
         """
         Get count of each relationship type for a given memory.
@@ -339,28 +838,24 @@ class GraphStorage:
             logger.error("Invalid memory hash (empty string)")
             return {}
 
-        try:
-            conn = await self._get_connection()
-
-            query = """
-            SELECT relationship_type, COUNT(*) as count
-            FROM memory_graph
-            WHERE source_hash = ?
-            GROUP BY relationship_type
-            """
-
+        def _types(conn: sqlite3.Connection) -> Dict[str, int]:
             cursor = conn.cursor()
             try:
-                cursor.execute(query, (memory_hash,))
-                results = cursor.fetchall()
-
-                relationship_counts = {row['relationship_type']: row['count'] for row in results}
-                logger.debug(f"Found {len(relationship_counts)} relationship types for {memory_hash}")
-
-                return relationship_counts
+                cursor.execute("""
+                SELECT relationship_type, COUNT(*) as count
+                FROM memory_graph
+                WHERE source_hash = ?
+                GROUP BY relationship_type
+                """, (memory_hash,))
+                return {row['relationship_type']: row['count'] for row in cursor.fetchall()}
             finally:
                 cursor.close()
 
+        try:
+            relationship_counts = await self._read("get_relationship_types", _types)
+            logger.debug(f"Found {len(relationship_counts)} relationship types for {memory_hash}")
+            return relationship_counts
+
         except sqlite3.Error as e:
             logger.error(f"Failed to get relationship types: {e}")
             return {}
@@ -370,22 +865,28 @@ class GraphStorage:
         hash1: str,
         hash2: str,
         max_depth: int = 5,
-        relationship_types: Optional[List[str]] = None
+        relationship_types: Optional[List[str]] = None,
+        direction: str = "outgoing",
+        max_expanded_nodes: Optional[int] = None
     ) -> Optional[List[str]]:
         """
-        Find shortest path between two memories using recursive CTE (BFS).
+        Find shortest path between two memories using bidirectional BFS.
 
-        Uses unidirectional breadth-first search from source to target.
-        BFS guarantees the shortest path is found first due to level-order traversal.
-
-        Note: Bidirectional BFS could improve performance for deep searches but adds
-        complexity. Current performance (15ms typical) is excellent for our use case.
+        Searches forward from ``hash1`` and backward from ``hash2`` at the
+        same time, always expanding the smaller frontier, and stops at the
+        first BFS level where the two searches meet. Each level is fetched
+        with one indexed query per side (or from the adjacency cache), so
+        cost grows with the nodes visited instead of the number of paths.
 
         Args:
             hash1: Source memory content hash
             hash2: Target memory content hash
-            max_depth: Maximum path length to search (default: 5)
+            max_depth: Maximum number of memories on the path (default: 5)
             relationship_types: Optional list of relationship types to filter by
+            direction: "outgoing" follows edges source → target (default),
+                "incoming" follows them backwards, "both" ignores direction
+            max_expanded_nodes: Optional budget of expanded nodes; the search
+                gives up (returns None) rather than exceed it
 
         Returns:
             Ordered list of memory hashes representing path, or None if no path exists
@@ -398,42 +899,33 @@ class GraphStorage:
         if hash1 == hash2:
             return [hash1]  # Trivial path
 
-        try:
-            conn = await self._get_connection()
-
-            # Recursive CTE for BFS pathfinding
-            # Stops at first path found (BFS guarantees shortest)
-            # Cycle prevention: Wrap hashes with delimiters to avoid substring matches
-
-            # Build WHERE clause for relationship_types filter
-            relationship_filter = ""
-            params = [hash1, f',{hash1},', max_depth, hash2, hash2]
-
-            if relationship_types is not None and len(relationship_types) > 0:
-                # Create IN clause for relationship types
-                placeholders = ','.join('?' * len(relationship_types))
-                relationship_filter = f"AND mg.relationship_type IN ({placeholders})"
-                params.extend(relationship_types)
+        if direction not in _PATH_EXPANSIONS:
+            logger.error(f"Invalid direction '{direction}', must be 'outgoing', 'incoming', or 'both'")
+            return None
+        forward, backward = _PATH_EXPANSIONS[direction]
 
-            query = _QUERY_TEMPLATE_SHORTEST_PATH.format(
-                relationship_filter=relationship_filter
+        def _path(conn: sqlite3.Connection) -> Tuple[Optional[List[str]], int, bool]:
+            return _bidirectional_shortest_path(
+                hash1, hash2, max_depth - 1,
+                lambda hashes, side_direction: self._neighbor_pairs(conn, hashes, side_direction, relationship_types),
+                forward, backward, max_expanded_nodes
             )
 
-            cursor = conn.cursor()
-            try:
-                cursor.execute(query, params)
-                result = cursor.fetchone()
-
-                if result:
-                    # Path format: ",hash1,,hash2,,hash3," - filter empty strings
-                    path = [h for h in result['path'].split(',') if h]
-                    logger.debug(f"Found path of length {len(path)}: {hash1} → {hash2}")
-                    return path
-                else:
-                    logger.debug(f"No path found between {hash1} and {hash2}")
-                    return None
-            finally:
-                cursor.close()
+        try:
+            path, expanded, exhausted = await self._read("shortest_path", _path)
+
+            if path:
+                logger.debug(f"Found path of length {len(path)}: {hash1} → {hash2} ({expanded} nodes expanded)")
+                return path
+            elif exhausted:
+                logger.info(
+                    f"Shortest path search {hash1} → {hash2} stopped after {expanded} nodes "
+                    f"(max_expanded_nodes={max_expanded_nodes})"
+                )
+                return None
+            else:
+                logger.debug(f"No path found between {hash1} and {hash2}")
+                return None
 
         except sqlite3.Error as e:
             logger.error(f"Failed to find shortest path: {e}")
@@ -490,88 +982,77 @@ class GraphStorage:
             nodes = {memory_hash}
             nodes.update(hash for hash, _ in connected)
 
-            # Check SQLite parameter limit (999 max, we use 2*len(nodes) + maybe 1 for relationship_type)
-            if len(nodes) > 499:
-                logger.warning(
-                    f"Subgraph too large ({len(nodes)} nodes > 499 limit). "
-                    f"Truncating to prevent SQLite parameter overflow."
-                )
-                # Keep center node + first 498 connected nodes
-                nodes = {memory_hash}
-                nodes.update(h for h, _ in list(connected)[:498])
+            # Fetch edges leaving the subgraph's nodes in chunks that stay under
+            # SQLite's parameter limit, keeping those that end inside the subgraph
+            relationship_filter = ""
+            if relationship_type is not None:
+                relationship_filter = "AND relationship_type = ?"
+            node_list = list(nodes)
 
-            # Fetch all edges between nodes in subgraph
-            conn = await self._get_connection()
+            def _edges(conn: sqlite3.Connection) -> List[sqlite3.Row]:
+                rows = []
+                cursor = conn.cursor()
+                try:
+                    for start in range(0, len(node_list), _NEIGHBOR_QUERY_CHUNK):
+                        chunk = node_list[start:start + _NEIGHBOR_QUERY_CHUNK]
+                        params = chunk + ([relationship_type] if relationship_type is not None else [])
+                        # Safety: placeholders are constructed from validated node set, not user input
+                        cursor.execute(_QUERY_TEMPLATE_SUBGRAPH.format(
+                            placeholders=','.join('?' * len(chunk)),
+                            relationship_filter=relationship_filter
+                        ), params)
+                        rows.extend(row for row in cursor.fetchall() if row['target_hash'] in nodes)
+                    return rows
+                finally:
+                    cursor.close()
 
-            # Use parameterized query with IN clause
-            # Safety: placeholders are constructed from validated node set, not user input
-            placeholders = ','.join('?' * len(nodes))
+            results = await self._read("get_subgraph", _edges)
 
-            # Add relationship_type filter if specified
-            relationship_filter = ""
-            params = list(nodes) + list(nodes)
+            # Format edges for visualization
+            edges = []
+            seen_edges = set()  # Avoid duplicates from bidirectional storage
 
-            if relationship_type is not None:
-                relationship_filter = "AND relationship_type = ?"
-                params.append(relationship_type)
+            for row in results:
+                source = row['source_hash']
+                target = row['target_hash']
 
-            query = _QUERY_TEMPLATE_SUBGRAPH.format(
-                placeholders=placeholders,
-                relationship_filter=relationship_filter
-            )
+                # Use canonical edge representation (sorted tuple) to deduplicate
+                edge_key = tuple(sorted([source, target]))
+                if edge_key in seen_edges:
+                    continue
+                seen_edges.add(edge_key)
 
-            cursor = conn.cursor()
-            try:
-                cursor.execute(query, params)
-                results = cursor.fetchall()
-
-                # Format edges for visualization
-                edges = []
-                seen_edges = set()  # Avoid duplicates from bidirectional storage
-
-                for row in results:
-                    source = row['source_hash']
-                    target = row['target_hash']
-
-                    # Use canonical edge representation (sorted tuple) to deduplicate
-                    edge_key = tuple(sorted([source, target]))
-                    if edge_key in seen_edges:
-                        continue
-                    seen_edges.add(edge_key)
-
-                    # connection_types should be a JSON-encoded list, but legacy
-                    # rows may contain a bare string (e.g. "semantic") — fall back
-                    # to wrapping it as a single-element list instead of crashing.
-                    raw_ct = row['connection_types']
-                    try:
-                        connection_types = json.loads(raw_ct) if raw_ct else []
-                    except (json.JSONDecodeError, TypeError):
-                        connection_types = [raw_ct] if raw_ct else []
+                # connection_types should be a JSON-encoded list, but legacy
+                # rows may contain a bare string (e.g. "semantic") — fall back
+                # to wrapping it as a single-element list instead of crashing.
+                raw_ct = row['connection_types']
+                try:
+                    connection_types = json.loads(raw_ct) if raw_ct else []
+                except (json.JSONDecodeError, TypeError):
+                    connection_types = [raw_ct] if raw_ct else []
 
-                    raw_meta = row['metadata']
-                    try:
-                        edge_metadata = json.loads(raw_meta) if raw_meta else {}
-                    except (json.JSONDecodeError, TypeError):
-                        edge_metadata = {}
-
-                    edges.append({
-                        "source": source,
-                        "target": target,
-                        "similarity": row['similarity'],
-                        "connection_types": connection_types,
-                        "metadata": edge_metadata,
-                        "relationship_type": row['relationship_type']
-                    })
-
-                subgraph = {
-                    "nodes": list(nodes),
-                    "edges": edges
-                }
+                raw_meta = row['metadata']
+                try:
+                    edge_metadata = json.loads(raw_meta) if raw_meta else {}
+                except (json.JSONDecodeError, TypeError):
+                    edge_metadata = {}
+
+                edges.append({
+                    "source": source,
+                    "target": target,
+                    "similarity": row['similarity'],
+                    "connection_types": connection_types,
+                    "metadata": edge_metadata,
+                    "relationship_type": row['relationship_type']
+                })
+
+            subgraph = {
+                "nodes": list(nodes),
+                "edges": edges
+            }
 
-                logger.debug(f"Extracted subgraph: {len(nodes)} nodes, {len(edges)} edges")
-                return subgraph
-            finally:
-                cursor.close()
+            logger.debug(f"Extracted subgraph: {len(nodes)} nodes, {len(edges)} edges")
+            return subgraph
 
         except sqlite3.Error as e:
             logger.error(f"Failed to extract subgraph: {e}")
@@ -605,27 +1086,29 @@ class GraphStorage:
             logger.error("Invalid hash provided (empty string)")
             return None
 
-        try:
-            conn = await self._get_connection()
-
+        def _get(conn: sqlite3.Connection) -> Optional[sqlite3.Row]:
             # Query for either direction (bidirectional storage)
-            query = """
-            SELECT
-                source_hash,
-                target_hash,
-                similarity,
-                connection_types,
-                metadata,
-                created_at
-            FROM memory_graph
-            WHERE (source_hash = ? AND target_hash = ?)
-               OR (source_hash = ? AND target_hash = ?)
-            LIMIT 1
-            """
-
             cursor = conn.cursor()
-            cursor.execute(query, (source_hash, target_hash, target_hash, source_hash))
-            result = cursor.fetchone()
+            try:
+                cursor.execute("""
+                SELECT
+                    source_hash,
+                    target_hash,
+                    similarity,
+                    connection_types,
+                    metadata,
+                    created_at
+                FROM memory_graph
+                WHERE (source_hash = ? AND target_hash = ?)
+                   OR (source_hash = ? AND target_hash = ?)
+                LIMIT 1
+                """, (source_hash, target_hash, target_hash, source_hash))
+                return cursor.fetchone()
+            finally:
+                cursor.close()
+
+        try:
+            result = await self._read("get_association", _get)
 
             if result:
                 return {
@@ -663,28 +1146,29 @@ class GraphStorage:
             logger.error("Invalid hash provided (empty string)")
             return False
 
-        try:
-            conn = await self._get_connection()
-
-            async with self._lock:  # Ensure thread safety
-                cursor = conn.cursor()
-
+        def _delete(conn: sqlite3.Connection) -> int:
+            cursor = conn.cursor()
+            try:
                 # Delete both directions (bidirectional storage)
                 cursor.execute("""
                     DELETE FROM memory_graph
                     WHERE (source_hash = ? AND target_hash = ?)
                        OR (source_hash = ? AND target_hash = ?)
                 """, (source_hash, target_hash, target_hash, source_hash))
-
                 conn.commit()
+                self._update_adjacency(removed=[(source_hash, target_hash), (target_hash, source_hash)])
+                return cursor.rowcount
+            finally:
+                cursor.close()
 
-                deleted_count = cursor.rowcount
-                if deleted_count > 0:
-                    logger.debug(f"Deleted association: {source_hash} ↔ {target_hash}")
-                    return True
-                else:
-                    logger.warning(f"No association found to delete: {source_hash} ↔ {target_hash}")
-                    return False
+        try:
+            deleted_count = await self._write("delete_association", _delete)
+            if deleted_count > 0:
+                logger.debug(f"Deleted association: {source_hash} ↔ {target_hash}")
+                return True
+            else:
+                logger.warning(f"No association found to delete: {source_hash} ↔ {target_hash}")
+                return False
 
         except sqlite3.Error as e:
             logger.error(f"Failed to delete association: {e}")
@@ -703,19 +1187,17 @@ class GraphStorage:
         if not memory_hash:
             return 0
 
-        try:
-            conn = await self._get_connection()
-            cursor = conn.cursor()
-
-            cursor.execute("""
+        def _count(conn: sqlite3.Connection) -> int:
+            result = conn.execute("""
                 SELECT COUNT(*) as count
                 FROM memory_graph
                 WHERE source_hash = ?
-            """, (memory_hash,))
-
-            result = cursor.fetchone()
+            """, (memory_hash,)).fetchone()
             return result['count'] if result else 0
 
+        try:
+            return await self._read("get_association_count", _count)
+
         except sqlite3.Error as e:
             logger.error(f"Failed to count associations: {e}")
             return 0
@@ -724,17 +1206,21 @@ class GraphStorage:
         """Store an entity link using memory_graph with relationship_type='has_entity'."""
         if not memory_hash or not entity_name:
             return False
+        metadata_json = json.dumps({"entity_type": entity_type})
+        created_at = datetime.now(timezone.utc).timestamp()
+
+        def _link(conn: sqlite3.Connection) -> None:
+            cursor = conn.execute("""
+                INSERT OR IGNORE INTO memory_graph
+                (source_hash, target_hash, similarity, connection_types, metadata, created_at, relationship_type)
+                VALUES (?, ?, 1.0, '["entity"]', ?, ?, 'has_entity')
+            """, (memory_hash, entity_name, metadata_json, created_at))
+            conn.commit()
+            if cursor.rowcount > 0:
+                self._update_adjacency(added=[(memory_hash, entity_name, "has_entity")], rowid=cursor.lastrowid)
+
         try:
-            conn = await self._get_connection()
-            metadata_json = json.dumps({"entity_type": entity_type})
-            created_at = datetime.now(timezone.utc).timestamp()
-            async with self._lock:
-                conn.execute("""
-                    INSERT OR IGNORE INTO memory_graph
-                    (source_hash, target_hash, similarity, connection_types, metadata, created_at, relationship_type)
-                    VALUES (?, ?, 1.0, '["entity"]', ?, ?, 'has_entity')
-                """, (memory_hash, entity_name, metadata_json, created_at))
-                conn.commit()
+            await self._write("store_entity_link", _link)
             return True
         except sqlite3.Error as e:
             logger.error(f"Failed to store entity link: {e}")
@@ -744,8 +1230,8 @@ class GraphStorage:
         """Find memory hashes linked to a given entity name."""
         if not entity_name:
             return []
-        try:
-            conn = await self._get_connection()
+
+        def _find(conn: sqlite3.Connection) -> List[str]:
             cursor = conn.cursor()
             try:
                 cursor.execute("""
@@ -756,6 +1242,9 @@ class GraphStorage:
                 return [row['source_hash'] for row in cursor.fetchall()]
             finally:
                 cursor.close()
+
+        try:
+            return await self._read("find_memories_by_entity", _find)
         except sqlite3.Error as e:
             logger.error(f"Failed to find memories by entity: {e}")
             return []
@@ -764,8 +1253,8 @@ class GraphStorage:
         """Get entity profile: memory count, entity types, last activity."""
         if not entity_name:
             return {}
-        try:
-            conn = await self._get_connection()
+
+        def _profile(conn: sqlite3.Connection) -> Dict[str, Any]:
             cursor = conn.cursor()
             try:
                 cursor.execute("""
@@ -797,16 +1286,31 @@ class GraphStorage:
                 }
             finally:
                 cursor.close()
+
+        try:
+            return await self._read("get_entity_profile", _profile)
         except sqlite3.Error as e:
             logger.error(f"Failed to get entity profile: {e}")
             return {}
 
     async def close(self):
-        """Close database connection."""
+        """Close database connections and stop the reader/writer threads."""
+        if self._readers is not None:
+            self._readers.shutdown(wait=True)
+            self._readers = None
+        with self._reader_connections_lock:
+            reader_connections, self._reader_connections = self._reader_connections, []
+        for conn in reader_connections:
+            conn.close()
+        self._reader_local = threading.local()
+        self._adjacency = None
         if self._connection:
             self._connection.close()
             self._connection = None
             logger.info("Closed GraphStorage connection")
+        if self._writer is not None:
+            self._writer.shutdown(wait=True)
+            self._writer = None
 
     async def transitive_closure(
         self,
@@ -827,8 +1331,11 @@ class GraphStorage:
             List of (source, target, distance) tuples
         """
         max_hops = min(max(max_hops, 2), 4)
-        try:
-            conn = await self._get_connection()
+
+        def _closure(conn: sqlite3.Connection) -> List[Tuple[str, str, int]]:
+            adjacency = self._current_adjacency(conn)
+            if adjacency is not None:
+                return adjacency.transitive_closure(relationship_type, max_hops)
             cursor = conn.cursor()
             try:
                 # Recursive CTE: find all reachable pairs via BFS in SQL
@@ -867,6 +1374,9 @@ class GraphStorage:
                         for row in cursor.fetchall()]
             finally:
                 cursor.close()
+
+        try:
+            return await self._read("transitive_closure", _closure)
         except sqlite3.Error as e:
             logger.error(f"Failed transitive closure query: {e}")
             return []
@@ -889,8 +1399,10 @@ class GraphStorage:
         Returns:
             List of (candidate_hash, shared_count, source_degree) tuples
         """
-        try:
-            conn = await self._get_connection()
+        def _common(conn: sqlite3.Connection) -> List[Tuple[str, int, int]]:
+            adjacency = self._current_adjacency(conn)
+            if adjacency is not None:
+                return adjacency.common_neighbors(memory_hash, min_shared)
             cursor = conn.cursor()
             try:
                 cursor.execute("""
@@ -924,6 +1436,156 @@ class GraphStorage:
                         for row in cursor.fetchall()]
             finally:
                 cursor.close()
+
+        try:
+            return await self._read("common_neighbors", _common)
         except sqlite3.Error as e:
             logger.error(f"Failed common neighbors query: {e}")
             return []
+
+    async def refresh_centrality(
+        self,
+        personalization: Optional[Dict[str, float]] = None,
+        force: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Recompute PageRank and degree centrality into ``memory_centrality``.
+
+        Intended as a background job after consolidation. The refresh is
+        incremental: it is skipped when ``memory_graph`` is unchanged since the
+        last run (and no new personalization is given), PageRank is
+        warm-started from the stored scores, and only rows whose scores moved
+        are rewritten.
+
+        Args:
+            personalization: Teleport weights for personalized PageRank, e.g.
+                consolidation relevance scores. Merged over the weights stored
+                by earlier refreshes; unweighted memories count as 1.0.
+            force: Recompute even if the graph has not changed
+
+        Returns:
+            Dict with ``skipped``, ``nodes``, ``updated``, ``removed`` and
+            ``iterations``; empty on failure or when NumPy is unavailable
+        """
+        try:
+            from .graph_centrality import compute_centrality
+        except ImportError:
+            logger.warning("NumPy not available - skipping graph centrality refresh")
+            return {}
+
+        def _refresh(conn: sqlite3.Connection) -> Dict[str, Any]:
+            conn.execute(_CENTRALITY_SCHEMA)
+            conn.execute(_CENTRALITY_STATE_SCHEMA)
+            fingerprint = tuple(conn.execute(
+                "SELECT COUNT(*), MAX(rowid), TOTAL(similarity) FROM memory_graph"
+            ).fetchone())
+            state = conn.execute(
+                "SELECT edge_count, max_rowid, total_similarity FROM memory_centrality_state WHERE id = 1"
+            ).fetchone()
+            if not force and not personalization and state is not None and tuple(state) == fingerprint:
+                return {"skipped": True, "nodes": 0, "updated": 0, "removed": 0, "iterations": 0}
+
+            previous = {
+                row["content_hash"]: row for row in conn.execute(
+                    "SELECT content_hash, pagerank, personalized_pagerank, degree, importance, "
+                    "personalization FROM memory_centrality"
+                )
+            }
+            weights = {
+                memory_hash: row["personalization"]
+                for memory_hash, row in previous.items() if row["personalization"] is not None
+            }
+            weights.update(personalization or {})
+
+            scores, iterations = compute_centrality(
+                conn.execute("SELECT source_hash, target_hash, similarity FROM memory_graph"),
+                personalization=weights or None,
+                previous={h: (row["pagerank"], row["personalized_pagerank"]) for h, row in previous.items()},
+            )
+
+            now = time.time()
+            changed = []
+            for memory_hash, score in scores.items():
+                old = previous.get(memory_hash)
+                weight = weights.get(memory_hash)
+                if old is None or old["degree"] != score.degree or old["personalization"] != weight or any(
+                    abs(old[column] - value) > _CENTRALITY_EPSILON
+                    for column, value in (
+                        ("pagerank", score.pagerank),
+                        ("personalized_pagerank", score.personalized_pagerank),
+                        ("importance", score.importance),
+                    )
+                ):
+                    changed.append((
+                        memory_hash, score.pagerank, score.personalized_pagerank,
+                        score.degree, score.importance, weight, now
+                    ))
+            removed = [(memory_hash,) for memory_hash in previous if memory_hash not in scores]
+
+            conn.executemany("INSERT OR REPLACE INTO memory_centrality VALUES (?, ?, ?, ?, ?, ?, ?)", changed)
+            conn.executemany("DELETE FROM memory_centrality WHERE content_hash = ?", removed)
+            conn.execute(
+                "INSERT OR REPLACE INTO memory_centrality_state VALUES (1, ?, ?, ?, ?, ?)",
+                (*fingerprint, iterations, now)
+            )
+            conn.commit()
+            return {
+                "skipped": False,
+                "nodes": len(scores),
+                "updated": len(changed),
+                "removed": len(removed),
+                "iterations": iterations,
+            }
+
+        try:
+            result = await self._write("refresh_centrality", _refresh)
+            if not result["skipped"]:
+                logger.info(
+                    f"Refreshed graph centrality: {result['nodes']} nodes, {result['updated']} updated, "
+                    f"{result['removed']} removed, {result['iterations']} iterations"
+                )
+            return result
+
+        except sqlite3.Error as e:
+            logger.error(f"Failed to refresh graph centrality: {e}")
+            return {}
+
+    async def get_centrality(self, memory_hashes: List[str]) -> Dict[str, Dict[str, float]]:
+        """
+        Stored centrality scores for the given memories.
+
+        Args:
+            memory_hashes: Memory content hashes
+
+        Returns:
+            Dict mapping each scored hash to its ``pagerank``,
+            ``personalized_pagerank``, ``degree`` and ``importance``; memories
+            outside the graph (or before the first refresh) are omitted
+        """
+        hashes = list(dict.fromkeys(h for h in memory_hashes if h))
+        if not hashes:
+            return {}
+
+        def _centrality(conn: sqlite3.Connection) -> Dict[str, Dict[str, float]]:
+            scores = {}
+            for start in range(0, len(hashes), _NEIGHBOR_QUERY_CHUNK):
+                chunk = hashes[start:start + _NEIGHBOR_QUERY_CHUNK]
+                for row in conn.execute(
+                    "SELECT content_hash, pagerank, personalized_pagerank, degree, importance "
+                    f"FROM memory_centrality WHERE content_hash IN ({','.join('?' * len(chunk))})",
+                    chunk
+                ):
+                    scores[row["content_hash"]] = {
+                        "pagerank": row["pagerank"],
+                        "personalized_pagerank": row["personalized_pagerank"],
+                        "degree": row["degree"],
+                        "importance": row["importance"],
+                    }
+            return scores
+
+        try:
+            return await self._read("get_centrality", _centrality)
+        except sqlite3.Error as e:
+            # memory_centrality does not exist until the first refresh
+            logger.debug(f"Failed to read graph centrality: {e}")
+            return {}
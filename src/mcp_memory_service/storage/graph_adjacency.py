@@ -0,0 +1,422 @@
+# Copyright 2024 Heinrich Krupp
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+In-process CSR adjacency cache for memory_graph traversal.
+
+The recursive CTEs in ``graph.py`` enumerate paths rather than nodes, so their
+cost grows exponentially around dense hubs. ``CSRAdjacency`` keeps the edge
+list of ``memory_graph`` as compressed-sparse-row NumPy arrays (one for
+outgoing, one for incoming edges) over integer node ids, and runs
+level-synchronous BFS with a real visited set:
+
+- ``k_hop``: nodes within N hops (``find_connected``)
+- ``neighbor_pairs``: one-hop expansion of many nodes (``shortest_path``)
+- ``common_neighbors``: 2-hop candidates with shared-neighbor counts
+- ``transitive_closure``: multi-source BFS over one relationship type
+
+Edges written after the arrays were built live in small per-node delta dicts
+(deletions flip an ``alive`` flag) until they are folded back into the CSR
+arrays by ``compact()``. All public methods take an internal lock, so one
+instance can be shared between the graph reader and writer threads.
+"""
+
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Fold delta edges back into the CSR arrays once they exceed this many edges
+# or 1/8 of the compacted edge count, whichever is larger.
+_MIN_COMPACT_THRESHOLD = 1024
+
+_EMPTY = np.zeros(0, dtype=np.int64)
+
+
+class _CSR:
+    """One direction of the adjacency: row ``v`` lists ``indices[indptr[v]:indptr[v + 1]]``."""
+
+    __slots__ = ("indptr", "indices", "types", "alive")
+
+    def __init__(self, rows: np.ndarray, cols: np.ndarray, types: np.ndarray, num_nodes: int):
+        order = np.lexsort((cols, rows))  # sorted rows, sorted neighbors within a row
+        self.indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=num_nodes), out=self.indptr[1:])
+        self.indices = cols[order].astype(np.int64)
+        self.types = types[order].astype(np.int16)
+        self.alive = np.ones(len(self.indices), dtype=bool)
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.indptr) - 1
+
+    def position(self, row: int, col: int) -> int:
+        """Index of edge ``row -> col`` in ``indices``, or -1."""
+        if row >= self.num_nodes:
+            return -1
+        start, end = self.indptr[row], self.indptr[row + 1]
+        pos = start + int(np.searchsorted(self.indices[start:end], col))
+        if pos < end and self.indices[pos] == col:
+            return int(pos)
+        return -1
+
+
+class CSRAdjacency:
+    """
+    Compressed-sparse-row adjacency of ``memory_graph`` with relationship-type masks.
+
+    Use ``from_rows`` to build it from ``(source_hash, target_hash,
+    relationship_type)`` rows, then keep it current with ``add_edge`` and
+    ``remove_edge``. ``fingerprint`` is free for the owner to record which
+    table state the cache reflects.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._node_ids: Dict[str, int] = {}
+        self._hashes: List[str] = []
+        self._type_ids: Dict[str, int] = {}
+        self._types: List[str] = []
+        self._out = _CSR(_EMPTY, _EMPTY, _EMPTY, 0)
+        self._in = _CSR(_EMPTY, _EMPTY, _EMPTY, 0)
+        # Edges added since the last compaction: node -> {neighbor: type_id}
+        self._added_out: Dict[int, Dict[int, int]] = {}
+        self._added_in: Dict[int, Dict[int, int]] = {}
+        self._pending = 0  # delta edges + tombstones since the last compaction
+        self._edge_count = 0
+        self.fingerprint: Optional[Tuple] = None
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Sequence[Optional[str]]]) -> "CSRAdjacency":
+        """Build from ``(source_hash, target_hash, relationship_type)`` rows."""
+        adjacency = cls()
+        node_ids, type_ids = adjacency._node_ids, adjacency._type_ids
+        sources: List[int] = []
+        targets: List[int] = []
+        types: List[int] = []
+        for source, target, relationship_type in rows:
+            sources.append(node_ids.setdefault(source, len(node_ids)))
+            targets.append(node_ids.setdefault(target, len(node_ids)))
+            types.append(type_ids.setdefault(relationship_type or "related", len(type_ids)))
+        adjacency._hashes = list(node_ids)
+        adjacency._types = list(type_ids)
+        adjacency._build(
+            np.asarray(sources, dtype=np.int64),
+            np.asarray(targets, dtype=np.int64),
+            np.asarray(types, dtype=np.int16),
+        )
+        return adjacency
+
+    def _build(self, sources: np.ndarray, targets: np.ndarray, types: np.ndarray) -> None:
+        num_nodes = len(self._hashes)
+        self._out = _CSR(sources, targets, types, num_nodes)
+        self._in = _CSR(targets, sources, types, num_nodes)
+        self._added_out, self._added_in = {}, {}
+        self._pending = 0
+        self._edge_count = len(sources)
+
+    # ------------------------------------------------------------------
+    # Incremental maintenance
+    # ------------------------------------------------------------------
+
+    @property
+    def edge_count(self) -> int:
+        return self._edge_count
+
+    @property
+    def node_count(self) -> int:
+        return len(self._hashes)
+
+    def add_edge(self, source_hash: str, target_hash: str, relationship_type: Optional[str]) -> bool:
+        """Insert or replace edge ``source -> target``. Returns True if it is new."""
+        with self._lock:
+            source = self._intern_node(source_hash)
+            target = self._intern_node(target_hash)
+            type_id = self._type_ids.setdefault(relationship_type or "related", len(self._type_ids))
+            if type_id == len(self._types):
+                self._types.append(relationship_type or "related")
+            existed = self._remove(source, target)
+            self._added_out.setdefault(source, {})[target] = type_id
+            self._added_in.setdefault(target, {})[source] = type_id
+            self._edge_count += 1
+            self._pending += 1
+            self._maybe_compact()
+            return not existed
+
+    def remove_edge(self, source_hash: str, target_hash: str) -> bool:
+        """Remove edge ``source -> target``. Returns True if it existed."""
+        with self._lock:
+            source = self._node_ids.get(source_hash)
+            target = self._node_ids.get(target_hash)
+            if source is None or target is None:
+                return False
+            removed = self._remove(source, target)
+            self._maybe_compact()
+            return removed
+
+    def _intern_node(self, memory_hash: str) -> int:
+        node = self._node_ids.get(memory_hash)
+        if node is None:
+            node = self._node_ids[memory_hash] = len(self._hashes)
+            self._hashes.append(memory_hash)
+        return node
+
+    def _remove(self, source: int, target: int) -> bool:
+        added = self._added_out.get(source)
+        if added is not None and target in added:
+            del added[target]
+            if not added:
+                del self._added_out[source]
+            incoming = self._added_in[target]
+            del incoming[source]
+            if not incoming:
+                del self._added_in[target]
+            self._edge_count -= 1
+            self._pending -= 1
+            return True
+        out_pos = self._out.position(source, target)
+        if out_pos < 0 or not self._out.alive[out_pos]:
+            return False
+        self._out.alive[out_pos] = False
+        self._in.alive[self._in.position(target, source)] = False
+        self._edge_count -= 1
+        self._pending += 1
+        return True
+
+    def _maybe_compact(self) -> None:
+        if self._pending > max(_MIN_COMPACT_THRESHOLD, len(self._out.indices) // 8):
+            self.compact()
+
+    def compact(self) -> None:
+        """Fold delta edges and tombstones back into the CSR arrays."""
+        with self._lock:
+            out = self._out
+            rows = np.repeat(np.arange(out.num_nodes, dtype=np.int64), np.diff(out.indptr))
+            sources = [rows[out.alive]]
+            targets = [out.indices[out.alive]]
+            types = [out.types[out.alive]]
+            for source, neighbors in self._added_out.items():
+                sources.append(np.full(len(neighbors), source, dtype=np.int64))
+                targets.append(np.fromiter(neighbors.keys(), dtype=np.int64, count=len(neighbors)))
+                types.append(np.fromiter(neighbors.values(), dtype=np.int16, count=len(neighbors)))
+            self._build(np.concatenate(sources), np.concatenate(targets), np.concatenate(types))
+
+    # ------------------------------------------------------------------
+    # Traversal primitives
+    # ------------------------------------------------------------------
+
+    def _type_mask(self, relationship_types: Optional[Iterable[str]]) -> Optional[np.ndarray]:
+        """Boolean mask over type ids, or None for "all types" (also for an empty filter)."""
+        relationship_types = list(relationship_types or ())
+        if not relationship_types:
+            return None
+        mask = np.zeros(max(len(self._types), 1), dtype=bool)
+        for relationship_type in relationship_types:
+            type_id = self._type_ids.get(relationship_type)
+            if type_id is not None:
+                mask[type_id] = True
+        return mask
+
+    def _directions(self, direction: str):
+        if direction == "outgoing":
+            return ((self._out, self._added_out),)
+        if direction == "incoming":
+            return ((self._in, self._added_in),)
+        return ((self._out, self._added_out), (self._in, self._added_in))
+
+    def _expand(
+        self,
+        frontier: np.ndarray,
+        direction: str,
+        mask: Optional[np.ndarray],
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Every live edge leaving ``frontier``.
+
+        Returns ``(position, neighbor)`` arrays where ``position`` indexes into
+        ``frontier``. Repeated frontier entries are expanded once per entry.
+        """
+        positions: List[np.ndarray] = []
+        neighbors: List[np.ndarray] = []
+        for csr, added in self._directions(direction):
+            in_base = np.nonzero(frontier < csr.num_nodes)[0]
+            nodes = frontier[in_base]
+            starts = csr.indptr[nodes]
+            counts = csr.indptr[nodes + 1] - starts
+            total = int(counts.sum())
+            if total:
+                edge_idx = np.repeat(starts - (np.cumsum(counts) - counts), counts) + np.arange(total)
+                keep = csr.alive[edge_idx]
+                if mask is not None:
+                    keep &= mask[csr.types[edge_idx]]
+                positions.append(np.repeat(in_base, counts)[keep])
+                neighbors.append(csr.indices[edge_idx][keep])
+            if added:
+                keys = np.fromiter(added.keys(), dtype=np.int64, count=len(added))
+                extra_pos: List[int] = []
+                extra_nbr: List[int] = []
+                for pos in np.nonzero(np.isin(frontier, keys))[0]:
+                    for neighbor, type_id in added[int(frontier[pos])].items():
+                        if mask is None or mask[type_id]:
+                            extra_pos.append(int(pos))
+                            extra_nbr.append(neighbor)
+                if extra_pos:
+                    positions.append(np.asarray(extra_pos, dtype=np.int64))
+                    neighbors.append(np.asarray(extra_nbr, dtype=np.int64))
+        if not positions:
+            return _EMPTY, _EMPTY
+        return np.concatenate(positions), np.concatenate(neighbors)
+
+    def _sorted_hashes(self, nodes: np.ndarray) -> List[str]:
+        return sorted(self._hashes[node] for node in nodes.tolist())
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def k_hop(
+        self,
+        memory_hash: str,
+        max_hops: int,
+        relationship_types: Optional[Iterable[str]] = None,
+        direction: str = "both",
+    ) -> List[Tuple[str, int]]:
+        """
+        Nodes within ``max_hops`` of ``memory_hash``, each at its BFS distance.
+
+        Returns:
+            ``(memory_hash, distance)`` tuples ordered by distance, then hash
+            (the start node is excluded)
+        """
+        with self._lock:
+            start = self._node_ids.get(memory_hash)
+            if start is None:
+                return []
+            mask = self._type_mask(relationship_types)
+            visited = np.zeros(len(self._hashes), dtype=bool)
+            visited[start] = True
+            frontier = np.array([start], dtype=np.int64)
+            results: List[Tuple[str, int]] = []
+            for distance in range(1, max_hops + 1):
+                _, neighbors = self._expand(frontier, direction, mask)
+                frontier = np.unique(neighbors[~visited[neighbors]])
+                if not len(frontier):
+                    break
+                visited[frontier] = True
+                results.extend((h, distance) for h in self._sorted_hashes(frontier))
+            return results
+
+    def neighbor_pairs(
+        self,
+        memory_hashes: Sequence[str],
+        direction: str = "both",
+        relationship_types: Optional[Iterable[str]] = None,
+    ) -> List[Tuple[str, str]]:
+        """
+        One-hop neighbors of many nodes at once.
+
+        Returns:
+            ``(memory_hash, neighbor_hash)`` pairs, one per live edge
+        """
+        with self._lock:
+            nodes = [self._node_ids[h] for h in memory_hashes if h in self._node_ids]
+            if not nodes:
+                return []
+            positions, neighbors = self._expand(
+                np.asarray(nodes, dtype=np.int64), direction, self._type_mask(relationship_types)
+            )
+            hashes = self._hashes
+            return [
+                (hashes[nodes[pos]], hashes[neighbor])
+                for pos, neighbor in zip(positions.tolist(), neighbors.tolist())
+            ]
+
+    def common_neighbors(
+        self,
+        memory_hash: str,
+        min_shared: int = 1,
+        limit: int = 10,
+    ) -> List[Tuple[str, int, int]]:
+        """
+        2-hop candidates ranked by shared-neighbor count.
+
+        Counts follow the SQL implementation: every stored edge row touching
+        the memory is one neighbor occurrence (a symmetric edge stored in both
+        directions counts twice), and ``source_degree`` is the number of such
+        rows.
+
+        Returns:
+            ``(candidate_hash, shared_count, source_degree)`` tuples, highest
+            shared count first
+        """
+        with self._lock:
+            start = self._node_ids.get(memory_hash)
+            if start is None:
+                return []
+            _, my_neighbors = self._expand(np.array([start], dtype=np.int64), "both", None)
+            if not len(my_neighbors):
+                return []
+            _, candidates = self._expand(my_neighbors, "both", None)
+            counts = np.bincount(candidates, minlength=len(self._hashes))
+            counts[start] = 0
+            counts[my_neighbors] = 0
+            selected = np.nonzero(counts >= max(min_shared, 1))[0]
+            ranked = sorted(
+                ((self._hashes[node], int(counts[node])) for node in selected.tolist()),
+                key=lambda item: (-item[1], item[0]),
+            )
+            degree = len(my_neighbors)
+            return [(candidate, shared, degree) for candidate, shared in ranked[:limit]]
+
+    def transitive_closure(self, relationship_type: str, max_hops: int) -> List[Tuple[str, str, int]]:
+        """
+        Pairs reachable in 2..``max_hops`` hops along ``relationship_type`` edges.
+
+        Runs one BFS per source, all sources advanced together level by level.
+        Each pair is reported once at its shortest distance; a pair with a
+        direct edge has distance 1 and is therefore never reported.
+
+        Returns:
+            ``(source_hash, target_hash, distance)`` tuples ordered by distance
+        """
+        with self._lock:
+            mask = self._type_mask([relationship_type])
+            num_nodes = len(self._hashes)
+            all_nodes = np.arange(num_nodes, dtype=np.int64)
+            positions, neighbors = self._expand(all_nodes, "outgoing", mask)
+            if not len(positions):
+                return []
+            # Frontier of (source, node) pairs, deduplicated by a combined key
+            pair_sources, pair_nodes = positions, neighbors
+            visited = np.unique(np.concatenate([
+                pair_sources * num_nodes + pair_nodes,
+                np.unique(pair_sources) * num_nodes + np.unique(pair_sources),
+            ]))
+            results: List[Tuple[str, str, int]] = []
+            for distance in range(2, max_hops + 1):
+                positions, neighbors = self._expand(pair_nodes, "outgoing", mask)
+                if not len(positions):
+                    break
+                keys = np.unique(pair_sources[positions] * num_nodes + neighbors)
+                keys = keys[~np.isin(keys, visited, assume_unique=True)]
+                if not len(keys):
+                    break
+                visited = np.union1d(visited, keys)
+                pair_sources, pair_nodes = keys // num_nodes, keys % num_nodes
+                level = sorted(
+                    (self._hashes[source], self._hashes[node])
+                    for source, node in zip(pair_sources.tolist(), pair_nodes.tolist())
+                )
+                results.extend((source, target, distance) for source, target in level)
+            return results
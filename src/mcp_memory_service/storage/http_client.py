@@ -332,7 +332,9 @@ class HTTPClientStorage(MemoryStorage):
         logger.warning("Bulk delete by tag not supported via HTTP client for safety")
         return 0, "Bulk delete by tag not supported via HTTP client for safety reasons"
     
-    async def cleanup_duplicates(self) -> Tuple[int, str]:
+    async def cleanup_duplicates(
+        self, near_duplicates: bool = False, threshold: float = 0.8
+    ) -> Tuple[int, str]:
         """Cleanup duplicates (not implemented via HTTP - server-side operation)."""
         logger.warning("Cleanup duplicates not supported via HTTP client")
         return 0, "Cleanup duplicates should be performed on the server side"
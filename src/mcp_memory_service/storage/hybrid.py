@@ -23,9 +23,10 @@ This implementation provides the best of both worlds:
 """
 
 import asyncio
+import json
 import logging
 import time
-from typing import List, Dict, Any, Tuple, Optional
+from typing import AsyncIterator, List, Dict, Any, Tuple, Optional
 from collections import deque
 from dataclasses import dataclass
 from datetime import date, datetime
@@ -33,6 +34,8 @@ from datetime import date, datetime
 from .base import MemoryStorage
 from .sqlite_vec import SqliteVecMemoryStorage
 from .cloudflare import CloudflareStorage
+from .cloudflare_limiter import BACKGROUND, background_priority, set_request_priority
+from .sync_digest import DigestDiff, reconcile_digests, supports_digest
 from ..models.memory import Memory, MemoryQueryResult
 
 # Import SSE for real-time progress updates
@@ -73,6 +76,18 @@ HYBRID_MAX_EMPTY_BATCHES = _max_empty if _max_empty is not None else 20
 _min_check = getattr(app_config, 'HYBRID_MIN_CHECK_COUNT', 1000)
 HYBRID_MIN_CHECK_COUNT = _min_check if _min_check is not None else 1000
 
+_digest_enabled = getattr(app_config, 'HYBRID_DIGEST_SYNC_ENABLED', True)
+HYBRID_DIGEST_SYNC_ENABLED = _digest_enabled if _digest_enabled is not None else True
+
+_digest_leaf = getattr(app_config, 'HYBRID_DIGEST_LEAF_SIZE', 256)
+HYBRID_DIGEST_LEAF_SIZE = _digest_leaf if _digest_leaf is not None else 256
+
+_reuse_embeddings = getattr(app_config, 'HYBRID_PULL_REUSE_EMBEDDINGS', True)
+HYBRID_PULL_REUSE_EMBEDDINGS = _reuse_embeddings if _reuse_embeddings is not None else True
+
+# Metadata-table key holding the cursor of an interrupted Cloudflare pull
+PULL_CHECKPOINT_KEY = 'hybrid_pull_checkpoint'
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -197,7 +212,9 @@ class BackgroundSyncService:
             'cloudflare_available': True,
             'last_drift_check': 0,
             'drift_detected_count': 0,
-            'drift_synced_count': 0
+            'drift_synced_count': 0,
+            'last_digest_round_trips': 0,
+            'last_digest_buckets_differing': 0
         }
 
         # Health monitoring
@@ -325,8 +342,35 @@ class BackgroundSyncService:
                 return None
         return hashes
 
+    async def _reconcile_digests(self) -> Optional[DigestDiff]:
+        """
+        Diff primary and secondary via hash-range digests (see sync_digest.py).
+
+        Returns None when digests are disabled, either backend lacks the digest
+        protocol, or the comparison fails; callers then fall back to their
+        full-scan paths.
+        """
+        if not HYBRID_DIGEST_SYNC_ENABLED:
+            return None
+        secondary = getattr(self, 'secondary', None)
+        if not (supports_digest(self.primary) and supports_digest(secondary)):
+            return None
+        try:
+            diff = await reconcile_digests(self.primary, secondary, leaf_size=HYBRID_DIGEST_LEAF_SIZE)
+        except Exception as e:
+            logger.warning(f"Digest reconciliation failed, falling back to full scan: {e}")
+            return None
+        self.sync_stats['last_digest_round_trips'] = diff.round_trips
+        self.sync_stats['last_digest_buckets_differing'] = diff.buckets_differing
+        logger.info(f"Digest reconciliation: {diff.summary()}")
+        return diff
+
     async def force_sync(self) -> Dict[str, Any]:
         """Force an immediate full synchronization between backends."""
+        with background_priority():
+            return await self._force_sync()
+
+    async def _force_sync(self) -> Dict[str, Any]:
         logger.info("Starting forced sync between primary and secondary storage")
         sync_start_time = time.time()
 
@@ -353,17 +397,25 @@ class BackgroundSyncService:
             # force_sync calls embed+upsert for every local memory and burns the CF
             # Workers AI quota on duplicates — the root cause of `0 synced / N failed`
             # reported in issue #750.
-            secondary_hashes = await self._fetch_secondary_hashes()
-            if secondary_hashes is not None:
+            # Digest reconciliation finds local-only hashes without listing every
+            # secondary hash; the paged hash fetch remains the fallback.
+            digest_diff = await self._reconcile_digests()
+            secondary_hashes = None if digest_diff is not None else await self._fetch_secondary_hashes()
+            if digest_diff is not None:
+                missing_remote = set(digest_diff.missing_remote)
+                new_memories = [m for m in primary_memories if m.content_hash in missing_remote]
+            elif secondary_hashes is not None:
                 new_memories = [m for m in primary_memories if m.content_hash not in secondary_hashes]
-                skipped_count = len(primary_memories) - len(new_memories)
+            else:
+                new_memories = primary_memories
+            skipped_count = len(primary_memories) - len(new_memories)
+
+            if digest_diff is not None or secondary_hashes is not None:
                 logger.info(
                     f"Dedupe: {skipped_count} of {len(primary_memories)} memories already on secondary, "
                     f"pushing {len(new_memories)}"
                 )
             else:
-                new_memories = primary_memories
-                skipped_count = 0
                 logger.debug("Secondary hash fetch unavailable — pushing all memories")
 
             # Sync from primary to secondary using concurrent operations
@@ -453,6 +505,11 @@ class BackgroundSyncService:
             }
         }
 
+        # Shared Cloudflare request budget (concurrency, throttling, 429s)
+        rate_limiter = getattr(self.secondary, 'rate_limiter', None)
+        if rate_limiter is not None:
+            status['rate_limiter'] = rate_limiter.stats()
+
         return status
 
     async def validate_memory_for_cloudflare(self, memory: Memory) -> Tuple[bool, Optional[str]]:
@@ -537,6 +594,8 @@ class BackgroundSyncService:
     async def _sync_loop(self):
         """Main background sync loop."""
         logger.info("Background sync loop started")
+        # Everything this task sends to Cloudflare yields to foreground requests
+        set_request_priority(BACKGROUND)
 
         while self.is_running:
             try:
@@ -795,12 +854,27 @@ class BackgroundSyncService:
         except Exception as e:
             logger.error(f"Error during periodic sync: {e}")
 
+    async def _fetch_secondary_by_hashes(self, content_hashes: List[str]) -> List[Memory]:
+        """Load memories from the secondary by hash, batched when supported."""
+        if not content_hashes:
+            return []
+        if hasattr(self.secondary, 'get_memories_by_hashes'):
+            return await self.secondary.get_memories_by_hashes(content_hashes)
+        memories = []
+        for content_hash in content_hashes:
+            memory = await self.secondary.get_by_hash(content_hash)
+            if memory:
+                memories.append(memory)
+        return memories
+
     async def _detect_and_sync_drift(self, dry_run: bool = False) -> Dict[str, int]:
         """
         Detect and sync memories with divergent metadata between backends.
 
         Compares updated_at timestamps to identify metadata drift (tags, types, custom fields)
-        and synchronizes changes using "newer timestamp wins" strategy.
+        and synchronizes changes using "newer timestamp wins" strategy. When both backends
+        support hash-range digests the whole corpus is reconciled and only differing
+        memories are fetched; otherwise memories updated since the last check are scanned.
 
         Args:
             dry_run: If True, detect drift but don't apply changes (preview mode)
@@ -811,6 +885,7 @@ class BackgroundSyncService:
             - drift_detected: Number of memories with divergent metadata
             - synced: Number of memories synchronized
             - failed: Number of sync failures
+            - missing_remote: Local-only memories found by digests (pushed by force_sync)
         """
         if not self.drift_check_enabled:
             return {'checked': 0, 'drift_detected': 0, 'synced': 0, 'failed': 0}
@@ -825,8 +900,15 @@ class BackgroundSyncService:
             # Strategy: Check memories updated since last drift check
             time_threshold = self.last_drift_check_time or (time.time() - self.drift_check_interval)
 
+            # Preferred: hash-range digests pinpoint exactly which memories differ,
+            # so only those are fetched and compared one by one.
+            digest_diff = await self._reconcile_digests()
+            if digest_diff is not None:
+                candidates = digest_diff.missing_local + digest_diff.newer_remote + digest_diff.newer_local
+                cf_updated = await self._fetch_secondary_by_hashes(candidates)
+                stats['missing_remote'] = len(digest_diff.missing_remote)
             # Get recently updated from Cloudflare
-            if hasattr(self.secondary, 'get_memories_updated_since'):
+            elif hasattr(self.secondary, 'get_memories_updated_since'):
                 cf_updated = await self.secondary.get_memories_updated_since(
                     time_threshold,
                     limit=batch_size
@@ -845,6 +927,9 @@ class BackgroundSyncService:
                     local_memory = await self.primary.get_by_hash(cf_memory.content_hash)
 
                     if not local_memory:
+                        # Deleted locally - the tombstone wins, deletion sync propagates it
+                        if hasattr(self.primary, 'is_deleted') and await self.primary.is_deleted(cf_memory.content_hash):
+                            continue
                         # Memory missing locally - sync it
                         stats['drift_detected'] += 1
                         logger.debug(f"Memory {cf_memory.content_hash[:8]} missing locally, syncing...")
@@ -1052,8 +1137,83 @@ class HybridMemoryStorage(MemoryStorage):
         # Wait a bit for server to fully start up
         await asyncio.sleep(2)
         logger.info("Starting initial sync in background (server is now accessible)")
+        set_request_priority(BACKGROUND)
         await self._perform_initial_sync()
 
+    def _embedding_models_match(self) -> bool:
+        """
+        Whether Cloudflare's Vectorize embeddings can be stored locally as-is.
+
+        Workers AI and sentence-transformers name the same model differently
+        ("@cf/baai/bge-base-en-v1.5" vs "BAAI/bge-base-en-v1.5"), so only the
+        final path segment is compared, together with the vector dimension.
+        """
+        if not HYBRID_PULL_REUSE_EMBEDDINGS or not hasattr(self.secondary, 'get_vectors_by_ids'):
+            return False
+        local_model = getattr(self.primary, 'embedding_model_name', None)
+        remote_model = getattr(self.secondary, 'embedding_model', None)
+        if not isinstance(local_model, str) or not isinstance(remote_model, str):
+            return False
+        return local_model.split('/')[-1].lower() == remote_model.split('/')[-1].lower()
+
+    async def _load_pull_checkpoint(self) -> Optional[Dict[str, Any]]:
+        """Load the checkpoint left by an interrupted Cloudflare pull, if any."""
+        if not hasattr(self.primary, 'get_metadata_value'):
+            return None
+        try:
+            value = await self.primary.get_metadata_value(PULL_CHECKPOINT_KEY)
+            return json.loads(value) if value else None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable pull checkpoint: {e}")
+            return None
+
+    async def _save_pull_checkpoint(self, state: Optional[Dict[str, Any]]) -> None:
+        """Persist (or with None, clear) the Cloudflare pull checkpoint."""
+        if not hasattr(self.primary, 'set_metadata_value'):
+            return
+        try:
+            await self.primary.set_metadata_value(
+                PULL_CHECKPOINT_KEY, json.dumps(state) if state is not None else None
+            )
+        except Exception as e:
+            logger.warning(f"Failed to save pull checkpoint: {e}")
+
+    async def _store_pulled_memories(self, memories: List[Memory], reuse_embeddings: bool) -> List[str]:
+        """
+        Insert memories pulled from Cloudflare in one local transaction.
+
+        Pulled memories already passed dedup and conflict checks when they were
+        first stored, so they go through store_batch rather than store(). When
+        the embedding models match, Vectorize's vectors are reused instead of
+        re-embedding locally.
+
+        Returns:
+            Content hashes that are now present locally
+        """
+        embeddings = None
+        if reuse_embeddings:
+            try:
+                vectors = await self.secondary.get_vectors_by_ids([m.content_hash for m in memories])
+                embeddings = [vectors.get(m.content_hash) for m in memories]
+            except Exception as e:
+                logger.warning(f"Could not fetch Vectorize embeddings, embedding locally: {e}")
+
+        if hasattr(self.primary, 'store_batch'):
+            if embeddings is not None:
+                results = await self.primary.store_batch(memories, embeddings=embeddings)
+            else:
+                results = await self.primary.store_batch(memories)
+        else:
+            results = [await self.primary.store(m, skip_semantic_dedup=True) for m in memories]
+
+        stored = []
+        for memory, (success, message) in zip(memories, results):
+            if success:
+                stored.append(memory.content_hash)
+            elif "Duplicate" not in message:
+                logger.warning(f"Failed to sync memory {memory.content_hash}: {message}")
+        return stored
+
     async def _sync_memories_from_cloudflare(
         self,
         sync_type: str = "initial",
@@ -1090,7 +1250,18 @@ class HybridMemoryStorage(MemoryStorage):
 
             logger.info(f"{sync_type.capitalize()} sync: Local={primary_count}, Cloudflare={secondary_count}")
 
-            if secondary_count <= primary_count:
+            # Hash-range digests name exactly which memories are missing or newer in
+            # Cloudflare, so only those are fetched instead of paging the whole corpus.
+            digest_diff = await self.sync_service._reconcile_digests() if self.sync_service else None
+            pending_hashes = None
+            if digest_diff is not None:
+                pending_hashes = list(digest_diff.missing_local)
+                if enable_drift_check:
+                    pending_hashes += digest_diff.newer_remote
+
+            if (pending_hashes is not None and not pending_hashes) or (
+                pending_hashes is None and secondary_count <= primary_count
+            ):
                 logger.info(f"No new memories to sync from Cloudflare ({sync_type} sync)")
                 return {
                     'success': True,
@@ -1106,176 +1277,224 @@ class HybridMemoryStorage(MemoryStorage):
             batch_size = min(500, self.batch_size * 5)  # 5x larger batches for sync
             cursor = None
             processed_count = 0
+            fetch_offset = 0
+            pending_offset = 0
             consecutive_empty_batches = 0
-
-            # Get all local hashes once for O(1) lookup
-            local_hashes = await self.primary.get_all_content_hashes()
+            use_cursor = pending_hashes is None and hasattr(self.secondary, 'get_all_memories_cursor')
+            completed = False
+
+            if pending_hashes is not None:
+                # Everything outside pending_hashes is known to match; drifted
+                # hashes are the only ones present locally.
+                missing_count = len(digest_diff.missing_local)
+                local_hashes = set(digest_diff.newer_remote)
+                deleted_hashes = None
+            else:
+                # Get all local hashes once for O(1) lookup; tombstones are the
+                # hashes that only show up when soft-deleted rows are included.
+                local_hashes = await self.primary.get_all_content_hashes()
+                deleted_hashes = await self.primary.get_all_content_hashes(include_deleted=True) - local_hashes
+
+            if use_cursor:
+                checkpoint = await self._load_pull_checkpoint()
+                if checkpoint and checkpoint.get('sync_type') != sync_type:
+                    # Another kind of pull left it; its cursor does not apply here
+                    logger.info(f"Discarding {checkpoint.get('sync_type')} sync checkpoint before {sync_type} sync")
+                    await self._save_pull_checkpoint(None)
+                elif checkpoint and checkpoint.get('cursor') is not None:
+                    cursor = checkpoint['cursor']
+                    processed_count = checkpoint.get('processed', 0)
+                    logger.info(f"Resuming {sync_type} sync from checkpoint: cursor={cursor}, processed={processed_count}")
             logger.info(f"Pulling {missing_count} potential memories from Cloudflare...")
 
-            while True:
-                try:
-                    # Get batch from Cloudflare using cursor-based pagination
-                    logger.debug(f"Fetching batch: cursor={cursor}, batch_size={batch_size}")
-
-                    if hasattr(self.secondary, 'get_all_memories_cursor'):
-                        cloudflare_memories = await self.secondary.get_all_memories_cursor(
-                            limit=batch_size,
-                            cursor=cursor
-                        )
-                    else:
-                        cloudflare_memories = await self.secondary.get_all_memories(
-                            limit=batch_size,
-                            offset=processed_count
-                        )
-
-                    if not cloudflare_memories:
-                        logger.debug(f"No more memories from Cloudflare at cursor {cursor}")
-                        break
-
-                    logger.debug(f"Processing batch of {len(cloudflare_memories)} memories")
-                    batch_checked = 0
-                    batch_missing = 0
-                    batch_synced = 0
-
-                    # Parallel processing with concurrency limit
-                    semaphore = asyncio.Semaphore(15)
-
-                    async def sync_single_memory(cf_memory):
-                        """Process a single memory with concurrency control."""
-                        nonlocal batch_checked, batch_missing, batch_synced, synced_count, processed_count
-
-                        async with semaphore:
-                            batch_checked += 1
-                            processed_count += 1
-                            try:
-                                # Fast O(1) existence check
-                                if cf_memory.content_hash not in local_hashes:
-                                    # Defense-in-depth: Skip if Cloudflare record itself is soft-deleted
-                                    # (should not happen if queries filter correctly, but prevents edge cases)
-                                    cf_deleted_at = getattr(cf_memory, 'deleted_at', None)
-                                    if cf_deleted_at is None and cf_memory.metadata:
-                                        cf_deleted_at = cf_memory.metadata.get('deleted_at')
-                                    if cf_deleted_at is not None:
-                                        logger.debug(f"Memory {cf_memory.content_hash[:8]} is soft-deleted in Cloudflare, skipping")
-                                        return ('skipped_deleted', cf_memory.content_hash, None)
-
-                                    # Check if memory was soft-deleted locally (tombstone check)
-                                    # This prevents re-syncing memories that were intentionally deleted
-                                    if hasattr(self.primary, 'is_deleted') and await self.primary.is_deleted(cf_memory.content_hash):
-                                        logger.debug(f"Memory {cf_memory.content_hash[:8]} was deleted locally, skipping cloud sync")
-                                        # Propagate deletion to cloud if sync service available
-                                        if self.sync_service:
-                                            operation = SyncOperation(operation='delete', content_hash=cf_memory.content_hash)
-                                            await self.sync_service.enqueue_operation(operation)
-                                        return ('tombstone', cf_memory.content_hash, None)
-
-                                    batch_missing += 1
-                                    # Memory doesn't exist locally, sync it
-                                    success, message = await self.primary.store(cf_memory)
-                                    if success:
-                                        batch_synced += 1
-                                        synced_count += 1
-                                        local_hashes.add(cf_memory.content_hash)  # Update cache
-
-                                        if sync_type == "initial":
-                                            self.initial_sync_completed = synced_count
-
-                                        if synced_count % 10 == 0:
-                                            logger.info(f"{sync_type.capitalize()} sync progress: {synced_count}/{missing_count} memories synced")
-
-                                            # Broadcast SSE progress event
-                                            if broadcast_sse and SSE_AVAILABLE:
-                                                try:
-                                                    progress_event = create_sync_progress_event(
-                                                        synced_count=synced_count,
-                                                        total_count=missing_count,
-                                                        sync_type=sync_type
-                                                    )
-                                                    await sse_manager.broadcast_event(progress_event)
-                                                except Exception as e:
-                                                    logger.debug(f"Failed to broadcast SSE progress: {e}")
-
-                                        return ('synced', cf_memory.content_hash, None)
-                                    else:
-                                        logger.warning(f"Failed to sync memory {cf_memory.content_hash}: {message}")
-                                        return ('failed', cf_memory.content_hash, message)
-                                elif enable_drift_check and self.sync_service and self.sync_service.drift_check_enabled:
-                                    # Memory exists - check for metadata drift
-                                    existing = await self.primary.get_by_hash(cf_memory.content_hash)
-                                    if existing:
-                                        cf_updated = cf_memory.updated_at or 0
-                                        local_updated = existing.updated_at or 0
-
-                                        # If Cloudflare version is newer, sync metadata
-                                        if cf_updated > local_updated + 1.0:
-                                            logger.debug(f"Metadata drift detected: {cf_memory.content_hash[:8]}")
-                                            success, _ = await self.primary.update_memory_metadata(
-                                                cf_memory.content_hash,
-                                                {
-                                                    'tags': cf_memory.tags,
-                                                    'memory_type': cf_memory.memory_type,
-                                                    'metadata': cf_memory.metadata,
-                                                    'created_at': cf_memory.created_at,
-                                                    'created_at_iso': cf_memory.created_at_iso,
-                                                    'updated_at': cf_memory.updated_at,
-                                                    'updated_at_iso': cf_memory.updated_at_iso,
-                                                },
-                                                preserve_timestamps=False
-                                            )
-                                            if success:
-                                                batch_synced += 1
-                                                synced_count += 1
-                                                logger.debug(f"Synced metadata for: {cf_memory.content_hash[:8]}")
-                                                return ('drift_synced', cf_memory.content_hash, None)
-                                return ('skipped', cf_memory.content_hash, None)
-                            except Exception as e:
-                                logger.warning(f"Error syncing memory {cf_memory.content_hash}: {e}")
-                                return ('error', cf_memory.content_hash, str(e))
-
-                    # Process batch in parallel
-                    tasks = [sync_single_memory(mem) for mem in cloudflare_memories]
-                    results = await asyncio.gather(*tasks, return_exceptions=True)
-                    for result in results:
-                        if isinstance(result, Exception):
-                            logger.error(f"Error during {sync_type} sync batch processing: {result}")
-
-                    logger.debug(f"Batch complete: checked={batch_checked}, missing={batch_missing}, synced={batch_synced}")
-
-                    # Track consecutive empty batches
-                    if batch_synced == 0:
-                        consecutive_empty_batches += 1
-                        logger.debug(f"Empty batch: consecutive={consecutive_empty_batches}/{HYBRID_MAX_EMPTY_BATCHES}")
-                    else:
-                        consecutive_empty_batches = 0
+            reuse_embeddings = self._embedding_models_match()
+
+            async def fetch_page(page_cursor, page_offset):
+                """Fetch the next page of Cloudflare memories."""
+                nonlocal pending_offset
+                if pending_hashes is not None:
+                    while pending_offset < len(pending_hashes):
+                        page = pending_hashes[pending_offset:pending_offset + batch_size]
+                        pending_offset += len(page)
+                        memories = await self.sync_service._fetch_secondary_by_hashes(page)
+                        if memories:
+                            return memories
+                        # Hashes vanished (deleted remotely meanwhile) - move to the next page
+                    return []
+                if use_cursor:
+                    return await self.secondary.get_all_memories_cursor(limit=batch_size, cursor=page_cursor)
+                return await self.secondary.get_all_memories(limit=batch_size, offset=page_offset)
+
+            async def is_tombstoned(content_hash):
+                if deleted_hashes is not None:
+                    return content_hash in deleted_hashes
+                return hasattr(self.primary, 'is_deleted') and await self.primary.is_deleted(content_hash)
+
+            semaphore = asyncio.Semaphore(15)
+
+            async def sync_drift(cf_memory):
+                """Apply newer Cloudflare metadata to an existing local memory."""
+                async with semaphore:
+                    existing = await self.primary.get_by_hash(cf_memory.content_hash)
+                    if not existing:
+                        return False
+                    cf_updated = cf_memory.updated_at or 0
+                    local_updated = existing.updated_at or 0
+
+                    # If Cloudflare version is newer, sync metadata
+                    if cf_updated <= local_updated + 1.0:
+                        return False
+                    logger.debug(f"Metadata drift detected: {cf_memory.content_hash[:8]}")
+                    success, _ = await self.primary.update_memory_metadata(
+                        cf_memory.content_hash,
+                        {
+                            'tags': cf_memory.tags,
+                            'memory_type': cf_memory.memory_type,
+                            'metadata': cf_memory.metadata,
+                            'created_at': cf_memory.created_at,
+                            'created_at_iso': cf_memory.created_at_iso,
+                            'updated_at': cf_memory.updated_at,
+                            'updated_at_iso': cf_memory.updated_at_iso,
+                        },
+                        preserve_timestamps=False
+                    )
+                    return success
 
-                    # Log progress summary
-                    if processed_count > 0 and processed_count % 100 == 0:
-                        logger.info(f"Sync progress: processed={processed_count}, synced={synced_count}/{missing_count}")
+            check_drift = enable_drift_check and self.sync_service and self.sync_service.drift_check_enabled
+            pull_start_time = time.time()
+            next_page = asyncio.create_task(fetch_page(cursor, fetch_offset))
 
-                    # Update cursor for next batch
-                    if cloudflare_memories and hasattr(self.secondary, 'get_all_memories_cursor'):
-                        cursor = min(memory.created_at for memory in cloudflare_memories if memory.created_at)
-                        logger.debug(f"Next cursor: {cursor}")
+            try:
+                while True:
+                    try:
+                        cloudflare_memories = await next_page
+                        if not cloudflare_memories:
+                            logger.debug(f"No more memories from Cloudflare at cursor {cursor}")
+                            completed = True
+                            break
+
+                        # Start fetching the next page while this one is stored locally
+                        if use_cursor:
+                            cursor = min(memory.created_at for memory in cloudflare_memories if memory.created_at)
+                            logger.debug(f"Next cursor: {cursor}")
+                        fetch_offset += len(cloudflare_memories)
+                        next_page = asyncio.create_task(fetch_page(cursor, fetch_offset))
+
+                        logger.debug(f"Processing batch of {len(cloudflare_memories)} memories")
+                        processed_count += len(cloudflare_memories)
+                        to_store = []
+                        drift_candidates = []
+                        for cf_memory in cloudflare_memories:
+                            if cf_memory.content_hash in local_hashes:
+                                if check_drift:
+                                    drift_candidates.append(cf_memory)
+                                continue
+
+                            # Defense-in-depth: Skip if Cloudflare record itself is soft-deleted
+                            # (should not happen if queries filter correctly, but prevents edge cases)
+                            cf_deleted_at = getattr(cf_memory, 'deleted_at', None)
+                            if cf_deleted_at is None and cf_memory.metadata:
+                                cf_deleted_at = cf_memory.metadata.get('deleted_at')
+                            if cf_deleted_at is not None:
+                                logger.debug(f"Memory {cf_memory.content_hash[:8]} is soft-deleted in Cloudflare, skipping")
+                                continue
+
+                            # Check if memory was soft-deleted locally (tombstone check)
+                            # This prevents re-syncing memories that were intentionally deleted
+                            if await is_tombstoned(cf_memory.content_hash):
+                                logger.debug(f"Memory {cf_memory.content_hash[:8]} was deleted locally, skipping cloud sync")
+                                # Propagate deletion to cloud if sync service available
+                                if self.sync_service:
+                                    operation = SyncOperation(operation='delete', content_hash=cf_memory.content_hash)
+                                    await self.sync_service.enqueue_operation(operation)
+                                continue
+
+                            to_store.append(cf_memory)
+
+                        batch_synced = 0
+                        if to_store:
+                            stored_hashes = await self._store_pulled_memories(to_store, reuse_embeddings)
+                            local_hashes.update(stored_hashes)
+                            batch_synced += len(stored_hashes)
+
+                        if drift_candidates:
+                            results = await asyncio.gather(
+                                *[sync_drift(mem) for mem in drift_candidates], return_exceptions=True
+                            )
+                            for result in results:
+                                if isinstance(result, Exception):
+                                    logger.warning(f"Error during {sync_type} sync drift check: {result}")
+                                elif result:
+                                    batch_synced += 1
+
+                        synced_count += batch_synced
+                        if sync_type == "initial":
+                            self.initial_sync_completed = synced_count
+
+                        logger.debug(f"Batch complete: checked={len(cloudflare_memories)}, missing={len(to_store)}, synced={batch_synced}")
+
+                        if use_cursor:
+                            await self._save_pull_checkpoint({
+                                'sync_type': sync_type,
+                                'cursor': cursor,
+                                'processed': processed_count,
+                                'saved_at': time.time(),
+                            })
+
+                        if batch_synced:
+                            elapsed = max(time.time() - pull_start_time, 1e-6)
+                            rate = synced_count / elapsed
+                            eta = max(missing_count - synced_count, 0) / rate if rate > 0 else None
+                            logger.info(
+                                f"{sync_type.capitalize()} sync progress: {synced_count}/{missing_count} memories synced "
+                                f"({rate:.1f}/s)"
+                            )
+
+                            # Broadcast SSE progress event
+                            if broadcast_sse and SSE_AVAILABLE:
+                                try:
+                                    progress_event = create_sync_progress_event(
+                                        synced_count=synced_count,
+                                        total_count=missing_count,
+                                        sync_type=sync_type,
+                                        memories_per_second=rate,
+                                        eta_seconds=eta
+                                    )
+                                    await sse_manager.broadcast_event(progress_event)
+                                except Exception as e:
+                                    logger.debug(f"Failed to broadcast SSE progress: {e}")
+
+                        # Track consecutive empty batches
+                        if batch_synced == 0:
+                            consecutive_empty_batches += 1
+                            logger.debug(f"Empty batch: consecutive={consecutive_empty_batches}/{HYBRID_MAX_EMPTY_BATCHES}")
+                        else:
+                            consecutive_empty_batches = 0
+
+                        # Early break conditions
+                        if consecutive_empty_batches >= HYBRID_MAX_EMPTY_BATCHES and synced_count > 0:
+                            logger.info(f"Completed after {consecutive_empty_batches} empty batches - {synced_count}/{missing_count} synced")
+                            completed = True
+                            break
+                        elif processed_count >= secondary_count and synced_count == 0:
+                            logger.info(f"No missing memories after checking all {processed_count} memories")
+                            completed = True
+                            break
 
-                    # Early break conditions
-                    if consecutive_empty_batches >= HYBRID_MAX_EMPTY_BATCHES and synced_count > 0:
-                        logger.info(f"Completed after {consecutive_empty_batches} empty batches - {synced_count}/{missing_count} synced")
-                        break
-                    elif processed_count >= secondary_count and synced_count == 0:
-                        logger.info(f"No missing memories after checking all {processed_count} memories")
+                    except Exception as e:
+                        # Handle Cloudflare D1 errors; the checkpoint is kept so the next run resumes
+                        if "400" in str(e) and not hasattr(self.secondary, 'get_all_memories_cursor'):
+                            logger.error(f"D1 OFFSET limitation at processed_count={processed_count}: {e}")
+                            logger.warning("Cloudflare D1 OFFSET limits reached - sync incomplete")
+                        else:
+                            logger.error(f"Error during {sync_type} sync: {e}")
                         break
+            finally:
+                if not next_page.done():
+                    next_page.cancel()
 
-                    await asyncio.sleep(0.01)
-
-                except Exception as e:
-                    # Handle Cloudflare D1 errors
-                    if "400" in str(e) and not hasattr(self.secondary, 'get_all_memories_cursor'):
-                        logger.error(f"D1 OFFSET limitation at processed_count={processed_count}: {e}")
-                        logger.warning("Cloudflare D1 OFFSET limits reached - sync incomplete")
-                        break
-                    else:
-                        logger.error(f"Error during {sync_type} sync: {e}")
-                        break
+            if use_cursor and completed:
+                await self._save_pull_checkpoint(None)
 
             time_taken = time.time() - sync_start_time
             logger.info(f"{sync_type.capitalize()} sync completed: {synced_count} memories in {time_taken:.2f}s")
@@ -1396,6 +1615,10 @@ class HybridMemoryStorage(MemoryStorage):
         """Retrieve memories from primary storage (fast)."""
         return await self.primary.retrieve(query, n_results, tags, min_confidence=min_confidence, include_superseded=include_superseded)
 
+    async def retrieve_clustered(self, query: str, n_results: int = 5, probe: int = 4, include_superseded: bool = False) -> List[MemoryQueryResult]:
+        """Cluster-filtered semantic search in primary storage, which holds the cluster index."""
+        return await self.primary.retrieve_clustered(query, n_results, probe=probe, include_superseded=include_superseded)
+
     async def search(self, query: str, n_results: int = 5, min_similarity: float = 0.0) -> List[MemoryQueryResult]:
         """Search memories in primary storage."""
         return await self.primary.search(query, n_results)
@@ -1527,10 +1750,26 @@ class HybridMemoryStorage(MemoryStorage):
 
         return count, message
 
-    async def cleanup_duplicates(self) -> Tuple[int, str]:
-        """Clean up duplicates in primary storage."""
-        # Only cleanup primary, secondary will sync naturally
-        return await self.primary.cleanup_duplicates()
+    async def cleanup_duplicates(
+        self, near_duplicates: bool = False, threshold: float = 0.8
+    ) -> Tuple[int, str]:
+        """Clean up duplicates in primary storage and queue near-duplicate deletes for secondary sync."""
+        # Exact duplicates share the content hash of the memory that is kept,
+        # so they are only cleaned up in primary
+        count, message = await self.primary.cleanup_duplicates()
+        if not near_duplicates:
+            return count, message
+
+        deleted_hashes = await self.primary.cleanup_near_duplicates(threshold)
+        if deleted_hashes and self.sync_service:
+            for content_hash in deleted_hashes:
+                operation = SyncOperation(operation='delete', content_hash=content_hash)
+                await self.sync_service.enqueue_operation(operation)
+
+        count += len(deleted_hashes)
+        if count > 0:
+            return count, f"Successfully soft-deleted {count} duplicate memories"
+        return 0, "No duplicate memories found"
 
     async def update_memory_metadata(self, content_hash: str, updates: Dict[str, Any], preserve_timestamps: bool = True) -> Tuple[bool, str]:
         """Update memory metadata in primary storage and queue for secondary sync."""
@@ -1651,6 +1890,10 @@ class HybridMemoryStorage(MemoryStorage):
         """
         return await self.primary.get_memory_timestamps(days)
 
+    async def get_graph_importance(self, memory_hashes: List[str]) -> Dict[str, float]:
+        """Precomputed graph importance, read from primary storage (SQLite-vec)."""
+        return await self.primary.get_graph_importance(memory_hashes)
+
     async def get_relationship_type_distribution(self) -> Dict[str, int]:
         """
         Get distribution of relationship types in the knowledge graph.
@@ -1681,6 +1924,24 @@ class HybridMemoryStorage(MemoryStorage):
         """
         return await self.primary.get_graph_visualization_data(limit, min_connections)
 
+    async def get_graph_view(
+        self,
+        node_budget: int = 200,
+        rank_by: str = "degree",
+        min_connections: int = 1
+    ) -> Dict[str, Any]:
+        """Level-of-detail graph for visualization. Delegates to primary storage (SQLite-vec)."""
+        return await self.primary.get_graph_view(node_budget, rank_by, min_connections)
+
+    async def expand_graph_node(
+        self,
+        content_hash: str,
+        limit: int = 50,
+        offset: int = 0
+    ) -> Dict[str, Any]:
+        """One page of a memory's graph neighbors. Delegates to primary storage (SQLite-vec)."""
+        return await self.primary.expand_graph_node(content_hash, limit, offset)
+
     async def recall(self, query: Optional[str] = None, n_results: int = 5, start_timestamp: Optional[float] = None, end_timestamp: Optional[float] = None) -> List[MemoryQueryResult]:
         """
         Retrieve memories with combined time filtering and optional semantic search.
@@ -1748,6 +2009,19 @@ class HybridMemoryStorage(MemoryStorage):
             start_time, end_time, include_embeddings=include_embeddings,
         )
 
+    async def iter_memories_for_consolidation(
+        self,
+        cutoff_timestamp: Optional[float] = None,
+        chunk_size: int = 1000,
+        limit: Optional[int] = None,
+        start_key: Optional[float] = None,
+    ) -> AsyncIterator[List[Memory]]:
+        """Stream memories in consolidation order from primary storage."""
+        async for chunk in self.primary.iter_memories_for_consolidation(
+            cutoff_timestamp=cutoff_timestamp, chunk_size=chunk_size, limit=limit, start_key=start_key,
+        ):
+            yield chunk
+
     async def close(self):
         """Clean shutdown of hybrid storage system."""
         logger.info("Shutting down hybrid memory storage...")
@@ -1812,11 +2086,12 @@ class HybridMemoryStorage(MemoryStorage):
             - time_taken_seconds: float
         """
         # Call shared helper method without drift checking (manual sync doesn't need it)
-        result = await self._sync_memories_from_cloudflare(
-            sync_type="manual",
-            broadcast_sse=True,
-            enable_drift_check=False
-        )
+        with background_priority():
+            result = await self._sync_memories_from_cloudflare(
+                sync_type="manual",
+                broadcast_sse=True,
+                enable_drift_check=False
+            )
 
         # Map result to expected return format
         return {
@@ -1986,12 +2261,12 @@ class HybridMemoryStorage(MemoryStorage):
         success, _ = await self.delete(content_hash)
         return success
 
-    async def get_memory_connections(self) -> Dict[str, int]:
+    async def get_memory_connections(self, memory_hashes: Optional[List[str]] = None) -> Dict[str, int]:
         """Get memory connection statistics (consolidation protocol).
 
         Proxies to primary storage.
         """
-        return await self.primary.get_memory_connections()
+        return await self.primary.get_memory_connections(memory_hashes=memory_hashes)
 
     async def get_access_patterns(self) -> Dict[str, datetime]:
         """Get memory access pattern statistics (consolidation protocol).
@@ -35,6 +35,7 @@ Design notes:
 """
 
 import asyncio
+import contextlib
 import json
 import logging
 import math
@@ -246,6 +247,7 @@ class MilvusMemoryStorage(MemoryStorage):
         token: Optional[str] = None,
         collection_name: str = "mcp_memory",
         embedding_model: str = "all-MiniLM-L6-v2",
+        read_pool_size: Optional[int] = None,
     ):
         if not PYMILVUS_AVAILABLE:
             raise ImportError(
@@ -289,13 +291,23 @@ class MilvusMemoryStorage(MemoryStorage):
         # Remote backends don't have that problem and must fail fast instead.
         self._is_lite = bool(self.uri and self.uri.endswith(".db"))
 
-        # Single lock per storage instance. Every CRUD call acquires this
-        # once in :meth:`_call_client`. pymilvus's sync gRPC channel is not
-        # safe under concurrent access from multiple worker threads against
-        # Milvus Lite, and every write_lock holder also holds the sole right
-        # to invoke the client — one lock is both enough and necessary.
+        # Single lock per storage instance. Every write acquires this once in
+        # :meth:`_call_client`. pymilvus's sync gRPC channel is not safe under
+        # concurrent access from multiple worker threads against Milvus Lite,
+        # so on Lite every read also takes it and the write_lock holder has
+        # the sole right to invoke the client.
         self._write_lock = asyncio.Lock()
 
+        # Remote Milvus / Zilliz Cloud serve concurrent RPCs fine, so reads
+        # there check out one of ``read_pool_size`` dedicated clients instead
+        # of queueing behind inserts on the write lock (see _read_client).
+        # The pool is built in initialize(); Lite never gets one.
+        if read_pool_size is None:
+            read_pool_size = int(os.getenv("MCP_MILVUS_READ_POOL_SIZE", "4"))
+        self.read_pool_size = max(1, read_pool_size)
+        self._read_clients: List[Any] = []
+        self._read_pool: Optional[asyncio.Queue] = None
+
         # Semantic deduplication — mirrors sqlite_vec knobs/env vars so
         # backends behave identically from the service layer's perspective.
         self.semantic_dedup_enabled = (
@@ -329,6 +341,11 @@ class MilvusMemoryStorage(MemoryStorage):
         await asyncio.to_thread(self._connect_client)
         await asyncio.to_thread(self._ensure_collection)
         await asyncio.to_thread(self._ensure_access_collection)
+        if not self._is_lite:
+            self._read_clients = await asyncio.to_thread(self._connect_read_clients)
+            self._read_pool = asyncio.Queue()
+            for client in self._read_clients:
+                self._read_pool.put_nowait(client)
 
         self._initialized = True
         logger.info(
@@ -342,6 +359,17 @@ class MilvusMemoryStorage(MemoryStorage):
             kwargs["token"] = self.token
         self.client = MilvusClient(**kwargs)
 
+    def _connect_read_clients(self) -> List[Any]:
+        """Build the read-only client pool for a remote Milvus endpoint.
+
+        ``dedicated=True`` gives each pooled client its own gRPC channel
+        (pymilvus ≥ 2.6 otherwise shares one connection per uri/token).
+        """
+        kwargs: Dict[str, Any] = {"uri": self.uri, "dedicated": True}
+        if self.token:
+            kwargs["token"] = self.token
+        return [MilvusClient(**kwargs) for _ in range(self.read_pool_size)]
+
     def _ensure_collection(self) -> None:
         """Create the collection if it does not already exist.
 
@@ -729,6 +757,8 @@ class MilvusMemoryStorage(MemoryStorage):
         * Every invocation holds ``self._write_lock`` (one lock per storage
           instance) — pymilvus's sync gRPC channel is not safe under
           concurrent access from multiple worker threads against Milvus Lite.
+          Read-only RPCs go through :meth:`_call_reader`, which only takes
+          this lock on Lite.
         * The sync pymilvus method runs via ``asyncio.to_thread`` so it
           doesn't block the event loop.
         * **Remote Milvus / Zilliz Cloud:** any RPC failure is logged with
@@ -775,6 +805,49 @@ class MilvusMemoryStorage(MemoryStorage):
             logger.exception("Milvus RPC failed on %s: %s", method_name, exc)
             raise
 
+    @contextlib.asynccontextmanager
+    async def _read_client(self):
+        """Yield a client that may run read-only RPCs for the block's duration.
+
+        * **Milvus Lite:** holds ``self._write_lock`` and yields
+          ``self.client`` — reads serialize with writes exactly as before.
+        * **Remote Milvus / Zilliz Cloud:** checks a client out of the read
+          pool without touching the write lock, so searches and iterator
+          drains run concurrently with each other and with in-flight inserts.
+          The pool size bounds the number of concurrent reads.
+        """
+        if self._read_pool is None:
+            async with self._write_lock:
+                if self.client is None:
+                    raise RuntimeError("MilvusMemoryStorage was not initialized")
+                yield self.client
+            return
+
+        client = await self._read_pool.get()
+        try:
+            yield client
+        finally:
+            self._read_pool.put_nowait(client)
+
+    async def _call_reader(self, method_name: str, *args, **kwargs):
+        """Invoke a read-only RPC (search / query / get / has_collection).
+
+        On Milvus Lite this is exactly :meth:`_call_client` (write lock plus
+        the dead-channel reconnect). On remote backends the call runs on a
+        pooled read client concurrently with other reads and writes; failures
+        are logged and re-raised, never retried.
+        """
+        if self._read_pool is None:
+            return await self._call_client(method_name, *args, **kwargs)
+        async with self._read_client() as client:
+            try:
+                return await asyncio.to_thread(
+                    getattr(client, method_name), *args, **kwargs
+                )
+            except Exception as exc:  # noqa: BLE001 — always log + re-raise
+                logger.exception("Milvus RPC failed on %s: %s", method_name, exc)
+                raise
+
     @staticmethod
     def _iso_from_epoch(epoch: float) -> str:
         """Render an epoch second value as an ISO-8601 UTC string."""
@@ -991,7 +1064,7 @@ class MilvusMemoryStorage(MemoryStorage):
             return False, None
 
         try:
-            results = await self._call_client(
+            results = await self._call_reader(
                 "search",
                 collection_name=self.collection_name,
                 data=[embedding],
@@ -1057,18 +1130,89 @@ class MilvusMemoryStorage(MemoryStorage):
             logger.error("Failed to store memory: %s\n%s", exc, traceback.format_exc())
             return False, f"Failed to store memory: {exc}"
 
-    async def _prepare_batch_entity(
-        self, memory: Memory
-    ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
-        """Build a single batch entity or return a failure message for it."""
-        try:
-            existing = await self.get_by_hash(memory.content_hash)
-            if existing is not None:
-                return None, "Duplicate content detected (exact match)"
-            embedding = self._generate_embedding(memory.content)
-        except Exception as exc:  # noqa: BLE001 — report per-item, don't abort the batch
-            return None, f"Failed to prepare memory: {exc}"
-        return self._memory_to_entity(memory, embedding), None
+    # Hashes per ``id in [...]`` dedup query. 64-char hashes keep the filter
+    # expression well under Milvus's expression-length limit.
+    _DEDUP_QUERY_CHUNK = 500
+    # Insert chunk bounds: row count and an estimated payload size kept well
+    # below the default 64 MB gRPC message limit.
+    _INSERT_CHUNK_ROWS = 1000
+    _INSERT_CHUNK_BYTES = 16 * 1024 * 1024
+
+    async def _existing_hashes(self, hashes: List[str]) -> set:
+        """Return the subset of ``hashes`` already stored, one query per chunk."""
+        existing: set = set()
+        for start in range(0, len(hashes), self._DEDUP_QUERY_CHUNK):
+            chunk = hashes[start:start + self._DEDUP_QUERY_CHUNK]
+            rows = await self._call_reader(
+                "query",
+                collection_name=self.collection_name,
+                filter=f"id in {json.dumps(chunk)}",
+                output_fields=["id"],
+                limit=len(chunk),
+            )
+            existing.update(row["id"] for row in rows or [] if row.get("id"))
+        return existing
+
+    def _generate_embeddings(
+        self, texts: List[str]
+    ) -> List[Tuple[Optional[List[float]], Optional[str]]]:
+        """Batch counterpart of :meth:`_generate_embedding` (sync).
+
+        Cache hits are served from the LRU; every miss goes through a single
+        ``encode`` call. Returns one ``(embedding, error)`` pair per text so
+        an invalid vector only fails its own item.
+        """
+        if not self.embedding_model:
+            raise RuntimeError("Embedding model not loaded. Call initialize() first.")
+
+        keys = [f"{self.embedding_model_name}::{text}" for text in texts]
+        results: List[Tuple[Optional[List[float]], Optional[str]]] = [
+            (_embedding_cache_get(key), None) for key in keys
+        ]
+        misses = [i for i, (embedding, _) in enumerate(results) if embedding is None]
+        if not misses:
+            return results
+
+        raw = self.embedding_model.encode(
+            [texts[i] for i in misses], convert_to_numpy=True
+        )
+        for i, vector in zip(misses, raw):
+            embedding = vector.tolist() if hasattr(vector, "tolist") else list(vector)
+            try:
+                self._validate_embedding(embedding)
+            except ValueError as exc:
+                results[i] = (None, str(exc))
+                continue
+            _embedding_cache_put(keys[i], embedding)
+            results[i] = (embedding, None)
+        return results
+
+    def _estimate_entity_bytes(self, entity: Dict[str, Any]) -> int:
+        """Rough wire size of one entity for insert chunking."""
+        text_bytes = sum(
+            len(entity.get(field) or "")
+            for field in ("content", "content_lower", "tags", "metadata")
+        )
+        return text_bytes * 2 + self.embedding_dimension * 4 + 256
+
+    def _insert_chunks(
+        self, entities: List[Dict[str, Any]]
+    ) -> List[Tuple[int, int]]:
+        """Split ``entities`` into ``(start, end)`` ranges within the insert limits."""
+        chunks: List[Tuple[int, int]] = []
+        start, size = 0, 0
+        for idx, entity in enumerate(entities):
+            entity_bytes = self._estimate_entity_bytes(entity)
+            if idx > start and (
+                idx - start >= self._INSERT_CHUNK_ROWS
+                or size + entity_bytes > self._INSERT_CHUNK_BYTES
+            ):
+                chunks.append((start, idx))
+                start, size = idx, 0
+            size += entity_bytes
+        if start < len(entities):
+            chunks.append((start, len(entities)))
+        return chunks
 
     async def _flush_batch_insert(
         self,
@@ -1076,39 +1220,75 @@ class MilvusMemoryStorage(MemoryStorage):
         to_insert: List[Dict[str, Any]],
         insert_indices: List[int],
     ) -> None:
-        """Commit a prepared batch and update ``results`` in place."""
-        if not to_insert:
-            return
-        try:
-            await self._call_client(
-                "insert",
-                collection_name=self.collection_name,
-                data=to_insert,
-            )
-            outcome = (True, "Memory stored successfully")
-        except Exception as exc:  # noqa: BLE001 — whole batch failed
-            logger.error("Milvus batch insert failed: %s", exc)
-            outcome = (False, f"Failed to store memory: {exc}")
-        for idx in insert_indices:
-            results[idx] = outcome
+        """Commit a prepared batch in size-bounded chunks and update ``results``
+        in place. A failed chunk only fails its own items."""
+        for start, end in self._insert_chunks(to_insert):
+            try:
+                await self._call_client(
+                    "insert",
+                    collection_name=self.collection_name,
+                    data=to_insert[start:end],
+                )
+                outcome = (True, "Memory stored successfully")
+            except Exception as exc:  # noqa: BLE001 — whole chunk failed
+                logger.error("Milvus batch insert failed: %s", exc)
+                outcome = (False, f"Failed to store memory: {exc}")
+            for idx in insert_indices[start:end]:
+                results[idx] = outcome
 
     async def store_batch(self, memories: List[Memory]) -> List[Tuple[bool, str]]:
+        """Store many memories with one dedup query per chunk of hashes, one
+        batched ``encode`` and chunked inserts.
+
+        Returns one ``(success, message)`` per input, in order. Exact
+        duplicates — of stored memories or of an earlier item in the same
+        batch — are reported per item; semantic dedup is not applied.
+        """
         if not memories:
             return []
         if not self._ensure_initialized():
             return [(False, "Milvus storage not initialized")] * len(memories)
 
         results: List[Tuple[bool, str]] = [(False, "not processed")] * len(memories)
-        to_insert: List[Dict[str, Any]] = []
-        insert_indices: List[int] = []
+        duplicate = (False, "Duplicate content detected (exact match)")
 
+        try:
+            existing = await self._existing_hashes(
+                list(dict.fromkeys(m.content_hash for m in memories))
+            )
+        except Exception as exc:  # noqa: BLE001 — report per-item, don't raise
+            logger.error("Milvus batch dedup query failed: %s", exc)
+            return [(False, f"Failed to prepare memory: {exc}")] * len(memories)
+
+        pending: List[int] = []
+        seen = set(existing)
         for idx, memory in enumerate(memories):
-            entity, err = await self._prepare_batch_entity(memory)
-            if entity is None:
-                results[idx] = (False, err or "Failed to prepare memory")
+            if memory.content_hash in seen:
+                results[idx] = duplicate
             else:
-                to_insert.append(entity)
-                insert_indices.append(idx)
+                seen.add(memory.content_hash)
+                pending.append(idx)
+        if not pending:
+            return results
+
+        try:
+            embeddings = await asyncio.to_thread(
+                self._generate_embeddings, [memories[i].content for i in pending]
+            )
+        except Exception as exc:  # noqa: BLE001 — report per-item, don't raise
+            logger.error("Milvus batch embedding failed: %s", exc)
+            for idx in pending:
+                results[idx] = (False, f"Failed to generate embedding: {exc}")
+            return results
+
+        to_insert: List[Dict[str, Any]] = []
+        insert_indices: List[int] = []
+        for idx, (embedding, err) in zip(pending, embeddings):
+            if embedding is None:
+                results[idx] = (False, f"Failed to prepare memory: {err}")
+                continue
+            to_insert.append(self._memory_to_entity(memories[idx], embedding))
+            insert_indices.append(idx)
 
         await self._flush_batch_insert(results, to_insert, insert_indices)
         return results
@@ -1174,7 +1354,7 @@ class MilvusMemoryStorage(MemoryStorage):
     ) -> List[Dict[str, Any]]:
         """Execute a vector search with a tag filter, returning the raw hit list."""
         try:
-            search_results = await self._call_client(
+            search_results = await self._call_reader(
                 "search",
                 collection_name=self.collection_name,
                 data=[query_embedding],
@@ -1224,7 +1404,7 @@ class MilvusMemoryStorage(MemoryStorage):
                 expr=tag_filter if tag_filter else None,
             )
 
-            search_results = await self._call_client(
+            search_results = await self._call_reader(
                 "hybrid_search",
                 collection_name=self.collection_name,
                 reqs=[vector_req, bm25_req],
@@ -1544,7 +1724,7 @@ class MilvusMemoryStorage(MemoryStorage):
         return len(hashes), hashes
 
     async def _collect_hashes(self, filter_expr: str) -> List[str]:
-        rows = await self._call_client(
+        rows = await self._call_reader(
             "query",
             collection_name=self.collection_name,
             filter=filter_expr,
@@ -1560,7 +1740,7 @@ class MilvusMemoryStorage(MemoryStorage):
             return None
 
         try:
-            rows = await self._call_client(
+            rows = await self._call_reader(
                 "get",
                 collection_name=self.collection_name,
                 ids=[content_hash],
@@ -1606,7 +1786,11 @@ class MilvusMemoryStorage(MemoryStorage):
         needle = content.lower()
         return [m for m in memories if needle in (m.content or "").lower()]
 
-    async def cleanup_duplicates(self) -> Tuple[int, str]:
+    async def cleanup_duplicates(
+        self, near_duplicates: bool = False, threshold: float = 0.8
+    ) -> Tuple[int, str]:
+        if near_duplicates:
+            logger.warning("Near-duplicate cleanup is not supported by Milvus")
         # With content_hash as the primary key, Milvus rejects duplicate PKs
         # at insert time (upsert replaces in place), so there is nothing to
         # clean up. Keep the method for contract compliance.
@@ -1792,13 +1976,13 @@ class MilvusMemoryStorage(MemoryStorage):
         week_ago = time.time() - 7 * 24 * 60 * 60
 
         try:
-            total_rows = await self._call_client(
+            total_rows = await self._call_reader(
                 "query",
                 collection_name=self.collection_name,
                 filter="",
                 output_fields=["count(*)"],
             )
-            recent_rows = await self._call_client(
+            recent_rows = await self._call_reader(
                 "query",
                 collection_name=self.collection_name,
                 filter=f"created_at >= {week_ago}",
@@ -1842,7 +2026,7 @@ class MilvusMemoryStorage(MemoryStorage):
             return []
 
         try:
-            rows = await self._call_client(
+            rows = await self._call_reader(
                 "query",
                 collection_name=self.collection_name,
                 filter="",
@@ -1920,7 +2104,7 @@ class MilvusMemoryStorage(MemoryStorage):
             return await self._count_stale_memories(filter_expr, stale_days)
 
         try:
-            rows = await self._call_client(
+            rows = await self._call_reader(
                 "query",
                 collection_name=self.collection_name,
                 filter=filter_expr,
@@ -1945,16 +2129,14 @@ class MilvusMemoryStorage(MemoryStorage):
 
         # Drain both collections under a single lock acquisition to avoid deadlock
         try:
-            async with self._write_lock:
-                if self.client is None:
-                    return 0
+            async with self._read_client() as client:
                 all_rows = await asyncio.to_thread(
-                    self._drain_main_ids_and_created_at, base_filter,
+                    self._drain_main_ids_and_created_at, base_filter, client=client,
                 )
                 active_rows: List[Dict[str, Any]] = []
                 if self._has_access_collection:
                     active_rows = await asyncio.to_thread(
-                        self._drain_active_hashes, threshold,
+                        self._drain_active_hashes, threshold, client=client,
                     )
         except Exception as exc:  # noqa: BLE001
             logger.warning("_count_stale_memories failed: %s", exc)
@@ -2002,7 +2184,7 @@ class MilvusMemoryStorage(MemoryStorage):
             filter_expr = f"created_at >= {cutoff}"
 
         try:
-            rows = await self._call_client(
+            rows = await self._call_reader(
                 "query",
                 collection_name=self.collection_name,
                 filter=filter_expr,
@@ -2059,11 +2241,9 @@ class MilvusMemoryStorage(MemoryStorage):
             return {}
 
         try:
-            async with self._write_lock:
-                if self.client is None:
-                    return {}
+            async with self._read_client() as client:
                 rows = await asyncio.to_thread(
-                    self._drain_access_records,
+                    self._drain_access_records, client=client,
                 )
         except Exception as exc:  # noqa: BLE001
             logger.warning("get_access_patterns failed: %s", exc)
@@ -2077,10 +2257,11 @@ class MilvusMemoryStorage(MemoryStorage):
                 patterns[rid] = datetime.fromtimestamp(ts, tz=timezone.utc)
         return patterns
 
-    def _drain_access_records(self) -> List[Dict[str, Any]]:
+    def _drain_access_records(self, client: Optional[Any] = None) -> List[Dict[str, Any]]:
         """Sync helper that drains all rows from the _access collection."""
-        assert self.client is not None
-        iterator = self.client.query_iterator(
+        client = client or self.client
+        assert client is not None
+        iterator = client.query_iterator(
             collection_name=self._access_collection,
             filter="",
             output_fields=["id", "last_accessed"],
@@ -2100,10 +2281,13 @@ class MilvusMemoryStorage(MemoryStorage):
                 pass
         return rows
 
-    def _drain_main_ids_and_created_at(self, filter_expr: str) -> List[Dict[str, Any]]:
+    def _drain_main_ids_and_created_at(
+        self, filter_expr: str, client: Optional[Any] = None,
+    ) -> List[Dict[str, Any]]:
         """Sync helper that drains id + created_at from the main collection."""
-        assert self.client is not None
-        iterator = self.client.query_iterator(
+        client = client or self.client
+        assert client is not None
+        iterator = client.query_iterator(
             collection_name=self.collection_name,
             filter=filter_expr or "",
             output_fields=["id", "created_at"],
@@ -2123,10 +2307,13 @@ class MilvusMemoryStorage(MemoryStorage):
                 pass
         return rows
 
-    def _drain_active_hashes(self, threshold: float) -> List[Dict[str, Any]]:
+    def _drain_active_hashes(
+        self, threshold: float, client: Optional[Any] = None,
+    ) -> List[Dict[str, Any]]:
         """Sync helper that drains active (recently accessed) hashes from _access collection."""
-        assert self.client is not None
-        iterator = self.client.query_iterator(
+        client = client or self.client
+        assert client is not None
+        iterator = client.query_iterator(
             collection_name=self._access_collection,
             filter=f"last_accessed >= {threshold}",
             output_fields=["id"],
@@ -2146,40 +2333,60 @@ class MilvusMemoryStorage(MemoryStorage):
                 pass
         return rows
 
-    async def get_memory_connections(self) -> Dict[str, int]:
+    async def get_memory_connections(
+        self, memory_hashes: Optional[List[str]] = None,
+    ) -> Dict[str, int]:
         """Return connection counts per memory hash from the graph collection.
 
-        Queries ``{collection_name}_graph`` for all edges and counts how many
-        times each hash appears as either ``source_hash`` or ``target_hash``.
-        This enables the Forgetting engine to protect highly-connected
-        "hub" memories from premature archival.
+        Counts how many edge records in ``{collection_name}_graph`` each hash
+        appears in as either ``source_hash`` or ``target_hash``. This enables
+        the Forgetting engine to protect highly-connected "hub" memories from
+        premature archival.
 
-        Uses ``query_iterator`` to handle arbitrarily large graph collections
-        without hitting the single-query limit cap.
+        When ``MilvusGraphStorage`` maintains the ``{collection_name}_degree``
+        side-collection, counts come from there: a batched ``id in [...]``
+        query over ``memory_hashes``, or a scan of one row per connected
+        memory when no candidates are given. Graphs without it (created
+        before degree tracking, not yet rebuilt) fall back to draining every
+        edge via ``query_iterator``.
+
+        Args:
+            memory_hashes: Optional candidate hashes. When given, only these
+                are looked up and only these can appear in the result.
         """
         graph_collection = f"{self.collection_name}_graph"
+        degree_collection = f"{self.collection_name}_degree"
 
         if not self._ensure_initialized():
             return {}
 
-        # Check if graph collection exists
+        # Check which graph collections exist
         try:
-            has_graph = await self._call_client(
+            has_graph = await self._call_reader(
                 "has_collection",
                 collection_name=graph_collection,
             )
             if not has_graph:
                 return {}
+            has_degree = await self._call_reader(
+                "has_collection",
+                collection_name=degree_collection,
+            )
         except Exception:  # noqa: BLE001
             return {}
 
+        if has_degree:
+            try:
+                return await self._degree_connections(degree_collection, memory_hashes)
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("get_memory_connections: failed to query degree collection: %s", exc)
+                return {}
+
         # Drain all edges via QueryIterator (handles large graphs)
         try:
-            async with self._write_lock:
-                if self.client is None:
-                    return {}
+            async with self._read_client() as client:
                 rows = await asyncio.to_thread(
-                    self._drain_graph_edges, graph_collection,
+                    self._drain_graph_edges, graph_collection, client=client,
                 )
         except Exception as exc:  # noqa: BLE001
             logger.warning("get_memory_connections: failed to query graph collection: %s", exc)
@@ -2195,12 +2402,74 @@ class MilvusMemoryStorage(MemoryStorage):
             if tgt:
                 connections[tgt] = connections.get(tgt, 0) + 1
 
+        if memory_hashes is not None:
+            wanted = set(memory_hashes)
+            connections = {h: c for h, c in connections.items() if h in wanted}
         return connections
 
-    def _drain_graph_edges(self, graph_collection: str) -> List[Dict[str, Any]]:
+    # Hashes per ``id in [...]`` degree lookup.
+    _DEGREE_QUERY_CHUNK = 500
+
+    async def _degree_connections(
+        self, degree_collection: str, memory_hashes: Optional[List[str]],
+    ) -> Dict[str, int]:
+        """Read ``{hash: degree}`` from the degree side-collection."""
+        if memory_hashes is None:
+            async with self._read_client() as client:
+                rows = await asyncio.to_thread(
+                    self._drain_degrees, degree_collection, client=client,
+                )
+        else:
+            hashes = list(dict.fromkeys(memory_hashes))
+            rows = []
+            for start in range(0, len(hashes), self._DEGREE_QUERY_CHUNK):
+                chunk = hashes[start:start + self._DEGREE_QUERY_CHUNK]
+                rows.extend(await self._call_reader(
+                    "query",
+                    collection_name=degree_collection,
+                    filter=f"id in {json.dumps(chunk)}",
+                    output_fields=["id", "degree"],
+                    limit=len(chunk),
+                ) or [])
+        return {
+            row["id"]: int(row["degree"])
+            for row in rows
+            if row.get("id") and row.get("degree")
+        }
+
+    def _drain_degrees(
+        self, degree_collection: str, client: Optional[Any] = None,
+    ) -> List[Dict[str, Any]]:
+        """Sync helper that drains every row from the degree collection."""
+        client = client or self.client
+        assert client is not None
+        iterator = client.query_iterator(
+            collection_name=degree_collection,
+            filter="",
+            output_fields=["id", "degree"],
+            batch_size=self._QUERY_ITER_BATCH,
+        )
+        rows: List[Dict[str, Any]] = []
+        try:
+            while True:
+                batch = iterator.next()
+                if not batch:
+                    break
+                rows.extend(batch)
+        finally:
+            try:
+                iterator.close()
+            except Exception:  # noqa: BLE001
+                pass
+        return rows
+
+    def _drain_graph_edges(
+        self, graph_collection: str, client: Optional[Any] = None,
+    ) -> List[Dict[str, Any]]:
         """Sync helper that drains all edges from the graph collection."""
-        assert self.client is not None
-        iterator = self.client.query_iterator(
+        client = client or self.client
+        assert client is not None
+        iterator = client.query_iterator(
             collection_name=graph_collection,
             filter="",
             output_fields=["source_hash", "target_hash"],
@@ -2302,34 +2571,36 @@ class MilvusMemoryStorage(MemoryStorage):
     ) -> List[Dict[str, Any]]:
         """Collect every row matching ``filter_expr`` using ``QueryIterator``.
 
-        One lock-acquisition covers the full iteration so other coroutines
-        can't interleave RPCs on the shared pymilvus channel.
+        One :meth:`_read_client` checkout covers the full iteration, so on
+        Milvus Lite other coroutines can't interleave RPCs on the shared
+        pymilvus channel, and on remote backends the drain doesn't block writes.
 
         Args:
             include_embeddings: If True, request the ``vector`` field in
                 ``output_fields`` so :meth:`_entity_to_memory` can hydrate
                 ``Memory.embedding``.
         """
-        async with self._write_lock:
-            if self.client is None:
-                raise RuntimeError("MilvusMemoryStorage was not initialized")
+        async with self._read_client() as client:
             return await asyncio.to_thread(
                 self._drain_query_iterator, filter_expr, include_embeddings,
+                client=client,
             )
 
     def _drain_query_iterator(
         self,
         filter_expr: str,
         include_embeddings: bool = False,
+        client: Optional[Any] = None,
     ) -> List[Dict[str, Any]]:
         """Sync helper that drains a ``QueryIterator`` into a plain list."""
-        assert self.client is not None
+        client = client or self.client
+        assert client is not None
         fields = (
             self._OUTPUT_FIELDS_WITH_VECTOR
             if include_embeddings
             else self._OUTPUT_FIELDS_BASE
         )
-        iterator = self.client.query_iterator(
+        iterator = client.query_iterator(
             collection_name=self.collection_name,
             filter=filter_expr or "",
             output_fields=list(fields),
@@ -2352,6 +2623,13 @@ class MilvusMemoryStorage(MemoryStorage):
     # -- Teardown ------------------------------------------------------------
 
     async def close(self) -> None:
+        read_clients, self._read_clients = self._read_clients, []
+        self._read_pool = None
+        for client in read_clients:
+            try:
+                await asyncio.to_thread(client.close)
+            except Exception as exc:  # noqa: BLE001 — teardown must never raise
+                logger.debug("MilvusClient.close failed (ignored): %s", exc)
         if self.client is None:
             return
         try:
@@ -29,6 +29,12 @@ Design notes:
     (A:B and B:A); asymmetric relationships store only the forward edge.
   * Graph traversal (find_connected, shortest_path, get_subgraph) is
     implemented as application-layer BFS with per-level Milvus queries.
+  * A ``{collection}_degree`` side-collection holds one row per memory with
+    its edge-row count (as source plus as target). Edge upserts and deletes
+    maintain it incrementally so ``MilvusMemoryStorage.get_memory_connections``
+    can look up candidate hashes instead of draining every edge. Graphs that
+    predate it need a one-off ``rebuild_degree_collection()``
+    (scripts/maintenance/rebuild_milvus_degree.py).
 """
 
 import asyncio
@@ -36,7 +42,7 @@ import hashlib
 import json
 import logging
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 try:
     from pymilvus import MilvusClient, DataType
@@ -47,12 +53,16 @@ except ImportError:
     DataType = None  # type: ignore
 
 from ..models.ontology import is_symmetric_relationship, validate_relationship
+from .graph import expand_association_edges
 
 logger = logging.getLogger(__name__)
 
 # Milvus per-call result limit ceiling.
 _MILVUS_MAX_LIMIT = 16384
 
+# Hashes per ``id in [...]`` filter when reading/writing degree rows.
+_DEGREE_QUERY_CHUNK = 500
+
 # Dimension for the dummy vector field required by Zilliz Cloud / remote Milvus.
 # Zilliz Cloud rejects collections without at least one vector field.
 _DUMMY_VEC_DIM = 2
@@ -91,9 +101,15 @@ class MilvusGraphStorage:
         self.uri = uri
         self.token = token
         self.collection_name = f"{collection_name}_graph"
+        self.degree_collection_name = f"{collection_name}_degree"
         self.client: Optional[MilvusClient] = None
         self._lock = asyncio.Lock()
 
+        # Whether edge writes maintain the degree side-collection. Set in
+        # initialize(): True for new graphs, and for existing graphs once
+        # rebuild_degree_collection() has populated it.
+        self._has_degree_collection = False
+
         logger.info(
             "Initialized MilvusGraphStorage (uri=%s, collection=%s)",
             self.uri, self.collection_name,
@@ -104,7 +120,11 @@ class MilvusGraphStorage:
     async def initialize(self) -> None:
         """Connect to Milvus and ensure the association collection exists."""
         await asyncio.to_thread(self._connect_client)
+        graph_existed = await asyncio.to_thread(
+            self.client.has_collection, collection_name=self.collection_name,
+        )
         await asyncio.to_thread(self._ensure_collection)
+        await asyncio.to_thread(self._ensure_degree_collection, graph_existed)
 
     def _connect_client(self) -> None:
         kwargs: Dict[str, Any] = {"uri": self.uri}
@@ -194,6 +214,59 @@ class MilvusGraphStorage:
             self.collection_name,
         )
 
+    def _create_degree_collection(self) -> None:
+        assert self.client is not None
+        schema = self.client.create_schema(
+            auto_id=False,
+            enable_dynamic_field=False,
+        )
+        schema.add_field(
+            field_name="id",
+            datatype=DataType.VARCHAR,
+            is_primary=True,
+            max_length=64,
+        )
+        schema.add_field(field_name="degree", datatype=DataType.INT64)
+        schema.add_field(
+            field_name="_dummy_vec",
+            datatype=DataType.FLOAT_VECTOR,
+            dim=_DUMMY_VEC_DIM,
+        )
+        index_params = self.client.prepare_index_params()
+        index_params.add_index(
+            field_name="_dummy_vec",
+            index_type="AUTOINDEX",
+            metric_type="L2",
+        )
+        self.client.create_collection(
+            collection_name=self.degree_collection_name,
+            schema=schema,
+            index_params=index_params,
+        )
+
+    def _ensure_degree_collection(self, graph_existed: bool) -> None:
+        """Create the degree side-collection alongside a new graph.
+
+        An existing graph without one is left alone: creating an empty degree
+        collection there would report every memory as unconnected until a
+        rebuild, so ``get_memory_connections`` keeps draining edges instead.
+        """
+        assert self.client is not None
+        if self.client.has_collection(collection_name=self.degree_collection_name):
+            self._has_degree_collection = True
+            return
+        if graph_existed:
+            logger.warning(
+                "Association collection '%s' has no degree collection; run "
+                "scripts/maintenance/rebuild_milvus_degree.py once to enable "
+                "incremental degree tracking",
+                self.collection_name,
+            )
+            return
+        self._create_degree_collection()
+        self._has_degree_collection = True
+        logger.info("Created degree collection '%s'", self.degree_collection_name)
+
     # -- Helper --------------------------------------------------------------
 
     def _ensure_ready(self) -> bool:
@@ -206,8 +279,144 @@ class MilvusGraphStorage:
     async def _call_client(self, method_name: str, *args: Any, **kwargs: Any) -> Any:
         """Thread-safe Milvus client call."""
         async with self._lock:
-            fn = getattr(self.client, method_name)
-            return await asyncio.to_thread(fn, *args, **kwargs)
+            return await self._invoke(method_name, *args, **kwargs)
+
+    async def _invoke(self, method_name: str, *args: Any, **kwargs: Any) -> Any:
+        """Run a client call; the caller must already hold ``self._lock``."""
+        fn = getattr(self.client, method_name)
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
+    # -- Degree maintenance --------------------------------------------------
+
+    @staticmethod
+    def _in_filter(field: str, values: List[str]) -> str:
+        escaped = [v.replace('"', '\\"') for v in values]
+        return f'{field} in [' + ", ".join(f'"{v}"' for v in escaped) + ']'
+
+    async def _existing_edges(self, edge_ids: List[str]) -> List[Dict[str, Any]]:
+        """Return ``source_hash``/``target_hash`` of the edges in ``edge_ids``
+        that exist. Caller holds ``self._lock``."""
+        rows = await self._invoke(
+            "query",
+            collection_name=self.collection_name,
+            filter=self._in_filter("id", edge_ids),
+            output_fields=["id", "source_hash", "target_hash"],
+            limit=len(edge_ids),
+        )
+        return rows or []
+
+    async def _read_degrees(self, hashes: List[str]) -> Dict[str, int]:
+        """Batched degree lookup. Caller holds ``self._lock``."""
+        degrees: Dict[str, int] = {}
+        for start in range(0, len(hashes), _DEGREE_QUERY_CHUNK):
+            chunk = hashes[start:start + _DEGREE_QUERY_CHUNK]
+            rows = await self._invoke(
+                "query",
+                collection_name=self.degree_collection_name,
+                filter=self._in_filter("id", chunk),
+                output_fields=["id", "degree"],
+                limit=len(chunk),
+            )
+            for row in rows or []:
+                degrees[row["id"]] = int(row.get("degree") or 0)
+        return degrees
+
+    async def _adjust_degrees(self, edges: List[Dict[str, Any]], sign: int) -> None:
+        """Add (``sign=1``) or remove (``sign=-1``) the endpoints of ``edges``
+        from the degree collection. Caller holds ``self._lock``."""
+        deltas: Dict[str, int] = {}
+        for edge in edges:
+            for endpoint in (edge["source_hash"], edge["target_hash"]):
+                deltas[endpoint] = deltas.get(endpoint, 0) + sign
+        if not deltas:
+            return
+
+        current = await self._read_degrees(list(deltas))
+        upserts: List[Dict[str, Any]] = []
+        deletes: List[str] = []
+        for memory_hash, delta in deltas.items():
+            degree = current.get(memory_hash, 0) + delta
+            if degree > 0:
+                upserts.append({"id": memory_hash, "degree": degree, "_dummy_vec": _DUMMY_VEC_VALUE})
+            elif memory_hash in current:
+                deletes.append(memory_hash)
+        if upserts:
+            await self._invoke("upsert", collection_name=self.degree_collection_name, data=upserts)
+        if deletes:
+            await self._invoke("delete", collection_name=self.degree_collection_name, ids=deletes)
+
+    async def get_degrees(self, memory_hashes: List[str]) -> Dict[str, int]:
+        """Return ``{hash: degree}`` for the given hashes that have edges.
+
+        Degree counts edge records a memory appears in as source or target,
+        so a symmetric association contributes 2 to each endpoint.
+        """
+        if not self._ensure_ready() or not self._has_degree_collection or not memory_hashes:
+            return {}
+        try:
+            async with self._lock:
+                return await self._read_degrees(list(dict.fromkeys(memory_hashes)))
+        except Exception as exc:
+            logger.error("Failed to read degrees: %s", exc)
+            return {}
+
+    def _drain_edge_degrees(self) -> Dict[str, int]:
+        """Sync helper: count edge endpoints over the whole graph collection."""
+        assert self.client is not None
+        iterator = self.client.query_iterator(
+            collection_name=self.collection_name,
+            filter="",
+            output_fields=["source_hash", "target_hash"],
+            batch_size=1000,
+        )
+        degrees: Dict[str, int] = {}
+        try:
+            while True:
+                batch = iterator.next()
+                if not batch:
+                    break
+                for row in batch:
+                    for endpoint in (row.get("source_hash"), row.get("target_hash")):
+                        if endpoint:
+                            degrees[endpoint] = degrees.get(endpoint, 0) + 1
+        finally:
+            try:
+                iterator.close()
+            except Exception:  # noqa: BLE001
+                pass
+        return degrees
+
+    async def rebuild_degree_collection(self, batch_size: int = 1000) -> int:
+        """Recreate the degree collection from a full scan of the edges.
+
+        One-off migration for graphs created before degree tracking, and a
+        repair tool if the counts ever drift (e.g. edges written by a process
+        that started before the degree collection existed). Returns the
+        number of memories with at least one edge.
+        """
+        if not self._ensure_ready():
+            return 0
+        async with self._lock:
+            degrees = await asyncio.to_thread(self._drain_edge_degrees)
+            if await self._invoke("has_collection", collection_name=self.degree_collection_name):
+                await self._invoke("drop_collection", collection_name=self.degree_collection_name)
+            await asyncio.to_thread(self._create_degree_collection)
+            rows = [
+                {"id": memory_hash, "degree": degree, "_dummy_vec": _DUMMY_VEC_VALUE}
+                for memory_hash, degree in degrees.items()
+            ]
+            for start in range(0, len(rows), batch_size):
+                await self._invoke(
+                    "insert",
+                    collection_name=self.degree_collection_name,
+                    data=rows[start:start + batch_size],
+                )
+            self._has_degree_collection = True
+        logger.info(
+            "Rebuilt degree collection '%s' (%d memories)",
+            self.degree_collection_name, len(degrees),
+        )
+        return len(degrees)
 
     # -- CRUD ----------------------------------------------------------------
 
@@ -288,17 +497,73 @@ class MilvusGraphStorage:
                     source_hash, target_hash, relationship_type,
                 )
 
-            await self._call_client(
-                "upsert",
-                collection_name=self.collection_name,
-                data=rows,
-            )
+            async with self._lock:
+                created: List[Dict[str, Any]] = rows
+                if self._has_degree_collection:
+                    existing = {
+                        row["id"] for row in await self._existing_edges([r["id"] for r in rows])
+                    }
+                    created = [r for r in rows if r["id"] not in existing]
+                await self._invoke(
+                    "upsert",
+                    collection_name=self.collection_name,
+                    data=rows,
+                )
+                if self._has_degree_collection:
+                    await self._adjust_degrees(created, sign=1)
             return True
 
         except Exception as exc:
             logger.error("Failed to store association: %s", exc)
             return False
 
+    async def store_associations_bulk(self, edges: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+        """Store many associations with a single upsert.
+
+        Same input and result as ``GraphStorage.store_associations_bulk``.
+        """
+        rows, skipped = expand_association_edges(edges)
+        result = {"inserted": 0, "updated": 0, "skipped": skipped, "failed": 0}
+        if not rows or not self._ensure_ready():
+            result["failed"] = len(rows)
+            return result
+
+        data = [
+            {
+                "id": _edge_id(source, target),
+                "source_hash": source,
+                "target_hash": target,
+                "similarity": similarity,
+                "connection_types": ct_json,
+                "metadata": meta_json,
+                "relationship_type": relationship_type,
+                "created_at": created_at,
+                "_dummy_vec": _DUMMY_VEC_VALUE,
+            }
+            for source, target, similarity, ct_json, meta_json, created_at, relationship_type
+            in rows.values()
+        ]
+        try:
+            async with self._lock:
+                existing: Set[str] = set()
+                for start in range(0, len(data), _DEGREE_QUERY_CHUNK):
+                    chunk = [row["id"] for row in data[start:start + _DEGREE_QUERY_CHUNK]]
+                    existing.update(row["id"] for row in await self._existing_edges(chunk))
+                created = [row for row in data if row["id"] not in existing]
+                await self._invoke(
+                    "upsert",
+                    collection_name=self.collection_name,
+                    data=data,
+                )
+                if self._has_degree_collection:
+                    await self._adjust_degrees(created, sign=1)
+            result["inserted"] = len(created)
+            result["updated"] = len(data) - len(created)
+        except Exception as exc:
+            logger.error("Failed to bulk store associations: %s", exc)
+            result["failed"] = len(data)
+        return result
+
     # -- BFS traversal -------------------------------------------------------
 
     async def _query_edges(
@@ -393,9 +658,13 @@ class MilvusGraphStorage:
         direction: str = "both",
         relationship_types: Optional[List[str]] = None,
         stop_at: Optional[str] = None,
+        max_expanded_nodes: Optional[int] = None,
     ) -> Tuple[List[Tuple[str, int]], Optional[Dict[str, str]]]:
         """Application-layer BFS over the association collection.
 
+        Stops before a level whose expansion would push the number of
+        expanded nodes past ``max_expanded_nodes``.
+
         Returns:
             (reachable, parents) where reachable is a list of (hash, distance)
             and parents is a dict mapping each hash to its predecessor (used
@@ -406,8 +675,13 @@ class MilvusGraphStorage:
         frontier: Set[str] = {start_hash}
         result: List[Tuple[str, int]] = []
         parents: Optional[Dict[str, str]] = {} if stop_at else None
+        expanded = 0
 
         for depth in range(1, max_hops + 1):
+            if max_expanded_nodes is not None and expanded + len(frontier) > max_expanded_nodes:
+                logger.info("BFS from %s stopped after %d expanded nodes", start_hash, expanded)
+                break
+            expanded += len(frontier)
             next_frontier: Set[str] = set()
 
             if direction == "both":
@@ -496,14 +770,61 @@ class MilvusGraphStorage:
             logger.error("Failed to find connected memories: %s", exc)
             return []
 
+    async def neighbors_many(
+        self,
+        memory_hashes: List[str],
+        relationship_types: Optional[List[str]] = None,
+        direction: str = "both",
+    ) -> Dict[str, List[str]]:
+        """Direct neighbors of many memories with a single edge query."""
+        if not self._ensure_ready():
+            return {}
+
+        if direction not in ("outgoing", "incoming", "both"):
+            logger.error(
+                "Invalid direction '%s', must be 'outgoing', 'incoming', or 'both'",
+                direction,
+            )
+            return {}
+
+        hashes = set(h for h in memory_hashes if h)
+        if not hashes:
+            return {}
+
+        try:
+            if direction == "both":
+                rows = await self._query_edges_both(hashes, relationship_types)
+            elif direction == "outgoing":
+                rows = await self._query_edges("source_hash", hashes, relationship_types)
+            else:
+                rows = await self._query_edges("target_hash", hashes, relationship_types)
+
+            grouped: Dict[str, Set[str]] = {h: set() for h in hashes}
+            for row in rows:
+                source, target = row["source_hash"], row["target_hash"]
+                if direction != "incoming" and source in hashes and target != source:
+                    grouped[source].add(target)
+                if direction != "outgoing" and target in hashes and source != target:
+                    grouped[target].add(source)
+            return {h: sorted(neighbors) for h, neighbors in grouped.items()}
+        except Exception as exc:
+            logger.error("Failed to fetch neighbors: %s", exc)
+            return {}
+
     async def shortest_path(
         self,
         hash1: str,
         hash2: str,
         max_depth: int = 5,
         relationship_types: Optional[List[str]] = None,
+        direction: str = "both",
+        max_expanded_nodes: Optional[int] = None,
     ) -> Optional[List[str]]:
-        """Find shortest path between two memories using BFS."""
+        """Find shortest path between two memories using BFS.
+
+        ``direction`` defaults to "both" (edge direction ignored);
+        ``max_expanded_nodes`` bounds the search as in ``GraphStorage``.
+        """
         if not self._ensure_ready():
             return None
 
@@ -518,9 +839,10 @@ class MilvusGraphStorage:
             result, parents = await self._bfs(
                 hash1,
                 max_depth,
-                direction="both",
+                direction=direction,
                 relationship_types=relationship_types,
                 stop_at=hash2,
+                max_expanded_nodes=max_expanded_nodes,
             )
 
             # Check if hash2 was reached
@@ -712,11 +1034,17 @@ class MilvusGraphStorage:
                 _edge_id(source_hash, target_hash),
                 _edge_id(target_hash, source_hash),
             ]
-            await self._call_client(
-                "delete",
-                collection_name=self.collection_name,
-                ids=ids_to_delete,
-            )
+            async with self._lock:
+                removed: List[Dict[str, Any]] = []
+                if self._has_degree_collection:
+                    removed = await self._existing_edges(ids_to_delete)
+                await self._invoke(
+                    "delete",
+                    collection_name=self.collection_name,
+                    ids=ids_to_delete,
+                )
+                if removed:
+                    await self._adjust_degrees(removed, sign=-1)
             logger.debug(
                 "Deleted association: %s ↔ %s", source_hash, target_hash,
             )
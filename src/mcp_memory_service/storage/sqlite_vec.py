@@ -29,9 +29,10 @@ import platform
 import hashlib
 import struct
 import re
+from array import array
 from collections import Counter
 from pathlib import Path
-from typing import List, Dict, Any, Tuple, Optional, Set, Callable
+from typing import AsyncIterator, List, Dict, Any, Tuple, Optional, Set, Callable, Iterable, Sequence
 from datetime import datetime, timezone, timedelta, date
 import asyncio
 import random
@@ -62,6 +63,7 @@ except ImportError:
 
 from .base import MemoryStorage
 from .migration_runner import MigrationRunner
+from .sync_digest import build_bucket_digest_query, build_bucket_entries_query, rows_to_digests
 from ..models.memory import Memory, MemoryQueryResult
 from ..utils.system_detection import (
     get_torch_device,
@@ -90,6 +92,74 @@ def _escape_like(value: str) -> str:
 _SQLITE_VEC_MAX_KNN_K = 4096        # sqlite-vec hard limit for k in KNN queries
 _MAX_TAG_SEARCH_CANDIDATES = _SQLITE_VEC_MAX_KNN_K  # Cap at sqlite-vec limit (was 10000, which exceeds k limit)
 _MAX_TAGS_FOR_SEARCH = 100          # Maximum number of tags to process in a single search (DoS protection)
+_MAX_UNINDEXED_CANDIDATES = 1000    # Newest memories outside the cluster index scored by retrieve_clustered
+
+# Graph views pass their node sets to SQL through this temp table instead of
+# IN (?, ?, ...) lists, so node budgets are not bound by SQLite's parameter limit
+_GRAPH_VIEW_NODES_SCHEMA = "CREATE TEMP TABLE IF NOT EXISTS graph_view_nodes (content_hash TEXT PRIMARY KEY) WITHOUT ROWID"
+
+# MinHash signatures for near-duplicate cleanup, keyed by content hash (a
+# signature depends only on the content). The triggers drop a signature when
+# its memory is soft-deleted or purged.
+_MINHASH_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS memory_minhash (
+        content_hash TEXT PRIMARY KEY,
+        num_perm INTEGER NOT NULL,
+        signature BLOB NOT NULL
+    ) WITHOUT ROWID
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS memories_minhash_au AFTER UPDATE OF deleted_at ON memories
+    WHEN new.deleted_at IS NOT NULL
+    BEGIN
+        DELETE FROM memory_minhash WHERE content_hash = new.content_hash;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS memories_minhash_ad AFTER DELETE ON memories
+    BEGIN
+        DELETE FROM memory_minhash WHERE content_hash = old.content_hash;
+    END
+    """,
+)
+
+# Persistent cluster index kept by consolidation (consolidation/cluster_index.py):
+# centroid, member count, radius and accumulated centroid shift per cluster,
+# and the cluster of every indexed memory. Searches use it as a coarse filter.
+_CLUSTER_INDEX_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS memory_clusters (
+        cluster_id TEXT PRIMARY KEY,
+        centroid BLOB NOT NULL,
+        member_count INTEGER NOT NULL,
+        radius REAL NOT NULL,
+        shift REAL NOT NULL,
+        updated_at REAL NOT NULL
+    ) WITHOUT ROWID
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS memory_cluster_members (
+        content_hash TEXT PRIMARY KEY,
+        cluster_id TEXT NOT NULL,
+        similarity REAL NOT NULL
+    ) WITHOUT ROWID
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_memory_cluster_members_cluster ON memory_cluster_members(cluster_id)",
+)
+
+# Consolidation visits memories least recently consolidated first. Queries
+# must repeat this expression verbatim to use the index; the plain range term
+# next to the keyset row-value comparison is what lets SQLite seek to each
+# chunk instead of rescanning from the start.
+_CONSOLIDATION_ORDER_KEY = (
+    "COALESCE(CAST(CASE WHEN json_valid(metadata) THEN json_extract(metadata, '$.last_consolidated_at') END AS REAL), "
+    "created_at, 0)"
+)
+_CONSOLIDATION_ORDER_INDEX = (
+    f"CREATE INDEX IF NOT EXISTS idx_memories_consolidation_order ON memories({_CONSOLIDATION_ORDER_KEY}, id) "
+    "WHERE deleted_at IS NULL"
+)
 
 # Global model cache for performance optimization
 _MODEL_CACHE = {}
@@ -1480,7 +1550,11 @@ SOLUTIONS:
             logger.error(traceback.format_exc())
             return False, error_msg
 
-    async def store_batch(self, memories: List[Memory]) -> List[Tuple[bool, str]]:
+    async def store_batch(
+        self,
+        memories: List[Memory],
+        embeddings: Optional[List[Optional[List[float]]]] = None,
+    ) -> List[Tuple[bool, str]]:
         """
         Store multiple memories in a single transaction with batched embedding generation.
 
@@ -1489,6 +1563,9 @@ SOLUTIONS:
 
         Args:
             memories: List of Memory objects to store
+            embeddings: Optional precomputed embeddings aligned with ``memories``
+                (e.g. vectors pulled from Cloudflare Vectorize). Entries that are
+                None or have the wrong dimension are generated locally.
 
         Returns:
             List of (success, message) tuples matching input order
@@ -1499,12 +1576,24 @@ SOLUTIONS:
         if not self.conn:
             return [(False, "Database not initialized")] * len(memories)
 
-        # Batch-generate embeddings for all memories upfront
-        contents = [m.content for m in memories]
+        # Reuse precomputed embeddings where their dimension matches the index
+        raw_embeddings: List[Any] = [None] * len(memories)
+        if embeddings is not None:
+            for j, embedding in enumerate(embeddings[:len(memories)]):
+                if embedding is not None and len(embedding) == self.embedding_dimension:
+                    raw_embeddings[j] = embedding
+        to_encode = [j for j, embedding in enumerate(raw_embeddings) if embedding is None]
+
+        # Batch-generate the remaining embeddings upfront
         try:
-            if not self.embedding_model:
-                raise RuntimeError("No embedding model available")
-            raw_embeddings = self.embedding_model.encode(contents, convert_to_numpy=True)
+            if to_encode:
+                if not self.embedding_model:
+                    raise RuntimeError("No embedding model available")
+                encoded = self.embedding_model.encode(
+                    [memories[j].content for j in to_encode], convert_to_numpy=True
+                )
+                for j, embedding in zip(to_encode, encoded):
+                    raw_embeddings[j] = embedding
         except Exception as e:
             error_msg = f"Batch embedding generation failed: {e}"
             logger.error(error_msg)
@@ -2531,6 +2620,91 @@ SOLUTIONS:
             logger.error(f"Failed to get all content hashes: {str(e)}")
             return set()
 
+    async def get_hash_bucket_digests(self, prefix_len: int, parents: Optional[List[str]] = None) -> Dict[str, Tuple[int, int, int]]:
+        """
+        Aggregate live memories into content_hash prefix buckets.
+
+        Used by hybrid anti-entropy sync (see storage/sync_digest.py) to compare
+        the local database against Cloudflare D1 without a full hash scan.
+
+        Args:
+            prefix_len: Bucket prefix length
+            parents: Optional parent prefixes restricting the scan
+
+        Returns:
+            Mapping of bucket prefix -> (count, hash_sum, time_sum)
+        """
+        if not self.conn:
+            return {}
+
+        sql, params = build_bucket_digest_query(prefix_len, parents)
+
+        def _digests():
+            return self.conn.execute(sql, params).fetchall()
+
+        return rows_to_digests(await self._execute_with_retry(_digests))
+
+    async def get_hash_bucket_entries(self, prefixes: List[str]) -> Dict[str, Optional[float]]:
+        """
+        Return content_hash -> updated_at for live memories in the given buckets.
+
+        Args:
+            prefixes: Bucket prefixes to expand
+
+        Returns:
+            Mapping of content_hash -> updated_at
+        """
+        if not self.conn or not prefixes:
+            return {}
+
+        sql, params = build_bucket_entries_query(prefixes)
+
+        def _entries():
+            return self.conn.execute(sql, params).fetchall()
+
+        return {row[0]: row[1] for row in await self._execute_with_retry(_entries)}
+
+    async def get_metadata_value(self, key: str) -> Optional[str]:
+        """
+        Read a value from the storage metadata table.
+
+        Args:
+            key: Metadata key
+
+        Returns:
+            Stored value, or None if the key is absent
+        """
+        if not self.conn:
+            return None
+
+        def _get():
+            row = self.conn.execute('SELECT value FROM metadata WHERE key = ?', (key,)).fetchone()
+            return row[0] if row else None
+
+        return await self._execute_with_retry(_get)
+
+    async def set_metadata_value(self, key: str, value: Optional[str]) -> None:
+        """
+        Write (or, with value=None, remove) a key in the storage metadata table.
+
+        Used for small pieces of durable state such as the hybrid pull checkpoint.
+
+        Args:
+            key: Metadata key
+            value: Value to store, or None to delete the key
+        """
+        if not self.conn:
+            return
+
+        def _set():
+            if value is None:
+                self.conn.execute('DELETE FROM metadata WHERE key = ?', (key,))
+            else:
+                self.conn.execute('INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)', (key, value))
+            self.conn.commit()
+
+        await self._execute_with_retry(_set)
+
     async def delete_by_tag(self, tag: str) -> Tuple[int, str]:
         """Soft-delete memories by tag (exact match only)."""
         try:
@@ -2782,8 +2956,20 @@ SOLUTIONS:
             logger.error(f"Error in exact content match: {str(e)}")
             return []
 
-    async def cleanup_duplicates(self) -> Tuple[int, str]:
-        """Soft-delete duplicate memories based on content hash."""
+    async def cleanup_duplicates(
+        self, near_duplicates: bool = False, threshold: float = 0.8
+    ) -> Tuple[int, str]:
+        """
+        Soft-delete duplicate memories based on content hash.
+
+        Args:
+            near_duplicates: Also soft-delete near duplicates (same text up to
+                case and whitespace, containment, or word overlap above
+                ``threshold``), keeping the oldest memory of each duplicate set.
+                Candidates come from a MinHash-LSH index whose signatures are
+                persisted in ``memory_minhash`` and reused by later runs.
+            threshold: Word-overlap (Jaccard) threshold for near duplicates.
+        """
         try:
             if not self.conn:
                 return 0, "Database not initialized"
@@ -2805,6 +2991,8 @@ SOLUTIONS:
                 return cursor.rowcount
 
             count = await self._execute_with_retry(_cleanup_dups)
+            if near_duplicates:
+                count += len(await self.cleanup_near_duplicates(threshold))
             logger.info(f"Soft-deleted {count} duplicate memories")
 
             if count > 0:
@@ -2817,6 +3005,67 @@ SOLUTIONS:
             logger.error(error_msg)
             return 0, error_msg
     
+    async def cleanup_near_duplicates(self, threshold: float = 0.8) -> List[str]:
+        """
+        Soft-delete memories that near-duplicate an older kept memory.
+
+        Returns:
+            Content hashes of the soft-deleted memories, so a hybrid backend
+            can propagate the deletes
+        """
+        return await self._execute_with_retry(lambda: self._cleanup_near_duplicates(threshold))
+
+    def _cleanup_near_duplicates(self, threshold: float) -> List[str]:
+        """
+        Soft-delete memories that near-duplicate an older kept memory (runs under the connection lock).
+
+        Memories are indexed oldest first, so the oldest memory of each set of
+        duplicates is the one kept.
+        """
+        import numpy as np
+        from ..utils.near_duplicates import NearDuplicateIndex
+
+        index = NearDuplicateIndex(threshold=threshold)
+        for statement in _MINHASH_SCHEMA:
+            self.conn.execute(statement)
+        # Signatures stored before the triggers existed may belong to deleted memories
+        self.conn.execute(
+            "DELETE FROM memory_minhash WHERE content_hash NOT IN "
+            "(SELECT content_hash FROM memories WHERE deleted_at IS NULL)"
+        )
+        stored = {
+            content_hash: np.frombuffer(signature, dtype=np.uint32)
+            for content_hash, signature in self.conn.execute(
+                "SELECT content_hash, signature FROM memory_minhash WHERE num_perm = ?", (index.num_perm,)
+            )
+        }
+
+        new_signatures = []
+        for content_hash, content in self.conn.execute(
+            "SELECT content_hash, content FROM memories WHERE deleted_at IS NULL ORDER BY created_at, rowid"
+        ):
+            index.add(content_hash, content, stored.get(content_hash))
+            signature = index.signature(content_hash)
+            if signature is not None and content_hash not in stored:
+                new_signatures.append((content_hash, index.num_perm, signature.tobytes()))
+
+        now = time.time()
+        redundant = list(index.redundant())
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO memory_minhash (content_hash, num_perm, signature) VALUES (?, ?, ?)",
+            new_signatures,
+        )
+        self.conn.executemany(
+            "UPDATE memories SET deleted_at = ? WHERE content_hash = ? AND deleted_at IS NULL",
+            [(now, key) for key in redundant],
+        )
+        self.conn.commit()
+        logger.info(
+            f"Near-duplicate scan: {len(index)} memories indexed, {len(new_signatures)} new signatures, "
+            f"{len(redundant)} near duplicates"
+        )
+        return redundant
+
     async def update_memory_metadata(self, content_hash: str, updates: Dict[str, Any], preserve_timestamps: bool = True) -> Tuple[bool, str]:
         """Update memory metadata without recreating the entire memory entry."""
         try:
@@ -3413,8 +3662,78 @@ SOLUTIONS:
             logger.error(f"Error getting memories by time range: {str(e)}")
             return []
 
-    async def get_memory_connections(self) -> Dict[str, int]:
-        """Get memory connection statistics."""
+    async def iter_memories_for_consolidation(
+        self,
+        cutoff_timestamp: Optional[float] = None,
+        chunk_size: int = 1000,
+        limit: Optional[int] = None,
+        start_key: Optional[float] = None,
+    ) -> AsyncIterator[List[Memory]]:
+        """
+        Stream memories with embeddings in consolidation order, one chunk per query.
+
+        The horizon cutoff and the ``last_consolidated_at`` ordering run in
+        SQL over an expression index, and chunks are fetched with keyset
+        pagination on (order key, id), so each query reads only its own
+        chunk and memories deleted between chunks are skipped cleanly.
+        Embeddings are delivered as float32 ``array('f')`` buffers (4 bytes
+        per dimension) instead of lists of Python floats. ``start_key`` seeds
+        the keyset, so a resumed stream starts at its index position.
+        """
+        await self.initialize()
+
+        conditions = ["deleted_at IS NULL"]
+        params: List[Any] = []
+        if cutoff_timestamp is not None:
+            conditions.append("created_at > 0 AND created_at < ?")
+            params.append(cutoff_timestamp)
+        sql = f'''
+            SELECT content_hash, content, tags, memory_type, metadata,
+                   created_at, updated_at, created_at_iso, updated_at_iso,
+                   e.content_embedding, {_CONSOLIDATION_ORDER_KEY}, memories.id
+            FROM memories INDEXED BY idx_memories_consolidation_order
+            LEFT JOIN memory_embeddings e ON memories.id = e.rowid
+            WHERE {' AND '.join(conditions)}
+              AND {_CONSOLIDATION_ORDER_KEY} >= ? AND ({_CONSOLIDATION_ORDER_KEY}, memories.id) > (?, ?)
+            ORDER BY {_CONSOLIDATION_ORDER_KEY}, memories.id
+            LIMIT ?
+        '''
+
+        def _fetch_chunk(after_key: float, after_id: int, size: int):
+            return self.conn.execute(sql, (*params, after_key, after_key, after_id, size)).fetchall()
+
+        await self._execute_with_retry(lambda: self.conn.execute(_CONSOLIDATION_ORDER_INDEX))
+        after_key, after_id = (float("-inf") if start_key is None else start_key), -1
+        remaining = limit
+        while remaining is None or remaining > 0:
+            size = chunk_size if remaining is None else min(chunk_size, remaining)
+            rows = await self._execute_with_retry(lambda: _fetch_chunk(after_key, after_id, size))
+            if not rows:
+                return
+            after_key, after_id = rows[-1][10], rows[-1][11]
+
+            chunk = []
+            for row in rows:
+                memory = self._row_to_memory(row[:9])
+                if memory is None:
+                    continue
+                blob = row[9]
+                if blob and len(blob) % 4 == 0:
+                    memory.embedding = array("f", blob)
+                chunk.append(memory)
+            if remaining is not None:
+                remaining -= len(rows)
+            if chunk:
+                yield chunk
+            if len(rows) < size:
+                return
+
+    async def get_memory_connections(self, memory_hashes: Optional[List[str]] = None) -> Dict[str, int]:
+        """Get memory connection statistics.
+
+        Counts are per tag, so ``memory_hashes`` is accepted for interface
+        compatibility and ignored.
+        """
         try:
             await self.initialize()
 
@@ -3824,6 +4143,280 @@ SOLUTIONS:
             logger.error(f"Unexpected error getting tags with counts: {str(e)}")
             raise
 
+    async def get_graph_importance(self, memory_hashes: List[str]) -> Dict[str, float]:
+        """
+        Precomputed graph importance for the given memories.
+
+        Reads the ``memory_centrality`` side table maintained by
+        ``GraphStorage.refresh_centrality`` with one primary-key lookup, so
+        ranking does no graph work per query.
+
+        Returns:
+            Dict mapping content hash to importance (0.0-1.0); empty before
+            the first centrality refresh
+        """
+        hashes = list(dict.fromkeys(h for h in memory_hashes if h))
+        if not hashes or not self.conn:
+            return {}
+
+        def _get_importance():
+            placeholders = ",".join("?" * len(hashes))
+            cursor = self.conn.execute(
+                f"SELECT content_hash, importance FROM memory_centrality WHERE content_hash IN ({placeholders})",
+                hashes
+            )
+            return cursor.fetchall()
+
+        try:
+            return {row[0]: row[1] for row in await self._execute_with_retry(_get_importance)}
+        except sqlite3.OperationalError as e:
+            # memory_centrality does not exist until the first refresh
+            logger.debug(f"Graph importance unavailable: {str(e)}")
+            return {}
+        except Exception as e:
+            logger.error(f"Unexpected error getting graph importance: {str(e)}")
+            return {}
+
+    def _create_cluster_index_tables(self) -> None:
+        for statement in _CLUSTER_INDEX_SCHEMA:
+            self.conn.execute(statement)
+
+    async def get_cluster_index(self) -> List[Dict[str, Any]]:
+        """
+        Clusters of the persistent cluster index.
+
+        Returns:
+            One dict per cluster with ``cluster_id``, ``centroid`` (float32
+            ``array('f')``), ``member_count``, ``radius``, ``shift`` and
+            ``updated_at``; empty before the first index build
+        """
+        if not self.conn:
+            return []
+
+        def _get():
+            self._create_cluster_index_tables()
+            return self.conn.execute(
+                "SELECT cluster_id, centroid, member_count, radius, shift, updated_at FROM memory_clusters"
+            ).fetchall()
+
+        return [
+            {
+                "cluster_id": row[0],
+                "centroid": array("f", row[1]),
+                "member_count": row[2],
+                "radius": row[3],
+                "shift": row[4],
+                "updated_at": row[5],
+            }
+            for row in await self._execute_with_retry(_get)
+        ]
+
+    async def iter_memory_embeddings(
+        self,
+        unclustered_only: bool = False,
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[List[Tuple[str, array]]]:
+        """
+        Stream (content hash, float32 embedding) pairs of live memories in id order.
+
+        With ``unclustered_only`` only memories outside the cluster index are
+        returned. Memories without an embedding are skipped; pages use keyset
+        pagination on the memory id.
+        """
+        if not self.conn:
+            return
+
+        membership = (
+            "AND NOT EXISTS (SELECT 1 FROM memory_cluster_members c WHERE c.content_hash = m.content_hash)"
+            if unclustered_only else ""
+        )
+        sql = f'''
+            SELECT m.id, m.content_hash, e.content_embedding
+            FROM memories m
+            CROSS JOIN memory_embeddings e ON e.rowid = m.id
+            WHERE m.deleted_at IS NULL AND m.id > ? {membership}
+            ORDER BY m.id
+            LIMIT ?
+        '''
+
+        await self._execute_with_retry(self._create_cluster_index_tables)
+        after_id = 0
+        while True:
+            rows = await self._execute_with_retry(
+                lambda: self.conn.execute(sql, (after_id, chunk_size)).fetchall()
+            )
+            if not rows:
+                return
+            after_id = rows[-1][0]
+            pairs = [(row[1], array("f", row[2])) for row in rows if row[2] and len(row[2]) % 4 == 0]
+            if pairs:
+                yield pairs
+            if len(rows) < chunk_size:
+                return
+
+    async def save_cluster_index(
+        self,
+        clusters: List[Dict[str, Any]],
+        members: List[Tuple[str, str, float]],
+        rebuild: bool = False,
+    ) -> int:
+        """
+        Write clusters and memberships of the persistent cluster index.
+
+        Memberships of deleted memories are dropped in the same transaction,
+        member counts recounted, and clusters left without members removed.
+        With no clusters and no members this only prunes and recounts.
+
+        Args:
+            clusters: Cluster dicts shaped like :meth:`get_cluster_index`
+                results (``centroid`` may be any float sequence); rows with
+                the same ``cluster_id`` are replaced
+            members: (content_hash, cluster_id, similarity) per assigned memory
+            rebuild: Replace the whole index instead of updating it
+
+        Returns:
+            Number of memberships dropped for deleted memories
+        """
+        if not self.conn:
+            return 0
+
+        cluster_rows = [
+            (
+                cluster["cluster_id"], array("f", cluster["centroid"]).tobytes(),
+                int(cluster["member_count"]), float(cluster["radius"]),
+                float(cluster["shift"]), cluster.get("updated_at") or time.time(),
+            )
+            for cluster in clusters
+        ]
+
+        def _save() -> int:
+            try:
+                self._create_cluster_index_tables()
+                if rebuild:
+                    self.conn.execute("DELETE FROM memory_cluster_members")
+                    self.conn.execute("DELETE FROM memory_clusters")
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO memory_clusters "
+                    "(cluster_id, centroid, member_count, radius, shift, updated_at) VALUES (?, ?, ?, ?, ?, ?)",
+                    cluster_rows,
+                )
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO memory_cluster_members (content_hash, cluster_id, similarity) "
+                    "VALUES (?, ?, ?)",
+                    members,
+                )
+                pruned = self.conn.execute(
+                    "DELETE FROM memory_cluster_members WHERE content_hash NOT IN "
+                    "(SELECT content_hash FROM memories WHERE deleted_at IS NULL)"
+                ).rowcount
+                if pruned:
+                    self.conn.execute(
+                        "UPDATE memory_clusters SET member_count = (SELECT COUNT(*) FROM memory_cluster_members c "
+                        "WHERE c.cluster_id = memory_clusters.cluster_id)"
+                    )
+                self.conn.execute("DELETE FROM memory_clusters WHERE member_count = 0")
+                self.conn.commit()
+                return pruned
+            except sqlite3.Error:
+                self.conn.rollback()
+                raise
+
+        return await self._execute_with_retry(_save)
+
+    async def retrieve_clustered(
+        self,
+        query: str,
+        n_results: int = 5,
+        probe: int = 4,
+        include_superseded: bool = False
+    ) -> List[MemoryQueryResult]:
+        """
+        Semantic search restricted to the clusters nearest the query.
+
+        A coarse filter over the persistent cluster index: the query is
+        compared with the cluster centroids, and only members of the
+        ``probe`` nearest clusters, plus the newest
+        ``_MAX_UNINDEXED_CANDIDATES`` memories stored since the index was
+        last updated, are scored. Without a cluster index this is
+        :meth:`retrieve`.
+        """
+        if not self.conn or not self.embedding_model:
+            return await self.retrieve(query, n_results, include_superseded=include_superseded)
+
+        try:
+            query_blob = serialize_float32(self._generate_embedding(query))
+        except Exception as e:
+            logger.error(f"Failed to generate query embedding: {str(e)}")
+            return []
+
+        superseded_filter = "" if include_superseded else " AND (m.superseded_by IS NULL OR m.superseded_by = '')"
+
+        def _search():
+            cluster_ids = [row[0] for row in self.conn.execute(
+                "SELECT cluster_id FROM memory_clusters ORDER BY vec_distance_cosine(centroid, ?) LIMIT ?",
+                (query_blob, probe)
+            )]
+            if not cluster_ids:
+                return None
+            # Members of the probed clusters and the newest unindexed
+            # memories; only those rows reach the embedding lookup and distance
+            return cluster_ids, self.conn.execute(f'''
+                WITH candidates(content_hash) AS (
+                    SELECT content_hash FROM memory_cluster_members
+                    WHERE cluster_id IN ({','.join('?' * len(cluster_ids))})
+                    UNION
+                    SELECT content_hash FROM (
+                        SELECT u.content_hash FROM memories u
+                        WHERE u.deleted_at IS NULL
+                          AND NOT EXISTS (SELECT 1 FROM memory_cluster_members c WHERE c.content_hash = u.content_hash)
+                        ORDER BY u.id DESC
+                        LIMIT ?
+                    )
+                )
+                SELECT m.content_hash, m.content, m.tags, m.memory_type, m.metadata,
+                       m.created_at, m.updated_at, m.created_at_iso, m.updated_at_iso,
+                       vec_distance_cosine(e.content_embedding, ?) AS distance
+                FROM candidates k
+                JOIN memories m ON m.content_hash = k.content_hash
+                CROSS JOIN memory_embeddings e ON e.rowid = m.id
+                WHERE m.deleted_at IS NULL{superseded_filter}
+                ORDER BY distance
+                LIMIT ?
+            ''', (*cluster_ids, _MAX_UNINDEXED_CANDIDATES, query_blob, n_results)).fetchall()
+
+        try:
+            found = await self._execute_with_retry(_search)
+        except sqlite3.OperationalError as e:
+            # memory_clusters does not exist until the first index build
+            logger.debug(f"Cluster index unavailable: {str(e)}")
+            found = None
+        if found is None:
+            return await self.retrieve(query, n_results, include_superseded=include_superseded)
+
+        cluster_ids, rows = found
+        results = []
+        for row in rows:
+            memory = self._row_to_memory(row[:9])
+            if memory is None:
+                continue
+            distance = row[9]
+            memory.record_access(query)
+            results.append(MemoryQueryResult(
+                memory=memory,
+                relevance_score=max(0.0, 1.0 - (float(distance) / 2.0)) if distance is not None else 0.0,
+                debug_info={
+                    "distance": distance,
+                    "backend": "sqlite-vec",
+                    "clusters_probed": len(cluster_ids),
+                }
+            ))
+
+        try:
+            await self._persist_access_metadata_batch([r.memory for r in results])
+        except Exception as e:
+            logger.warning(f"Failed to persist access metadata: {e}")
+        return results
+
     async def get_relationship_type_distribution(self) -> Dict[str, int]:
         """
         Get distribution of relationship types in the knowledge graph.
@@ -3909,69 +4502,23 @@ SOLUTIONS:
                 """, (min_connections, limit))
                 return cursor.fetchall()
 
-            # Build nodes list
             nodes = []
-            node_hashes = set()
-
+            node_hashes = []
             for row in await self._execute_with_retry(_get_graph_nodes):
-                content_hash, content, memory_type, created_at, updated_at, tags_str, metadata_str, connection_count = row
-
-                # Parse tags
-                tags = []
-                if tags_str:
-                    tags = [tag.strip() for tag in tags_str.split(",") if tag.strip()]
-
-                # Parse metadata to extract quality_score
-                metadata = self._safe_json_loads(metadata_str, "get_graph_visualization_data")
-
-                # Create node
-                nodes.append({
-                    "id": content_hash,
-                    "type": memory_type or "untyped",
-                    "content": content[:100] if content else "",  # Preview only
-                    "connections": connection_count,
-                    "created_at": created_at,
-                    "updated_at": updated_at,
-                    "quality_score": metadata.get("quality_score", 0.5),
-                    "tags": tags
-                })
-                node_hashes.add(content_hash)
+                nodes.append(self._graph_view_node(row[:7], row[7]))
+                node_hashes.append(row[0])
 
             # Step 2: Get edges between these nodes
-            if node_hashes:
-                placeholders = ",".join("?" * len(node_hashes))
-                query = f"""
-                    SELECT
-                        source_hash,
-                        target_hash,
-                        relationship_type,
-                        similarity,
-                        connection_types
-                    FROM memory_graph
-                    WHERE source_hash IN ({placeholders})
-                      AND target_hash IN ({placeholders})
-                """
-
-                # Execute with node hashes twice (for both source and target)
-                def _get_graph_edges(q=query, nh=node_hashes):
-                    cursor = self.conn.execute(q, list(nh) + list(nh))
-                    return cursor.fetchall()
-
-                # Build edges list
-                edges = []
-                for row in await self._execute_with_retry(_get_graph_edges):
-                    source, target, rel_type, similarity, conn_types = row
-
-                    edges.append({
-                        "source": source,
-                        "target": target,
-                        "relationship_type": rel_type or "related",
-                        "similarity": similarity if similarity is not None else 0.5,
-                        "connection_types": conn_types or ""
-                    })
+            def _get_graph_edges():
+                cursor = self.conn.cursor()
+                try:
+                    self._load_graph_view_nodes(cursor, node_hashes)
+                    return self._graph_view_edges(cursor)
+                finally:
+                    self._clear_graph_view_nodes(cursor)
+                    cursor.close()
 
-            else:
-                edges = []
+            edges = await self._execute_with_retry(_get_graph_edges) if node_hashes else []
 
             return {
                 "nodes": nodes,
@@ -3991,6 +4538,342 @@ SOLUTIONS:
             logger.error(f"Unexpected error getting graph visualization data: {str(e)}")
             return {"nodes": [], "edges": []}
 
+    def _load_graph_view_nodes(self, cursor: sqlite3.Cursor, content_hashes: Iterable[str]) -> None:
+        """Fill the graph_view_nodes temp table. Runs inside a locked DB operation."""
+        cursor.execute(_GRAPH_VIEW_NODES_SCHEMA)
+        cursor.execute("DELETE FROM temp.graph_view_nodes")
+        cursor.executemany(
+            "INSERT OR IGNORE INTO temp.graph_view_nodes (content_hash) VALUES (?)",
+            ((content_hash,) for content_hash in content_hashes)
+        )
+
+    def _clear_graph_view_nodes(self, cursor: sqlite3.Cursor) -> None:
+        """Empty the graph_view_nodes temp table and end its implicit transaction."""
+        try:
+            cursor.execute("DELETE FROM temp.graph_view_nodes")
+        except sqlite3.OperationalError:
+            pass  # Table was never created
+        self.conn.commit()
+
+    def _graph_view_node(self, row: Sequence[Any], connection_count: int) -> Dict[str, Any]:
+        """Format a (content_hash, content, memory_type, created_at, updated_at, tags, metadata) row as a graph node."""
+        content_hash, content, memory_type, created_at, updated_at, tags_str, metadata_str = row
+        tags = [tag.strip() for tag in tags_str.split(",") if tag.strip()] if tags_str else []
+        metadata = self._safe_json_loads(metadata_str, "graph_view_node")
+        return {
+            "id": content_hash,
+            "type": memory_type or "untyped",
+            "content": content[:100] if content else "",  # Preview only
+            "connections": connection_count,
+            "created_at": created_at,
+            "updated_at": updated_at,
+            "quality_score": metadata.get("quality_score", 0.5),
+            "tags": tags
+        }
+
+    def _graph_view_nodes(self, cursor: sqlite3.Cursor, degrees: Dict[str, int]) -> List[Dict[str, Any]]:
+        """Node dicts for the memories in graph_view_nodes, ordered by ``degrees``."""
+        cursor.execute("""
+            SELECT m.content_hash, m.content, m.memory_type, m.created_at, m.updated_at, m.tags, m.metadata
+            FROM memories m
+            JOIN temp.graph_view_nodes v ON v.content_hash = m.content_hash
+            WHERE m.deleted_at IS NULL
+        """)
+        rows = {row[0]: row for row in cursor.fetchall()}
+        return [
+            self._graph_view_node(rows[content_hash], degree)
+            for content_hash, degree in degrees.items()
+            if content_hash in rows
+        ]
+
+    def _graph_view_edges(self, cursor: sqlite3.Cursor) -> List[Dict[str, Any]]:
+        """Edges whose endpoints are both in graph_view_nodes."""
+        cursor.execute("""
+            SELECT mg.source_hash, mg.target_hash, mg.relationship_type, mg.similarity, mg.connection_types
+            FROM memory_graph mg
+            JOIN temp.graph_view_nodes s ON s.content_hash = mg.source_hash
+            JOIN temp.graph_view_nodes t ON t.content_hash = mg.target_hash
+        """)
+        return [
+            {
+                "source": source,
+                "target": target,
+                "relationship_type": rel_type or "related",
+                "similarity": similarity if similarity is not None else 0.5,
+                "connection_types": conn_types or ""
+            }
+            for source, target, rel_type, similarity, conn_types in cursor.fetchall()
+        ]
+
+    async def get_graph_view(
+        self,
+        node_budget: int = 200,
+        rank_by: str = "degree",
+        min_connections: int = 1
+    ) -> Dict[str, Any]:
+        """
+        Level-of-detail graph for visualization.
+
+        Returns at most ``node_budget`` memories, ranked by degree (edge rows
+        touching the memory, in + out) or by precomputed centrality importance,
+        plus the edges between them. Every other memory is folded into
+        "cluster" super-nodes: one per visible memory holding its hidden
+        neighbors, and a ``cluster:rest`` node for memories not adjacent to any
+        visible one. Clusters are opened with :meth:`expand_graph_node`.
+
+        Args:
+            node_budget: Maximum number of memory nodes to return
+            rank_by: "degree" or "centrality" (falls back to degree when no
+                centrality has been computed yet)
+            min_connections: Minimum degree a memory must have to be counted
+
+        Returns:
+            Dictionary with "nodes" and "edges" (D3.js format, as in
+            get_graph_visualization_data), "clusters", "cluster_edges" and "meta"
+        """
+        if rank_by not in ("degree", "centrality"):
+            raise ValueError(f"rank_by must be 'degree' or 'centrality', got {rank_by!r}")
+        empty = {"nodes": [], "edges": [], "clusters": [], "cluster_edges": [], "meta": {}}
+
+        try:
+            if not self.conn:
+                logger.error("Database not initialized")
+                return empty
+
+            def _view():
+                cursor = self.conn.cursor()
+                try:
+                    degree_query = """
+                        SELECT h, SUM(c) AS degree FROM (
+                            SELECT source_hash AS h, COUNT(*) AS c FROM memory_graph GROUP BY source_hash
+                            UNION ALL
+                            SELECT target_hash AS h, COUNT(*) AS c FROM memory_graph GROUP BY target_hash
+                        ) GROUP BY h
+                    """
+                    ranked_by = rank_by
+                    if rank_by == "centrality":
+                        try:
+                            cursor.execute("""
+                                SELECT c.content_hash, c.degree, COUNT(*) OVER () AS total
+                                FROM memory_centrality c
+                                JOIN memories m ON m.content_hash = c.content_hash AND m.deleted_at IS NULL
+                                WHERE c.degree >= ?
+                                ORDER BY c.importance DESC, c.content_hash
+                                LIMIT ?
+                            """, (min_connections, node_budget))
+                            ranked = cursor.fetchall()
+                        except sqlite3.OperationalError:
+                            ranked = []
+                        if not ranked:
+                            ranked_by = "degree"
+                    if ranked_by == "degree":
+                        cursor.execute(f"""
+                            SELECT d.h, d.degree, COUNT(*) OVER () AS total
+                            FROM ({degree_query}) d
+                            JOIN memories m ON m.content_hash = d.h AND m.deleted_at IS NULL
+                            WHERE d.degree >= ?
+                            ORDER BY d.degree DESC, d.h
+                            LIMIT ?
+                        """, (min_connections, node_budget))
+                        ranked = cursor.fetchall()
+
+                    total_nodes = ranked[0][2] if ranked else 0
+                    degrees = {content_hash: degree for content_hash, degree, _ in ranked}
+                    self._load_graph_view_nodes(cursor, degrees)
+
+                    nodes = self._graph_view_nodes(cursor, degrees)
+                    edges = self._graph_view_edges(cursor)
+
+                    # Hidden neighbors of each visible node, aggregated per node.
+                    # Neighbors are drawn from the population total_nodes counts
+                    # (live memories with enough connections), so cluster:rest
+                    # is that population minus visible and adjacent memories.
+                    population = ""
+                    params: Tuple[Any, ...] = ()
+                    if min_connections > 1:
+                        population = f"JOIN ({degree_query}) d ON d.h = l.other AND d.degree >= ?"
+                        params = (min_connections,)
+                    hidden = f"""
+                        WITH linked(anchor, other, similarity) AS (
+                            SELECT mg.source_hash, mg.target_hash, mg.similarity
+                            FROM memory_graph mg
+                            JOIN temp.graph_view_nodes v ON v.content_hash = mg.source_hash
+                            WHERE mg.target_hash NOT IN (SELECT content_hash FROM temp.graph_view_nodes)
+                            UNION ALL
+                            SELECT mg.target_hash, mg.source_hash, mg.similarity
+                            FROM memory_graph mg
+                            JOIN temp.graph_view_nodes v ON v.content_hash = mg.target_hash
+                            WHERE mg.source_hash NOT IN (SELECT content_hash FROM temp.graph_view_nodes)
+                        ),
+                        hidden(anchor, other, similarity) AS (
+                            SELECT l.anchor, l.other, l.similarity
+                            FROM linked l
+                            JOIN memories m ON m.content_hash = l.other AND m.deleted_at IS NULL
+                            {population}
+                        )
+                    """
+                    cursor.execute(hidden + """
+                        SELECT anchor, COUNT(DISTINCT other), AVG(similarity)
+                        FROM hidden GROUP BY anchor
+                    """, params)
+                    anchored = cursor.fetchall()
+                    cursor.execute(hidden + "SELECT COUNT(DISTINCT other) FROM hidden", params)
+                    adjacent_hidden = cursor.fetchone()[0]
+                    cursor.execute("""
+                        SELECT COUNT(*) FROM memory_graph mg
+                        JOIN memories s ON s.content_hash = mg.source_hash AND s.deleted_at IS NULL
+                        JOIN memories t ON t.content_hash = mg.target_hash AND t.deleted_at IS NULL
+                    """)
+                    total_edges = cursor.fetchone()[0]
+                    return nodes, edges, anchored, adjacent_hidden, total_nodes, total_edges, ranked_by
+                finally:
+                    self._clear_graph_view_nodes(cursor)
+                    cursor.close()
+
+            nodes, edges, anchored, adjacent_hidden, total_nodes, total_edges, ranked_by = (
+                await self._execute_with_retry(_view)
+            )
+
+            clusters = []
+            cluster_edges = []
+            for anchor, size, avg_similarity in anchored:
+                cluster_id = f"cluster:{anchor}"
+                avg_similarity = round(avg_similarity, 4) if avg_similarity is not None else 0.5
+                clusters.append({
+                    "id": cluster_id,
+                    "type": "cluster",
+                    "anchor": anchor,
+                    "size": size,
+                    "avg_similarity": avg_similarity,
+                })
+                cluster_edges.append({
+                    "source": anchor,
+                    "target": cluster_id,
+                    "relationship_type": "cluster",
+                    "similarity": avg_similarity,
+                    "weight": size,
+                })
+            unreached = max(total_nodes - len(nodes) - adjacent_hidden, 0)
+            if unreached:
+                clusters.append({
+                    "id": "cluster:rest",
+                    "type": "cluster",
+                    "anchor": None,
+                    "size": unreached,
+                    "avg_similarity": None,
+                })
+
+            return {
+                "nodes": nodes,
+                "edges": edges,
+                "clusters": clusters,
+                "cluster_edges": cluster_edges,
+                "meta": {
+                    "total_nodes": total_nodes,
+                    "total_edges": total_edges,
+                    "visible_nodes": len(nodes),
+                    "visible_edges": len(edges),
+                    "hidden_nodes": max(total_nodes - len(nodes), 0),
+                    "node_budget": node_budget,
+                    "rank_by": ranked_by,
+                    "min_connections": min_connections,
+                }
+            }
+
+        except sqlite3.Error as e:
+            logger.error(f"Database error getting graph view: {str(e)}")
+            return empty
+
+    async def expand_graph_node(
+        self,
+        content_hash: str,
+        limit: int = 50,
+        offset: int = 0
+    ) -> Dict[str, Any]:
+        """
+        One page of a memory's neighbors, for expanding a graph view on demand.
+
+        Neighbors (in either direction) are ordered by strongest similarity,
+        so successive pages open a cluster super-node from its closest members.
+
+        Args:
+            content_hash: Memory whose neighbors to return
+            limit: Page size
+            offset: Number of neighbors to skip
+
+        Returns:
+            Dictionary with "nodes" and "edges" (D3.js format) for the page,
+            the expanded "node", "total" neighbor count, "offset", "limit" and
+            "has_more"
+        """
+        result = {
+            "node": content_hash, "nodes": [], "edges": [],
+            "total": 0, "offset": offset, "limit": limit, "has_more": False
+        }
+
+        try:
+            if not self.conn:
+                logger.error("Database not initialized")
+                return result
+
+            def _expand():
+                cursor = self.conn.cursor()
+                try:
+                    # Soft-deleted neighbors are neither listed nor counted
+                    cursor.execute("""
+                        SELECT n.other, COUNT(*) OVER () AS total FROM (
+                            SELECT target_hash AS other, similarity FROM memory_graph WHERE source_hash = ?
+                            UNION ALL
+                            SELECT source_hash AS other, similarity FROM memory_graph WHERE target_hash = ?
+                        ) n
+                        JOIN memories m ON m.content_hash = n.other AND m.deleted_at IS NULL
+                        GROUP BY n.other
+                        ORDER BY MAX(n.similarity) DESC, n.other
+                        LIMIT ? OFFSET ?
+                    """, (content_hash, content_hash, limit, offset))
+                    page = cursor.fetchall()
+                    if not page:
+                        cursor.execute("""
+                            SELECT COUNT(*) FROM (
+                                SELECT target_hash AS other FROM memory_graph WHERE source_hash = ?
+                                UNION
+                                SELECT source_hash AS other FROM memory_graph WHERE target_hash = ?
+                            ) n
+                            JOIN memories m ON m.content_hash = n.other AND m.deleted_at IS NULL
+                        """, (content_hash, content_hash))
+                        return [], [], cursor.fetchone()[0]
+
+                    self._load_graph_view_nodes(cursor, [content_hash] + [other for other, _ in page])
+                    cursor.execute("""
+                        SELECT h, SUM(c) FROM (
+                            SELECT mg.source_hash AS h, COUNT(*) AS c FROM memory_graph mg
+                            JOIN temp.graph_view_nodes v ON v.content_hash = mg.source_hash
+                            GROUP BY mg.source_hash
+                            UNION ALL
+                            SELECT mg.target_hash AS h, COUNT(*) AS c FROM memory_graph mg
+                            JOIN temp.graph_view_nodes v ON v.content_hash = mg.target_hash
+                            GROUP BY mg.target_hash
+                        ) GROUP BY h
+                    """)
+                    counts = dict(cursor.fetchall())
+                    degrees = {other: counts.get(other, 0) for other, _ in page}
+                    # Edges to the expanded memory and among the page's neighbors
+                    return self._graph_view_nodes(cursor, degrees), self._graph_view_edges(cursor), page[0][1]
+                finally:
+                    self._clear_graph_view_nodes(cursor)
+                    cursor.close()
+
+            nodes, edges, total = await self._execute_with_retry(_expand)
+            result.update(
+                nodes=nodes, edges=edges, total=total,
+                has_more=offset + limit < total
+            )
+            return result
+
+        except sqlite3.Error as e:
+            logger.error(f"Database error expanding graph node: {str(e)}")
+            return result
+
     # -------------------------------------------------------------------------
     # Memory Evolution P2: Staleness Scoring
     # -------------------------------------------------------------------------
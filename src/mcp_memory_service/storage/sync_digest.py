@@ -0,0 +1,258 @@
+# Copyright 2024 Heinrich Krupp
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Hash-range digests for anti-entropy reconciliation between storage backends.
+
+Both the local SQLite-vec database and Cloudflare D1 keep a ``memories`` table
+keyed by ``content_hash``. Instead of shipping every hash across the wire to
+find differences, each side aggregates its rows into prefix buckets
+(``substr(content_hash, 1, n)``) and reports ``(count, hash_sum, time_sum)``
+per bucket. Buckets whose digests match are identical with overwhelming
+probability and are skipped; only differing buckets are refined one hex digit
+at a time until they are small enough to compare row by row.
+
+With a handful of changes in a 100k-memory corpus this costs a few round trips
+per side instead of a full hash scan.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Root level: 2 hex digits -> 256 buckets (one query per side)
+DIGEST_ROOT_PREFIX_LEN = 2
+# Deepest refinement before falling back to row comparison
+DIGEST_MAX_PREFIX_LEN = 8
+# Buckets with at most this many rows are compared row by row
+DIGEST_DEFAULT_LEAF_SIZE = 256
+# Prefixes per query; each prefix binds two parameters and D1 caps a
+# statement at 100 bound parameters.
+DIGEST_PREFIXES_PER_QUERY = 40
+# Timestamp tolerance used by drift detection (seconds)
+DIGEST_TIMESTAMP_TOLERANCE = 1.0
+
+# Additive hash over the trailing 7 hex digits of content_hash (base-17 so that
+# non-hex characters map to 0 without colliding with '0'). Row values stay below
+# 2**33, so SUM() cannot overflow SQLite's 64-bit integers for realistic corpora.
+_HASH_SUM_EXPR = " + ".join(
+    f"instr('0123456789abcdef', lower(substr(content_hash, -{i}, 1))) * {17 ** (i - 1)}"
+    for i in range(1, 8)
+)
+_TIME_SUM_EXPR = "CAST(COALESCE(updated_at, 0) AS INTEGER)"
+
+BucketDigest = Tuple[int, int, int]  # (count, hash_sum, time_sum)
+
+
+def _range_filter(prefixes: List[str]) -> Tuple[str, List[Any]]:
+    """Build an index-friendly OR of ``content_hash BETWEEN prefix AND prefix~``."""
+    clauses = []
+    params: List[Any] = []
+    for prefix in prefixes:
+        clauses.append("content_hash BETWEEN ? AND ?")
+        # '~' sorts after every hex digit and alphanumeric character
+        params.extend([prefix, prefix + "~"])
+    return "(" + " OR ".join(clauses) + ")", params
+
+
+def build_bucket_digest_query(prefix_len: int, parents: Optional[List[str]] = None) -> Tuple[str, List[Any]]:
+    """
+    Build the aggregate query for one digest level.
+
+    Args:
+        prefix_len: Length of the bucket prefix to group by
+        parents: Optional list of parent prefixes restricting the scan
+
+    Returns:
+        Tuple of (sql, params) returning rows of (bucket, n, hash_sum, time_sum)
+    """
+    sql = (
+        f"SELECT substr(content_hash, 1, {int(prefix_len)}) AS bucket, "
+        f"COUNT(*) AS n, SUM({_HASH_SUM_EXPR}) AS hash_sum, SUM({_TIME_SUM_EXPR}) AS time_sum "
+        "FROM memories WHERE deleted_at IS NULL"
+    )
+    params: List[Any] = []
+    if parents:
+        clause, params = _range_filter(parents)
+        sql += f" AND {clause}"
+    sql += " GROUP BY bucket"
+    return sql, params
+
+
+def build_bucket_entries_query(prefixes: List[str]) -> Tuple[str, List[Any]]:
+    """Build the leaf query returning (content_hash, updated_at) rows for buckets."""
+    clause, params = _range_filter(prefixes)
+    sql = (
+        "SELECT content_hash, updated_at FROM memories "
+        f"WHERE deleted_at IS NULL AND {clause}"
+    )
+    return sql, params
+
+
+def chunk_prefixes(prefixes: List[str], size: int = DIGEST_PREFIXES_PER_QUERY) -> List[List[str]]:
+    """Split prefixes into query-sized chunks."""
+    return [prefixes[i:i + size] for i in range(0, len(prefixes), size)]
+
+
+def rows_to_digests(rows) -> Dict[str, BucketDigest]:
+    """Convert (bucket, n, hash_sum, time_sum) rows into a digest mapping."""
+    return {
+        row[0]: (int(row[1] or 0), int(row[2] or 0), int(row[3] or 0))
+        for row in rows
+    }
+
+
+@dataclass
+class DigestDiff:
+    """Result of a digest reconciliation between a primary and a secondary."""
+    missing_local: List[str] = field(default_factory=list)    # only on secondary
+    missing_remote: List[str] = field(default_factory=list)   # only on primary
+    newer_remote: List[str] = field(default_factory=list)     # secondary updated_at is newer
+    newer_local: List[str] = field(default_factory=list)      # primary updated_at is newer
+    buckets_compared: int = 0
+    buckets_differing: int = 0
+    round_trips: int = 0
+
+    @property
+    def in_sync(self) -> bool:
+        return not (self.missing_local or self.missing_remote or self.newer_remote or self.newer_local)
+
+    def summary(self) -> Dict[str, int]:
+        return {
+            'missing_local': len(self.missing_local),
+            'missing_remote': len(self.missing_remote),
+            'newer_remote': len(self.newer_remote),
+            'newer_local': len(self.newer_local),
+            'buckets_compared': self.buckets_compared,
+            'buckets_differing': self.buckets_differing,
+            'round_trips': self.round_trips,
+        }
+
+
+def supports_digest(storage: Any) -> bool:
+    """Whether a storage backend implements the hash-range digest protocol."""
+    return (
+        storage is not None
+        and hasattr(storage, 'get_hash_bucket_digests')
+        and hasattr(storage, 'get_hash_bucket_entries')
+    )
+
+
+async def reconcile_digests(
+    primary: Any,
+    secondary: Any,
+    leaf_size: int = DIGEST_DEFAULT_LEAF_SIZE,
+    tolerance: float = DIGEST_TIMESTAMP_TOLERANCE,
+) -> DigestDiff:
+    """
+    Find the content hashes that differ between two backends.
+
+    Compares root-level bucket digests, descends only into buckets whose
+    digests differ, and compares rows once a bucket holds at most
+    ``leaf_size`` rows (or one side has no rows in it at all).
+
+    Args:
+        primary: Local backend implementing the digest protocol
+        secondary: Remote backend implementing the digest protocol
+        leaf_size: Row count at which a bucket is compared row by row
+        tolerance: updated_at difference (seconds) treated as equal
+
+    Returns:
+        DigestDiff describing missing and drifted hashes on each side
+    """
+    diff = DigestDiff()
+    prefix_len = DIGEST_ROOT_PREFIX_LEN
+    parents: Optional[List[str]] = None
+
+    while True:
+        local_digests = await _digests_for_level(primary, prefix_len, parents, diff)
+        remote_digests = await _digests_for_level(secondary, prefix_len, parents, diff)
+
+        buckets = set(local_digests) | set(remote_digests)
+        diff.buckets_compared += len(buckets)
+
+        leaves: List[str] = []
+        deeper: List[str] = []
+        for bucket in sorted(buckets):
+            local = local_digests.get(bucket)
+            remote = remote_digests.get(bucket)
+            if local == remote:
+                continue
+            diff.buckets_differing += 1
+            local_count = local[0] if local else 0
+            remote_count = remote[0] if remote else 0
+            if (
+                local_count == 0
+                or remote_count == 0
+                or max(local_count, remote_count) <= leaf_size
+                or prefix_len >= DIGEST_MAX_PREFIX_LEN
+            ):
+                leaves.append(bucket)
+            else:
+                deeper.append(bucket)
+
+        if leaves:
+            await _compare_leaves(primary, secondary, leaves, diff, tolerance)
+
+        if not deeper:
+            break
+        parents = deeper
+        prefix_len += 1
+
+    logger.debug(f"Digest reconciliation: {diff.summary()}")
+    return diff
+
+
+async def _digests_for_level(storage: Any, prefix_len: int, parents: Optional[List[str]],
+                             diff: DigestDiff) -> Dict[str, BucketDigest]:
+    if parents is None:
+        diff.round_trips += 1
+        return await storage.get_hash_bucket_digests(prefix_len)
+    digests: Dict[str, BucketDigest] = {}
+    for chunk in chunk_prefixes(parents):
+        diff.round_trips += 1
+        digests.update(await storage.get_hash_bucket_digests(prefix_len, chunk))
+    return digests
+
+
+async def _entries(storage: Any, prefixes: List[str], diff: DigestDiff) -> Dict[str, Optional[float]]:
+    entries: Dict[str, Optional[float]] = {}
+    for chunk in chunk_prefixes(prefixes):
+        diff.round_trips += 1
+        entries.update(await storage.get_hash_bucket_entries(chunk))
+    return entries
+
+
+async def _compare_leaves(primary: Any, secondary: Any, prefixes: List[str],
+                          diff: DigestDiff, tolerance: float) -> None:
+    local_entries = await _entries(primary, prefixes, diff)
+    remote_entries = await _entries(secondary, prefixes, diff)
+
+    for content_hash, remote_updated in remote_entries.items():
+        if content_hash not in local_entries:
+            diff.missing_local.append(content_hash)
+            continue
+        remote_ts = remote_updated or 0
+        local_ts = local_entries[content_hash] or 0
+        if abs(remote_ts - local_ts) > tolerance:
+            if remote_ts > local_ts:
+                diff.newer_remote.append(content_hash)
+            else:
+                diff.newer_local.append(content_hash)
+
+    for content_hash in local_entries:
+        if content_hash not in remote_entries:
+            diff.missing_remote.append(content_hash)
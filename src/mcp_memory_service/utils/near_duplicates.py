@@ -0,0 +1,235 @@
+# Copyright 2024 Heinrich Krupp
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Near-duplicate detection with MinHash signatures and LSH banding.
+
+Every text is tokenized once into its set of lowercased words and reduced to
+a MinHash signature, whose matching positions estimate the word Jaccard
+similarity of two texts. Signatures are split into bands and bucketed, so
+texts that are likely similar land in a shared bucket and candidate lookup
+costs O(bands) per memory instead of a scan over all others. Candidates are
+then confirmed with the exact rules in :func:`is_near_duplicate`.
+
+Signatures depend only on the content, so they can be persisted by content
+hash and reused (see ``SqliteVecMemoryStorage.cleanup_duplicates``).
+"""
+
+import zlib
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+DEFAULT_NUM_PERM = 64
+DEFAULT_BANDS = 16
+DEFAULT_THRESHOLD = 0.8
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+# Fixed seed: persisted signatures must stay comparable across processes
+_PERMUTATION_SEED = 1
+
+
+def normalize_text(text: str) -> str:
+    """Lowercased text with whitespace runs collapsed, as duplicate checks compare it."""
+    return " ".join(text.lower().split())
+
+
+def _permutations(num_perm: int) -> Tuple[np.ndarray, np.ndarray]:
+    rng = np.random.RandomState(_PERMUTATION_SEED)
+    a = rng.randint(1, np.iinfo(np.int64).max, size=num_perm, dtype=np.int64).astype(np.uint64) % _MERSENNE_PRIME
+    b = rng.randint(0, np.iinfo(np.int64).max, size=num_perm, dtype=np.int64).astype(np.uint64) % _MERSENNE_PRIME
+    return a, b
+
+
+_PERMUTATION_CACHE: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+
+
+def minhash_signature(words: Iterable[str], num_perm: int = DEFAULT_NUM_PERM) -> np.ndarray:
+    """
+    MinHash signature (uint32, length ``num_perm``) of a set of words.
+
+    An empty set yields the maximum hash in every position.
+    """
+    if num_perm not in _PERMUTATION_CACHE:
+        _PERMUTATION_CACHE[num_perm] = _permutations(num_perm)
+    a, b = _PERMUTATION_CACHE[num_perm]
+    hashes = np.fromiter((zlib.crc32(word.encode("utf-8")) for word in set(words)), dtype=np.uint64)
+    if len(hashes) == 0:
+        return np.full(num_perm, _MAX_HASH, dtype=np.uint32)
+    with np.errstate(over="ignore"):
+        permuted = (hashes[:, None] * a + b) % _MERSENNE_PRIME & _MAX_HASH
+    return permuted.min(axis=0).astype(np.uint32)
+
+
+def is_near_duplicate(text1: str, text2: str, threshold: float = DEFAULT_THRESHOLD) -> bool:
+    """
+    Exact duplicate check between two normalized texts.
+
+    Texts are duplicates if equal, or, when both are longer than 50
+    characters, if one contains the other or their word sets (more than 5
+    words each) have a Jaccard similarity above ``threshold``.
+    """
+    if text1 == text2:
+        return True
+    if len(text1) > 50 and len(text2) > 50:
+        if text1 in text2 or text2 in text1:
+            return True
+        words1, words2 = set(text1.split()), set(text2.split())
+        if len(words1) > 5 and len(words2) > 5:
+            return len(words1 & words2) / len(words1 | words2) > threshold
+    return False
+
+
+class NearDuplicateIndex:
+    """
+    LSH index over MinHash signatures keyed by content hash.
+
+    ``bands * rows`` must equal ``num_perm``. With the defaults (16 bands of
+    4 rows) a pair with word Jaccard 0.8 shares a bucket with probability
+    above 0.999, while pairs below ~0.3 rarely become candidates.
+    """
+
+    def __init__(
+        self,
+        threshold: float = DEFAULT_THRESHOLD,
+        num_perm: int = DEFAULT_NUM_PERM,
+        bands: int = DEFAULT_BANDS,
+        min_length: int = 20,
+    ):
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be a multiple of bands ({bands})")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.min_length = min_length
+        self._texts: Dict[str, str] = {}
+        self._signatures: Dict[str, np.ndarray] = {}
+        self._exact: Dict[str, List[str]] = defaultdict(list)
+        self._buckets: Dict[Tuple[int, bytes], List[str]] = defaultdict(list)
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._texts
+
+    def signature(self, key: str) -> Optional[np.ndarray]:
+        """Signature of an indexed text (None if it is too short to be indexed)."""
+        return self._signatures.get(key)
+
+    def add(self, key: str, text: str, signature: Optional[np.ndarray] = None) -> None:
+        """
+        Index ``text`` under ``key``; a repeated key is ignored.
+
+        Pass a stored ``signature`` to skip recomputing it. Texts shorter than
+        ``min_length`` after normalization are not indexed.
+        """
+        normalized = normalize_text(text)
+        if key in self._texts or len(normalized) < self.min_length:
+            return
+        if signature is None or len(signature) != self.num_perm:
+            signature = minhash_signature(normalized.split(), self.num_perm)
+        self._texts[key] = normalized
+        self._signatures[key] = signature
+        self._exact[normalized].append(key)
+        for band, bucket in enumerate(self._band_keys(signature)):
+            self._buckets[(band, bucket)].append(key)
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [signature[i * self.rows:(i + 1) * self.rows].tobytes() for i in range(self.bands)]
+
+    def candidates(self, key: str) -> Set[str]:
+        """Keys sharing the exact text or at least one LSH bucket with ``key``."""
+        if key not in self._texts:
+            return set()
+        found = set(self._exact[self._texts[key]])
+        for band, bucket in enumerate(self._band_keys(self._signatures[key])):
+            found.update(self._buckets[(band, bucket)])
+        found.discard(key)
+        return found
+
+    def duplicates_of(self, key: str) -> List[str]:
+        """Indexed keys confirmed as near duplicates of ``key``."""
+        text = self._texts.get(key)
+        if text is None:
+            return []
+        return [
+            other for other in self.candidates(key)
+            if is_near_duplicate(text, self._texts[other], self.threshold)
+        ]
+
+    def has_duplicate(self, key: str) -> bool:
+        """Whether any other indexed key is a near duplicate of ``key``."""
+        text = self._texts.get(key)
+        if text is None:
+            return False
+        if len(self._exact[text]) > 1:
+            return True
+        return any(
+            is_near_duplicate(text, self._texts[other], self.threshold)
+            for other in self.candidates(key)
+        )
+
+    def redundant(self) -> List[str]:
+        """
+        Keys to drop so that no two kept keys are near duplicates, in insertion order.
+
+        Keys are walked in insertion order and each key is kept unless it is a
+        near duplicate of a key already kept. Unlike :meth:`groups`, whose
+        transitive chains can join keys that are not similar to each other,
+        every dropped key is a confirmed near duplicate of an earlier kept key.
+        """
+        order = {key: position for position, key in enumerate(self._texts)}
+        dropped: Set[str] = set()
+        for key in self._texts:
+            if key in dropped:
+                continue
+            dropped.update(other for other in self.duplicates_of(key) if order[other] > order[key])
+        return sorted(dropped, key=order.__getitem__)
+
+    def groups(self) -> List[List[str]]:
+        """
+        Connected groups of near duplicates, each in insertion order.
+
+        Only groups with at least two keys are returned, ordered by their
+        first key's insertion order.
+        """
+        order = {key: position for position, key in enumerate(self._texts)}
+        parent = {key: key for key in self._texts}
+
+        def find(key: str) -> str:
+            while parent[key] != key:
+                parent[key] = parent[parent[key]]
+                key = parent[key]
+            return key
+
+        for key in self._texts:
+            for other in self.duplicates_of(key):
+                root, other_root = find(key), find(other)
+                if root != other_root:
+                    # Earliest inserted key stays the root
+                    if order[other_root] < order[root]:
+                        root, other_root = other_root, root
+                    parent[other_root] = root
+
+        members: Dict[str, List[str]] = defaultdict(list)
+        for key in self._texts:
+            members[find(key)].append(key)
+        return sorted(
+            (group for group in members.values() if len(group) > 1),
+            key=lambda group: order[group[0]],
+        )
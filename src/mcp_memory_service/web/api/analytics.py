@@ -714,6 +714,79 @@ async def get_graph_visualization(
         raise HTTPException(status_code=500, detail=f"Failed to get graph visualization data: {str(e)}")
 
 
+class GraphRankType(str, Enum):
+    """Node ranking for level-of-detail graph views."""
+    DEGREE = "degree"
+    CENTRALITY = "centrality"
+
+
+class GraphViewData(BaseModel):
+    """Level-of-detail graph: top nodes plus cluster super-nodes for the rest."""
+    nodes: List[Dict[str, Any]]
+    edges: List[Dict[str, Any]]
+    clusters: List[Dict[str, Any]]
+    cluster_edges: List[Dict[str, Any]]
+    meta: Dict[str, Any]
+
+
+class GraphExpansionData(BaseModel):
+    """One page of a memory's neighbors for expanding a graph view."""
+    node: str
+    nodes: List[Dict[str, Any]]
+    edges: List[Dict[str, Any]]
+    total: int
+    offset: int
+    limit: int
+    has_more: bool
+
+
+@router.get("/graph-view", response_model=GraphViewData, tags=["analytics"])
+async def get_graph_view(
+    node_budget: int = Query(200, description="Maximum number of memory nodes to return", ge=1, le=2000),
+    rank_by: GraphRankType = Query(GraphRankType.DEGREE, description="Rank nodes by degree or precomputed centrality"),
+    min_connections: int = Query(1, description="Minimum connections per node", ge=1),
+    storage: MemoryStorage = Depends(get_storage),
+    user: AuthenticationResult = Depends(require_read_access)
+):
+    """
+    Get a level-of-detail knowledge graph for large graphs.
+
+    Returns the top memories by degree or centrality within the node budget and
+    the edges between them. All other memories are summarized as cluster
+    super-nodes (one per visible memory holding its hidden neighbors, plus
+    ``cluster:rest``), which the client opens with ``/graph-view/expand``.
+    """
+    try:
+        graph_data = await storage.get_graph_view(node_budget, rank_by.value, min_connections)
+        return GraphViewData(**graph_data)
+
+    except Exception as e:
+        logger.error(f"Failed to get graph view: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to get graph view: {str(e)}")
+
+
+@router.get("/graph-view/expand/{content_hash}", response_model=GraphExpansionData, tags=["analytics"])
+async def expand_graph_view_node(
+    content_hash: str,
+    limit: int = Query(50, description="Neighbors per page", ge=1, le=500),
+    offset: int = Query(0, description="Neighbors to skip", ge=0),
+    storage: MemoryStorage = Depends(get_storage),
+    user: AuthenticationResult = Depends(require_read_access)
+):
+    """
+    Get one page of a memory's neighbors, strongest similarity first.
+
+    Used to expand a node or cluster super-node of ``/graph-view`` on demand.
+    """
+    try:
+        expansion = await storage.expand_graph_node(content_hash, limit, offset)
+        return GraphExpansionData(**expansion)
+
+    except Exception as e:
+        logger.error(f"Failed to expand graph node: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to expand graph node: {str(e)}")
+
+
 @router.get("/search-analytics", response_model=SearchAnalytics, tags=["analytics"])
 async def get_search_analytics(
     user: AuthenticationResult = Depends(require_read_access)
@@ -110,6 +110,7 @@ PARAM_DESCRIPTIONS = {
     "MCP_MILVUS_URI": "Milvus endpoint: ./milvus.db (Milvus Lite), http://host:19530 (self-hosted), or https://xxx.zillizcloud.com (Zilliz Cloud)",
     "MCP_MILVUS_TOKEN": "Auth token for Zilliz Cloud or authenticated Milvus servers (leave blank for Milvus Lite)",
     "MCP_MILVUS_COLLECTION_NAME": "Milvus collection name (default: mcp_memory)",
+    "MCP_MILVUS_READ_POOL_SIZE": "Concurrent read clients for remote Milvus / Zilliz Cloud (ignored for Milvus Lite, default: 4)",
 
     # Quality System
     "MCP_QUALITY_SYSTEM_ENABLED": "Enable AI-powered quality scoring system",
@@ -118,6 +119,10 @@ PARAM_DESCRIPTIONS = {
     "MCP_QUALITY_LOCAL_DEVICE": "Device for local inference: auto, cpu, cuda, mps, directml",
     "MCP_QUALITY_BATCH_SIZE": "Maximum items per ONNX inference batch (default: 32, higher = faster on GPU)",
     "MCP_QUALITY_MIN_GPU_BATCH": "Minimum batch size for GPU batched inference (default: 16)",
+    "MCP_QUALITY_ONNX_INTRA_OP_THREADS": "ONNX Runtime intra-op threads for quality scoring (0 = runtime default)",
+    "MCP_QUALITY_ONNX_GRAPH_OPTIMIZATION": "ONNX graph optimization level: disabled, basic, extended, all (default: all)",
+    "MCP_QUALITY_ONNX_CPU_MEM_ARENA": "Use the ONNX Runtime CPU memory arena (default: true)",
+    "MCP_QUALITY_ONNX_MAX_LENGTH": "Token limit per quality scoring sequence (16-512, default: 512)",
     "MCP_QUALITY_BOOST_ENABLED": "Enable quality-boosted search (default: false)",
     "MCP_QUALITY_BOOST_WEIGHT": "Quality weight for boosted search (0.0-1.0, default: 0.3)",
     "MCP_QUALITY_RETENTION_HIGH": "Retention period for high quality memories (days)",
@@ -176,14 +181,24 @@ PARAM_DESCRIPTIONS = {
     "MCP_CLUSTERING_ENABLED": "Enable memory clustering",
     "MCP_CLUSTERING_MIN_SIZE": "Minimum cluster size",
     "MCP_CLUSTERING_ALGORITHM": "Clustering algorithm: dbscan, hierarchical, simple",
+    "MCP_CLUSTERING_MEMORY_BUDGET_MB": "Working-set memory budget for clustering (MB)",
+    "MCP_CLUSTERING_MAX_NEIGHBORS": "Strongest neighbours kept per memory when clustering",
+    "MCP_CLUSTER_INDEX_ENABLED": "Keep a persistent cluster index updated incrementally",
+    "MCP_CLUSTER_ASSIGN_THRESHOLD": "Minimum similarity for a new memory to join an indexed cluster (0.0-1.0)",
+    "MCP_CLUSTER_DRIFT_THRESHOLD": "Cluster index drift that triggers a full re-cluster (0.0-1.0)",
     "MCP_COMPRESSION_ENABLED": "Enable memory compression",
     "MCP_COMPRESSION_MAX_LENGTH": "Maximum summary length for compression",
     "MCP_COMPRESSION_PRESERVE_ORIGINALS": "Preserve original memories after compression",
+    "MCP_COMPRESSION_SUMMARIZER": "Summary sentence selection: tfidf (batched, default), concepts",
     "MCP_FORGETTING_ENABLED": "Enable quality-based forgetting",
     "MCP_FORGETTING_RELEVANCE_THRESHOLD": "Relevance threshold for forgetting (0.0-1.0)",
     "MCP_FORGETTING_ACCESS_THRESHOLD": "Access threshold for forgetting (days)",
     "MCP_CONSOLIDATION_BATCH_SIZE": "Batch size for consolidation operations",
     "MCP_CONSOLIDATION_INCREMENTAL": "Use incremental consolidation mode",
+    "MCP_CONSOLIDATION_CHUNK_SIZE": "Memories per chunk read from storage during consolidation",
+    "MCP_CONSOLIDATION_WINDOW_SIZE": "Memories per window in full consolidation runs (0 = whole horizon)",
+    "MCP_CONSOLIDATION_MAX_WORKERS": "Max worker processes (CPU cores) for consolidation phases",
+    "MCP_CONSOLIDATION_PROFILE_HISTORY": "Per-phase performance profiles of recent consolidation runs to keep",
     "MCP_SCHEDULE_DAILY": "Daily consolidation schedule (HH:MM)",
     "MCP_SCHEDULE_WEEKLY": "Weekly consolidation schedule (DAY HH:MM)",
     "MCP_SCHEDULE_MONTHLY": "Monthly consolidation schedule (DD HH:MM)",
@@ -218,6 +233,10 @@ PARAM_DESCRIPTIONS = {
     "MCP_SSE_HEARTBEAT": "Server-Sent Events heartbeat interval (seconds)",
     "MCP_MEMORY_INCLUDE_HOSTNAME": "Include hostname in machine identification",
     "MCP_GRAPH_STORAGE_MODE": "Graph storage mode: memories_only, dual_write, graph_only",
+    "MCP_GRAPH_ADJACENCY_CACHE": "Run graph traversals over an in-memory CSR adjacency instead of recursive SQL (default: false)",
+    "MCP_GRAPH_PATH_MAX_EXPANDED_NODES": "Node expansion budget for memory_graph path searches (default: 10000)",
+    "MCP_GRAPH_CENTRALITY_ENABLED": "Refresh PageRank/degree centrality after consolidation (default: true)",
+    "MCP_GRAPH_IMPORTANCE_WEIGHT": "Graph importance weight blended into search ranking (0.0-1.0, default: 0.0)",
 }
 
 
@@ -287,6 +306,7 @@ ENV_CATEGORIES = {
             ("MCP_MILVUS_URI", "string", None, False),
             ("MCP_MILVUS_TOKEN", "string", None, True),
             ("MCP_MILVUS_COLLECTION_NAME", "string", None, False),
+            ("MCP_MILVUS_READ_POOL_SIZE", "integer", None, False),
         ]
     },
     "quality": {
@@ -299,6 +319,10 @@ ENV_CATEGORIES = {
             ("MCP_QUALITY_LOCAL_DEVICE", "choice", ["auto", "cpu", "cuda", "mps", "directml"], False),
             ("MCP_QUALITY_BATCH_SIZE", "integer", None, False),
             ("MCP_QUALITY_MIN_GPU_BATCH", "integer", None, False),
+            ("MCP_QUALITY_ONNX_INTRA_OP_THREADS", "integer", None, False),
+            ("MCP_QUALITY_ONNX_GRAPH_OPTIMIZATION", "choice", ["disabled", "basic", "extended", "all"], False),
+            ("MCP_QUALITY_ONNX_CPU_MEM_ARENA", "boolean", None, False),
+            ("MCP_QUALITY_ONNX_MAX_LENGTH", "integer", None, False),
             ("MCP_QUALITY_BOOST_ENABLED", "boolean", None, False),
             ("MCP_QUALITY_BOOST_WEIGHT", "float", None, False),
             ("MCP_QUALITY_RETENTION_HIGH", "integer", None, False),
@@ -379,14 +403,24 @@ ENV_CATEGORIES = {
             ("MCP_CLUSTERING_ENABLED", "boolean", None, False),
             ("MCP_CLUSTERING_MIN_SIZE", "integer", None, False),
             ("MCP_CLUSTERING_ALGORITHM", "choice", ["dbscan", "hierarchical", "simple"], False),
+            ("MCP_CLUSTERING_MEMORY_BUDGET_MB", "integer", None, False),
+            ("MCP_CLUSTERING_MAX_NEIGHBORS", "integer", None, False),
+            ("MCP_CLUSTER_INDEX_ENABLED", "boolean", None, False),
+            ("MCP_CLUSTER_ASSIGN_THRESHOLD", "float", None, False),
+            ("MCP_CLUSTER_DRIFT_THRESHOLD", "float", None, False),
             ("MCP_COMPRESSION_ENABLED", "boolean", None, False),
             ("MCP_COMPRESSION_MAX_LENGTH", "integer", None, False),
             ("MCP_COMPRESSION_PRESERVE_ORIGINALS", "boolean", None, False),
+            ("MCP_COMPRESSION_SUMMARIZER", "choice", ["tfidf", "concepts"], False),
             ("MCP_FORGETTING_ENABLED", "boolean", None, False),
             ("MCP_FORGETTING_RELEVANCE_THRESHOLD", "float", None, False),
             ("MCP_FORGETTING_ACCESS_THRESHOLD", "integer", None, False),
             ("MCP_CONSOLIDATION_BATCH_SIZE", "integer", None, False),
             ("MCP_CONSOLIDATION_INCREMENTAL", "boolean", None, False),
+            ("MCP_CONSOLIDATION_CHUNK_SIZE", "integer", None, False),
+            ("MCP_CONSOLIDATION_WINDOW_SIZE", "integer", None, False),
+            ("MCP_CONSOLIDATION_MAX_WORKERS", "integer", None, False),
+            ("MCP_CONSOLIDATION_PROFILE_HISTORY", "integer", None, False),
             ("MCP_SCHEDULE_DAILY", "string", None, False),
             ("MCP_SCHEDULE_WEEKLY", "string", None, False),
             ("MCP_SCHEDULE_MONTHLY", "string", None, False),
@@ -425,6 +459,10 @@ ENV_CATEGORIES = {
             ("MCP_SSE_HEARTBEAT", "integer", None, False),
             ("MCP_MEMORY_INCLUDE_HOSTNAME", "boolean", None, False),
             ("MCP_GRAPH_STORAGE_MODE", "choice", ["memories_only", "dual_write", "graph_only"], False),
+            ("MCP_GRAPH_ADJACENCY_CACHE", "boolean", None, False),
+            ("MCP_GRAPH_PATH_MAX_EXPANDED_NODES", "integer", None, False),
+            ("MCP_GRAPH_CENTRALITY_ENABLED", "boolean", None, False),
+            ("MCP_GRAPH_IMPORTANCE_WEIGHT", "float", None, False),
         ]
     }
 }
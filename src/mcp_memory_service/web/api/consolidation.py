@@ -16,12 +16,13 @@
 Consolidation API endpoints for HTTP server.
 
 Provides RESTful HTTP access to memory consolidation operations
-including manual triggers and scheduler status queries.
+including manual triggers, scheduler status queries, checkpointed
+run records (query and resume) and per-phase performance profiles.
 """
 
 import logging
-from typing import Dict, Any, Optional
-from fastapi import APIRouter, HTTPException, Depends
+from typing import Dict, Any, List, Optional
+from fastapi import APIRouter, HTTPException, Depends, Query
 from pydantic import BaseModel, Field
 
 from ..oauth.middleware import require_read_access, require_write_access, AuthenticationResult
@@ -37,6 +38,14 @@ class ConsolidationRequest(BaseModel):
         default="weekly",
         description="Time horizon for consolidation (daily, weekly, monthly, quarterly, yearly)"
     )
+    run_id: Optional[str] = Field(
+        default=None,
+        description="Resume this unfinished run instead of starting a new one (uses the run's time horizon)"
+    )
+    capture_profile: bool = Field(
+        default=False,
+        description="Also record cProfile and tracemalloc captures of this run into the archive directory"
+    )
 
 
 class ConsolidationResponse(BaseModel):
@@ -47,6 +56,46 @@ class ConsolidationResponse(BaseModel):
     compressed: int = Field(description="Number of memories compressed")
     forgotten: int = Field(description="Number of memories forgotten/archived")
     duration: float = Field(description="Operation duration in seconds")
+    run_id: Optional[str] = Field(None, description="Checkpointed run record of this operation")
+
+
+class ConsolidationRunResponse(BaseModel):
+    """Response model for a checkpointed consolidation run."""
+    run_id: str = Field(description="Run record id")
+    time_horizon: str = Field(description="Time horizon of the run")
+    status: str = Field(description="Run status (running, completed, failed)")
+    attempts: int = Field(description="Times the run was started or resumed")
+    started_at: str = Field(description="Run start (ISO format)")
+    updated_at: str = Field(description="Last checkpoint (ISO format)")
+    finished_at: Optional[str] = Field(None, description="End of the last attempt (ISO format)")
+    error: Optional[str] = Field(None, description="Error of the last failed attempt")
+    windows_completed: int = Field(description="Memory windows fully consolidated")
+    streamed: bool = Field(description="Whether every window is done")
+    totals: Dict[str, int] = Field(description="Report counters accumulated so far")
+    current_window: Optional[Dict[str, Any]] = Field(
+        None, description="Window in progress: index, input set hash and completed phases with their outputs"
+    )
+
+
+class ConsolidationRunsResponse(BaseModel):
+    """Response model for the consolidation run list."""
+    runs: List[ConsolidationRunResponse] = Field(description="Recent runs, newest first")
+
+
+class ConsolidationProfileResponse(BaseModel):
+    """Response model for the per-phase profile of one consolidation run."""
+    timestamp: str = Field(description="End of the run (ISO format)")
+    time_horizon: str = Field(description="Time horizon of the run")
+    success: bool = Field(description="Whether the run finished without errors")
+    profile: Dict[str, Any] = Field(
+        description="Run totals and per-phase wall time, CPU time, peak RSS delta, items in/out, "
+                    "storage round trips and bytes read"
+    )
+
+
+class ConsolidationProfilesResponse(BaseModel):
+    """Response model for recent consolidation profiles."""
+    profiles: List[ConsolidationProfileResponse] = Field(description="Recent run profiles, newest first")
 
 
 class SchedulerStatusResponse(BaseModel):
@@ -104,14 +153,16 @@ async def trigger_consolidation(request: ConsolidationRequest, user: Authenticat
         from ...api.operations import _consolidate_async
 
         # Call the shared async implementation
-        result = await _consolidate_async(request.time_horizon)
+        result = await _consolidate_async(
+            request.time_horizon, run_id=request.run_id, capture_profile=request.capture_profile
+        )
 
         # Convert to dict for HTTP response
         return result._asdict()
 
     except ValueError:
         # Invalid time horizon - use fixed message to avoid leaking exception details
-        raise HTTPException(status_code=400, detail="Invalid time horizon specified")
+        raise HTTPException(status_code=400, detail="Invalid time horizon or run specified")
     except RuntimeError:
         # Consolidator not available - use fixed message to avoid leaking exception details
         raise HTTPException(status_code=503, detail="Consolidator not available")
@@ -120,6 +171,150 @@ async def trigger_consolidation(request: ConsolidationRequest, user: Authenticat
         raise HTTPException(status_code=500, detail="Consolidation failed")
 
 
+@router.get("/runs", response_model=ConsolidationRunsResponse)
+async def list_consolidation_runs(
+    limit: int = Query(default=10, ge=1, le=20, description="Maximum number of runs"),
+    user: AuthenticationResult = Depends(require_read_access)
+) -> Dict[str, Any]:
+    """
+    List recent checkpointed consolidation runs, newest first.
+
+    Each run records the windows it finished and, for the window in
+    progress, the hash of its input set and the phases already completed.
+    A run with status ``running`` or ``failed`` can be resumed.
+
+    Example:
+        GET /api/consolidation/runs?limit=5
+
+        Response:
+        {
+            "runs": [{
+                "run_id": "3f2a9c...",
+                "time_horizon": "quarterly",
+                "status": "failed",
+                "attempts": 1,
+                "windows_completed": 12,
+                "current_window": {"index": 13, "input_hash": "...", "phases": {"relevance": {...}}},
+                ...
+            }]
+        }
+    """
+    from ...api.client import get_consolidator
+
+    consolidator = get_consolidator()
+    if consolidator is None:
+        raise HTTPException(status_code=503, detail="Consolidator not available")
+    try:
+        return {"runs": [run.summary() for run in await consolidator.list_runs(limit)]}
+    except Exception:
+        logger.error("Failed to list consolidation runs")
+        raise HTTPException(status_code=500, detail="Failed to list consolidation runs")
+
+
+@router.get("/runs/{run_id}", response_model=ConsolidationRunResponse)
+async def get_consolidation_run(run_id: str, user: AuthenticationResult = Depends(require_read_access)) -> Dict[str, Any]:
+    """
+    Get one checkpointed consolidation run.
+
+    Raises:
+        HTTPException: 404 if the run is unknown
+    """
+    from ...api.client import get_consolidator
+
+    consolidator = get_consolidator()
+    if consolidator is None:
+        raise HTTPException(status_code=503, detail="Consolidator not available")
+    run = await consolidator.get_run(run_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail="Consolidation run not found")
+    return run.summary()
+
+
+@router.post("/runs/{run_id}/resume", response_model=ConsolidationResponse)
+async def resume_consolidation_run(run_id: str, user: AuthenticationResult = Depends(require_write_access)) -> Dict[str, Any]:
+    """
+    Resume an unfinished consolidation run from its last completed phase.
+
+    Raises:
+        HTTPException: 404 if the run is unknown, 409 if it already completed
+
+    Example:
+        POST /api/consolidation/runs/3f2a9c.../resume
+
+        Response:
+        {
+            "status": "completed",
+            "horizon": "quarterly",
+            "processed": 48210,
+            ...
+            "run_id": "3f2a9c..."
+        }
+    """
+    from ...api.client import get_consolidator
+    from ...api.operations import _consolidate_async
+
+    consolidator = get_consolidator()
+    if consolidator is None:
+        raise HTTPException(status_code=503, detail="Consolidator not available")
+    run = await consolidator.get_run(run_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail="Consolidation run not found")
+    if not run.resumable:
+        raise HTTPException(status_code=409, detail="Consolidation run already completed")
+
+    try:
+        result = await _consolidate_async(run.time_horizon, run_id=run_id)
+        return result._asdict()
+    except Exception:
+        logger.error("Consolidation resume failed")
+        raise HTTPException(status_code=500, detail="Consolidation failed")
+
+
+@router.get("/profiles", response_model=ConsolidationProfilesResponse)
+async def list_consolidation_profiles(
+    limit: int = Query(default=10, ge=1, le=100, description="Maximum number of profiles"),
+    user: AuthenticationResult = Depends(require_read_access)
+) -> Dict[str, Any]:
+    """
+    List per-phase performance profiles of recent consolidation runs, newest first.
+
+    Phases repeated per memory window are summed. CPU time includes the
+    consolidation worker processes; ``peak_rss_delta_mb`` is the largest
+    growth of the process's peak RSS during one run of the phase. Runs
+    triggered with ``capture_profile`` list their cProfile and tracemalloc
+    files under ``profile.artifacts``.
+
+    Example:
+        GET /api/consolidation/profiles?limit=1
+
+        Response:
+        {
+            "profiles": [{
+                "timestamp": "2025-11-16T03:00:41",
+                "time_horizon": "weekly",
+                "success": true,
+                "profile": {
+                    "wall_seconds": 41.2,
+                    "cpu_seconds": 63.8,
+                    "storage_calls": 212,
+                    "phases": [
+                        {"phase": "clustering", "runs": 3, "wall_seconds": 18.4, "cpu_seconds": 35.1,
+                         "peak_rss_delta_mb": 96.0, "items_in": 2418, "items_out": 57,
+                         "storage_calls": 0, "storage_bytes_read": 0},
+                        ...
+                    ]
+                }
+            }]
+        }
+    """
+    from ...api.client import get_consolidator
+
+    consolidator = get_consolidator()
+    if consolidator is None:
+        raise HTTPException(status_code=503, detail="Consolidator not available")
+    return {"profiles": consolidator.get_profile_history(limit)}
+
+
 @router.get("/status", response_model=SchedulerStatusResponse)
 async def get_scheduler_status(user: AuthenticationResult = Depends(require_read_access)) -> Dict[str, Any]:
     """
@@ -184,16 +184,22 @@ async def bulk_delete_memories(
 @router.post("/cleanup-duplicates", response_model=BulkOperationResponse, tags=["management"])
 async def cleanup_duplicates(
     storage: MemoryStorage = Depends(get_storage),
-    user: AuthenticationResult = Depends(require_write_access)
+    user: AuthenticationResult = Depends(require_write_access),
+    near_duplicates: bool = Query(False, description="Also remove near duplicates, keeping the oldest memory"),
+    threshold: float = Query(0.8, ge=0.0, le=1.0, description="Word-overlap threshold for near duplicates"),
 ):
     """
     Clean up duplicate memories in the database.
 
     Removes duplicate entries based on content hash and merges metadata.
+    With ``near_duplicates``, memories whose text nearly matches an older
+    memory are removed too.
     """
     try:
         if hasattr(storage, 'cleanup_duplicates'):
-            count, message = await storage.cleanup_duplicates()
+            count, message = await storage.cleanup_duplicates(
+                near_duplicates=near_duplicates, threshold=threshold
+            )
             return BulkOperationResponse(
                 success=count > 0,
                 message=message,
@@ -421,7 +427,7 @@ async def perform_system_operation(
     """
     try:
         if operation == "cleanup_duplicates":
-            return await cleanup_duplicates(storage, user)
+            return await cleanup_duplicates(storage, user, near_duplicates=False, threshold=0.8)
 
         elif operation == "optimize_db":
             # Database optimization (would need storage-specific implementation)
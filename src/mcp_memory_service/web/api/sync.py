@@ -21,6 +21,8 @@ Provides status monitoring and manual sync triggering for hybrid storage mode.
 import time
 from datetime import datetime, timezone
 
+from typing import Any, Dict, Optional
+
 from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel
 
@@ -48,6 +50,7 @@ class SyncStatusResponse(BaseModel):
     time_since_last_sync_seconds: float
     next_sync_eta_seconds: float
     status: str  # 'synced', 'syncing', 'pending', 'error' — reflects current health only
+    rate_limiter: Optional[Dict[str, Any]] = None  # Shared Cloudflare budget: concurrency, throttled time, 429s
 
 
 class SyncForceResponse(BaseModel):
@@ -129,7 +132,8 @@ async def get_sync_status(
             sync_interval_seconds=sync_interval,
             time_since_last_sync_seconds=time_since_sync,
             next_sync_eta_seconds=next_sync_eta,
-            status=status
+            status=status,
+            rate_limiter=sync_status.get('rate_limiter')
         )
 
     except Exception as e:
@@ -329,22 +329,27 @@ def create_sync_progress_event(
     synced_count: int,
     total_count: int,
     sync_type: str = "initial",
-    message: str = None
+    message: str = None,
+    memories_per_second: Optional[float] = None,
+    eta_seconds: Optional[float] = None
 ) -> SSEEvent:
     """Create a sync_progress event for real-time sync updates."""
     progress_percentage = (synced_count / total_count * 100) if total_count > 0 else 0
 
-    return SSEEvent(
-        event_type="sync_progress",
-        data={
-            "sync_type": sync_type,
-            "synced_count": synced_count,
-            "total_count": total_count,
-            "remaining_count": total_count - synced_count,
-            "progress_percentage": round(progress_percentage, 1),
-            "message": message or f"Syncing: {synced_count}/{total_count} memories ({progress_percentage:.1f}%)"
-        }
-    )
+    data = {
+        "sync_type": sync_type,
+        "synced_count": synced_count,
+        "total_count": total_count,
+        "remaining_count": total_count - synced_count,
+        "progress_percentage": round(progress_percentage, 1),
+        "message": message or f"Syncing: {synced_count}/{total_count} memories ({progress_percentage:.1f}%)"
+    }
+    if memories_per_second is not None:
+        data["memories_per_second"] = round(memories_per_second, 1)
+    if eta_seconds is not None:
+        data["eta_seconds"] = round(eta_seconds, 1)
+
+    return SSEEvent(event_type="sync_progress", data=data)
 
 
 def create_sync_completed_event(
@@ -363,4 +368,24 @@ def create_sync_completed_event(
             "time_taken_seconds": round(time_taken_seconds, 2),
             "message": f"Sync completed: {synced_count} memories synced in {time_taken_seconds:.1f}s"
         }
-    )
\ No newline at end of file
+    )
+
+def create_consolidation_progress_event(
+    time_horizon: str,
+    phase: str,
+    status: str,
+    window: Optional[int] = None,
+    details: Optional[Dict[str, Any]] = None
+) -> SSEEvent:
+    """Create a consolidation_progress event for a consolidation run or phase."""
+    data = {
+        "time_horizon": time_horizon,
+        "phase": phase,
+        "status": status,
+        "details": details or {},
+        "message": f"Consolidation ({time_horizon}) {phase}: {status}"
+    }
+    if window is not None:
+        data["window"] = window
+
+    return SSEEvent(event_type="consolidation_progress", data=data)
@@ -800,7 +800,13 @@ class MemoryDashboard {
         // Update sync status display if visible
         const syncStatus = document.getElementById('syncStatus');
         if (syncStatus) {
-            const progressText = `Syncing: ${data.synced_count}/${data.total_count} (${data.progress_percentage}%)`;
+            let progressText = `Syncing: ${data.synced_count}/${data.total_count} (${data.progress_percentage}%)`;
+            if (data.memories_per_second) {
+                progressText += ` · ${data.memories_per_second}/s`;
+            }
+            if (data.eta_seconds != null) {
+                progressText += ` · ETA ${Math.ceil(data.eta_seconds)}s`;
+            }
             syncStatus.textContent = progressText;
             syncStatus.className = 'sync-status syncing';
         }
@@ -5146,6 +5152,7 @@ class MemoryDashboard {
                 this.loadTopTagsReport(),
                 this.loadRecentActivityReport(),
                 this.loadStorageReport(),
+                this.loadConsolidationProfileReport(),
                 this.loadRelationshipTypesChart(),
                 this.loadGraphVisualization()
             ]);
@@ -5614,6 +5621,64 @@ class MemoryDashboard {
         container.innerHTML = html;
     }
 
+    /**
+     * Load the per-phase profile of the latest consolidation run
+     */
+    async loadConsolidationProfileReport() {
+        const container = document.getElementById('consolidationProfileReport');
+        if (!container) return;
+
+        try {
+            const data = await this.apiCall('/consolidation/profiles?limit=1');
+            this.renderConsolidationProfileReport(container, (data.profiles || [])[0]);
+        } catch (error) {
+            // Consolidation may be disabled on this server
+            console.error('Failed to load consolidation profile:', error);
+            container.innerHTML = '<p>Consolidation profile not available</p>';
+        }
+    }
+
+    /**
+     * Render consolidation profile report
+     */
+    renderConsolidationProfileReport(container, entry) {
+        if (!entry || !entry.profile) {
+            container.innerHTML = '<p>No consolidation runs profiled yet</p>';
+            return;
+        }
+
+        const profile = entry.profile;
+        const date = new Date(entry.timestamp).toLocaleString();
+        let html = '<div class="storage-report consolidation-profile">';
+
+        html += '<div class="storage-summary">';
+        html += `<div class="storage-stat"><strong>Run:</strong> ${this.escapeHtml(entry.time_horizon)} • ${date}</div>`;
+        html += `<div class="storage-stat"><strong>Wall:</strong> ${profile.wall_seconds}s</div>`;
+        html += `<div class="storage-stat"><strong>CPU:</strong> ${profile.cpu_seconds}s</div>`;
+        html += `<div class="storage-stat"><strong>Storage calls:</strong> ${profile.storage_calls}</div>`;
+        html += '</div>';
+
+        html += '<table class="profile-phases"><thead><tr>';
+        html += '<th>Phase</th><th>Wall s</th><th>CPU s</th><th>RSS Δ MB</th><th>In</th><th>Out</th><th>Calls</th><th>Read KB</th>';
+        html += '</tr></thead><tbody>';
+        (profile.phases || []).forEach(phase => {
+            html += `<tr>
+                <td>${this.escapeHtml(phase.phase)}</td>
+                <td>${phase.wall_seconds}</td>
+                <td>${phase.cpu_seconds}</td>
+                <td>${phase.peak_rss_delta_mb}</td>
+                <td>${phase.items_in}</td>
+                <td>${phase.items_out}</td>
+                <td>${phase.storage_calls}</td>
+                <td>${Math.round(phase.storage_bytes_read / 1024)}</td>
+            </tr>`;
+        });
+        html += '</tbody></table>';
+
+        html += '</div>';
+        container.innerHTML = html;
+    }
+
     /**
      * Handle growth period change
      */
@@ -5700,14 +5765,21 @@ class MemoryDashboard {
                 this.showToast(`Loading ${limit} nodes may impact performance. Consider using filters.`, 'warning', 5000);
             }
 
-            const data = await this.apiCall(`/analytics/graph-visualization?limit=${limit}&min_connections=${minConnections}`);
+            // Level-of-detail view: top nodes plus cluster super-nodes for the rest
+            const view = await this.apiCall(`/analytics/graph-view?node_budget=${limit}&min_connections=${minConnections}`);
 
-            if (!data || !data.nodes || data.nodes.length === 0) {
+            if (!view || !view.nodes || view.nodes.length === 0) {
                 container.innerHTML = '<p>No connected memories found. Try lowering the minimum connections filter.</p>';
                 return;
             }
 
-            // Store data for fullscreen use
+            const data = {
+                nodes: view.nodes.concat(view.clusters.map(c => ({ ...c, expanded: 0 }))),
+                edges: view.edges.concat(view.cluster_edges),
+                meta: view.meta
+            };
+
+            // Store data for fullscreen use and cluster expansion
             this.currentGraphData = data;
 
             this.renderGraphVisualization(container, data);
@@ -5801,9 +5873,11 @@ class MemoryDashboard {
             .selectAll('circle')
             .data(data.nodes)
             .join('circle')
-            .attr('class', 'graph-node')
-            .attr('r', d => Math.min(20, 8 + Math.sqrt(d.connections) * 2))
-            .attr('fill', d => nodeColors[d.type] || nodeColors['untyped'])
+            .attr('class', d => d.type === 'cluster' ? 'graph-node graph-cluster' : 'graph-node')
+            .attr('r', d => d.type === 'cluster'
+                ? Math.min(28, 10 + Math.log2(1 + d.size) * 2)
+                : Math.min(20, 8 + Math.sqrt(d.connections) * 2))
+            .attr('fill', d => d.type === 'cluster' ? '#BDC3C7' : (nodeColors[d.type] || nodeColors['untyped']))
             .style('cursor', 'pointer')
             .on('click', (event, d) => this.handleGraphNodeClick(event, d))
             .call(this.dragBehavior(simulation));
@@ -5821,6 +5895,7 @@ class MemoryDashboard {
             .attr('fill', isFullscreen ? '#ffffff' : 'currentColor')
             .attr('dy', -15)
             .text(d => {
+                if (d.type === 'cluster') return `+${d.size}`;
                 const content = d.content || '';
                 return content.length > 20 ? content.substring(0, 20) + '...' : content;
             });
@@ -5912,6 +5987,13 @@ class MemoryDashboard {
      * Format enhanced tooltip with quality score, timestamps, and metadata
      */
     formatGraphTooltip(d) {
+        if (d.type === 'cluster') {
+            return `
+                <div class="graph-tooltip-title">cluster</div>
+                <div class="graph-tooltip-content">${d.size} hidden ${d.anchor ? 'neighbors' : 'memories not connected to visible nodes'}</div>
+                ${d.anchor ? '<div class="tooltip-hint">💡 Click to expand</div>' : ''}
+            `;
+        }
         const qualityClass = d.quality_score >= 0.7 ? 'high' : d.quality_score >= 0.4 ? 'medium' : 'low';
         const qualityColor = qualityClass === 'high' ? '#50C878' : qualityClass === 'medium' ? '#F39C12' : '#E24A4A';
 
@@ -5970,6 +6052,11 @@ class MemoryDashboard {
     async handleGraphNodeClick(event, nodeData) {
         event.stopPropagation();
 
+        if (nodeData.type === 'cluster') {
+            await this.expandGraphCluster(nodeData);
+            return;
+        }
+
         // Visual feedback - highlight selected node
         d3.selectAll('.graph-node').classed('selected', false);
         d3.select(event.currentTarget).classed('selected', true);
@@ -5990,6 +6077,45 @@ class MemoryDashboard {
         }
     }
 
+    /**
+     * Replace part of a cluster super-node with the next page of its anchor's neighbors
+     */
+    async expandGraphCluster(cluster) {
+        if (!cluster.anchor || !this.currentGraphData) {
+            this.showToast('These memories are not connected to any visible node', 'info');
+            return;
+        }
+
+        try {
+            const page = await this.apiCall(
+                `/analytics/graph-view/expand/${encodeURIComponent(cluster.anchor)}?limit=50&offset=${cluster.expanded}`
+            );
+            const data = this.currentGraphData;
+            const known = new Set(data.nodes.map(n => n.id));
+            const idOf = end => (typeof end === 'object' ? end.id : end);
+            const edgeKeys = new Set(data.edges.map(e => `${idOf(e.source)}|${idOf(e.target)}`));
+
+            page.nodes.filter(n => !known.has(n.id)).forEach(n => data.nodes.push(n));
+            page.edges
+                .filter(e => !edgeKeys.has(`${e.source}|${e.target}`))
+                .forEach(e => data.edges.push(e));
+
+            cluster.expanded += page.nodes.length;
+            cluster.size = Math.max(0, cluster.size - page.nodes.length);
+            if (!page.has_more || cluster.size === 0) {
+                data.nodes = data.nodes.filter(n => n.id !== cluster.id);
+                data.edges = data.edges.filter(e => idOf(e.target) !== cluster.id);
+            }
+
+            const container = document.getElementById('graphVisualizationContainer');
+            if (this.graphSimulation) this.graphSimulation.stop();
+            this.renderGraphVisualization(container, data);
+        } catch (error) {
+            console.error('Failed to expand graph cluster:', error);
+            this.showToast('Failed to expand cluster', 'error');
+        }
+    }
+
     /**
      * Enter fullscreen mode for graph visualization
      */
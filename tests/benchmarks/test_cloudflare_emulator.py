@@ -0,0 +1,103 @@
+"""Tests for the local Cloudflare API emulator and the emulated hybrid sync benchmark."""
+
+import httpx
+import pytest
+
+from cloudflare_emulator import CloudflareEmulator, FaultConfig
+from benchmark_hybrid_emulator import make_memories, parse_args, run_benchmark
+from mcp_memory_service.storage.cloudflare import CloudflareStorage
+
+
+def _storage(emulator: CloudflareEmulator, **kwargs) -> CloudflareStorage:
+    options = dict(max_retries=8, base_delay=0.01, requests_per_second=1000, rate_limit_burst=1000)
+    options.update(kwargs)
+    storage = CloudflareStorage(
+        api_token="t", account_id="a", vectorize_index="v", d1_database_id="d", r2_bucket="b", **options
+    )
+    emulator.attach(storage)
+    return storage
+
+
+class TestCloudflareEmulator:
+
+    @pytest.mark.asyncio
+    async def test_storage_round_trip(self):
+        emulator = CloudflareEmulator()
+        storage = _storage(emulator, large_content_threshold=100)
+        await storage.initialize()
+
+        memories = make_memories(5)
+        memories[0].content = memories[0].content * 5  # goes to R2
+        for memory in memories:
+            success, _ = await storage.store(memory)
+            assert success
+
+        stats = await storage.get_stats()
+        assert stats["total_memories"] == 5
+        assert stats["r2_stored_count"] == 1
+
+        loaded = await storage.get_by_hash(memories[0].content_hash)
+        assert loaded.content == memories[0].content
+        assert sorted(loaded.tags) == sorted(memories[0].tags)
+
+        results = await storage.retrieve(memories[3].content, n_results=1)
+        assert results[0].memory.content_hash == memories[3].content_hash
+
+        success, _ = await storage.delete(memories[1].content_hash)
+        assert success
+        assert memories[1].content_hash not in emulator.vectors
+        await storage.close()
+
+    @pytest.mark.asyncio
+    async def test_d1_bound_parameter_limit(self):
+        emulator = CloudflareEmulator()
+        storage = _storage(emulator, max_retries=0)
+        await storage.initialize()
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await storage._d1_rows("SELECT 1 WHERE 1 IN (" + ",".join("?" * 101) + ")", list(range(101)))
+        assert emulator.stats()["responses"]["400"] == 1
+        await storage.close()
+
+    @pytest.mark.asyncio
+    async def test_injected_faults_are_retried(self):
+        emulator = CloudflareEmulator(faults=FaultConfig(error_rate=0.1, rate_limit_rate=0.1, retry_after=0.01, seed=7))
+        storage = _storage(emulator)
+        await storage.initialize()
+
+        emulator.seed_memories(make_memories(50))
+        memories = await storage.get_all_memories_cursor(limit=50)
+
+        assert len(memories) == 50
+        responses = emulator.stats()["responses"]
+        assert responses.get("429", 0) > 0 and responses.get("500", 0) > 0
+        assert storage.rate_limiter.stats()["rate_limited_count"] == responses["429"]
+        await storage.close()
+
+    @pytest.mark.asyncio
+    async def test_quota_window_sets_retry_after(self):
+        emulator = CloudflareEmulator(faults=FaultConfig(quota=3, quota_window=0.2, services={"d1"}))
+        storage = _storage(emulator)
+        await storage.initialize()
+
+        for _ in range(8):
+            await storage._d1_rows("SELECT 1 AS one", [])
+
+        assert emulator.stats()["responses"]["429"] >= 1
+        assert storage.rate_limiter.stats()["throttled_seconds"] > 0
+        await storage.close()
+
+
+class TestEmulatedHybridBenchmark:
+
+    @pytest.mark.asyncio
+    async def test_benchmark_smoke(self):
+        args = parse_args(["--store-count", "10", "--drift-fraction", "0.02", "--drain-timeout", "60"])
+        result = await run_benchmark(200, args)
+
+        assert result["store"]["memories"] == 10
+        assert result["queue_drain"]["failure_count"] in (0, None)
+        assert result["initial_pull"]["memories"] == 200
+        assert result["drift_check"]["changed"] == 4
+        assert result["drift_check"]["synced"] == 4
+        assert result["drift_check"]["digest_round_trips"] > 0
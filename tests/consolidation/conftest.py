@@ -240,7 +240,7 @@ def mock_storage(sample_memories):
                 return True
             return False
 
-        async def get_memory_connections(self):
+        async def get_memory_connections(self, memory_hashes=None):
             return self.connections
 
         async def get_access_patterns(self):
@@ -352,7 +352,7 @@ def mock_large_storage(large_memory_set):
                 return True
             return False
 
-        async def get_memory_connections(self):
+        async def get_memory_connections(self, memory_hashes=None):
             return self.connections
 
         async def get_access_patterns(self):
@@ -1,6 +1,7 @@
 """Unit tests for the creative association engine."""
 
 import pytest
+import numpy as np
 from datetime import datetime, timedelta
 
 from mcp_memory_service.consolidation.associations import (
@@ -369,4 +370,76 @@ class TestCreativeAssociationEngine:
             assert 'confidence_score' in assoc.metadata
             assert 'analysis_version' in assoc.metadata
             assert isinstance(assoc.metadata['shared_concepts'], list)
-            assert isinstance(assoc.metadata['confidence_score'], float)
\ No newline at end of file
+            assert isinstance(assoc.metadata['confidence_score'], float)    
+    @pytest.mark.asyncio
+    async def test_band_candidates_stay_in_sweet_spot(self, association_engine):
+        """Candidate pairs come from the similarity band and skip known pairs."""
+        rng = np.random.default_rng(11)
+        memories = [
+            Memory(
+                content=f"Memory {i} about Python testing",
+                content_hash=f"band_{i}",
+                tags=["python"],
+                embedding=rng.normal(size=32).tolist(),
+            )
+            for i in range(40)
+        ]
+        existing = {("band_0", "band_1"), ("band_2", "band_3")}
+        association_engine.max_pairs_per_run = 25
+        
+        pairs = await association_engine._band_candidate_pairs(memories, existing)
+        
+        assert 0 < len(pairs) <= 25
+        seen = set()
+        for mem1, mem2, similarity in pairs:
+            key = tuple(sorted([mem1.content_hash, mem2.content_hash]))
+            assert key not in existing and key not in seen
+            seen.add(key)
+            assert association_engine.min_similarity <= similarity <= association_engine.max_similarity
+            assert similarity == pytest.approx(
+                await association_engine._calculate_semantic_similarity(mem1, mem2), abs=1e-5
+            )
+    
+    @pytest.mark.asyncio
+    async def test_zero_embeddings_are_never_paired(self, association_engine):
+        """A zero vector scores 0.0 against everything, so it stays out of the band."""
+        rng = np.random.default_rng(5)
+        memories = [
+            Memory(content=f"Memory {i}", content_hash=f"vec_{i}", embedding=rng.normal(size=16).tolist())
+            for i in range(10)
+        ]
+        memories += [
+            Memory(content=f"Blank {i}", content_hash=f"zero_{i}", embedding=[0.0] * 16)
+            for i in range(10)
+        ]
+        association_engine.min_similarity = 0.4
+        association_engine.max_similarity = 0.9
+        association_engine.max_pairs_per_run = 1000
+
+        pairs = await association_engine._band_candidate_pairs(memories, set())
+
+        assert pairs
+        assert not any(m.content_hash.startswith("zero_") for pair in pairs for m in pair[:2])
+
+    @pytest.mark.asyncio
+    async def test_concepts_extracted_once_per_memory(self, association_engine, monkeypatch):
+        """Concept extraction is cached across the pairs of a run."""
+        calls = []
+        extract = association_engine._extract_concepts
+        monkeypatch.setattr(
+            association_engine, "_extract_concepts", lambda text: calls.append(text) or extract(text)
+        )
+        rng = np.random.default_rng(5)
+        memories = [
+            Memory(
+                content=f"Note {i} on the Deployment checklist",
+                content_hash=f"concept_{i}",
+                tags=["deploy"],
+                embedding=rng.normal(size=32).tolist(),
+            )
+            for i in range(30)
+        ]
+        
+        await association_engine.process(memories)
+        
+        assert 0 < len(calls) == len(set(calls)) <= len(memories)
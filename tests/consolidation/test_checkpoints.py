@@ -0,0 +1,192 @@
+"""Tests for checkpointed, resumable consolidation runs."""
+
+from dataclasses import replace
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+import pytest
+import pytest_asyncio
+
+from mcp_memory_service.consolidation.base import ConsolidationError
+from mcp_memory_service.consolidation.checkpoints import (
+    MAX_RUN_HISTORY,
+    ConsolidationRun,
+    ConsolidationRunStore,
+    dump_clusters,
+    input_set_hash,
+    load_clusters,
+)
+from mcp_memory_service.consolidation.consolidator import DreamInspiredConsolidator
+from mcp_memory_service.models.memory import Memory
+
+
+@pytest_asyncio.fixture
+async def sqlite_storage(tmp_path):
+    from mcp_memory_service.storage.sqlite_vec import SqliteVecMemoryStorage
+
+    storage = SqliteVecMemoryStorage(str(tmp_path / "runs.db"))
+    await storage.initialize()
+    now = datetime.now().timestamp()
+    for i in range(25):
+        await storage.store(Memory(
+            content=f"Checkpointed memory {i} about topic {i % 4} and release planning",
+            content_hash=f"run{i:03d}",
+            tags=[f"topic{i % 4}"],
+            created_at=now - (40 + i) * 86400,
+        ))
+    yield storage
+    storage.conn.close()
+
+
+@pytest.fixture
+def windowed_config(consolidation_config):
+    return replace(consolidation_config, incremental_mode=False, consolidation_window_size=10)
+
+
+@pytest.mark.unit
+class TestRunStore:
+
+    @pytest.mark.asyncio
+    async def test_records_persist_in_storage_metadata(self, sqlite_storage):
+        store = ConsolidationRunStore(sqlite_storage)
+        run = ConsolidationRun.start("weekly", 1700000000.0)
+        run.window = {"index": 1, "input_hash": "abc", "totals": {}, "phases": {"relevance": {}}, "state": {}}
+        await store.save(run)
+
+        reloaded = await ConsolidationRunStore(sqlite_storage).load(run.run_id)
+        assert store.persistent
+        assert reloaded == run
+        assert (await store.latest_unfinished("weekly")).run_id == run.run_id
+        assert await store.latest_unfinished("monthly") is None
+
+    @pytest.mark.asyncio
+    async def test_history_is_bounded(self, sqlite_storage):
+        store = ConsolidationRunStore(sqlite_storage)
+        runs = [ConsolidationRun.start("daily", float(i)) for i in range(MAX_RUN_HISTORY + 3)]
+        for run in runs:
+            await store.save(run)
+
+        listed = await store.list_runs(limit=100)
+        assert [r.run_id for r in listed] == [r.run_id for r in reversed(runs)][:MAX_RUN_HISTORY]
+        assert await store.load(runs[0].run_id) is None
+
+    @pytest.mark.asyncio
+    async def test_storage_without_metadata_keeps_runs_in_memory(self):
+        store = ConsolidationRunStore(AsyncMock())
+        run = ConsolidationRun.start("weekly", 0.0)
+        await store.save(run)
+
+        assert not store.persistent
+        assert (await store.load(run.run_id)).run_id == run.run_id
+
+    def test_cluster_state_round_trip(self, sample_memories):
+        import numpy as np
+        from mcp_memory_service.consolidation.base import MemoryCluster
+
+        cluster = MemoryCluster(
+            cluster_id="c1",
+            memory_hashes=[m.content_hash for m in sample_memories[:3]],
+            centroid_embedding=np.ones(4, dtype=np.float32).tolist(),
+            coherence_score=np.float32(0.75).item(),
+            created_at=datetime(2026, 1, 2, 3, 4, 5),
+            theme_keywords=["system"],
+        )
+        assert load_clusters(dump_clusters([cluster])) == [cluster]
+        assert input_set_hash(sample_memories) == input_set_hash(list(reversed(sample_memories)))
+
+
+@pytest.mark.integration
+class TestResumableConsolidation:
+
+    @pytest.mark.asyncio
+    async def test_failed_run_resumes_from_last_completed_phase(self, sqlite_storage, windowed_config):
+        consolidator = DreamInspiredConsolidator(sqlite_storage, windowed_config)
+        discover = consolidator.association_engine.process
+        calls = {"associations": 0, "clustering": 0}
+
+        async def flaky_associations(*args, **kwargs):
+            calls["associations"] += 1
+            if calls["associations"] == 2:
+                raise RuntimeError("worker lost")
+            return await discover(*args, **kwargs)
+
+        cluster = consolidator.clustering_engine.process
+
+        async def counted_clustering(*args, **kwargs):
+            calls["clustering"] += 1
+            return await cluster(*args, **kwargs)
+
+        consolidator.association_engine.process = flaky_associations
+        consolidator.clustering_engine.process = counted_clustering
+
+        failed = await consolidator.consolidate("weekly")
+        assert "worker lost" in failed.errors
+        run = await consolidator.get_run(failed.run_id)
+        assert run.status == "failed"
+        assert run.windows_completed == 1
+        assert list(run.window["phases"]) == ["relevance", "clustering"]
+        assert calls["clustering"] == 2
+
+        resumed = await consolidator.consolidate("weekly")
+        assert resumed.run_id == failed.run_id
+        assert resumed.errors == []
+        assert resumed.memories_processed == 25
+        assert resumed.performance_metrics["run"] == {
+            "run_id": failed.run_id, "attempt": 2, "restored_phases": 2,
+        }
+        # Window 2 reused its checkpointed clusters; only window 3 was clustered
+        assert calls["clustering"] == 3
+
+        run = await consolidator.get_run(failed.run_id)
+        assert (run.status, run.windows_completed, run.streamed, run.window) == ("completed", 3, True, None)
+        assert run.totals["memories_processed"] == 25
+
+    @pytest.mark.asyncio
+    async def test_changed_window_is_recomputed(self, sqlite_storage, windowed_config):
+        consolidator = DreamInspiredConsolidator(sqlite_storage, windowed_config)
+        run = await consolidator._begin_run("weekly", None, resume=False)
+        run.window = {
+            "index": 1, "input_hash": "stale", "totals": {"clusters_created": 0},
+            "phases": {"relevance": {}, "clustering": {}}, "state": {},
+        }
+        run.status = "failed"
+        await consolidator.run_store.save(run)
+        consolidator._active_runs.clear()
+
+        report = await consolidator.consolidate("weekly", run_id=run.run_id)
+        assert report.errors == []
+        assert report.performance_metrics["run"]["restored_phases"] == 0
+        assert report.memories_processed == 25
+
+    @pytest.mark.asyncio
+    async def test_resume_options(self, sqlite_storage, windowed_config):
+        consolidator = DreamInspiredConsolidator(sqlite_storage, windowed_config)
+        first = await consolidator.consolidate("weekly")
+
+        with pytest.raises(ConsolidationError):
+            await consolidator.consolidate("weekly", run_id=first.run_id)
+        with pytest.raises(ConsolidationError):
+            await consolidator.consolidate("weekly", run_id="missing")
+
+        second = await consolidator.consolidate("weekly", resume=False)
+        assert second.run_id != first.run_id
+        assert [r.run_id for r in await consolidator.list_runs()] == [second.run_id, first.run_id]
+
+    @pytest.mark.asyncio
+    async def test_finished_incremental_batch_is_not_redone(self, sqlite_storage, consolidation_config):
+        config = replace(consolidation_config, batch_size=10, clustering_enabled=False,
+                         associations_enabled=False, compression_enabled=False)
+        consolidator = DreamInspiredConsolidator(sqlite_storage, config)
+        consolidator._refresh_graph_centrality = AsyncMock(side_effect=[RuntimeError("graph locked"), None])
+
+        failed = await consolidator.consolidate("weekly")
+        assert "graph locked" in failed.errors
+        assert (await consolidator.get_run(failed.run_id)).windows_completed == 1
+
+        resumed = await consolidator.consolidate("weekly")
+        assert resumed.run_id == failed.run_id
+        assert resumed.memories_processed == 10
+        assert resumed.performance_metrics["streaming"]["windows"] == 0
+
+        memories = await sqlite_storage.get_all_memories()
+        assert sum("last_consolidated_at" in m.metadata for m in memories) == 10
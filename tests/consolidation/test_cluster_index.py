@@ -0,0 +1,202 @@
+"""Tests for the persistent, incrementally maintained cluster index."""
+
+from dataclasses import replace
+
+import numpy as np
+import pytest
+import pytest_asyncio
+
+from mcp_memory_service.consolidation.cluster_index import (
+    ClusterIndexMaintainer,
+    IndexArrays,
+    drift_metrics,
+    fold_into_index,
+    rebuild_index,
+)
+from mcp_memory_service.models.memory import Memory
+
+TOPICS = ("asyncio", "sqlite", "garden", "travel", "music")
+
+
+def topic_vector(topic: str, seed: int, dimension: int) -> np.ndarray:
+    """A unit vector near the axis of ``topic``."""
+    rng = np.random.default_rng(seed)
+    vector = rng.normal(0, 0.3 / np.sqrt(dimension), dimension)
+    vector[TOPICS.index(topic)] += 1.0
+    return (vector / np.linalg.norm(vector)).astype(np.float32)
+
+
+@pytest_asyncio.fixture
+async def sqlite_storage(tmp_path, monkeypatch):
+    from mcp_memory_service.storage.sqlite_vec import SqliteVecMemoryStorage
+
+    storage = SqliteVecMemoryStorage(str(tmp_path / "clusters.db"))
+    await storage.initialize()
+    dimension = storage.embedding_dimension
+
+    def embed(text):
+        topic, seed = text.split()[:2]
+        return topic_vector(topic, int(seed), dimension).tolist()
+
+    monkeypatch.setattr(storage, "_generate_embedding", embed)
+    for i in range(24):
+        topic = TOPICS[i % 3]
+        await storage.store(
+            Memory(content=f"{topic} {i} note", content_hash=f"{topic}{i:03d}", tags=[topic]),
+            skip_semantic_dedup=True,
+        )
+    yield storage
+    storage.conn.close()
+
+
+@pytest.fixture
+def index_config(consolidation_config):
+    return replace(consolidation_config, min_cluster_size=3, clustering_algorithm="simple")
+
+
+@pytest.mark.unit
+class TestIndexMath:
+
+    def test_fold_assigns_nearest_centroid_and_opens_outliers(self):
+        centroids = np.eye(2, 8, dtype=np.float32)
+        arrays = IndexArrays(centroids, np.array([4, 4]), np.zeros(2, np.float32), np.zeros(2, np.float32))
+        rows = np.stack([topic_vector(t, s, 8) for t, s in (("asyncio", 1), ("sqlite", 2), ("garden", 3))])
+
+        update = fold_into_index(rows, arrays, threshold=0.7)
+
+        assert update.labels.tolist() == [0, 1, 2]
+        assert update.outliers == 1
+        assert update.arrays.counts.tolist() == [5, 5, 1]
+        assert update.changed.tolist() == [True, True, True]
+        np.testing.assert_allclose(update.arrays.centroids[0], (centroids[0] * 4 + rows[0]) / 5, rtol=1e-5)
+        assert (update.arrays.shifts[:2] > 0).all() and update.arrays.shifts[2] == 0
+        assert update.arrays.radii[0] == pytest.approx(1 - update.similarities[0])
+
+    def test_rebuild_places_every_row(self):
+        rows = np.stack([topic_vector(TOPICS[i % 3], i, 16) for i in range(30)] + [topic_vector("travel", 99, 16)])
+
+        update = rebuild_index(rows, "simple", 3, 64, 64, threshold=0.7)
+
+        assert (update.labels >= 0).all()
+        assert update.arrays.counts.sum() == len(rows)
+        assert len(update.arrays.counts) == 4
+        assert len(set(update.labels[:30:3].tolist())) == 1
+
+    def test_drift_metrics(self):
+        arrays = IndexArrays(np.zeros((2, 4), np.float32), np.array([30, 10]),
+                             np.zeros(2, np.float32), np.array([0.0, 0.4], np.float32))
+        assert drift_metrics(arrays, 4) == {"outlier_share": 0.1, "centroid_shift": 0.1}
+        assert drift_metrics(IndexArrays.empty(4), 0) == {"outlier_share": 0.0, "centroid_shift": 0.0}
+
+
+@pytest.mark.integration
+class TestClusterIndexMaintenance:
+
+    @pytest.mark.asyncio
+    async def test_new_memories_join_existing_clusters(self, sqlite_storage, index_config):
+        maintainer = ClusterIndexMaintainer(index_config)
+        built = await maintainer.maintain(sqlite_storage)
+        assert (built["mode"], built["reason"], built["indexed"], built["clusters"]) == ("rebuild", "empty", 24, 3)
+
+        await sqlite_storage.store(Memory(content="sqlite 500 new", content_hash="sqlite500"), skip_semantic_dedup=True)
+        update = await maintainer.maintain(sqlite_storage)
+        assert (update["mode"], update["indexed"], update["outliers"], update["clusters"]) == ("incremental", 1, 0, 3)
+
+        index = await sqlite_storage.get_cluster_index()
+        assert sorted(c["member_count"] for c in index) == [8, 8, 9]
+        assert (await maintainer.maintain(sqlite_storage))["indexed"] == 0
+
+    @pytest.mark.asyncio
+    async def test_drift_triggers_full_recluster(self, sqlite_storage, index_config):
+        maintainer = ClusterIndexMaintainer(replace(index_config, cluster_drift_threshold=0.05))
+        await maintainer.maintain(sqlite_storage)
+
+        await sqlite_storage.store(Memory(content="travel 600 new", content_hash="travel600"), skip_semantic_dedup=True)
+        assert (await maintainer.maintain(sqlite_storage))["outlier_share"] == 0.04
+
+        await sqlite_storage.store(Memory(content="music 601 new", content_hash="music601"), skip_semantic_dedup=True)
+        rebuilt = await maintainer.maintain(sqlite_storage)
+        assert (rebuilt["mode"], rebuilt["reason"], rebuilt["clusters"]) == ("rebuild", "drift", 5)
+        assert rebuilt["outlier_share"] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_deleted_memories_leave_the_index(self, sqlite_storage, index_config):
+        maintainer = ClusterIndexMaintainer(index_config)
+        await maintainer.maintain(sqlite_storage)
+        await sqlite_storage.delete("garden002")
+        await sqlite_storage.store(Memory(content="garden 700 new", content_hash="garden700"), skip_semantic_dedup=True)
+
+        assert (await maintainer.maintain(sqlite_storage))["pruned"] == 1
+        assert sorted(c["member_count"] for c in await sqlite_storage.get_cluster_index()) == [8, 8, 8]
+
+    @pytest.mark.asyncio
+    async def test_quiet_runs_still_prune_deleted_memories(self, sqlite_storage, index_config):
+        maintainer = ClusterIndexMaintainer(index_config)
+        await maintainer.maintain(sqlite_storage)
+        await sqlite_storage.delete("garden002")
+
+        quiet = await maintainer.maintain(sqlite_storage)
+        assert (quiet["mode"], quiet["indexed"], quiet["pruned"]) == ("incremental", 0, 1)
+        assert sorted(c["member_count"] for c in await sqlite_storage.get_cluster_index()) == [7, 8, 8]
+
+    @pytest.mark.asyncio
+    async def test_search_coarse_filter(self, sqlite_storage, index_config):
+        # Without an index the filter falls back to a full search
+        fallback = await sqlite_storage.search_memories(query="garden 1000 query", cluster_probe=1, limit=5)
+        assert len(fallback["memories"]) == 5
+
+        await ClusterIndexMaintainer(index_config).maintain(sqlite_storage)
+        await sqlite_storage.store(Memory(content="sqlite 800 new", content_hash="sqlite800"), skip_semantic_dedup=True)
+
+        response = await sqlite_storage.search_memories(
+            query="sqlite 1000 query", cluster_probe=1, limit=20, include_debug=True
+        )
+        hashes = [m["content_hash"] for m in response["memories"]]
+        # The probed cluster plus the memory stored since the index update
+        assert sorted(hashes) == sorted([f"sqlite{i:03d}" for i in range(1, 24, 3)] + ["sqlite800"])
+        assert response["memories"][0]["debug_info"]["clusters_probed"] == 1
+        assert response["debug"]["cluster_probe"] == 1
+
+        invalid = await sqlite_storage.search_memories(query="sqlite", cluster_probe=-1)
+        assert "Invalid cluster_probe" in invalid["error"]
+
+    @pytest.mark.asyncio
+    async def test_search_scores_only_newest_unindexed_memories(self, sqlite_storage, index_config, monkeypatch):
+        from mcp_memory_service.storage import sqlite_vec
+
+        await ClusterIndexMaintainer(index_config).maintain(sqlite_storage)
+        for content_hash in ("sqlite800", "sqlite801"):
+            await sqlite_storage.store(
+                Memory(content=f"sqlite {content_hash[6:]} new", content_hash=content_hash), skip_semantic_dedup=True
+            )
+        monkeypatch.setattr(sqlite_vec, "_MAX_UNINDEXED_CANDIDATES", 1)
+
+        results = await sqlite_storage.retrieve_clustered("sqlite 1000 query", n_results=20, probe=1)
+
+        hashes = [r.memory.content_hash for r in results]
+        assert "sqlite801" in hashes and "sqlite800" not in hashes
+        assert len(hashes) == 9
+
+    @pytest.mark.asyncio
+    async def test_search_warns_when_cluster_probe_is_ignored(self, sqlite_storage, index_config, caplog):
+        await ClusterIndexMaintainer(index_config).maintain(sqlite_storage)
+
+        with caplog.at_level("WARNING"):
+            await sqlite_storage.search_memories(query="sqlite 1000 query", cluster_probe=1, quality_boost=0.3)
+        assert "cluster_probe is ignored" in caplog.text
+
+        caplog.clear()
+        with caplog.at_level("WARNING"):
+            await sqlite_storage.search_memories(query="sqlite 1000 query", cluster_probe=1)
+        assert "cluster_probe is ignored" not in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_consolidation_maintains_index(self, sqlite_storage, index_config):
+        from mcp_memory_service.consolidation.consolidator import DreamInspiredConsolidator
+
+        config = replace(index_config, associations_enabled=False, compression_enabled=False,
+                         forgetting_enabled=False)
+        report = await DreamInspiredConsolidator(sqlite_storage, config).consolidate("daily")
+
+        assert report.performance_metrics["cluster_index"]["clusters"] == 3
+        assert len(await sqlite_storage.get_cluster_index()) == 3
@@ -416,4 +416,103 @@ class TestSemanticClusteringEngine:
             # Should count tag frequencies correctly  
             assert isinstance(tag_dist, dict)
             assert tag_dist.get("python", 0) >= 2  # Appears multiple times
-            assert tag_dist.get("programming", 0) >= 2  # Appears multiple times
\ No newline at end of file
+            assert tag_dist.get("programming", 0) >= 2  # Appears multiple times
+
+@pytest.mark.unit
+class TestVectorClustering:
+    """Test the blocked neighbour graph and density clustering."""
+
+    @staticmethod
+    def _blobs(seed=3, per_blob=30, blobs=4, noise=20, dims=24):
+        rng = np.random.default_rng(seed)
+        centers = rng.normal(size=(blobs, dims))
+        points = [center + rng.normal(scale=0.3, size=(per_blob, dims)) for center in centers]
+        points.append(rng.normal(size=(noise, dims)))
+        return np.vstack(points).astype(np.float32)
+
+    def test_blocked_graph_matches_dense_similarities(self):
+        from mcp_memory_service.consolidation.vector_clustering import normalize_rows, radius_neighbors
+
+        unit = normalize_rows(self._blobs())
+        dense = unit @ unit.T
+        np.fill_diagonal(dense, -1)
+        graph = radius_neighbors(unit, 0.6, max_neighbors=1000, block_rows=7)
+
+        assert np.array_equal(graph.counts, (dense >= 0.6).sum(axis=1) + 1)
+        assert len(graph.sources) == int((dense >= 0.6).sum())
+        assert np.allclose(graph.similarities, dense[graph.sources, graph.targets], atol=1e-6)
+
+        # Capped rows keep their strongest neighbours; counts stay exact
+        capped = radius_neighbors(unit, 0.6, max_neighbors=3, block_rows=11)
+        assert np.array_equal(capped.counts, graph.counts)
+        assert np.bincount(capped.sources, minlength=len(unit)).max() <= 3
+        for row in np.flatnonzero(graph.counts > 4)[:10]:
+            kept = np.sort(capped.similarities[capped.sources == row])
+            assert np.allclose(kept, np.sort(dense[row][dense[row] >= 0.6])[-3:], atol=1e-6)
+
+    def test_density_clusters_match_sklearn_dbscan(self):
+        sklearn_cluster = pytest.importorskip("sklearn.cluster")
+        from mcp_memory_service.consolidation.vector_clustering import (
+            density_clusters, normalize_rows, radius_neighbors,
+        )
+
+        embeddings = self._blobs()
+        labels = density_clusters(
+            radius_neighbors(normalize_rows(embeddings), 0.7, 1000, 16), min_samples=3
+        )
+        reference = sklearn_cluster.DBSCAN(eps=0.3, min_samples=3, metric="cosine").fit_predict(embeddings)
+
+        assert np.array_equal(labels == -1, reference == -1)
+        for label in set(reference) - {-1}:
+            assert len(set(labels[reference == label])) == 1
+        assert len(set(labels.tolist())) == len(set(reference.tolist()))
+
+    def test_memory_budget_bounds_blocks_and_edges(self):
+        from mcp_memory_service.consolidation.vector_clustering import plan_memory_budget
+
+        block_rows, max_neighbors = plan_memory_budget(100_000, 64, 256)
+        assert max_neighbors == 64
+        assert 1 <= block_rows < 200
+        assert block_rows * 100_000 * 17 + 100_000 * 64 * 12 <= 256 * 1024 * 1024
+
+        # A tight budget lowers the kept neighbours instead of overrunning
+        block_rows, max_neighbors = plan_memory_budget(100_000, 64, 16)
+        assert max_neighbors < 64
+        assert block_rows >= 1
+
+    @pytest.mark.asyncio
+    async def test_engine_reports_run_stats(self, consolidation_config):
+        embeddings = self._blobs(per_blob=10, noise=5)
+        memories = [
+            Memory(content=f"memory {i}", content_hash=f"stats_{i}", tags=[], embedding=row.tolist())
+            for i, row in enumerate(embeddings)
+        ]
+        consolidation_config.clustering_algorithm = 'dbscan'
+        consolidation_config.clustering_memory_budget_mb = 16
+        engine = SemanticClusteringEngine(consolidation_config)
+
+        clusters = await engine.process(memories)
+
+        stats = engine.last_run_stats
+        assert stats['memories'] == len(memories)
+        assert stats['clusters'] == len(clusters) > 0
+        assert stats['clusters_per_second'] > 0
+        assert stats['memory_budget_mb'] == 16
+        assert stats['edges'] > 0 and stats['block_rows'] >= 1
+        assert 'peak_rss_mb' in stats
+
+    @pytest.mark.parametrize("low, high", [(-0.2, 0.2), (0.75, 0.85)])
+    def test_band_pairs_sample_distinct_in_band_pairs(self, low, high):
+        """Common bands use random draws, rare bands the row scan; both stay in band."""
+        from mcp_memory_service.consolidation.vector_clustering import band_pairs, normalize_rows
+
+        unit = normalize_rows(self._blobs(per_blob=60, noise=40))
+        dense = unit @ unit.T
+        upper = np.triu((dense >= low) & (dense <= high), k=1)
+        rows, cols, sims = band_pairs(unit, low, high, 50, 16, rng=np.random.default_rng(0))
+
+        assert len(rows) == min(50, int(upper.sum()))
+        assert np.all(rows < cols)
+        assert len(set(zip(rows.tolist(), cols.tolist()))) == len(rows)
+        assert upper[rows, cols].all()
+        assert np.allclose(sims, dense[rows, cols], atol=1e-6)
@@ -1,13 +1,27 @@
 """Unit tests for the semantic compression engine."""
 
+import re
+from array import array
+from collections import Counter
+
 import pytest
+from dataclasses import replace
 from datetime import datetime, timedelta
 
+import numpy as np
+
 from mcp_memory_service.consolidation.compression import (
     SemanticCompressionEngine, 
     CompressionResult
 )
-from mcp_memory_service.consolidation.base import MemoryCluster
+from mcp_memory_service.consolidation.base import ConsolidationConfig, MemoryCluster
+from mcp_memory_service.consolidation.executor import ConsolidationExecutor
+from mcp_memory_service.consolidation.vector_summaries import (
+    centroid_scores,
+    centroid_similarity,
+    select_sentences,
+    sentence_matrix,
+)
 from mcp_memory_service.models.memory import Memory
 
 
@@ -758,4 +772,180 @@ class TestAggregateMetadataPrefixNesting:
                         break
                 assert contiguous <= 1, (
                     f"After run {run}, key {key!r} has {contiguous} leading prefix(es)"
-                )
\ No newline at end of file
+                )
+
+@pytest.mark.unit
+class TestTfidfSummaries:
+    """Batched TF-IDF centroid sentence selection (compression_summarizer='tfidf')."""
+
+    @staticmethod
+    def _cluster(cluster_id, contents, embeddings=None, centroid=None):
+        memories = [
+            Memory(
+                content=content,
+                content_hash=f"{cluster_id}-{i}",
+                embedding=embeddings[i] if embeddings else None,
+                created_at=datetime.now().timestamp(),
+            )
+            for i, content in enumerate(contents)
+        ]
+        cluster = MemoryCluster(
+            cluster_id=cluster_id,
+            memory_hashes=[m.content_hash for m in memories],
+            centroid_embedding=centroid,
+            coherence_score=0.8,
+            created_at=datetime.now(),
+            theme_keywords=[],
+        )
+        return cluster, memories
+
+    def test_tfidf_is_the_default(self):
+        assert SemanticCompressionEngine(ConsolidationConfig()).summarizer == "tfidf"
+        config = replace(ConsolidationConfig(), compression_summarizer="unknown")
+        assert SemanticCompressionEngine(config).summarizer == "tfidf"
+
+    def test_marked_words_match_concept_patterns(self, consolidation_config):
+        contents = [
+            "The HTTP API of SQLite v2.3 returns 42 rows. ConsolidationConfig sets 3.14 and 1.5x today",
+            "An Ox, Ab and OK go to Paris! See /src/app.py and https://example.com/docs now",
+            "snake_Case, Word2Vec and CAFÉ Bar are 4th. Numbers 10.25. End with Done.",
+        ]
+        engine = SemanticCompressionEngine(consolidation_config)
+        matrix = sentence_matrix([contents[:2], contents[2:]])
+
+        for position, cluster in enumerate([contents[:2], contents[2:]]):
+            all_text = " ".join(cluster)
+            expected = set(re.findall(r"\b[A-Z][a-z]{2,}\b", all_text))
+            for name in ("technical_terms", "acronyms", "numbers"):
+                expected.update(engine._important_patterns[name].findall(all_text))
+            assert matrix.marked_words[position] == expected
+            counts = Counter(re.findall(r"\b[a-zA-Z]{4,}\b", all_text.lower()))
+            assert matrix.term_counts[position] == counts
+            assert list(matrix.term_counts[position]) == list(counts)
+            assert engine._select_key_concepts(
+                all_text, [], counts, matrix.marked_words[position]
+            ) == engine._select_key_concepts(all_text, [], counts)
+
+    def test_sentences_split_per_memory(self):
+        contents = ["First one. Second one!  Third", "", "Trailing break. ", "Nul\0inside. ok"]
+        matrix = sentence_matrix([contents[:2], contents[2:]])
+
+        expected = [
+            (piece.strip(), memory)
+            for memory, content in enumerate(contents)
+            for piece in re.split(r"[.!?]+\s+", content.replace("\0", " "))
+        ]
+        assert list(zip(matrix.sentences, matrix.memories.tolist())) == expected
+        assert matrix.clusters.tolist() == [0] * 4 + [1] * 4
+        assert sentence_matrix([[], []]).marked_words == [set(), set()]
+
+    def test_select_sentences_skips_overlapping_sentences(self):
+        repeated = "Vector search ranks memories by cosine similarity"
+        matrix = sentence_matrix([
+            [f"{repeated}. Short one", f"{repeated}. Memories are ranked by cosine similarity of vectors"],
+            ["Tomato seedlings need warm soil in spring", "Water the tomato seedlings every morning"],
+        ])
+        scores = centroid_scores(matrix)
+
+        deploy, garden = select_sentences(matrix, scores, [1000, 45])
+
+        assert deploy.count(repeated) == 1
+        assert "Short one" not in deploy
+        assert len(garden) == 1 and sum(map(len, garden)) < 45
+
+    @pytest.mark.asyncio
+    async def test_key_concepts_match_concept_summarizer(self, consolidation_config):
+        cluster, memories = self._cluster("c", [
+            "Python list comprehensions provide a concise way to create lists. They are readable.",
+            "List comprehensions in Python are more readable than loops. SQLite stores the results.",
+            "Python comprehensions work for lists, sets and dictionaries. See https://docs.python.org now.",
+        ])
+        tfidf = SemanticCompressionEngine(replace(consolidation_config, compression_summarizer="tfidf"))
+        concepts = SemanticCompressionEngine(replace(consolidation_config, compression_summarizer="concepts"))
+
+        (batched,) = await tfidf.process([cluster], memories)
+        (single,) = await concepts.process([cluster], memories)
+
+        assert batched.key_concepts == single.key_concepts
+        assert batched.compression_metadata["algorithm"] == "semantic_compression_tfidf_v1"
+        assert single.compression_metadata["algorithm"] == "semantic_compression_v1"
+        assert batched.compressed_memory.content.startswith("Cluster of 3 related memories about")
+
+    @pytest.mark.asyncio
+    async def test_sentences_stay_in_their_cluster_without_repeats(self, consolidation_config):
+        repeated = "The deployment pipeline builds containers for every release branch"
+        deploy = self._cluster("deploy", [
+            f"{repeated}. Rollbacks restore the previous container image quickly.",
+            f"{repeated}. Release branches are tagged before the pipeline deploys them.",
+            "Container images for the release pipeline are scanned before deployment.",
+        ])
+        garden = self._cluster("garden", [
+            "Tomato seedlings need warm soil and plenty of sunlight in spring.",
+            "Water the tomato seedlings in the morning so the soil stays warm.",
+        ])
+        engine = SemanticCompressionEngine(replace(
+            consolidation_config, compression_summarizer="tfidf", max_summary_length=600
+        ))
+
+        results = {r.cluster_id: r for r in await engine.process(
+            [deploy[0], garden[0]], deploy[1] + garden[1]
+        )}
+
+        deploy_summary = results["deploy"].compressed_memory.content
+        assert deploy_summary.count(repeated) == 1
+        assert "omato" not in deploy_summary
+        assert "pipeline" not in results["garden"].compressed_memory.content
+        for result in results.values():
+            assert len(result.compressed_memory.content) <= 600
+
+    def test_centroid_scores_follow_the_cluster_centroid(self):
+        matrix = sentence_matrix([[
+            "Vector search ranks memories by cosine similarity. Lunch was pasta today",
+            "Cosine similarity ranks vector search results",
+        ]])
+        scores = centroid_scores(matrix)
+        ranked = [matrix.sentences[i] for i in np.argsort(-scores)]
+        assert ranked[-1] == "Lunch was pasta today"
+
+        # A memory far from the cluster centroid in embedding space is discounted
+        weighted = centroid_scores(matrix, np.array([0.0, 1.0]))
+        assert weighted[matrix.memories == 0].max() == 0
+        assert weighted[matrix.memories == 1].max() > 0
+
+    def test_centroid_similarity_without_embeddings(self):
+        similarity = centroid_similarity(
+            [[1.0, 0.0], None, [0.0, 1.0], [1.0, 0.0, 0.0], [0.6, 0.8]],
+            [[1.0, 0.0], None],
+            [0, 0, 0, 0, 1],
+        )
+        assert similarity.tolist() == [1.0, 1.0, 0.0, 1.0, 1.0]
+
+        # Float32 buffers as streamed from SQLite-vec give the same result
+        buffers = centroid_similarity(
+            [array("f", [1.0, 0.0]), array("f", [0.0, 1.0]), array("f", [0.6, 0.8])],
+            [[1.0, 0.0], [0.6, 0.8]],
+            [0, 0, 1],
+        )
+        assert buffers.tolist() == pytest.approx([1.0, 0.0, 1.0])
+
+    @pytest.mark.asyncio
+    async def test_worker_processes_match_inline(self, consolidation_config):
+        cluster, memories = self._cluster("c", [
+            "Consolidation streams memories in windows. Each window is scored and clustered.",
+            "Windows of memories are clustered after relevance scoring. Checkpoints follow each phase.",
+        ], embeddings=[[1.0, 0.0], [0.8, 0.6]], centroid=[1.0, 0.0])
+        config = replace(consolidation_config, compression_summarizer="tfidf", max_summary_length=600)
+
+        (inline,) = await SemanticCompressionEngine(config).process([cluster], memories)
+        engine = SemanticCompressionEngine(config)
+        engine.executor = ConsolidationExecutor(max_workers=1)
+        try:
+            (pooled,) = await engine.process([cluster], memories)
+        finally:
+            engine.executor.shutdown()
+
+        assert pooled.key_concepts == inline.key_concepts
+        assert "Consolidation streams memories in windows" in inline.compressed_memory.content
+        for sentence in inline.compressed_memory.content.split(". ")[1:-1]:
+            assert sentence in pooled.compressed_memory.content
+        assert pooled.compressed_memory.embedding == [1.0, 0.0]
@@ -1,11 +1,13 @@
 """Integration tests for the main dream-inspired consolidator."""
 
 import pytest
+import pytest_asyncio
+from dataclasses import replace
 from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock
 
 from mcp_memory_service.consolidation.consolidator import DreamInspiredConsolidator
-from mcp_memory_service.consolidation.base import ConsolidationReport
+from mcp_memory_service.consolidation.base import ConsolidationReport, MemoryAssociation
 from mcp_memory_service.models.memory import Memory
 
 
@@ -342,6 +344,64 @@ class TestDreamInspiredConsolidator:
         assert "memories_per_second" in perf_metrics
         assert "success" in perf_metrics
     
+    @pytest.mark.asyncio
+    async def test_graph_centrality_refreshed_after_consolidation(self, consolidator):
+        """Test that centrality is refreshed, personalized by relevance scores."""
+        consolidator._graph_storage_initialized = True
+        consolidator.graph_storage = MagicMock()
+        consolidator.graph_storage.refresh_centrality = AsyncMock(return_value={"skipped": False})
+
+        report = await consolidator.consolidate("weekly")
+
+        assert report.memories_processed > 0
+        consolidator.graph_storage.refresh_centrality.assert_awaited_once()
+        personalization = consolidator.graph_storage.refresh_centrality.await_args.kwargs["personalization"]
+        assert len(personalization) == report.memories_processed
+        assert all(score >= 0 for score in personalization.values())
+
+    @pytest.mark.asyncio
+    async def test_graph_associations_stored_in_one_bulk_write(self, consolidator, sample_memories):
+        """Test that discovered associations reach the graph table in a single bulk call."""
+        consolidator.graph_storage = MagicMock()
+        consolidator.graph_storage.store_associations_bulk = AsyncMock(
+            return_value={"inserted": 4, "updated": 0, "skipped": 0, "failed": 0}
+        )
+        hashes = [m.content_hash for m in sample_memories[:3]]
+        associations = [
+            MemoryAssociation(
+                source_memory_hashes=[hashes[0], hashes[i]],
+                similarity_score=0.5,
+                connection_type="semantic, temporal",
+                discovery_method="creative_association",
+                discovery_date=datetime.now(),
+            )
+            for i in (1, 2)
+        ]
+
+        await consolidator._store_associations_in_graph_table(associations)
+
+        consolidator.graph_storage.store_associations_bulk.assert_awaited_once()
+        edges = consolidator.graph_storage.store_associations_bulk.await_args.args[0]
+        assert [(e["source_hash"], e["target_hash"]) for e in edges] == [
+            (hashes[0], hashes[1]), (hashes[0], hashes[2])
+        ]
+        assert edges[0]["connection_types"] == ["semantic", "temporal"]
+        assert edges[0]["metadata"]["discovery_method"] == "creative_association"
+
+    @pytest.mark.asyncio
+    async def test_relevance_scores_written_in_one_batch(self, consolidator, mock_storage, sample_memories):
+        """Test that every scored memory reaches storage in a single batch update."""
+        mock_storage.update_memories_batch = AsyncMock(return_value=[True] * len(sample_memories))
+
+        scores = await consolidator._update_relevance_scores(sample_memories, "daily")
+
+        mock_storage.update_memories_batch.assert_awaited_once()
+        updated = mock_storage.update_memories_batch.await_args.args[0]
+        by_hash = {s.memory_hash: s.total_score for s in scores}
+        assert [m.content_hash for m in updated] == [m.content_hash for m in sample_memories]
+        assert all(m.metadata['relevance_score'] == by_hash[m.content_hash] for m in updated)
+        assert len({m.metadata['relevance_calculated_at'] for m in updated}) == 1
+
     @pytest.mark.asyncio
     async def test_storage_backend_integration(self, consolidator, mock_storage):
         """Test integration with storage backend methods."""
@@ -418,4 +478,98 @@ class TestDreamInspiredConsolidator:
         # With disabled features, the second consolidator might process differently
         # but both should complete successfully
         assert report1.performance_metrics["success"] is True
-        assert report2.performance_metrics["success"] is True
\ No newline at end of file
+        assert report2.performance_metrics["success"] is True
+
+@pytest.mark.integration
+class TestStreamingConsolidation:
+    """Consolidation over storage streamed in consolidation order."""
+
+    @pytest_asyncio.fixture
+    async def sqlite_storage(self, tmp_path):
+        from mcp_memory_service.storage.sqlite_vec import SqliteVecMemoryStorage
+
+        storage = SqliteVecMemoryStorage(str(tmp_path / "stream.db"))
+        await storage.initialize()
+        now = datetime.now().timestamp()
+        for i in range(25):
+            await storage.store(Memory(
+                content=f"Streaming window memory {i} about topic {i % 4} and deployment notes",
+                content_hash=f"window{i:03d}",
+                tags=[f"topic{i % 4}"],
+                created_at=now - (40 + i) * 86400,
+            ))
+        yield storage
+        storage.conn.close()
+
+    @pytest.mark.asyncio
+    async def test_full_run_processes_corpus_in_windows(self, sqlite_storage, consolidation_config):
+        config = replace(consolidation_config, incremental_mode=False, consolidation_window_size=10)
+        report = await DreamInspiredConsolidator(sqlite_storage, config).consolidate("weekly")
+
+        assert report.performance_metrics["success"] is True
+        assert report.memories_processed == 25
+        assert report.performance_metrics["streaming"]["windows"] == 3
+        assert report.performance_metrics["streaming"]["peak_rss_mb"] > 0
+
+    async def _clustered_windows(self, storage, config):
+        consolidator = DreamInspiredConsolidator(storage, config)
+        clustered = []
+        process = consolidator.clustering_engine.process
+
+        async def record(memories):
+            clustered.append({memory.content_hash for memory in memories})
+            return await process(memories)
+
+        consolidator.clustering_engine.process = record
+        return clustered, await consolidator.consolidate("weekly")
+
+    @pytest.mark.asyncio
+    async def test_full_run_clusters_whole_horizon_by_default(self, sqlite_storage, consolidation_config):
+        config = replace(
+            consolidation_config, incremental_mode=False, consolidation_chunk_size=10,
+            associations_enabled=False, compression_enabled=False, forgetting_enabled=False,
+        )
+        clustered, report = await self._clustered_windows(sqlite_storage, config)
+
+        # Storage is read in chunks of 10, but the horizon is clustered at once
+        assert [len(window) for window in clustered] == [25]
+        assert report.performance_metrics["streaming"]["windows"] == 1
+        assert report.performance_metrics["clustering"]["windows"] == 1
+
+    @pytest.mark.asyncio
+    async def test_window_size_opts_into_per_window_clustering(self, sqlite_storage, consolidation_config):
+        # Windowed full runs trade cross-window clusters for bounded memory
+        config = replace(
+            consolidation_config, incremental_mode=False, consolidation_window_size=10,
+            associations_enabled=False, compression_enabled=False, forgetting_enabled=False,
+        )
+        clustered, report = await self._clustered_windows(sqlite_storage, config)
+
+        assert [len(window) for window in clustered] == [10, 10, 5]
+        assert not (clustered[0] & clustered[1]) and not (clustered[1] & clustered[2])
+        stats = report.performance_metrics["clustering"]
+        assert stats["windows"] == 3
+        assert stats["memories"] == 25
+
+    @pytest.mark.asyncio
+    async def test_incremental_runs_rotate_through_corpus(self, sqlite_storage, consolidation_config):
+        config = replace(
+            consolidation_config, batch_size=10, consolidation_chunk_size=4,
+            associations_enabled=False, clustering_enabled=False, compression_enabled=False,
+            forgetting_enabled=False,
+        )
+        consolidator = DreamInspiredConsolidator(sqlite_storage, config)
+
+        seen = []
+        for _ in range(3):
+            batch = await consolidator._get_memories_for_horizon("weekly")
+            seen.append({memory.content_hash for memory in batch})
+            report = await consolidator.consolidate("weekly")
+            assert report.memories_processed == len(batch)
+            assert report.performance_metrics["streaming"]["windows"] == 1
+
+        # Oldest first: the three runs cover every memory before repeating any
+        assert [len(batch) for batch in seen] == [10, 10, 10]
+        assert len(seen[0] | seen[1]) == 20
+        assert seen[0].isdisjoint(seen[1])
+        assert len(seen[0] | seen[1] | seen[2]) == 25
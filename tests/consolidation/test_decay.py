@@ -1,9 +1,15 @@
 """Unit tests for the exponential decay calculator."""
 
+import numpy as np
 import pytest
-from datetime import datetime, timedelta
-
-from mcp_memory_service.consolidation.decay import ExponentialDecayCalculator, RelevanceScore
+from datetime import datetime, timedelta, timezone
+
+from mcp_memory_service.consolidation.decay import (
+    DecayColumns,
+    ExponentialDecayCalculator,
+    RelevanceScore,
+    relevance_arrays,
+)
 from mcp_memory_service.models.memory import Memory
 
 
@@ -483,4 +489,69 @@ class TestExponentialDecayCalculator:
         assert updated_memory.metadata['quality_boost_reason'] == 'association_connections'
         assert updated_memory.metadata['quality_boost_connection_count'] == 8
         assert updated_memory.metadata['original_quality_before_boost'] == 0.6
-        assert 'quality_boost_date' in updated_memory.metadata
\ No newline at end of file
+        assert 'quality_boost_date' in updated_memory.metadata
+
+@pytest.mark.unit
+class TestColumnarRelevance:
+    """Test decay scoring over whole columns."""
+
+    REFERENCE = datetime(2026, 1, 31, 12, tzinfo=timezone.utc)
+    NO_BOOST = {'enabled': False, 'min_connections': 5, 'factor': 1.2}
+
+    def _columns(self, ages, accessed=None, protected=None, connections=None):
+        now = self.REFERENCE.timestamp()
+        n = len(ages)
+        return DecayColumns(
+            reference_ts=np.array([now - a * 86400 if a is not None else np.nan for a in ages]),
+            last_access_ts=np.array([now - a * 86400 if a is not None else np.nan
+                                     for a in (accessed or [None] * n)]),
+            base_importance=np.ones(n),
+            retention_period=np.full(n, 30),
+            connection_count=np.array(connections or [0] * n),
+            quality=np.full(n, 0.5),
+            protected=np.array(protected or [False] * n),
+        )
+
+    def _reference_us(self):
+        return int(self.REFERENCE.timestamp()) * 1_000_000
+
+    def test_ages_are_whole_days(self):
+        arrays = relevance_arrays(self._columns([0.5, 1.0, 29.99, None]), self._reference_us(), self.NO_BOOST)
+
+        assert arrays['age_days'].tolist() == [0, 1, 29, 0]
+        assert arrays['decay_factor'][1] == pytest.approx(np.exp(-1 / 30))
+
+    def test_access_boost_bands(self):
+        columns = self._columns([40] * 5, accessed=[1.5, 2.5, 8.5, 31.5, None])
+        arrays = relevance_arrays(columns, self._reference_us(), self.NO_BOOST)
+
+        assert arrays['access_boost'].tolist() == [1.5, 1.2, 1.1, 1.0, 1.0]
+
+    def test_protected_floor_and_quality_boost(self):
+        columns = self._columns([400, 400], protected=[True, False], connections=[0, 6])
+        boost = dict(self.NO_BOOST, enabled=True)
+        arrays = relevance_arrays(columns, self._reference_us(), boost)
+
+        assert arrays['total_score'][0] == 0.5
+        assert arrays['total_score'][1] < 0.5
+        assert arrays['association_boost_applied'].tolist() == [False, True]
+        assert arrays['quality_score'].tolist() == pytest.approx([0.5, 0.6])
+        assert arrays['quality_boost_factor'].tolist() == [1.0, 1.2]
+
+    @pytest.mark.asyncio
+    async def test_batch_matches_single_memory_scores(self, consolidation_config, sample_memories):
+        calculator = ExponentialDecayCalculator(consolidation_config)
+        now = datetime.now()
+        connections = {sample_memories[0].content_hash: 6, sample_memories[2].content_hash: 2}
+        access_patterns = {sample_memories[1].content_hash: now - timedelta(days=3)}
+
+        batch = await calculator.process(
+            sample_memories, connections=connections, access_patterns=access_patterns, reference_time=now
+        )
+        single = [
+            calculator._score_memory(memory, now, connections, access_patterns)
+            for memory in sample_memories
+        ]
+
+        assert batch == single
+        assert all(type(s.metadata['age_days']) is int for s in batch)
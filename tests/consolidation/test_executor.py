@@ -0,0 +1,166 @@
+"""Tests for running consolidation compute off the event loop."""
+
+import asyncio
+import time
+from dataclasses import replace
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from mcp_memory_service.consolidation.clustering import compute_clusters
+from mcp_memory_service.consolidation.consolidator import DreamInspiredConsolidator
+from mcp_memory_service.consolidation.decay import ExponentialDecayCalculator
+from mcp_memory_service.consolidation.executor import (
+    ConsolidationExecutor,
+    SharedMatrix,
+    resolve_matrix,
+    strip_embeddings,
+)
+from mcp_memory_service.consolidation.forgetting import ControlledForgettingEngine
+
+
+def _blobs(rng, n_per_blob=40, dim=16):
+    centers = rng.normal(size=(3, dim)) * 5
+    return np.vstack([c + rng.normal(size=(n_per_blob, dim)) * 0.2 for c in centers]).astype(np.float32)
+
+
+@pytest.mark.unit
+class TestConsolidationExecutor:
+
+    @pytest.mark.asyncio
+    async def test_thread_mode_keeps_arrays_local(self):
+        executor = ConsolidationExecutor(max_workers=0)
+        array = np.ones((3, 2), dtype=np.float32)
+        with executor.share(array) as matrix:
+            assert matrix is array
+        assert executor.stats() == {'mode': 'thread', 'max_workers': 0}
+
+        batches = await executor.map_batches(lambda batch, k: [x * k for x in batch], list(range(7)), 3)
+        assert batches == [x * 3 for x in range(7)]
+
+    @pytest.mark.asyncio
+    async def test_shared_matrix_round_trip(self):
+        executor = ConsolidationExecutor(max_workers=1)
+        array = np.arange(12, dtype=np.float32).reshape(4, 3)
+        with executor.share(array) as matrix:
+            assert isinstance(matrix, SharedMatrix)
+            assert np.array_equal(resolve_matrix(matrix), array)
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_finishing_run_keeps_pool_for_concurrent_run(self):
+        executor = ConsolidationExecutor(max_workers=1)
+        executor.acquire()
+        executor.acquire()
+        try:
+            # One worker: the second task waits in the pool's queue
+            pending = asyncio.gather(*(executor.run(time.sleep, 0.3) for _ in range(2)))
+            while executor._pool is None:
+                await asyncio.sleep(0.01)
+            # The first run finishing must not cancel the second run's work
+            executor.release()
+            assert executor._pool is not None
+            assert await pending == [None, None]
+        finally:
+            executor.release()
+        assert executor._pool is None
+
+    @pytest.mark.asyncio
+    async def test_process_pool_matches_inline_clustering(self):
+        embeddings = _blobs(np.random.default_rng(7))
+        inline, _ = compute_clusters(embeddings, 'dbscan', 3, 64, 64)
+
+        executor = ConsolidationExecutor(max_workers=1)
+        try:
+            with executor.share(embeddings) as matrix:
+                pooled, stats = await executor.run(compute_clusters, matrix, 'dbscan', 3, 64, 64)
+        finally:
+            executor.shutdown()
+
+        assert executor.stats()['mode'] == 'process'
+        assert stats['edges'] > 0
+        assert [sorted(members.tolist()) for members, _, _ in pooled] == \
+            [sorted(members.tolist()) for members, _, _ in inline]
+
+    @pytest.mark.asyncio
+    async def test_loop_stays_responsive_during_compute(self):
+        """Event-loop ticks keep arriving while clustering runs on the executor."""
+        embeddings = _blobs(np.random.default_rng(3), n_per_blob=1500, dim=64)
+        executor = ConsolidationExecutor(max_workers=0)
+        ticks = []
+
+        async def ticker():
+            while True:
+                ticks.append(time.perf_counter())
+                await asyncio.sleep(0.005)
+
+        task = asyncio.create_task(ticker())
+        started = time.perf_counter()
+        await executor.run(compute_clusters, embeddings, 'dbscan', 3, 64, 64)
+        elapsed = time.perf_counter() - started
+        task.cancel()
+
+        assert len(ticks) > 1
+        assert max(np.diff(ticks), default=0) < max(0.5, elapsed / 2)
+
+    def test_strip_embeddings_copies(self, sample_memories):
+        stripped = strip_embeddings(sample_memories)
+        assert all(m.embedding is None for m in stripped)
+        assert any(m.embedding for m in sample_memories)
+        assert [m.content_hash for m in stripped] == [m.content_hash for m in sample_memories]
+
+
+@pytest.mark.unit
+class TestEnginesOnExecutor:
+
+    @pytest.mark.asyncio
+    async def test_decay_scores_match_inline(self, consolidation_config, sample_memories):
+        reference_time = sample_memories[0].timestamp
+        inline = await ExponentialDecayCalculator(consolidation_config).process(
+            sample_memories, reference_time=reference_time
+        )
+
+        calculator = ExponentialDecayCalculator(consolidation_config)
+        calculator.executor = ConsolidationExecutor(max_workers=0)
+        offloaded = await calculator.process(sample_memories, reference_time=reference_time)
+
+        assert [(s.memory_hash, s.total_score) for s in offloaded] == \
+            [(s.memory_hash, s.total_score) for s in inline]
+
+    @pytest.mark.asyncio
+    async def test_forgetting_flags_duplicates_on_executor(self, consolidation_config, sample_memories):
+        engine = ControlledForgettingEngine(consolidation_config)
+        engine.executor = ConsolidationExecutor(max_workers=0)
+        memory = sample_memories[1]  # not protected
+        duplicate = replace(memory, content_hash="duplicate_of_second")
+        scores = await ExponentialDecayCalculator(consolidation_config).process([memory, duplicate])
+
+        candidates = await engine._identify_forgetting_candidates(
+            [memory, duplicate], {s.memory_hash: s for s in scores}, {}, 'monthly'
+        )
+        flagged = {c.memory.content_hash for c in candidates if 'potential_duplicate' in c.forgetting_reasons}
+        assert flagged == {memory.content_hash, duplicate.content_hash}
+
+
+@pytest.mark.integration
+class TestConsolidatorProgress:
+
+    @pytest.mark.asyncio
+    async def test_progress_events_and_executor_stats(self, mock_storage, consolidation_config):
+        consolidator = DreamInspiredConsolidator(mock_storage, consolidation_config)
+        events = []
+
+        async def capture(event, connection_filter=None):
+            events.append(event.data)
+
+        with patch('mcp_memory_service.consolidation.consolidator.sse_manager.broadcast_event', side_effect=capture):
+            report = await consolidator.consolidate('weekly')
+
+        assert report.performance_metrics['executor'] == {'mode': 'thread', 'max_workers': 0}
+        steps = [(e['phase'], e['status']) for e in events]
+        assert steps[0] == ('run', 'started')
+        assert steps[-1] == ('run', 'completed')
+        for phase in ('relevance', 'clustering', 'associations', 'compression'):
+            assert steps.index((phase, 'running')) < steps.index((phase, 'completed'))
+        assert all(e['time_horizon'] == 'weekly' for e in events)
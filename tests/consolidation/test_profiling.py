@@ -0,0 +1,146 @@
+"""Tests for per-phase performance profiles of consolidation runs."""
+
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from mcp_memory_service.consolidation.consolidator import DreamInspiredConsolidator
+from mcp_memory_service.consolidation.health import ConsolidationHealthMonitor
+from mcp_memory_service.consolidation.profiling import (
+    MeteredStorage,
+    PhaseProfiler,
+    payload_bytes,
+    profile_phase,
+    unwrap_storage,
+)
+from mcp_memory_service.models.memory import Memory
+
+
+class _Backend:
+    def __init__(self):
+        self.memories = [Memory(content="x" * 10, content_hash=f"h{i}", embedding=[0.0] * 4) for i in range(3)]
+        self.name = "backend"
+
+    async def get_all_memories(self):
+        return self.memories
+
+    async def stream(self):
+        for memory in self.memories:
+            yield [memory]
+
+
+@pytest.mark.unit
+class TestPhaseProfiler:
+
+    def test_phases_are_summed_by_name(self):
+        profile = PhaseProfiler()
+        with profile.activate():
+            for window in (3, 5):
+                with profile_phase("relevance", window) as phase:
+                    phase["items_out"] = window - 1
+            with profile_phase("graph"):
+                pass
+        summary = profile.summary()
+
+        relevance, graph = summary["phases"]
+        assert relevance["phase"] == "relevance"
+        assert (relevance["runs"], relevance["items_in"], relevance["items_out"]) == (2, 8, 6)
+        assert graph["phase"] == "graph" and graph["runs"] == 1
+        assert relevance["wall_seconds"] >= 0 and relevance["cpu_seconds"] >= 0
+        assert summary["storage_calls"] == 0
+
+    def test_profile_phase_outside_a_run_is_a_noop(self):
+        with profile_phase("relevance", 3) as phase:
+            phase["items_out"] = 1
+        assert phase["items_in"] == 0
+
+    def test_payload_bytes(self):
+        memory = Memory(content="abcd", content_hash="h", embedding=[0.0] * 8)
+        assert payload_bytes(memory) == 4 + 32
+        assert payload_bytes({"h": 2}) == 1 + 8
+        assert payload_bytes(None) == 0
+
+
+@pytest.mark.unit
+class TestMeteredStorage:
+
+    @pytest.mark.asyncio
+    async def test_counts_round_trips_of_the_running_phase(self):
+        storage = MeteredStorage(_Backend())
+        profile = PhaseProfiler()
+        with profile.activate():
+            with profile_phase("load"):
+                await storage.get_all_memories()
+                chunks = [chunk async for chunk in storage.stream()]
+            await storage.get_all_memories()  # Between phases
+
+        assert len(chunks) == 3
+        summary = profile.summary()
+        load = summary["phases"][0]
+        assert load["storage_calls"] == 4
+        assert load["storage_bytes_read"] == 2 * 3 * (10 + 16)
+        assert summary["storage_calls"] == 5
+
+    @pytest.mark.asyncio
+    async def test_calls_outside_a_run_are_not_counted(self):
+        backend = _Backend()
+        storage = MeteredStorage(backend)
+        profile = PhaseProfiler()
+        assert await storage.get_all_memories() is backend.memories
+        assert storage.name == "backend"
+        assert unwrap_storage(storage) is backend
+        assert unwrap_storage(backend) is backend
+        assert profile.summary()["storage_calls"] == 0
+
+
+@pytest.mark.unit
+class TestHealthProfileHistory:
+
+    def test_history_is_bounded_and_newest_first(self, consolidation_config):
+        monitor = ConsolidationHealthMonitor(replace(consolidation_config, profile_history_size=3))
+        for i in range(5):
+            monitor.record_consolidation_performance(
+                "daily", 1.0, 10, True, profile={"wall_seconds": i, "phases": []}
+            )
+        monitor.record_consolidation_performance("daily", 1.0, 10, True)  # No profile
+
+        history = monitor.get_profile_history(limit=10)
+        assert [entry["profile"]["wall_seconds"] for entry in history] == [4, 3, 2]
+        assert history[0]["time_horizon"] == "daily" and history[0]["success"] is True
+        assert len(monitor.get_profile_history(limit=1)) == 1
+
+
+@pytest.mark.integration
+class TestConsolidationProfile:
+
+    @pytest.mark.asyncio
+    async def test_report_carries_phase_profile(self, mock_storage, consolidation_config):
+        consolidator = DreamInspiredConsolidator(mock_storage, consolidation_config)
+        report = await consolidator.consolidate("weekly")
+
+        profile = report.performance_metrics["profile"]
+        phases = {phase["phase"]: phase for phase in profile["phases"]}
+        assert {"load", "relevance", "clustering", "associations"} <= set(phases)
+        assert phases["relevance"]["items_in"] == report.memories_processed
+        assert phases["relevance"]["items_out"] == report.memories_processed
+        assert phases["load"]["items_out"] == report.memories_processed
+        assert phases["load"]["storage_calls"] >= 1
+        assert phases["clustering"]["items_out"] == report.clusters_created
+        assert profile["storage_calls"] >= sum(phase["storage_calls"] for phase in phases.values())
+        assert "artifacts" not in profile
+
+        history = consolidator.get_profile_history()
+        assert history[0]["profile"] is profile
+
+    @pytest.mark.asyncio
+    async def test_capture_profile_writes_artifacts(self, mock_storage, consolidation_config):
+        consolidator = DreamInspiredConsolidator(mock_storage, consolidation_config)
+        report = await consolidator.consolidate("daily", capture_profile=True)
+
+        artifacts = report.performance_metrics["profile"]["artifacts"]
+        names = {Path(path).name for path in artifacts}
+        assert names == {"consolidation.prof", "cprofile.txt", "tracemalloc.txt"}
+        archive = Path(consolidation_config.archive_location).resolve()
+        assert all(Path(path).resolve().is_relative_to(archive / "profiles") for path in artifacts)
+        assert all(Path(path).stat().st_size > 0 for path in artifacts)
@@ -94,3 +94,108 @@ class TestExecuteWithRetryThreading:
         assert result == "success"
         assert call_count == 3
         storage.conn.close()
+
+
+def _create_graph_table(db_path):
+    conn = sqlite3.connect(db_path)
+    conn.execute("""
+        CREATE TABLE memory_graph (
+            source_hash TEXT NOT NULL,
+            target_hash TEXT NOT NULL,
+            similarity REAL NOT NULL,
+            connection_types TEXT NOT NULL,
+            metadata TEXT,
+            created_at REAL NOT NULL,
+            relationship_type TEXT DEFAULT 'related',
+            PRIMARY KEY (source_hash, target_hash)
+        )
+    """)
+    return conn
+
+
+class TestGraphStorageThreading:
+    """Verify GraphStorage runs its SQL on the reader/writer threads."""
+
+    @pytest.mark.asyncio
+    async def test_reads_use_pool_and_writes_use_writer(self, tmp_path):
+        """Reads go to read-only pool connections, writes to the writer connection."""
+        from mcp_memory_service.storage.graph import GraphStorage
+
+        db_path = str(tmp_path / "graph.db")
+        _create_graph_table(db_path).close()
+        graph = GraphStorage(db_path, read_pool_size=2)
+
+        assert await graph.store_association("a", "b", 0.8, ["semantic"])
+        assert await graph.find_connected("a", max_hops=1) == [("b", 1)]
+
+        reader = graph._reader_connections[0]
+        assert reader is not graph._connection
+        with pytest.raises(sqlite3.OperationalError):
+            reader.execute("DELETE FROM memory_graph")
+
+        stats = graph.get_query_stats()
+        assert stats["store_association"]["count"] == 1
+        assert stats["find_connected"]["count"] == 1
+        assert stats["find_connected"]["max_ms"] >= stats["find_connected"]["p50_ms"] >= 0
+
+        await graph.close()
+        assert graph._connection is None and graph._reader_connections == []
+
+    @pytest.mark.asyncio
+    @pytest.mark.performance
+    async def test_four_hop_traversal_does_not_block_loop(self, tmp_path):
+        """A 4-hop traversal over a 1M-edge graph must leave the event loop free.
+
+        100k nodes with 10 random out-edges each; traversing in both directions
+        visits ~90k nodes and takes hundreds of milliseconds. A 10ms ticker runs
+        alongside and must never be starved for long.
+        """
+        import random
+        from mcp_memory_service.storage.graph import GraphStorage
+
+        db_path = str(tmp_path / "graph_1m.db")
+        conn = _create_graph_table(db_path)
+        nodes, out_degree = 100_000, 10
+        rng = random.Random(7)
+        conn.executemany(
+            "INSERT OR IGNORE INTO memory_graph VALUES (?, ?, 0.5, '[\"semantic\"]', NULL, 0.0, 'related')",
+            (
+                (f"h{source}", f"h{target}")
+                for source in range(nodes)
+                for target in rng.sample(range(nodes), out_degree)
+                if target != source
+            ),
+        )
+        conn.execute("CREATE INDEX idx_graph_source ON memory_graph(source_hash)")
+        conn.execute("CREATE INDEX idx_graph_target ON memory_graph(target_hash)")
+        conn.commit()
+        assert conn.execute("SELECT COUNT(*) FROM memory_graph").fetchone()[0] > 990_000
+        conn.close()
+
+        graph = GraphStorage(db_path)
+        done = asyncio.Event()
+
+        async def ticker():
+            gaps = []
+            while not done.is_set():
+                t = time.monotonic()
+                await asyncio.sleep(0.01)
+                gaps.append(time.monotonic() - t)
+            return gaps
+
+        async def traverse():
+            try:
+                t = time.monotonic()
+                connected = await graph.find_connected("h0", max_hops=4, direction="both")
+                return connected, time.monotonic() - t
+            finally:
+                done.set()
+
+        (connected, elapsed), gaps = await asyncio.gather(traverse(), ticker())
+        await graph.close()
+
+        assert len(connected) > 10_000
+        assert max(d for _, d in connected) == 4
+        assert max(gaps) < 0.1, (
+            f"Event loop was blocked during a {elapsed * 1000:.0f}ms traversal — max tick gap {max(gaps) * 1000:.0f}ms"
+        )
@@ -0,0 +1,113 @@
+"""
+Tests for streaming memories in consolidation order (iter_memories_for_consolidation).
+
+Covers:
+- SQL ordering by last_consolidated_at with created_at fallback, matching
+  the Python sort key used by the base-class default
+- Horizon cutoff, limit and soft-delete filtering
+- Fixed-size chunks with float32 embeddings
+- Chunk queries seek through the expression index instead of sorting
+"""
+
+import os
+import shutil
+import tempfile
+import time
+from array import array
+
+import pytest
+import pytest_asyncio
+
+from mcp_memory_service.models.memory import Memory
+from mcp_memory_service.storage.base import MemoryStorage, consolidation_sort_key
+from mcp_memory_service.storage.sqlite_vec import SqliteVecMemoryStorage, _CONSOLIDATION_ORDER_KEY
+
+DAY = 86400
+
+
+@pytest_asyncio.fixture
+async def storage():
+    temp_dir = tempfile.mkdtemp()
+    storage = SqliteVecMemoryStorage(os.path.join(temp_dir, "test_stream.db"))
+    try:
+        await storage.initialize()
+        now = time.time()
+        for i in range(23):
+            metadata = {"last_consolidated_at": now - i * 60} if i % 3 == 0 else {}
+            await storage.store(Memory(
+                content=f"Streaming consolidation test memory number {i}",
+                content_hash=f"stream{i:03d}",
+                tags=["stream"],
+                metadata=metadata,
+                created_at=now - (100 + i) * DAY,
+            ))
+        yield storage
+    finally:
+        if storage.conn:
+            storage.conn.close()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+async def _collect(source, **kwargs):
+    return [chunk async for chunk in source.iter_memories_for_consolidation(**kwargs)]
+
+
+@pytest.mark.asyncio
+async def test_chunks_follow_consolidation_order(storage):
+    chunks = await _collect(storage, chunk_size=5)
+    assert [len(chunk) for chunk in chunks] == [5, 5, 5, 5, 3]
+
+    streamed = [memory for chunk in chunks for memory in chunk]
+    expected = sorted(await storage.get_all_memories(), key=consolidation_sort_key)
+    assert [m.content_hash for m in streamed] == [m.content_hash for m in expected]
+    # Never-consolidated memories (ordered by created_at) come first
+    assert "last_consolidated_at" not in streamed[0].metadata
+
+    embedding = streamed[0].embedding
+    assert isinstance(embedding, array) and embedding.typecode == "f"
+    assert len(embedding) == len(expected[0].embedding)
+    assert list(embedding) == pytest.approx(expected[0].embedding)
+
+
+@pytest.mark.asyncio
+async def test_cutoff_limit_and_deleted(storage):
+    cutoff = time.time() - 110.5 * DAY
+    streamed = [m for chunk in await _collect(storage, cutoff_timestamp=cutoff, chunk_size=4) for m in chunk]
+    assert {m.content_hash for m in streamed} == {f"stream{i:03d}" for i in range(11, 23)}
+
+    limited = await _collect(storage, chunk_size=4, limit=6)
+    assert [len(chunk) for chunk in limited] == [4, 2]
+
+    first = limited[0][0].content_hash
+    await storage.delete(first)
+    remaining = [m.content_hash for chunk in await _collect(storage, chunk_size=7) for m in chunk]
+    assert first not in remaining and len(remaining) == 22
+
+
+@pytest.mark.asyncio
+async def test_chunk_query_seeks_through_index(storage):
+    await _collect(storage, limit=1)
+    plan = storage.conn.execute(
+        f"EXPLAIN QUERY PLAN SELECT id FROM memories INDEXED BY idx_memories_consolidation_order "
+        f"WHERE deleted_at IS NULL AND {_CONSOLIDATION_ORDER_KEY} >= ? "
+        f"AND ({_CONSOLIDATION_ORDER_KEY}, id) > (?, ?) ORDER BY {_CONSOLIDATION_ORDER_KEY}, id LIMIT 10",
+        (0, 0, 0),
+    ).fetchall()
+    details = " ".join(row[-1] for row in plan)
+    assert "SEARCH memories USING INDEX idx_memories_consolidation_order" in details
+    assert "TEMP B-TREE" not in details
+
+
+@pytest.mark.asyncio
+async def test_base_default_matches_sqlite(storage):
+    """The MemoryStorage default (load, filter, sort in Python) yields the same order."""
+    cutoff = time.time() - 105.5 * DAY
+    default = [
+        m.content_hash
+        for chunk in [c async for c in MemoryStorage.iter_memories_for_consolidation(
+            storage, cutoff_timestamp=cutoff, chunk_size=3, limit=10
+        )]
+        for m in chunk
+    ]
+    streamed = [m.content_hash for chunk in await _collect(storage, cutoff_timestamp=cutoff, limit=10) for m in chunk]
+    assert default == streamed
@@ -0,0 +1,170 @@
+"""Tests for the CSR adjacency cache behind GraphStorage traversals.
+
+Each query is run twice against the same database: once through the
+recursive CTEs and once through the adjacency cache. The CTEs enumerate
+paths, so where they can report a node or pair at several distances the
+comparison uses the shortest one, which is what the BFS reports.
+"""
+
+import random
+import sqlite3
+
+import pytest
+import pytest_asyncio
+
+pytest.importorskip("numpy")
+
+from mcp_memory_service.storage.graph import GraphStorage
+from mcp_memory_service.storage.graph_adjacency import CSRAdjacency
+
+RELATIONSHIPS = ["related", "causes", "fixes", "supports"]
+
+
+def _min_distance(rows):
+    best = {}
+    for *key, distance in rows:
+        key = tuple(key)
+        best[key] = min(distance, best.get(key, distance))
+    return best
+
+
+@pytest_asyncio.fixture
+async def storages(temp_graph_db):
+    """A random mixed-type graph, opened once with and once without the cache."""
+    writer = GraphStorage(temp_graph_db, adjacency_cache=False)
+    rng = random.Random(11)
+    nodes = [f"node_{i:02d}" for i in range(40)]
+    for _ in range(90):
+        source, target = rng.sample(nodes, 2)
+        await writer.store_association(
+            source, target, 0.6, ["semantic"], relationship_type=rng.choice(RELATIONSHIPS)
+        )
+    await writer.close()
+
+    cte = GraphStorage(temp_graph_db, adjacency_cache=False)
+    cached = GraphStorage(temp_graph_db, adjacency_cache=True)
+    yield cte, cached, nodes
+    await cte.close()
+    await cached.close()
+
+
+@pytest.mark.asyncio
+async def test_find_connected_matches_cte(storages):
+    cte, cached, nodes = storages
+    for node in nodes[:10]:
+        for direction in ("outgoing", "incoming", "both"):
+            for relationship_type in (None, "causes"):
+                expected = _min_distance(
+                    await cte.find_connected(node, 3, relationship_type, direction)
+                )
+                actual = await cached.find_connected(node, 3, relationship_type, direction)
+                assert {(h,): d for h, d in actual} == expected
+                assert actual == sorted(actual, key=lambda item: (item[1], item[0]))
+    assert cached.get_query_stats()["adjacency_load"]["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_neighbors_many_matches_find_connected(storages):
+    cte, cached, nodes = storages
+    for direction in ("outgoing", "incoming", "both"):
+        for relationship_types in (None, ["causes", "fixes"]):
+            expected = await cte.neighbors_many(nodes, relationship_types, direction)
+            assert expected == await cached.neighbors_many(nodes, relationship_types, direction)
+            if relationship_types is None:
+                for node in nodes[:10]:
+                    one_hop = await cte.find_connected(node, 1, direction=direction)
+                    assert expected[node] == [h for h, _ in one_hop]
+
+
+@pytest.mark.asyncio
+async def test_empty_relationship_filter_means_all_types(storages):
+    cte, cached, nodes = storages
+    for storage in (cte, cached):
+        for direction in ("outgoing", "both"):
+            unfiltered = await storage.neighbors_many(nodes, None, direction)
+            assert await storage.neighbors_many(nodes, [], direction) == unfiltered
+        for source, target in zip(nodes[:10], reversed(nodes)):
+            assert await storage.shortest_path(source, target, relationship_types=[]) == \
+                await storage.shortest_path(source, target)
+
+
+@pytest.mark.asyncio
+async def test_shortest_path_matches_cte_length(storages):
+    cte, cached, nodes = storages
+    for source, target in zip(nodes[:15], reversed(nodes)):
+        expected = await cte.shortest_path(source, target, max_depth=5)
+        actual = await cached.shortest_path(source, target, max_depth=5)
+        if expected is None:
+            assert actual is None
+            continue
+        assert len(actual) == len(expected)
+        assert actual[0] == source and actual[-1] == target
+        for a, b in zip(actual, actual[1:]):
+            assert await cached.get_association(a, b) is not None
+
+
+@pytest.mark.asyncio
+async def test_common_neighbors_matches_cte(storages):
+    cte, cached, nodes = storages
+    for node in nodes[:10]:
+        expected = await cte.common_neighbors(node, min_shared=1)
+        actual = await cached.common_neighbors(node, min_shared=1)
+        # Same counts; ties may be cut at LIMIT 10 in a different order
+        assert [shared for _, shared, _ in actual] == [shared for _, shared, _ in expected]
+        assert {c: (s, d) for c, s, d in actual if s > actual[-1][1]} == \
+            {c: (s, d) for c, s, d in expected if s > actual[-1][1]}
+
+
+@pytest.mark.asyncio
+async def test_transitive_closure_matches_cte(storages):
+    cte, cached, _ = storages
+    for relationship_type in RELATIONSHIPS:
+        expected = _min_distance(await cte.transitive_closure(relationship_type, max_hops=3))
+        actual = await cached.transitive_closure(relationship_type, max_hops=3)
+        assert {(s, t): d for s, t, d in actual} == expected
+        assert len(actual) == len(expected), "each pair is reported once"
+
+
+@pytest.mark.asyncio
+async def test_own_writes_update_cache_without_reload(storages):
+    _, cached, _ = storages
+    assert await cached.find_connected("new_a", 2) == []
+
+    assert await cached.store_association("new_a", "new_b", 0.7, ["semantic"], relationship_type="causes")
+    assert await cached.store_association("new_b", "node_00", 0.7, ["semantic"])
+    assert await cached.find_connected("new_a", 2, direction="outgoing") == [("new_b", 1), ("node_00", 2)]
+
+    assert await cached.delete_association("new_a", "new_b")
+    assert await cached.find_connected("new_a", 2) == []
+    assert cached.get_query_stats()["adjacency_load"]["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_external_writes_trigger_reload(storages, temp_graph_db):
+    _, cached, _ = storages
+    assert await cached.find_connected("ext_a", 1) == []
+
+    conn = sqlite3.connect(temp_graph_db)
+    conn.execute(
+        "INSERT INTO memory_graph VALUES ('ext_a', 'ext_b', 0.5, '[]', NULL, 0, 'related')"
+    )
+    conn.commit()
+    conn.close()
+
+    assert await cached.find_connected("ext_a", 1) == [("ext_b", 1)]
+    assert cached.get_query_stats()["adjacency_load"]["count"] == 2
+
+
+def test_compaction_preserves_edges():
+    adjacency = CSRAdjacency.from_rows([("a", "b", "related"), ("b", "c", "causes")])
+    for i in range(3000):
+        adjacency.add_edge(f"x{i}", f"x{i + 1}", "follows")
+    adjacency.remove_edge("a", "b")
+    adjacency.compact()
+
+    assert adjacency.edge_count == 3001
+    assert adjacency.k_hop("b", 1, direction="outgoing") == [("c", 1)]
+    assert adjacency.k_hop("a", 3) == []
+    assert adjacency.k_hop("x0", 3, ["follows"], "outgoing") == [("x1", 1), ("x2", 2), ("x3", 3)]
+    assert adjacency.neighbor_pairs(["x1", "b"], "both") == [("x1", "x2"), ("b", "c"), ("x1", "x0")]
+    assert adjacency.neighbor_pairs(["x1", "b"], "incoming", ["causes"]) == []
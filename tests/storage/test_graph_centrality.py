@@ -0,0 +1,107 @@
+"""Tests for precomputed graph centrality (PageRank / degree)."""
+
+import sqlite3
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from mcp_memory_service.storage.graph import GraphStorage
+from mcp_memory_service.storage.graph_centrality import compute_centrality, pagerank
+
+
+def _dense_pagerank(edges, n, teleport, damping=0.85, iterations=500):
+    """Reference PageRank with a dense transition matrix."""
+    matrix = np.zeros((n, n))
+    for source, target, weight in edges:
+        matrix[target, source] += weight
+    out_weight = matrix.sum(axis=0)
+    scores = teleport.copy()
+    for _ in range(iterations):
+        dangling = scores[out_weight == 0].sum()
+        flow = matrix @ np.divide(scores, out_weight, out=np.zeros(n), where=out_weight > 0)
+        scores = damping * (flow + dangling * teleport) + (1 - damping) * teleport
+    return scores
+
+
+def test_pagerank_matches_dense_reference():
+    rng = np.random.default_rng(5)
+    n = 30
+    edges = [(int(s), int(t), float(w)) for s, t, w in zip(
+        rng.integers(0, n, 120), rng.integers(0, n, 120), rng.random(120)
+    )]
+    sources, targets, weights = (np.array(column) for column in zip(*edges))
+    teleport = rng.random(n)
+
+    for personalization in (None, teleport):
+        scores, iterations = pagerank(sources, targets, weights, n, teleport=personalization)
+        expected = _dense_pagerank(
+            edges, n, np.full(n, 1 / n) if personalization is None else teleport / teleport.sum()
+        )
+        assert np.allclose(scores, expected, atol=1e-7)
+        assert scores.sum() == pytest.approx(1.0)
+        assert iterations < 100
+
+
+def test_warm_start_converges_faster():
+    edges = [(f"n{i}", f"n{(i * 7 + 3) % 50}", 0.5) for i in range(50)]
+    edges += [(f"n{i}", "hub", 0.9) for i in range(0, 50, 3)]
+    cold, cold_iterations = compute_centrality(edges)
+    assert max(cold, key=lambda h: cold[h].pagerank) == "hub"
+    assert cold["hub"].degree == 17
+    assert max(score.importance for score in cold.values()) <= 1.0
+
+    warm, warm_iterations = compute_centrality(
+        edges + [("n1", "n2", 0.5)],
+        previous={h: (s.pagerank, s.personalized_pagerank) for h, s in cold.items()},
+    )
+    assert warm_iterations < cold_iterations
+    assert warm["hub"].pagerank == pytest.approx(cold["hub"].pagerank, rel=0.05)
+
+
+@pytest.mark.asyncio
+async def test_refresh_centrality_is_incremental(temp_graph_db):
+    graph = GraphStorage(temp_graph_db)
+    try:
+        for i in range(6):
+            await graph.store_association(f"leaf{i}", "hub", 0.8, ["semantic"], relationship_type="supports")
+        await graph.store_association("a", "b", 0.5, ["semantic"])
+
+        first = await graph.refresh_centrality()
+        assert first["skipped"] is False
+        assert first["nodes"] == first["updated"] == 9
+        assert (await graph.refresh_centrality())["skipped"] is True
+
+        scores = await graph.get_centrality(["hub", "leaf0", "missing"])
+        assert set(scores) == {"hub", "leaf0"}
+        assert 0 < scores["leaf0"]["importance"] < scores["hub"]["importance"] <= 1.0
+        assert scores["hub"]["pagerank"] > scores["leaf0"]["pagerank"]
+        assert scores["hub"]["degree"] == 6
+
+        # Personalization raises the personalized score of the weighted memory
+        await graph.refresh_centrality(personalization={"a": 50.0})
+        a_scores = (await graph.get_centrality(["a"]))["a"]
+        assert a_scores["personalized_pagerank"] > a_scores["pagerank"]
+
+        await graph.delete_association("a", "b")
+        result = await graph.refresh_centrality()
+        assert result["removed"] == 2
+        assert await graph.get_centrality(["a", "b"]) == {}
+
+        conn = sqlite3.connect(temp_graph_db)
+        weight = conn.execute(
+            "SELECT personalization FROM memory_centrality WHERE content_hash = 'hub'"
+        ).fetchone()
+        conn.close()
+        assert weight == (None,)
+    finally:
+        await graph.close()
+
+
+@pytest.mark.asyncio
+async def test_get_centrality_before_first_refresh(temp_graph_db):
+    graph = GraphStorage(temp_graph_db)
+    try:
+        assert await graph.get_centrality(["anything"]) == {}
+    finally:
+        await graph.close()
@@ -299,6 +299,69 @@ class TestGraphStorage:
 
         assert path == ["hash_x"], "Self-path should return [hash]"
 
+    @pytest.mark.asyncio
+    async def test_shortest_path_direction(self, graph_storage):
+        """Test direction semantics on directed (asymmetric) edges.
+
+        Chain: P causes Q, R causes Q (P → Q ← R)
+
+        Validates:
+        - "outgoing" follows edges only source → target
+        - "incoming" follows them backwards
+        - "both" ignores direction and finds P - Q - R
+        """
+        await graph_storage.store_association("hash_p", "hash_q", 0.7, ["causal"], relationship_type="causes")
+        await graph_storage.store_association("hash_r", "hash_q", 0.7, ["causal"], relationship_type="causes")
+
+        assert await graph_storage.shortest_path("hash_p", "hash_q") == ["hash_p", "hash_q"]
+        assert await graph_storage.shortest_path("hash_q", "hash_p") is None
+        assert await graph_storage.shortest_path("hash_q", "hash_p", direction="incoming") == ["hash_q", "hash_p"]
+        assert await graph_storage.shortest_path("hash_p", "hash_r") is None
+        assert await graph_storage.shortest_path("hash_p", "hash_r", direction="both") == \
+            ["hash_p", "hash_q", "hash_r"]
+        assert await graph_storage.shortest_path("hash_p", "hash_r", direction="sideways") is None
+
+    @pytest.mark.asyncio
+    async def test_shortest_path_relationship_filter_and_depth(self, graph_storage):
+        """Test relationship_types filtering and max_depth (memories on the path).
+
+        Graph: S → T → U (causes) plus a direct S → U "supports" shortcut
+
+        Validates:
+        - The shortcut wins without a filter
+        - Filtering to "causes" takes the 2-hop route
+        - max_depth=2 forbids the 2-hop route
+        """
+        await graph_storage.store_association("hash_s", "hash_t", 0.7, ["causal"], relationship_type="causes")
+        await graph_storage.store_association("hash_t", "hash_u", 0.7, ["causal"], relationship_type="causes")
+        await graph_storage.store_association("hash_s", "hash_u", 0.7, ["semantic"], relationship_type="supports")
+
+        assert await graph_storage.shortest_path("hash_s", "hash_u") == ["hash_s", "hash_u"]
+        assert await graph_storage.shortest_path("hash_s", "hash_u", relationship_types=["causes"]) == \
+            ["hash_s", "hash_t", "hash_u"]
+        assert await graph_storage.shortest_path(
+            "hash_s", "hash_u", max_depth=2, relationship_types=["causes"]
+        ) is None
+
+    @pytest.mark.asyncio
+    async def test_shortest_path_expansion_budget(self, graph_storage):
+        """Test max_expanded_nodes bounds the search.
+
+        Graph: a 6-node chain from chain_0 to chain_5
+
+        Validates:
+        - The path is found with an adequate budget
+        - A budget smaller than the nodes needed returns None
+        """
+        for i in range(5):
+            await graph_storage.store_association(f"chain_{i}", f"chain_{i + 1}", 0.7, ["semantic"])
+
+        path = await graph_storage.shortest_path("chain_0", "chain_5", max_depth=6, max_expanded_nodes=10)
+        assert path == [f"chain_{i}" for i in range(6)]
+        assert await graph_storage.shortest_path(
+            "chain_0", "chain_5", max_depth=6, max_expanded_nodes=3
+        ) is None
+
     @pytest.mark.asyncio
     async def test_get_subgraph(self, graph_storage, sample_graph_data):
         """Test subgraph extraction for visualization.
@@ -0,0 +1,155 @@
+"""Tests for the level-of-detail graph view (get_graph_view / expand_graph_node)."""
+
+import os
+import tempfile
+
+import pytest
+import pytest_asyncio
+
+from mcp_memory_service.models.memory import Memory
+from mcp_memory_service.storage.graph import GraphStorage
+from mcp_memory_service.storage.sqlite_vec import SqliteVecMemoryStorage
+from mcp_memory_service.utils.hashing import generate_content_hash
+
+
+@pytest_asyncio.fixture
+async def star_graph():
+    """Two hubs with 8 and 4 leaves, plus an isolated pair, in one database."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage = SqliteVecMemoryStorage(os.path.join(tmpdir, "graph_view.db"))
+        await storage.initialize()
+
+        hashes = {}
+        for name in ["hub_a", "hub_b", "x", "y"] + [f"a{i}" for i in range(8)] + [f"b{i}" for i in range(4)]:
+            content = f"Graph view memory {name}"
+            memory = Memory(content=content, content_hash=generate_content_hash(content), tags=["test"])
+            success, message = await storage.store(memory)
+            assert success, message
+            hashes[name] = memory.content_hash
+
+        graph = GraphStorage(storage.db_path)
+        edges = [("hub_a", f"a{i}", 0.5 + i / 20) for i in range(8)]
+        edges += [("hub_b", f"b{i}", 0.6) for i in range(4)]
+        edges += [("hub_a", "hub_b", 0.9), ("x", "y", 0.4)]
+        result = await graph.store_associations_bulk([
+            {"source_hash": hashes[s], "target_hash": hashes[t], "similarity": sim, "connection_types": ["semantic"]}
+            for s, t, sim in edges
+        ])
+        assert result["inserted"] == 2 * len(edges)
+        await graph.close()
+
+        yield storage, hashes
+        await storage.close()
+
+
+@pytest.mark.asyncio
+async def test_graph_view_folds_hidden_nodes_into_clusters(star_graph):
+    storage, hashes = star_graph
+
+    view = await storage.get_graph_view(node_budget=2)
+
+    assert [node["id"] for node in view["nodes"]] == [hashes["hub_a"], hashes["hub_b"]]
+    assert view["nodes"][0]["connections"] == 18  # 9 symmetric edges, stored both ways
+    assert [(e["source"], e["target"]) for e in view["edges"]] in (
+        [(hashes["hub_a"], hashes["hub_b"]), (hashes["hub_b"], hashes["hub_a"])],
+        [(hashes["hub_b"], hashes["hub_a"]), (hashes["hub_a"], hashes["hub_b"])],
+    )
+
+    clusters = {cluster["id"]: cluster for cluster in view["clusters"]}
+    assert clusters[f"cluster:{hashes['hub_a']}"]["size"] == 8
+    assert clusters[f"cluster:{hashes['hub_b']}"]["size"] == 4
+    assert clusters["cluster:rest"]["size"] == 2
+    assert {(e["source"], e["weight"]) for e in view["cluster_edges"]} == {
+        (hashes["hub_a"], 8), (hashes["hub_b"], 4)
+    }
+    assert view["meta"]["total_nodes"] == 16
+    assert view["meta"]["hidden_nodes"] == 14
+    assert view["meta"]["rank_by"] == "degree"
+
+
+@pytest.mark.asyncio
+async def test_graph_view_centrality_falls_back_to_degree(star_graph):
+    storage, hashes = star_graph
+
+    view = await storage.get_graph_view(node_budget=1, rank_by="centrality")
+    assert view["meta"]["rank_by"] == "degree"
+
+    graph = GraphStorage(storage.db_path)
+    await graph.refresh_centrality()
+    await graph.close()
+
+    view = await storage.get_graph_view(node_budget=1, rank_by="centrality")
+    assert view["meta"]["rank_by"] == "centrality"
+    assert view["nodes"][0]["id"] == hashes["hub_a"]
+
+    with pytest.raises(ValueError):
+        await storage.get_graph_view(rank_by="pagerank")
+
+
+@pytest.mark.asyncio
+async def test_expand_graph_node_pages_by_similarity(star_graph):
+    storage, hashes = star_graph
+
+    first = await storage.expand_graph_node(hashes["hub_a"], limit=4)
+    assert first["total"] == 9
+    assert first["has_more"] is True
+    # hub_b (0.9) first, then the leaves from strongest to weakest
+    assert [node["id"] for node in first["nodes"]] == [
+        hashes["hub_b"], hashes["a7"], hashes["a6"], hashes["a5"]
+    ]
+    assert first["nodes"][0]["connections"] == 10
+    assert all(hashes["hub_a"] in (e["source"], e["target"]) for e in first["edges"])
+    assert len(first["edges"]) == 8
+
+    last = await storage.expand_graph_node(hashes["hub_a"], limit=4, offset=8)
+    assert [node["id"] for node in last["nodes"]] == [hashes["a0"]]
+    assert last["has_more"] is False
+
+    beyond = await storage.expand_graph_node(hashes["hub_a"], limit=4, offset=20)
+    assert beyond["nodes"] == [] and beyond["total"] == 9
+
+
+@pytest.mark.asyncio
+async def test_graph_view_skips_soft_deleted_neighbors(star_graph):
+    storage, hashes = star_graph
+    # Tombstones whose graph edges are still stored
+    storage.conn.executemany(
+        "UPDATE memories SET deleted_at = 1.0 WHERE content_hash = ?",
+        [(hashes["a7"],), (hashes["b0"],), (hashes["x"],)],
+    )
+    storage.conn.commit()
+
+    view = await storage.get_graph_view(node_budget=2)
+
+    clusters = {cluster["id"]: cluster for cluster in view["clusters"]}
+    assert clusters[f"cluster:{hashes['hub_a']}"]["size"] == 7
+    assert clusters[f"cluster:{hashes['hub_b']}"]["size"] == 3
+    assert clusters["cluster:rest"]["size"] == 1
+    assert view["meta"]["total_nodes"] == 13
+    assert view["meta"]["total_edges"] == 2 * 11
+
+    # Only the hubs have 3+ connections, so their leaves are not counted in any cluster
+    hubs_only = await storage.get_graph_view(node_budget=2, min_connections=3)
+    assert hubs_only["meta"]["total_nodes"] == 2
+    assert hubs_only["clusters"] == []
+
+    page = await storage.expand_graph_node(hashes["hub_a"], limit=4)
+    assert page["total"] == 8
+    assert hashes["a7"] not in [node["id"] for node in page["nodes"]]
+    beyond = await storage.expand_graph_node(hashes["hub_a"], limit=4, offset=20)
+    assert beyond["total"] == 8
+
+
+@pytest.mark.asyncio
+async def test_subgraph_is_not_truncated_at_parameter_limit(temp_graph_db):
+    graph = GraphStorage(temp_graph_db)
+    try:
+        await graph.store_associations_bulk([
+            {"source_hash": "center", "target_hash": f"leaf{i}", "similarity": 0.5, "connection_types": ["semantic"]}
+            for i in range(600)
+        ])
+        subgraph = await graph.get_subgraph("center", radius=1)
+        assert len(subgraph["nodes"]) == 601
+        assert len(subgraph["edges"]) == 600
+    finally:
+        await graph.close()
@@ -0,0 +1,172 @@
+"""
+Tests for the checkpointed Cloudflare -> SQLite pull in hybrid storage.
+
+Covers:
+- Pulled memories are inserted with store_batch (no per-memory store())
+- Vectorize embeddings are reused when the embedding models match
+- An interrupted pull resumes from the cursor checkpointed in the metadata table
+- SSE progress events carry throughput and ETA
+"""
+
+import os
+import struct
+import tempfile
+from typing import List, Optional
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import pytest_asyncio
+
+from mcp_memory_service.models.memory import Memory
+from mcp_memory_service.storage.hybrid import PULL_CHECKPOINT_KEY, HybridMemoryStorage
+from mcp_memory_service.utils.hashing import generate_content_hash
+
+
+class FakeCloudflare:
+    """Cursor-paginated stand-in for CloudflareStorage."""
+
+    def __init__(self, memories: List[Memory], embedding_model: str, dimension: int,
+                 fail_on_call: Optional[int] = None):
+        self.memories = sorted(memories, key=lambda m: m.created_at, reverse=True)
+        self.embedding_model = embedding_model
+        self.dimension = dimension
+        self.fail_on_call = fail_on_call
+        self.cursor_calls = []
+        self.vector_requests = 0
+
+    async def get_stats(self):
+        return {'total_memories': len(self.memories)}
+
+    async def get_all_memories_cursor(self, limit=None, cursor=None):
+        self.cursor_calls.append(cursor)
+        if self.fail_on_call is not None and len(self.cursor_calls) == self.fail_on_call:
+            self.fail_on_call = None
+            raise RuntimeError("connection reset")
+        page = [m for m in self.memories if cursor is None or m.created_at < cursor]
+        return page[:limit]
+
+    async def get_vectors_by_ids(self, vector_ids):
+        self.vector_requests += 1
+        return {vid: self.vector_for(vid) for vid in vector_ids}
+
+    def vector_for(self, content_hash: str) -> List[float]:
+        seed = int(content_hash[:6], 16)
+        return [((seed + i) % 97) / 97.0 for i in range(self.dimension)]
+
+
+def _memories(count: int) -> List[Memory]:
+    memories = []
+    for i in range(count):
+        content = f"cloud memory number {i}"
+        memories.append(Memory(
+            content=content,
+            content_hash=generate_content_hash(content),
+            tags=["cloud"],
+            created_at=1_700_000_000.0 + i,
+        ))
+    return memories
+
+
+@pytest_asyncio.fixture
+async def hybrid():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage = HybridMemoryStorage(sqlite_db_path=os.path.join(tmpdir, "pull.db"))
+        await storage.primary.initialize()
+        storage.batch_size = 4  # 20-memory pages
+        storage.primary.store = AsyncMock(side_effect=AssertionError("pull must use store_batch"))
+        yield storage
+        await storage.primary.close()
+
+
+def _stored_embedding(primary, content_hash: str) -> List[float]:
+    row = primary.conn.execute(
+        "SELECT e.content_embedding FROM memories m JOIN memory_embeddings e ON e.rowid = m.id "
+        "WHERE m.content_hash = ?", (content_hash,)
+    ).fetchone()
+    blob = row[0]
+    return list(struct.unpack(f"{len(blob) // 4}f", blob))
+
+
+class TestResumablePull:
+
+    @pytest.mark.asyncio
+    async def test_pull_batches_and_reuses_matching_embeddings(self, hybrid):
+        memories = _memories(50)
+        fake = FakeCloudflare(memories, "@cf/" + hybrid.primary.embedding_model_name,
+                              hybrid.primary.embedding_dimension)
+        hybrid.secondary = fake
+
+        result = await hybrid._sync_memories_from_cloudflare(sync_type="initial", broadcast_sse=False)
+
+        assert result['memories_synced'] == 50
+        assert len(await hybrid.primary.get_all_content_hashes()) == 50
+        assert fake.vector_requests == 3  # one per page
+        target = memories[7].content_hash
+        assert _stored_embedding(hybrid.primary, target) == pytest.approx(fake.vector_for(target), abs=1e-6)
+        # Completed pulls leave no checkpoint behind
+        assert await hybrid.primary.get_metadata_value(PULL_CHECKPOINT_KEY) is None
+
+    @pytest.mark.asyncio
+    async def test_mismatched_models_embed_locally(self, hybrid):
+        memories = _memories(10)
+        fake = FakeCloudflare(memories, "@cf/baai/bge-base-en-v1.5", 768)
+        hybrid.secondary = fake
+
+        result = await hybrid._sync_memories_from_cloudflare(sync_type="manual", broadcast_sse=False)
+
+        assert result['memories_synced'] == 10
+        assert fake.vector_requests == 0
+
+    @pytest.mark.asyncio
+    async def test_interrupted_pull_resumes_from_checkpoint(self, hybrid):
+        memories = _memories(60)
+        fake = FakeCloudflare(memories, "other-model", 8, fail_on_call=3)
+        hybrid.secondary = fake
+
+        first = await hybrid._sync_memories_from_cloudflare(sync_type="initial", broadcast_sse=False)
+        assert first['memories_synced'] == 40
+        checkpoint = await hybrid._load_pull_checkpoint()
+        assert checkpoint['cursor'] == fake.memories[39].created_at
+        assert checkpoint['processed'] == 40
+
+        fake.cursor_calls.clear()
+        second = await hybrid._sync_memories_from_cloudflare(sync_type="initial", broadcast_sse=False)
+
+        # The restart continues at the checkpointed cursor instead of the newest page
+        assert fake.cursor_calls[0] == checkpoint['cursor']
+        assert second['memories_synced'] == 20
+        assert len(await hybrid.primary.get_all_content_hashes()) == 60
+        assert await hybrid._load_pull_checkpoint() is None
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_of_another_sync_type_is_discarded(self, hybrid):
+        memories = _memories(60)
+        fake = FakeCloudflare(memories, "other-model", 8, fail_on_call=3)
+        hybrid.secondary = fake
+
+        await hybrid._sync_memories_from_cloudflare(sync_type="initial", broadcast_sse=False)
+        assert (await hybrid._load_pull_checkpoint())['sync_type'] == "initial"
+
+        fake.cursor_calls.clear()
+        result = await hybrid._sync_memories_from_cloudflare(sync_type="manual", broadcast_sse=False)
+
+        # The manual pull starts from the newest page, not the initial sync's cursor
+        assert fake.cursor_calls[0] is None
+        assert result['memories_synced'] == 20
+        assert await hybrid._load_pull_checkpoint() is None
+
+    @pytest.mark.asyncio
+    async def test_progress_events_include_throughput_and_eta(self, hybrid):
+        hybrid.secondary = FakeCloudflare(_memories(45), "other-model", 8)
+        events = []
+
+        async def capture(event):
+            events.append(event)
+
+        with patch("mcp_memory_service.storage.hybrid.sse_manager.broadcast_event", side_effect=capture):
+            await hybrid._sync_memories_from_cloudflare(sync_type="initial", broadcast_sse=True)
+
+        progress = [e.data for e in events if e.event_type == "sync_progress"]
+        assert [p['synced_count'] for p in progress] == [20, 40, 45]
+        assert all(p['memories_per_second'] > 0 for p in progress)
+        assert progress[-1]['eta_seconds'] == 0
@@ -207,6 +207,74 @@ async def test_store_batch(storage):
     assert all((not ok) and "duplicate" in msg.lower() for ok, msg in second)
 
 
+@pytest.mark.asyncio
+async def test_store_batch_rejects_duplicates_within_batch(storage):
+    content = "Batch memory repeated inside one call"
+    memory = Memory(content=content, content_hash=generate_content_hash(content))
+
+    results = await storage.store_batch([memory, memory])
+
+    assert results[0][0] is True
+    assert results[1][0] is False and "duplicate" in results[1][1].lower()
+    assert await storage.count_all_memories() == 1
+
+
+class _BatchRecordingClient:
+    """Fake client recording the RPCs store_batch issues."""
+
+    def __init__(self, existing=(), fail_insert_call=None):
+        self.existing = set(existing)
+        self.fail_insert_call = fail_insert_call
+        self.queries = []
+        self.inserts = []
+
+    def query(self, **kwargs):
+        self.queries.append(kwargs)
+        return [{"id": h} for h in self.existing if f'"{h}"' in kwargs["filter"]]
+
+    def insert(self, **kwargs):
+        self.inserts.append(kwargs["data"])
+        if len(self.inserts) == self.fail_insert_call:
+            raise RuntimeError("insert rejected")
+        return {"insert_count": len(kwargs["data"])}
+
+
+class _CountingModel:
+    def __init__(self, dim):
+        self.dim = dim
+        self.calls = []
+
+    def encode(self, texts, convert_to_numpy=True):
+        self.calls.append(list(texts))
+        return [[float(len(t) % 7 + 1)] * self.dim for t in texts]
+
+
+@pytest.mark.asyncio
+async def test_store_batch_issues_one_dedup_query_and_one_encode():
+    """Regression: store_batch used to issue one get_by_hash RPC and one
+    single-text encode per memory."""
+    storage = MilvusMemoryStorage(uri="http://fake-remote:19530", collection_name="batch_rpc")
+    memories = [
+        Memory(content=f"vectorized batch item {i}", content_hash=generate_content_hash(f"vectorized batch item {i}"))
+        for i in range(7)
+    ]
+    storage.client = _BatchRecordingClient(existing={memories[2].content_hash}, fail_insert_call=2)
+    storage.embedding_model = _CountingModel(storage.embedding_dimension)
+    storage._initialized = True
+    storage._INSERT_CHUNK_ROWS = 3
+
+    results = await storage.store_batch(memories)
+
+    assert len(storage.client.queries) == 1
+    assert len(storage.embedding_model.calls) == 1
+    assert len(storage.embedding_model.calls[0]) == 6
+    assert [len(chunk) for chunk in storage.client.inserts] == [3, 3]
+    # Item 2 already exists; the second insert chunk (items 4-6) failed alone.
+    assert [ok for ok, _ in results] == [True, True, False, True, False, False, False]
+    assert "duplicate" in results[2][1].lower()
+    assert "insert rejected" in results[4][1]
+
+
 # -- Tag search -------------------------------------------------------------
 
 
@@ -463,6 +531,30 @@ async def test_get_memory_connections_with_graph_data(storage):
     client.drop_collection(collection_name=graph_collection)
 
 
+@pytest.mark.asyncio
+async def test_get_memory_connections_reads_degree_collection(storage, milvus_db_path):
+    """With a degree side-collection, candidate hashes are looked up directly."""
+    from src.mcp_memory_service.storage.milvus_graph import MilvusGraphStorage
+
+    graph = MilvusGraphStorage(uri=str(milvus_db_path), collection_name=storage.collection_name)
+    await graph.initialize()
+    try:
+        await graph.store_association("aaaa1111", "bbbb2222", 0.8, ["semantic"], relationship_type="related")
+        await graph.store_association("aaaa1111", "cccc3333", 0.7, ["semantic"], relationship_type="causes")
+
+        # Fail loudly if the full-edge drain is used
+        storage._drain_graph_edges = None
+
+        assert await storage.get_memory_connections(["aaaa1111", "cccc3333", "dddd4444"]) == {
+            "aaaa1111": 3, "cccc3333": 1,
+        }
+        assert await storage.get_memory_connections() == {"aaaa1111": 3, "bbbb2222": 2, "cccc3333": 1}
+    finally:
+        for name in (graph.collection_name, graph.degree_collection_name):
+            storage.client.drop_collection(collection_name=name)
+        await graph.close()
+
+
 # -- Access tracking ---------------------------------------------------------
 
 
@@ -0,0 +1,149 @@
+"""Tests for the MilvusMemoryStorage reader/writer split.
+
+Remote backends route read-only RPCs through a pool of clients that never
+touch the write lock; Milvus Lite keeps serializing everything on it. These
+tests use fake clients so no Milvus server or embedding model is needed.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+pymilvus = pytest.importorskip("pymilvus")
+
+from src.mcp_memory_service.storage.milvus import MilvusMemoryStorage  # noqa: E402
+
+
+class _FakeReadClient:
+    """Records concurrent ``query`` calls and serves a tiny query iterator."""
+
+    def __init__(self, tracker=None, delay: float = 0.0):
+        self.tracker = tracker
+        self.delay = delay
+        self.closed = False
+        self.calls = 0
+
+    def query(self, **kwargs):
+        self.calls += 1
+        if self.tracker is not None:
+            self.tracker.enter()
+        try:
+            time.sleep(self.delay)
+        finally:
+            if self.tracker is not None:
+                self.tracker.leave()
+        return [{"count(*)": 3}]
+
+    def query_iterator(self, **kwargs):
+        return _FakeIterator([[{"id": "a"}, {"id": "b"}], []])
+
+    def close(self):
+        self.closed = True
+
+
+class _FakeIterator:
+    def __init__(self, batches):
+        self._batches = list(batches)
+
+    def next(self):
+        return self._batches.pop(0)
+
+    def close(self):
+        pass
+
+
+class _ConcurrencyTracker:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+    def enter(self):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+
+    def leave(self):
+        with self._lock:
+            self.active -= 1
+
+
+def _remote_storage(pool):
+    storage = MilvusMemoryStorage(uri="http://fake-remote:19530", collection_name="pool_test",
+                                  read_pool_size=len(pool))
+    storage.client = _FakeReadClient()
+    storage._initialized = True
+    storage._read_clients = list(pool)
+    storage._read_pool = asyncio.Queue()
+    for client in pool:
+        storage._read_pool.put_nowait(client)
+    return storage
+
+
+def test_read_pool_size_defaults_from_env(monkeypatch):
+    monkeypatch.setenv("MCP_MILVUS_READ_POOL_SIZE", "6")
+    storage = MilvusMemoryStorage(uri="http://fake-remote:19530", collection_name="irrelevant")
+    assert storage.read_pool_size == 6
+    assert MilvusMemoryStorage(uri="http://fake-remote:19530", read_pool_size=0).read_pool_size == 1
+
+
+@pytest.mark.asyncio
+async def test_remote_reads_do_not_wait_for_write_lock():
+    reader = _FakeReadClient()
+    storage = _remote_storage([reader])
+
+    async with storage._write_lock:  # simulate an in-flight insert
+        rows = await asyncio.wait_for(storage._call_reader("query", collection_name="x"), timeout=1)
+
+    assert rows == [{"count(*)": 3}]
+    assert reader.calls == 1
+    assert storage.client.calls == 0, "reads must not use the write client on remote backends"
+
+
+@pytest.mark.asyncio
+async def test_lite_reads_still_serialize_on_write_lock(tmp_path):
+    storage = MilvusMemoryStorage(uri=str(tmp_path / "lite.db"), collection_name="lite_test")
+    assert storage._is_lite and storage._read_pool is None
+    storage.client = _FakeReadClient()
+    storage._initialized = True
+
+    async with storage._write_lock:
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(storage._call_reader("query", collection_name="x"), timeout=0.2)
+
+    assert await storage._call_reader("query", collection_name="x") == [{"count(*)": 3}]
+
+
+@pytest.mark.asyncio
+async def test_pool_size_bounds_concurrent_reads():
+    tracker = _ConcurrencyTracker()
+    storage = _remote_storage([_FakeReadClient(tracker, delay=0.05) for _ in range(2)])
+
+    await asyncio.gather(*(storage._call_reader("query", collection_name="x") for _ in range(6)))
+
+    assert tracker.peak == 2
+    assert storage._read_pool.qsize() == 2, "every client must be returned to the pool"
+
+
+@pytest.mark.asyncio
+async def test_iterator_drains_use_pooled_client():
+    storage = _remote_storage([_FakeReadClient()])
+    storage.client = None  # the write client must not be needed for a drain
+
+    async with storage._write_lock:
+        rows = await asyncio.wait_for(storage._iterate_all_rows(""), timeout=1)
+
+    assert [r["id"] for r in rows] == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_close_releases_read_clients():
+    pool = [_FakeReadClient(), _FakeReadClient()]
+    storage = _remote_storage(pool)
+
+    await storage.close()
+
+    assert all(client.closed for client in pool)
+    assert storage._read_pool is None and storage._read_clients == []
@@ -0,0 +1,174 @@
+"""
+Tests for hash-range digest reconciliation (hybrid anti-entropy sync).
+
+Covers:
+- Identical corpora reconcile with one digest query per side
+- Missing, extra and drifted hashes are found by descending only into differing buckets
+- Soft-deleted rows are ignored
+- BackgroundSyncService drift detection pulls only the differing memories
+- Cloudflare digest rows are parsed from D1 responses
+"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+from unittest.mock import Mock
+
+import pytest
+import pytest_asyncio
+
+from mcp_memory_service.models.memory import Memory
+from mcp_memory_service.storage.cloudflare import CloudflareStorage
+from mcp_memory_service.storage.hybrid import BackgroundSyncService
+from mcp_memory_service.storage.sqlite_vec import SqliteVecMemoryStorage
+from mcp_memory_service.storage.sync_digest import (
+    DIGEST_ROOT_PREFIX_LEN,
+    build_bucket_digest_query,
+    reconcile_digests,
+)
+
+
+def _hash(i: int) -> str:
+    return hashlib.sha256(f"memory-{i}".encode()).hexdigest()
+
+
+def _insert_rows(storage, rows):
+    """Insert (content_hash, updated_at) rows directly into the memories table."""
+    storage.conn.executemany(
+        "INSERT INTO memories (content_hash, content, created_at, updated_at) VALUES (?, ?, ?, ?)",
+        [(h, f"content {h[:8]}", ts, ts) for h, ts in rows],
+    )
+    storage.conn.commit()
+
+
+@pytest_asyncio.fixture
+async def storage_pair():
+    temp_dir = tempfile.mkdtemp()
+    primary = SqliteVecMemoryStorage(os.path.join(temp_dir, "primary.db"))
+    secondary = SqliteVecMemoryStorage(os.path.join(temp_dir, "secondary.db"))
+    await primary.initialize()
+    await secondary.initialize()
+    try:
+        yield primary, secondary
+    finally:
+        await primary.close()
+        await secondary.close()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+class TestReconcileDigests:
+
+    @pytest.mark.asyncio
+    async def test_identical_corpora_use_one_query_per_side(self, storage_pair):
+        primary, secondary = storage_pair
+        rows = [(_hash(i), 1_700_000_000.0 + i) for i in range(2000)]
+        _insert_rows(primary, rows)
+        _insert_rows(secondary, rows)
+
+        diff = await reconcile_digests(primary, secondary, leaf_size=32)
+
+        assert diff.in_sync
+        assert diff.round_trips == 2
+        assert diff.buckets_compared == 16 ** DIGEST_ROOT_PREFIX_LEN
+
+    @pytest.mark.asyncio
+    async def test_finds_missing_and_drifted_hashes(self, storage_pair):
+        primary, secondary = storage_pair
+        rows = [(_hash(i), 1_700_000_000.0 + i) for i in range(3000)]
+        _insert_rows(primary, rows[:-1])          # last row only on secondary
+        _insert_rows(secondary, rows[1:])         # first row only on primary
+        primary.conn.execute("UPDATE memories SET updated_at = updated_at + 60 WHERE content_hash = ?", (rows[10][0],))
+        secondary.conn.execute("UPDATE memories SET updated_at = updated_at + 60 WHERE content_hash = ?", (rows[20][0],))
+        # Sub-second differences are within tolerance and must not be reported
+        secondary.conn.execute("UPDATE memories SET updated_at = updated_at + 0.4 WHERE content_hash = ?", (rows[30][0],))
+        primary.conn.commit()
+        secondary.conn.commit()
+
+        diff = await reconcile_digests(primary, secondary, leaf_size=4)
+
+        assert diff.missing_local == [rows[-1][0]]
+        assert diff.missing_remote == [rows[0][0]]
+        assert diff.newer_local == [rows[10][0]]
+        assert diff.newer_remote == [rows[20][0]]
+        # Only differing buckets are refined: far fewer round trips than rows
+        assert diff.round_trips < 20
+        assert diff.buckets_compared < 400
+
+    @pytest.mark.asyncio
+    async def test_soft_deleted_rows_are_ignored(self, storage_pair):
+        primary, secondary = storage_pair
+        rows = [(_hash(i), 1_700_000_000.0) for i in range(50)]
+        _insert_rows(primary, rows)
+        _insert_rows(secondary, rows)
+        primary.conn.execute("UPDATE memories SET deleted_at = 1 WHERE content_hash = ?", (rows[5][0],))
+        primary.conn.commit()
+
+        diff = await reconcile_digests(primary, secondary)
+
+        assert diff.missing_local == [rows[5][0]]
+        assert not diff.missing_remote
+
+
+class TestDigestDriftDetection:
+
+    @pytest.mark.asyncio
+    async def test_drift_check_pulls_only_differing_memories(self, storage_pair):
+        primary, secondary = storage_pair
+        shared = [
+            Memory(content=f"shared memory {i}", content_hash=_hash(i), tags=["t"], updated_at=1_700_000_000.0)
+            for i in range(5)
+        ]
+        for memory in shared:
+            await primary.store(memory, skip_semantic_dedup=True)
+            await secondary.store(memory, skip_semantic_dedup=True)
+        remote_only = Memory(content="only in the cloud", content_hash=_hash(99), tags=["cloud"])
+        await secondary.store(remote_only, skip_semantic_dedup=True)
+
+        fetched = []
+        original_get_by_hash = secondary.get_by_hash
+
+        async def tracking_get_by_hash(content_hash):
+            fetched.append(content_hash)
+            return await original_get_by_hash(content_hash)
+
+        secondary.get_by_hash = tracking_get_by_hash
+
+        service = BackgroundSyncService(primary, secondary, sync_interval=60, batch_size=10)
+        service.drift_check_enabled = True
+        service.drift_check_interval = 3600
+        stats = await service._detect_and_sync_drift()
+
+        assert fetched == [remote_only.content_hash]
+        assert stats['synced'] == 1
+        assert await primary.get_by_hash(remote_only.content_hash) is not None
+        assert service.sync_stats['last_digest_round_trips'] > 0
+
+
+class TestCloudflareDigestQueries:
+
+    @pytest.mark.asyncio
+    async def test_bucket_digests_parse_d1_rows(self):
+        storage = CloudflareStorage(
+            api_token="t", account_id="a", vectorize_index="v", d1_database_id="d"
+        )
+        captured = {}
+
+        async def fake_request(method, url, **kwargs):
+            captured.update(kwargs["json"])
+            response = Mock()
+            response.json = Mock(return_value={
+                "success": True,
+                "result": [{"results": [
+                    {"bucket": "ab0", "n": 3, "hash_sum": 123, "time_sum": 456},
+                ]}],
+            })
+            return response
+
+        storage._retry_request = fake_request
+        digests = await storage.get_hash_bucket_digests(3, ["ab"])
+
+        assert digests == {"ab0": (3, 123, 456)}
+        expected_sql, expected_params = build_bucket_digest_query(3, ["ab"])
+        assert captured["sql"] == expected_sql
+        assert captured["params"] == expected_params == ["ab", "ab~"]
@@ -3,6 +3,7 @@ Tests for batched ONNX inference in the consolidation pipeline.
 
 Covers:
 - ONNXRankerModel.score_quality_batch() — classifier and cross-encoder
+- Length-bucketed dynamic padding and ONNX session settings
 - QualityEvaluator.evaluate_quality_batch() — single model and fallback
 - AsyncQualityScorer batched worker dequeue
 - SqliteVecMemoryStorage.store_batch() — batched embedding + transaction
@@ -21,10 +22,10 @@ import numpy as np
 import pytest
 
 from mcp_memory_service.models.memory import Memory
-from mcp_memory_service.quality.onnx_ranker import get_onnx_ranker_model
+from mcp_memory_service.quality.onnx_ranker import ONNXRankerModel, get_onnx_ranker_model
 from mcp_memory_service.quality.ai_evaluator import QualityEvaluator
 from mcp_memory_service.quality.async_scorer import AsyncQualityScorer
-from mcp_memory_service.quality.config import QualityConfig
+from mcp_memory_service.quality.config import SUPPORTED_MODELS, QualityConfig
 
 # Check if ONNX models are available for integration tests
 DEBERTA_AVAILABLE = Path.home().joinpath(
@@ -127,6 +128,118 @@ class TestScoreQualityBatchMSMarco:
             assert 0.0 <= s <= 1.0
 
 
+class _RecordingSession:
+    """ONNX session double: logit grows with sequence length, records each input shape."""
+
+    def __init__(self, fail_above: int = None):
+        self.shapes = []
+        self.fail_above = fail_above
+
+    def get_providers(self):
+        return ["CPUExecutionProvider"]
+
+    def run(self, _, inputs):
+        assert set(inputs) == {"input_ids", "attention_mask", "token_type_ids"}
+        self.shapes.append(inputs["input_ids"].shape)
+        if self.fail_above and len(inputs["input_ids"]) > self.fail_above:
+            raise RuntimeError("simulated ONNX failure")
+        lengths = inputs["attention_mask"].sum(axis=1)
+        return [(lengths * 0.1 - 2.0)[:, None]]
+
+
+def _word_level_ranker(max_length: int = 64, session=None) -> ONNXRankerModel:
+    """Cross-encoder ranker over a word-level tokenizer, without ONNX Runtime or model files."""
+    from tokenizers import Tokenizer, models, pre_tokenizers, processors
+
+    vocab = {"[PAD]": 0, "[UNK]": 1, "[CLS]": 2, "[SEP]": 3, "query": 4, "word": 5}
+    tokenizer = Tokenizer(models.WordLevel(vocab, unk_token="[UNK]"))
+    tokenizer.pre_tokenizer = pre_tokenizers.Whitespace()
+    tokenizer.post_processor = processors.TemplateProcessing(
+        single="[CLS] $A [SEP]",
+        pair="[CLS] $A [SEP] $B:1 [SEP]:1",
+        special_tokens=[("[CLS]", 2), ("[SEP]", 3)],
+    )
+    tokenizer.enable_truncation(max_length=max_length)
+    tokenizer.no_padding()
+
+    ranker = ONNXRankerModel.__new__(ONNXRankerModel)
+    ranker.model_name = "ms-marco-MiniLM-L-6-v2"
+    ranker.model_config = SUPPORTED_MODELS["ms-marco-MiniLM-L-6-v2"]
+    ranker._config = QualityConfig(onnx_max_length=max_length)
+    ranker.max_length = max_length
+    ranker._tokenizer = tokenizer
+    ranker._use_fast_tokenizer = True
+    ranker._model = session or _RecordingSession()
+    return ranker
+
+
+class TestLengthBucketedBatching:
+    """Dynamic padding: buckets sorted by token count, scores in input order."""
+
+    def test_buckets_padded_to_own_length_in_input_order(self):
+        ranker = _word_level_ranker()
+        word_counts = [30, 2, 12, 5, 40, 1]
+        pairs = [("query", " ".join(["word"] * n)) for n in word_counts]
+
+        scores = ranker.score_quality_batch(pairs, max_batch_size=2)
+
+        # [CLS] query [SEP] words [SEP]
+        lengths = np.array(word_counts) + 4
+        expected = 1.0 / (1.0 + np.exp(-(lengths * 0.1 - 2.0)))
+        np.testing.assert_allclose(scores, expected)
+        widths = [shape[1] for shape in ranker._model.shapes]
+        assert widths == sorted(lengths)[1::2]
+        assert all(shape[0] == 2 for shape in ranker._model.shapes)
+
+    def test_single_item_matches_batch(self):
+        ranker = _word_level_ranker()
+        pairs = [("query", "word " * n) for n in (3, 9, 27)]
+        batch = ranker.score_quality_batch(pairs)
+        assert batch == pytest.approx([ranker.score_quality(q, c) for q, c in pairs])
+        assert ranker.score_quality("", "word") == 0.0
+        assert ranker.score_quality("query", "") == 0.0
+
+    def test_long_memory_is_clipped_and_truncated(self):
+        ranker = _word_level_ranker(max_length=32)
+        content = "word " * 10_000
+        clipped = ranker._clip(content)
+        assert len(clipped) <= 32 * ranker.CHARS_PER_TOKEN
+        assert not clipped.endswith("wo")
+
+        (ids, type_ids), = ranker._encode([("query", content)])
+        assert len(ids) == 32
+        assert type_ids[:3] == [0, 0, 0] and type_ids[-1] == 1
+
+    def test_failed_bucket_falls_back_to_sequential(self):
+        ranker = _word_level_ranker(session=_RecordingSession(fail_above=1))
+        pairs = [("query", "word " * n) for n in (8, 1, 4)]
+        scores = ranker.score_quality_batch(pairs, max_batch_size=3)
+        lengths = np.array([8, 1, 4]) + 4
+        np.testing.assert_allclose(scores, 1.0 / (1.0 + np.exp(-(lengths * 0.1 - 2.0))))
+
+
+class TestOnnxSessionConfig:
+    """ONNX session settings in QualityConfig."""
+
+    def test_from_env(self, monkeypatch):
+        monkeypatch.setenv("MCP_QUALITY_ONNX_INTRA_OP_THREADS", "4")
+        monkeypatch.setenv("MCP_QUALITY_ONNX_GRAPH_OPTIMIZATION", "Extended")
+        monkeypatch.setenv("MCP_QUALITY_ONNX_CPU_MEM_ARENA", "false")
+        monkeypatch.setenv("MCP_QUALITY_ONNX_MAX_LENGTH", "256")
+        config = QualityConfig.from_env()
+        assert (config.onnx_intra_op_threads, config.onnx_graph_optimization) == (4, "extended")
+        assert config.onnx_cpu_mem_arena is False and config.onnx_max_length == 256
+
+    @pytest.mark.parametrize("field, value", [
+        ("onnx_intra_op_threads", -1),
+        ("onnx_graph_optimization", "aggressive"),
+        ("onnx_max_length", 1024),
+    ])
+    def test_validate_rejects(self, field, value):
+        with pytest.raises(ValueError):
+            QualityConfig(**{field: value}).validate()
+
+
 # ---------------------------------------------------------------------------
 # QualityEvaluator.evaluate_quality_batch()
 # ---------------------------------------------------------------------------
@@ -86,6 +86,10 @@ def mock_graph_storage():
         ("hash_a", 1),
         ("hash_b", 2),
     ])
+    storage.neighbors_many = AsyncMock(return_value={
+        "hash_1": ["hash_a", "hash_b"],
+        "hash_2": [],
+    })
     storage.shortest_path = AsyncMock(return_value=["hash_1", "hash_mid", "hash_2"])
     storage.get_subgraph = AsyncMock(return_value={
         "nodes": ["hash_1", "hash_2", "hash_3"],
@@ -174,6 +178,42 @@ class TestFindConnectedUnavailable:
         assert result["count"] == 0
 
 
+# ---------------------------------------------------------------------------
+# get_neighbors
+# ---------------------------------------------------------------------------
+
+class TestGetNeighbors:
+    @pytest.mark.asyncio
+    async def test_returns_grouped_neighbors(self, graph_service, mock_graph_storage):
+        result = await graph_service.get_neighbors(
+            ["hash_1", "hash_2"], relationship_types=["causes"], direction="incoming"
+        )
+
+        assert result["success"] is True
+        assert result["neighbors"] == {"hash_1": ["hash_a", "hash_b"], "hash_2": []}
+        assert result["count"] == 2
+        mock_graph_storage.neighbors_many.assert_awaited_once_with(
+            ["hash_1", "hash_2"], relationship_types=["causes"], direction="incoming"
+        )
+
+    @pytest.mark.asyncio
+    async def test_error_handling(self, graph_service, mock_graph_storage):
+        mock_graph_storage.neighbors_many.side_effect = RuntimeError("DB error")
+        result = await graph_service.get_neighbors(["hash_1"])
+
+        assert result["success"] is False
+        assert "DB error" in result["error"]
+        assert result["neighbors"] == {}
+
+    @pytest.mark.asyncio
+    async def test_returns_error_when_unavailable(self, unavailable_graph_service):
+        result = await unavailable_graph_service.get_neighbors(["any_hash"])
+
+        assert result["success"] is False
+        assert "not available" in result["error"]
+        assert result["count"] == 0
+
+
 # ---------------------------------------------------------------------------
 # find_shortest_path — normal path
 # ---------------------------------------------------------------------------
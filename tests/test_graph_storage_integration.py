@@ -131,3 +131,48 @@ class TestBackwardCompatibility:
         # Call find_connected without new parameters
         connected = await graph_storage.find_connected("hash1", max_hops=2)
         assert len(connected) >= 0  # Should not error
+
+
+class TestStoreAssociationsBulk:
+    """Tests for bulk association writes"""
+
+    @pytest.mark.asyncio
+    async def test_bulk_matches_sequential_writes(self, graph_storage):
+        """Bulk writes store the same rows as store_association calls"""
+        edges = [
+            {"source_hash": "a", "target_hash": "b", "similarity": 0.8,
+             "connection_types": ["semantic"], "relationship_type": "related"},
+            {"source_hash": "a", "target_hash": "c", "similarity": 0.7,
+             "connection_types": ["causal"], "relationship_type": "causes",
+             "metadata": {"discovery_method": "test"}, "created_at": 100.0},
+            {"source_hash": "d", "target_hash": "d", "similarity": 0.5,
+             "connection_types": ["semantic"]},
+            {"source_hash": "a", "target_hash": "e", "similarity": 0.5,
+             "connection_types": ["semantic"], "relationship_type": "not_a_type"},
+        ]
+        result = await graph_storage.store_associations_bulk(edges)
+        assert result == {"inserted": 3, "updated": 0, "skipped": 2, "failed": 0}
+
+        assert await graph_storage.get_relationship_types("b") == {"related": 1}
+        causes = await graph_storage.get_association("a", "c")
+        assert causes["metadata"] == {"discovery_method": "test"}
+        assert causes["created_at"] == 100.0
+        assert await graph_storage.get_association_count("c") == 0
+
+        # Re-storing updates in place; a new symmetric pair adds two rows
+        result = await graph_storage.store_associations_bulk([
+            {"source_hash": "a", "target_hash": "b", "similarity": 0.9, "connection_types": ["semantic"]},
+            {"source_hash": "c", "target_hash": "e", "similarity": 0.6,
+             "connection_types": ["semantic"], "relationship_type": "contradicts"},
+        ])
+        assert result == {"inserted": 2, "updated": 2, "skipped": 0, "failed": 0}
+        assert (await graph_storage.get_association("b", "a"))["similarity"] == 0.9
+        assert await graph_storage.get_relationship_types("e") == {"contradicts": 1}
+
+    @pytest.mark.asyncio
+    async def test_bulk_with_nothing_to_store(self, graph_storage):
+        """Empty or fully invalid input does not touch the database"""
+        assert await graph_storage.store_associations_bulk([]) == {
+            "inserted": 0, "updated": 0, "skipped": 0, "failed": 0
+        }
+        assert "store_associations_bulk" not in graph_storage.get_query_stats()
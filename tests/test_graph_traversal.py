@@ -196,6 +196,25 @@ async def test_find_connected_memories_no_connections(memory_server):
     assert len(response["connected"]) == 0
 
 
+@pytest.mark.asyncio
+async def test_memory_graph_neighbors(memory_server, setup_graph_data):
+    """Test the batched 'neighbors' action of memory_graph."""
+    if STORAGE_BACKEND not in ['sqlite_vec', 'hybrid']:
+        pytest.skip(f"Graph operations not supported for backend: {STORAGE_BACKEND}")
+
+    hashes = setup_graph_data
+    result = await memory_server.handle_memory_graph({
+        "action": "neighbors",
+        "hashes": [hashes["hash_a"], hashes["hash_c"]]
+    })
+
+    response = json.loads(result[0].text)
+    assert response["success"] is True
+    assert set(response["neighbors"][hashes["hash_a"]]) == {hashes["hash_b"], hashes["hash_d"]}
+    assert response["neighbors"][hashes["hash_c"]] == [hashes["hash_b"]]
+    assert response["count"] == 3
+
+
 @pytest.mark.asyncio
 async def test_find_shortest_path_valid(memory_server, setup_graph_data):
     """Test find_shortest_path with valid input."""
@@ -254,6 +273,25 @@ async def test_find_shortest_path_no_path(memory_server, setup_graph_data):
     assert response["length"] == 0
 
 
+@pytest.mark.asyncio
+async def test_find_shortest_path_expansion_budget(memory_server, setup_graph_data):
+    """Test that max_expanded_nodes bounds the path search."""
+    if STORAGE_BACKEND not in ['sqlite_vec', 'hybrid']:
+        pytest.skip(f"Graph operations not supported for backend: {STORAGE_BACKEND}")
+
+    hashes = setup_graph_data
+    arguments = {"hash1": hashes["hash_a"], "hash2": hashes["hash_c"], "max_depth": 5}
+
+    # A -> B -> C needs one expansion from each end
+    result = await memory_server.handle_find_shortest_path({**arguments, "max_expanded_nodes": 2})
+    assert json.loads(result[0].text)["length"] == 3
+
+    result = await memory_server.handle_find_shortest_path({**arguments, "max_expanded_nodes": 1})
+    response = json.loads(result[0].text)
+    assert response["success"] is True
+    assert response["path"] is None
+
+
 @pytest.mark.asyncio
 async def test_find_shortest_path_missing_params(memory_server):
     """Test find_shortest_path with missing parameters."""
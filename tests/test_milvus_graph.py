@@ -433,6 +433,74 @@ class TestRealContentHashes:
         assert eid != eid_rev
 
 
+# ---------------------------------------------------------------------------
+# Degree side-collection
+# ---------------------------------------------------------------------------
+
+class TestDegreeCollection:
+    @pytest.mark.asyncio
+    async def test_new_graph_creates_degree_collection(self, graph):
+        assert graph._has_degree_collection is True
+        assert graph.client.has_collection(collection_name="test_mem_degree")
+
+    @pytest.mark.asyncio
+    async def test_degrees_follow_edge_writes_and_deletes(self, graph):
+        await graph.store_association("hash_a", "hash_b", 0.8, ["semantic"], relationship_type="related")
+        await graph.store_association("hash_a", "hash_c", 0.7, ["semantic"], relationship_type="causes")
+        # Re-storing an existing edge must not double count
+        await graph.store_association("hash_a", "hash_b", 0.9, ["semantic"], relationship_type="related")
+
+        degrees = await graph.get_degrees(["hash_a", "hash_b", "hash_c", "hash_z"])
+        assert degrees == {"hash_a": 3, "hash_b": 2, "hash_c": 1}
+
+        await graph.delete_association("hash_a", "hash_b")
+        assert await graph.get_degrees(["hash_a", "hash_b", "hash_c"]) == {"hash_a": 1, "hash_c": 1}
+
+    @pytest.mark.asyncio
+    async def test_bulk_store_counts_and_degrees(self, graph):
+        result = await graph.store_associations_bulk([
+            {"source_hash": "hash_a", "target_hash": "hash_b", "similarity": 0.8,
+             "connection_types": ["semantic"], "relationship_type": "related"},
+            {"source_hash": "hash_a", "target_hash": "hash_c", "similarity": 0.7,
+             "connection_types": ["causal"], "relationship_type": "causes"},
+            {"source_hash": "hash_a", "target_hash": "hash_a", "similarity": 0.7,
+             "connection_types": ["semantic"]},
+        ])
+        assert result == {"inserted": 3, "updated": 0, "skipped": 1, "failed": 0}
+
+        result = await graph.store_associations_bulk([
+            {"source_hash": "hash_a", "target_hash": "hash_b", "similarity": 0.9,
+             "connection_types": ["semantic"]},
+        ])
+        assert result == {"inserted": 0, "updated": 2, "skipped": 0, "failed": 0}
+        assert await graph.get_degrees(["hash_a", "hash_b", "hash_c"]) == {
+            "hash_a": 3, "hash_b": 2, "hash_c": 1
+        }
+
+    @pytest.mark.asyncio
+    async def test_existing_graph_needs_rebuild(self, tmp_dir):
+        uri = os.path.join(tmp_dir, "legacy.db")
+        gs = MilvusGraphStorage(uri=uri, collection_name="legacy")
+        await gs.initialize()
+        await gs.store_association("hash_a", "hash_b", 0.8, ["semantic"], relationship_type="related")
+        # Simulate a graph created before degree tracking existed
+        gs.client.drop_collection(collection_name=gs.degree_collection_name)
+        await gs.close()
+
+        gs = MilvusGraphStorage(uri=uri, collection_name="legacy")
+        await gs.initialize()
+        try:
+            assert gs._has_degree_collection is False
+            assert await gs.get_degrees(["hash_a"]) == {}
+
+            assert await gs.rebuild_degree_collection() == 2
+            assert await gs.get_degrees(["hash_a", "hash_b"]) == {"hash_a": 2, "hash_b": 2}
+            await gs.store_association("hash_b", "hash_c", 0.5, ["semantic"], relationship_type="follows")
+            assert await gs.get_degrees(["hash_b", "hash_c"]) == {"hash_b": 3, "hash_c": 1}
+        finally:
+            await gs.close()
+
+
 # ---------------------------------------------------------------------------
 # Remote Milvus / Zilliz Cloud compatibility
 # ---------------------------------------------------------------------------
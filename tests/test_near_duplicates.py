@@ -0,0 +1,205 @@
+"""Tests for MinHash-LSH near-duplicate detection."""
+
+import os
+import random
+import sqlite3
+import tempfile
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from mcp_memory_service.models.memory import Memory
+from mcp_memory_service.storage.sqlite_vec import SqliteVecMemoryStorage
+from mcp_memory_service.utils.hashing import generate_content_hash
+from mcp_memory_service.utils.near_duplicates import (
+    NearDuplicateIndex,
+    is_near_duplicate,
+    minhash_signature,
+    normalize_text,
+)
+
+_BASE = "The staging deployment pipeline runs integration tests before promoting every build to production"
+
+
+def _corpus(seed=7, count=200):
+    rng = random.Random(seed)
+    vocabulary = [f"word{i}" for i in range(400)]
+    texts = [" ".join(rng.choices(vocabulary, k=rng.randint(8, 30))) for _ in range(count)]
+    # Near duplicates: one word appended, case changes, containment, exact copies
+    for i in range(0, count, 10):
+        texts.append(texts[i] + " extra")
+        texts.append(texts[i + 1].upper())
+        texts.append(texts[i + 2])
+    return [(f"k{i}", text) for i, text in enumerate(texts)]
+
+
+def _brute_force_has_duplicate(key, text, corpus):
+    normalized = normalize_text(text)
+    if len(normalized) < 20:
+        return False
+    return any(
+        other_key != key and is_near_duplicate(normalized, normalize_text(other), 0.8)
+        for other_key, other in corpus
+    )
+
+
+def test_signature_estimates_jaccard_and_is_deterministic():
+    words1 = [f"w{i}" for i in range(100)]
+    words2 = [f"w{i}" for i in range(20, 120)]  # Jaccard 80/120
+    sig1, sig2 = minhash_signature(words1, 256), minhash_signature(words2, 256)
+    assert sig1.dtype == np.uint32 and len(sig1) == 256
+    assert np.mean(sig1 == sig2) == pytest.approx(80 / 120, abs=0.1)
+    assert np.array_equal(sig1, minhash_signature(reversed(words1), 256))
+
+
+def test_index_matches_pairwise_scan():
+    corpus = _corpus()
+    index = NearDuplicateIndex(threshold=0.8)
+    for key, text in corpus:
+        index.add(key, text)
+
+    for key, text in corpus:
+        assert index.has_duplicate(key) == _brute_force_has_duplicate(key, text, corpus), key
+
+    groups = index.groups()
+    assert ["k0", "k200"] in groups
+    assert all(len(group) == len(set(group)) >= 2 for group in groups)
+
+
+def test_redundant_keys_are_duplicates_of_a_kept_key():
+    words = [f"word{i}" for i in range(24)]
+    index = NearDuplicateIndex(threshold=0.8)
+    # a~b and b~c (Jaccard 18/22) but a and c only share 16 of 24 words
+    index.add("a", " ".join(words[0:20]))
+    index.add("b", " ".join(words[2:22]))
+    index.add("c", " ".join(words[4:24]))
+    index.add("d", " ".join(words[0:20]).upper())
+
+    assert index.groups() == [["a", "b", "c", "d"]]
+    assert index.redundant() == ["b", "d"]
+
+
+def test_stored_signatures_are_reused():
+    index = NearDuplicateIndex()
+    index.add("a", _BASE)
+    stored = index.signature("a")
+
+    reloaded = NearDuplicateIndex()
+    reloaded.add("a", _BASE, signature=stored)
+    reloaded.add("b", _BASE + " today")
+    assert reloaded.duplicates_of("b") == ["a"]
+    assert NearDuplicateIndex().signature("missing") is None
+
+    with pytest.raises(ValueError):
+        NearDuplicateIndex(num_perm=64, bands=10)
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cleanup_near_duplicates_persists_signatures():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage = SqliteVecMemoryStorage(os.path.join(tmpdir, "dedup.db"))
+        await storage.initialize()
+        try:
+            contents = [_BASE, _BASE.upper() + "!", _BASE + " nightly", "A completely unrelated note about lunch plans"]
+            for content in contents:
+                success, message = await storage.store(
+                    Memory(content=content, content_hash=generate_content_hash(content), tags=["dedup"])
+                )
+                assert success, message
+
+            count, _ = await storage.cleanup_duplicates()
+            assert count == 0
+
+            count, message = await storage.cleanup_duplicates(near_duplicates=True)
+            assert count == 2, message
+            assert await storage.get_by_hash(generate_content_hash(contents[0])) is not None
+            assert await storage.get_by_hash(generate_content_hash(contents[3])) is not None
+
+            # Signatures of the soft-deleted duplicates are dropped with them
+            conn = sqlite3.connect(storage.db_path)
+            stored = conn.execute("SELECT COUNT(*) FROM memory_minhash").fetchone()[0]
+            conn.close()
+            assert stored == 2
+
+            count, _ = await storage.cleanup_duplicates(near_duplicates=True)
+            assert count == 0
+        finally:
+            await storage.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cleanup_near_duplicates_keeps_oldest_memory():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage = SqliteVecMemoryStorage(os.path.join(tmpdir, "dedup.db"))
+        await storage.initialize()
+        try:
+            # Stored newest first, so rowid order is the reverse of creation order
+            contents = [_BASE + " nightly", _BASE]
+            for created_at, content in zip([2_000_000.0, 1_000_000.0], contents):
+                success, message = await storage.store(
+                    Memory(content=content, content_hash=generate_content_hash(content), created_at=created_at)
+                )
+                assert success, message
+
+            count, message = await storage.cleanup_duplicates(near_duplicates=True)
+            assert count == 1, message
+            assert await storage.get_by_hash(generate_content_hash(_BASE)) is not None
+            assert await storage.get_by_hash(generate_content_hash(contents[0])) is None
+        finally:
+            await storage.close()
+
+
+@pytest.mark.asyncio
+async def test_deleting_a_memory_drops_its_signature():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage = SqliteVecMemoryStorage(os.path.join(tmpdir, "dedup.db"))
+        await storage.initialize()
+        try:
+            contents = [_BASE, "A completely unrelated note about lunch plans", "Weekly sync moved to Thursday"]
+            for content in contents:
+                success, message = await storage.store(
+                    Memory(content=content, content_hash=generate_content_hash(content))
+                )
+                assert success, message
+            await storage.cleanup_duplicates(near_duplicates=True)
+
+            success, _ = await storage.delete(generate_content_hash(contents[1]))
+            assert success
+            # A signature stored for a memory that is then purged outright
+            storage.conn.execute(
+                "DELETE FROM memories WHERE content_hash = ?", (generate_content_hash(contents[2]),)
+            )
+
+            stored = [row[0] for row in storage.conn.execute("SELECT content_hash FROM memory_minhash")]
+            assert stored == [generate_content_hash(contents[0])]
+        finally:
+            await storage.close()
+
+
+@pytest.mark.asyncio
+async def test_hybrid_cleanup_queues_near_duplicate_deletes():
+    from unittest.mock import AsyncMock, MagicMock
+    from mcp_memory_service.storage.hybrid import HybridMemoryStorage
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage = HybridMemoryStorage(sqlite_db_path=os.path.join(tmpdir, "hybrid.db"))
+        await storage.primary.initialize()
+        storage.sync_service = MagicMock(enqueue_operation=AsyncMock())
+        try:
+            contents = [_BASE, _BASE + " nightly", "A completely unrelated note about lunch plans"]
+            for created_at, content in zip([1_000_000.0, 2_000_000.0, 3_000_000.0], contents):
+                success, message = await storage.primary.store(
+                    Memory(content=content, content_hash=generate_content_hash(content), created_at=created_at)
+                )
+                assert success, message
+
+            count, message = await storage.cleanup_duplicates(near_duplicates=True)
+
+            assert count == 1, message
+            queued = [call.args[0] for call in storage.sync_service.enqueue_operation.await_args_list]
+            assert [(op.operation, op.content_hash) for op in queued] == [
+                ("delete", generate_content_hash(contents[1]))
+            ]
+        finally:
+            await storage.primary.close()
@@ -303,3 +303,43 @@ async def test_quality_boost_edge_cases(storage):
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
+
+
+@pytest.mark.asyncio
+async def test_graph_importance_boost(storage):
+    """Test that precomputed graph centrality can rerank search results."""
+    from mcp_memory_service.storage.graph import _CENTRALITY_SCHEMA
+
+    memories = [
+        create_memory(f"Python async note {i} about event loops", quality_score=0.5)
+        for i in range(3)
+    ]
+    for memory in memories:
+        await storage.store(memory)
+
+    # No centrality table yet: graph boost degrades to plain ranking
+    results = await storage.retrieve_with_quality_boost(
+        query="Python async", n_results=3, quality_boost=False, graph_weight=0.5
+    )
+    assert len(results) == 3
+    assert all(r.debug_info['graph_importance'] == 0.0 for r in results)
+
+    central = memories[2].content_hash
+    storage.conn.execute(_CENTRALITY_SCHEMA)
+    storage.conn.execute(
+        "INSERT INTO memory_centrality VALUES (?, 0.5, 0.5, 4, 1.0, NULL, 0)", (central,)
+    )
+    storage.conn.commit()
+    assert await storage.get_graph_importance([central, "unknown"]) == {central: 1.0}
+
+    results = await storage.retrieve_with_quality_boost(
+        query="Python async", n_results=3, quality_boost=False, graph_weight=0.9
+    )
+    assert results[0].memory.content_hash == central
+    assert results[0].debug_info['graph_weight'] == 0.9
+
+    response = await storage.search_memories(query="Python async", graph_boost=0.9, limit=3)
+    assert response["memories"][0]["content_hash"] == central
+
+    with pytest.raises(ValueError, match="graph_weight must be 0.0-1.0"):
+        await storage.retrieve_with_quality_boost(query="test", graph_weight=1.5)
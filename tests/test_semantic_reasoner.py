@@ -168,6 +168,33 @@ class TestBurst45FindCauses:
         assert causes == []
 
 
+class TestOneHopLookups:
+    """Tests for one-hop lookups backed by GraphStorage.neighbors_many"""
+
+    @pytest.mark.asyncio
+    async def test_uses_one_hop_query(self, setup_graph):
+        """Should answer with one indexed neighbor read instead of a recursive CTE"""
+        storage = setup_graph
+        reasoner = SemanticReasoner(storage)
+
+        assert await reasoner.find_causes("error1") == ["decision1"]
+        assert storage.get_query_stats()["neighbors_many"]["count"] == 1
+        assert "find_connected" not in storage.get_query_stats()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_find_connected(self):
+        """Should work with graph backends that lack neighbors_many"""
+        class LegacyGraph:
+            async def find_connected(self, memory_hash, max_hops, relationship_type, direction):
+                return [("fix_" + memory_hash, 1)]
+
+            async def shortest_path(self, hash1, hash2):
+                return None
+
+        reasoner = SemanticReasoner(LegacyGraph())
+        assert await reasoner.find_fixes("a") == ["fix_a"]
+
+
 class TestBurst46AbstractToConcept:
     """Tests for Burst 4.6: abstract_to_concept"""
 
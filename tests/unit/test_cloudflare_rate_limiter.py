@@ -0,0 +1,185 @@
+"""
+Tests for the shared Cloudflare rate limiter / concurrency governor.
+
+A local fake Cloudflare API (httpx.MockTransport) enforces fixed quota windows
+and answers 429 with Retry-After once a window is exhausted, so the limiter's
+back-off, AIMD concurrency and foreground priority can be exercised without
+network access.
+"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from mcp_memory_service.storage.cloudflare import CloudflareStorage
+from mcp_memory_service.storage.cloudflare_limiter import (
+    BACKGROUND,
+    FOREGROUND,
+    CloudflareRateLimiter,
+    background_priority,
+    current_priority,
+    parse_rate_limit_headers,
+    parse_retry_after,
+)
+from mcp_memory_service.storage.hybrid import BackgroundSyncService
+
+
+class QuotaWindowServer:
+    """Fake Cloudflare API allowing `quota` requests per `window` seconds."""
+
+    def __init__(self, quota: int, window: float, latency: float = 0.0):
+        self.quota = quota
+        self.window = window
+        self.latency = latency
+        self.window_start = time.monotonic()
+        self.used = 0
+        self.status_codes = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.completed = []
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        now = time.monotonic()
+        if now - self.window_start >= self.window:
+            self.window_start = now
+            self.used = 0
+        if self.used >= self.quota:
+            retry_after = self.window - (now - self.window_start)
+            self.status_codes.append(429)
+            return httpx.Response(429, headers={"Retry-After": f"{retry_after:.3f}"}, json={"success": False})
+        self.used += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.latency:
+                await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+        self.status_codes.append(200)
+        self.completed.append(request.headers.get("x-caller", ""))
+        remaining = self.quota - self.used
+        return httpx.Response(
+            200,
+            headers={"x-ratelimit-remaining": str(remaining)},
+            json={"success": True, "result": [{"results": []}]},
+        )
+
+
+def _storage(server: QuotaWindowServer, **limiter_kwargs) -> CloudflareStorage:
+    storage = CloudflareStorage(
+        api_token="t", account_id="a", vectorize_index="v", d1_database_id="d",
+        max_retries=8, base_delay=0.05, **limiter_kwargs,
+    )
+    storage.client = httpx.AsyncClient(transport=httpx.MockTransport(server.handler))
+    return storage
+
+
+class TestHeaderParsing:
+
+    def test_retry_after_seconds_and_date(self):
+        assert parse_retry_after("3") == 3.0
+        assert parse_retry_after("0.25") == 0.25
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0  # in the past
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+    def test_rate_limit_headers(self):
+        assert parse_rate_limit_headers({"ratelimit": '"default";r=12;t=30'}) == {"remaining": 12.0, "reset": 30.0}
+        assert parse_rate_limit_headers({"x-ratelimit-remaining": "0", "x-ratelimit-reset": "5"}) == {"remaining": 0.0, "reset": 5.0}
+        assert parse_rate_limit_headers({}) is None
+
+    def test_priority_context(self):
+        assert current_priority() == FOREGROUND
+        with background_priority():
+            assert current_priority() == BACKGROUND
+        assert current_priority() == FOREGROUND
+
+
+class TestAimd:
+
+    def test_multiplicative_decrease_and_additive_increase(self):
+        limiter = CloudflareRateLimiter(max_concurrency=8)
+        limiter.on_rate_limited(0)
+        assert limiter.concurrency_limit == 4
+        limiter.on_rate_limited(0)
+        assert limiter.concurrency_limit == 2
+        for _ in range(10):
+            limiter.on_success()
+        assert 2 < limiter.concurrency_limit <= 8
+        assert limiter.stats()["rate_limited_count"] == 2
+
+
+class TestQuotaWindows:
+
+    @pytest.mark.asyncio
+    async def test_requests_survive_quota_windows(self):
+        server = QuotaWindowServer(quota=10, window=0.3)
+        storage = _storage(server, requests_per_second=1000, rate_limit_burst=100, max_concurrency=8)
+
+        responses = await asyncio.gather(*[
+            storage._retry_request("POST", "https://fake/d1/query", json={}) for _ in range(30)
+        ])
+
+        assert all(r.status_code == 200 for r in responses)
+        stats = storage.rate_limiter.stats()
+        # The first window overflows once; afterwards the global back-off and the
+        # reduced concurrency keep the client inside the quota.
+        assert 1 <= stats["rate_limited_count"] < 30
+        assert stats["concurrency_limit"] < 8
+        assert stats["throttled_seconds"] > 0
+        await storage.close()
+
+    @pytest.mark.asyncio
+    async def test_token_bucket_paces_without_429s(self):
+        server = QuotaWindowServer(quota=10, window=0.5)
+        # 10 requests per 0.5s allowed; at most burst + rate * window = 8 per window
+        storage = _storage(server, requests_per_second=12, rate_limit_burst=2, max_concurrency=4)
+
+        await asyncio.gather(*[
+            storage._retry_request("POST", "https://fake/d1/query", json={}) for _ in range(20)
+        ])
+
+        assert server.status_codes.count(429) == 0
+        assert server.max_in_flight <= 4
+        await storage.close()
+
+    @pytest.mark.asyncio
+    async def test_foreground_overtakes_background_backlog(self):
+        server = QuotaWindowServer(quota=1000, window=60, latency=0.02)
+        storage = _storage(server, requests_per_second=1000, rate_limit_burst=1000, max_concurrency=2)
+
+        async def call(tag):
+            await storage._retry_request("POST", "https://fake/d1/query", json={}, headers={"x-caller": tag})
+
+        with background_priority():
+            background = [asyncio.create_task(call("bg")) for _ in range(20)]
+        await asyncio.sleep(0.03)
+        await call("fg")
+        position = server.completed.index("fg")
+        await asyncio.gather(*background)
+
+        # Background traffic may only use max_concurrency - 1 slots, so the
+        # foreground read finishes long before the background backlog drains.
+        assert position <= 5
+        stats = storage.rate_limiter.stats()
+        assert stats["background_requests"] == 20
+        assert stats["foreground_requests"] == 1
+        await storage.close()
+
+
+class TestSyncStatus:
+
+    @pytest.mark.asyncio
+    async def test_sync_status_exposes_limiter(self):
+        server = QuotaWindowServer(quota=100, window=1)
+        storage = _storage(server)
+
+        service = BackgroundSyncService(None, storage, sync_interval=60, batch_size=10)
+        status = await service.get_sync_status()
+
+        limiter = status["rate_limiter"]
+        assert limiter["concurrency_limit"] == storage.rate_limiter.max_concurrency
+        assert {"throttled_seconds", "rate_limited_count", "in_flight"} <= set(limiter)
+        await storage.close()
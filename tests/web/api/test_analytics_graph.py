@@ -715,3 +715,52 @@ async def test_graph_visualization_handles_deleted_memories(test_app, initialize
     # Deleted memory should not appear in nodes
     node_ids = [node["id"] for node in data["nodes"]]
     assert mem2 not in node_ids
+
+
+# Tests for /api/analytics/graph-view
+
+@pytest.mark.asyncio
+async def test_graph_view_budget_and_clusters(test_app, storage_with_graph_data, monkeypatch):
+    """Test that the level-of-detail view respects the node budget and folds the rest into clusters."""
+    set_storage(storage_with_graph_data)
+
+    response = test_app.get("/api/analytics/graph-view?node_budget=3")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["nodes"]) == 3
+    assert data["meta"]["total_nodes"] == 10
+    assert data["meta"]["hidden_nodes"] == 7
+
+    visible = {node["id"] for node in data["nodes"]}
+    for edge in data["edges"]:
+        assert edge["source"] in visible and edge["target"] in visible
+    for cluster in data["clusters"]:
+        assert cluster["type"] == "cluster"
+        assert cluster["anchor"] is None or cluster["anchor"] in visible
+    assert sum(cluster["size"] for cluster in data["clusters"]) >= 7 - 3
+
+
+@pytest.mark.asyncio
+async def test_graph_view_expand_pagination(test_app, storage_with_graph_data, monkeypatch):
+    """Test that expanding a node pages through its neighbors."""
+    set_storage(storage_with_graph_data)
+    hub = generate_content_hash("Test memory 0")
+
+    first = test_app.get(f"/api/analytics/graph-view/expand/{hub}?limit=1").json()
+    assert first["total"] == 2
+    assert first["has_more"] is True
+    # Strongest neighbor first: "related" Test memory 1 (0.8) before "follows" Test memory 9 (0.65)
+    assert first["nodes"][0]["id"] == generate_content_hash("Test memory 1")
+
+    second = test_app.get(f"/api/analytics/graph-view/expand/{hub}?limit=1&offset=1").json()
+    assert second["nodes"][0]["id"] == generate_content_hash("Test memory 9")
+    assert second["has_more"] is False
+
+
+@pytest.mark.asyncio
+async def test_graph_view_parameter_validation(test_app):
+    """Test parameter validation for the graph view endpoints."""
+    assert test_app.get("/api/analytics/graph-view?node_budget=0").status_code == 422
+    assert test_app.get("/api/analytics/graph-view?rank_by=pagerank").status_code == 422
+    assert test_app.get("/api/analytics/graph-view/expand/abc?limit=0").status_code == 422
@@ -0,0 +1,79 @@
+"""Tests for the consolidation profile endpoint and profile capture on trigger."""
+
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+
+from mcp_memory_service.consolidation.base import ConsolidationReport
+
+
+class FakeConsolidator:
+    """Consolidator double with a fixed profile history."""
+
+    def __init__(self):
+        self.calls = []
+        self.profiles = [{
+            "timestamp": "2025-11-16T03:00:41",
+            "time_horizon": "weekly",
+            "success": True,
+            "profile": {"wall_seconds": 4.2, "cpu_seconds": 6.1, "storage_calls": 9, "phases": [
+                {"phase": "relevance", "runs": 1, "wall_seconds": 0.4, "cpu_seconds": 0.3,
+                 "peak_rss_delta_mb": 0.0, "items_in": 30, "items_out": 30,
+                 "storage_calls": 1, "storage_bytes_read": 0},
+            ]},
+        }]
+
+    def get_profile_history(self, limit=10):
+        return self.profiles[:limit]
+
+    async def consolidate(self, time_horizon, run_id=None, capture_profile=False, **kwargs):
+        self.calls.append((time_horizon, capture_profile))
+        now = datetime.now()
+        return ConsolidationReport(
+            time_horizon=time_horizon, start_time=now, end_time=now, memories_processed=30,
+        )
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("MCP_ALLOW_ANONYMOUS_ACCESS", "true")
+
+    from mcp_memory_service.api import client as api_client
+    from mcp_memory_service.web.app import app
+    from mcp_memory_service.web.oauth.middleware import (
+        AuthenticationResult,
+        get_current_user,
+        require_read_access,
+        require_write_access,
+    )
+
+    async def _user():
+        return AuthenticationResult(
+            authenticated=True, client_id="test", scope="read write", auth_method="test"
+        )
+
+    app.dependency_overrides[get_current_user] = _user
+    app.dependency_overrides[require_read_access] = _user
+    app.dependency_overrides[require_write_access] = _user
+    consolidator = FakeConsolidator()
+    monkeypatch.setattr(api_client, "_consolidator_instance", consolidator)
+
+    yield TestClient(app), consolidator
+    app.dependency_overrides.clear()
+
+
+def test_list_profiles(client):
+    http, _ = client
+    response = http.get("/api/consolidation/profiles?limit=1")
+    assert response.status_code == 200
+    (entry,) = response.json()["profiles"]
+    assert entry["time_horizon"] == "weekly"
+    assert entry["profile"]["phases"][0]["phase"] == "relevance"
+
+
+def test_trigger_passes_capture_profile(client):
+    http, consolidator = client
+    response = http.post("/api/consolidation/trigger", json={"time_horizon": "daily", "capture_profile": True})
+    assert response.status_code == 200
+    assert consolidator.calls == [("daily", True)]
@@ -0,0 +1,109 @@
+"""Tests for the checkpointed consolidation run endpoints under /api/consolidation/runs."""
+
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+
+from mcp_memory_service.consolidation.base import ConsolidationReport
+from mcp_memory_service.consolidation.checkpoints import ConsolidationRun
+
+
+class FakeConsolidator:
+    """Consolidator double holding run records in a dict."""
+
+    def __init__(self, runs):
+        self.runs = {run.run_id: run for run in runs}
+        self.resumed = []
+
+    async def get_run(self, run_id):
+        return self.runs.get(run_id)
+
+    async def list_runs(self, limit=20):
+        return list(reversed(self.runs.values()))[:limit]
+
+    async def consolidate(self, time_horizon, run_id=None, **kwargs):
+        self.resumed.append((time_horizon, run_id))
+        run = self.runs[run_id]
+        run.status = "completed"
+        now = datetime.now()
+        return ConsolidationReport(
+            time_horizon=time_horizon, start_time=now, end_time=now,
+            memories_processed=30, run_id=run_id,
+        )
+
+
+@pytest.fixture
+def runs():
+    failed = ConsolidationRun.start("quarterly", 1700000000.0)
+    failed.status = "failed"
+    failed.error = "disk I/O error"
+    failed.windows_completed = 2
+    failed.totals = {"memories_processed": 20}
+    failed.window = {
+        "index": 3, "input_hash": "abc", "totals": {},
+        "phases": {"relevance": {"seconds": 0.1, "outputs": {"scored": 10}}},
+        "state": {"relevance_scores": [{"memory_hash": "h"}]},
+    }
+    done = ConsolidationRun.start("weekly", 1700000100.0)
+    done.status = "completed"
+    return [failed, done]
+
+
+@pytest.fixture
+def client(monkeypatch, runs):
+    monkeypatch.setenv("MCP_ALLOW_ANONYMOUS_ACCESS", "true")
+
+    from mcp_memory_service.api import client as api_client
+    from mcp_memory_service.web.app import app
+    from mcp_memory_service.web.oauth.middleware import (
+        AuthenticationResult,
+        get_current_user,
+        require_read_access,
+        require_write_access,
+    )
+
+    async def _user():
+        return AuthenticationResult(
+            authenticated=True, client_id="test", scope="read write", auth_method="test"
+        )
+
+    app.dependency_overrides[get_current_user] = _user
+    app.dependency_overrides[require_read_access] = _user
+    app.dependency_overrides[require_write_access] = _user
+    consolidator = FakeConsolidator(runs)
+    monkeypatch.setattr(api_client, "_consolidator_instance", consolidator)
+
+    yield TestClient(app), consolidator
+    app.dependency_overrides.clear()
+
+
+def test_list_runs_hides_phase_state(client, runs):
+    http, _ = client
+    response = http.get("/api/consolidation/runs")
+    assert response.status_code == 200
+    listed = response.json()["runs"]
+    assert [run["run_id"] for run in listed] == [runs[1].run_id, runs[0].run_id]
+    failed = listed[1]
+    assert failed["status"] == "failed"
+    assert failed["current_window"] == {
+        "index": 3, "input_hash": "abc",
+        "phases": {"relevance": {"seconds": 0.1, "outputs": {"scored": 10}}},
+    }
+
+
+def test_get_run(client, runs):
+    http, _ = client
+    assert http.get(f"/api/consolidation/runs/{runs[0].run_id}").json()["windows_completed"] == 2
+    assert http.get("/api/consolidation/runs/unknown").status_code == 404
+
+
+def test_resume_run(client, runs):
+    http, consolidator = client
+    response = http.post(f"/api/consolidation/runs/{runs[0].run_id}/resume")
+    assert response.status_code == 200
+    assert response.json()["run_id"] == runs[0].run_id
+    assert consolidator.resumed == [("quarterly", runs[0].run_id)]
+
+    assert http.post(f"/api/consolidation/runs/{runs[1].run_id}/resume").status_code == 409
+    assert http.post("/api/consolidation/runs/unknown/resume").status_code == 404